@@ -109,10 +109,14 @@ export class AdminApiClient {
   public async listJobs(args: {
     tenantId: string | null
     status: string | null
+    cursor?: string | null
+    limit?: number
   }): Promise<ApiResult<AdminJobListResponse>> {
     const q = new URLSearchParams()
     if (args.tenantId !== null && args.tenantId.trim() !== '') q.set('tenant_id', args.tenantId)
     if (args.status !== null && args.status.trim() !== '') q.set('status', args.status)
+    if (args.cursor !== undefined && args.cursor !== null) q.set('cursor', args.cursor)
+    if (args.limit !== undefined) q.set('limit', String(args.limit))
     const suffix = q.toString()
     return await this.getJson<AdminJobListResponse>(`/jobs${suffix === '' ? '' : `?${suffix}`}`, { auth: true })
   }
@@ -46,6 +46,7 @@ export interface components {
         };
         AdminJobListResponse: {
             jobs?: components["schemas"]["AdminJobListItem"][];
+            next_cursor?: string | null;
         };
         AdminJobRetryResponse: {
             job_id: string;
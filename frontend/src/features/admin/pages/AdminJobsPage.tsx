@@ -18,6 +18,7 @@ export function AdminJobsPage(props: AdminJobsPageProps) {
   const [busy, setBusy] = useState<boolean>(false)
   const [error, setError] = useState<ApiError | null>(null)
   const [items, setItems] = useState<AdminJobListItem[]>([])
+  const [nextCursor, setNextCursor] = useState<string | null>(null)
 
   const [filterTenant, setFilterTenant] = useState<TenantFilter>('')
   const [filterStatus, setFilterStatus] = useState<string>('')
@@ -25,13 +26,14 @@ export function AdminJobsPage(props: AdminJobsPageProps) {
   const [selected, setSelected] = useState<AdminJobListItem | null>(null)
   const [detail, setDetail] = useState<AdminJobDetailResponse | null>(null)
 
-  const refresh = async () => {
+  const loadPage = async (cursor: string | null) => {
     if (busy) return
     setBusy(true)
     setError(null)
     const result = await props.api.listJobs({
       tenantId: filterTenant === '' ? null : filterTenant,
       status: filterStatus === '' ? null : filterStatus,
+      cursor,
     })
     setBusy(false)
 
@@ -40,9 +42,13 @@ export function AdminJobsPage(props: AdminJobsPageProps) {
       setError(result.error)
       return
     }
-    setItems(result.value.jobs ?? [])
+    const page = result.value.jobs ?? []
+    setItems((prev) => (cursor === null ? page : [...prev, ...page]))
+    setNextCursor(result.value.next_cursor ?? null)
   }
 
+  const refresh = async () => await loadPage(null)
+
   const loadDetail = async (job: AdminJobListItem) => {
     if (busy) return
     setSelected(job)
@@ -189,6 +195,13 @@ export function AdminJobsPage(props: AdminJobsPageProps) {
               </tbody>
             </table>
           </div>
+          {nextCursor === null ? null : (
+            <div style={{ display: 'flex', justifyContent: 'center', marginTop: 12 }}>
+              <button className="btn btn-secondary" type="button" onClick={() => void loadPage(nextCursor)} disabled={busy}>
+                {busy ? '加载中…' : '加载更多'}
+              </button>
+            </div>
+          )}
         </div>
       </div>
 
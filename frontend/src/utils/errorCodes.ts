@@ -35,6 +35,7 @@ const INTERNAL_TO_PUBLIC: Record<string, PublicErrorCode> = {
   ADMIN_BEARER_TOKEN_INVALID: 'E1002',
   ADMIN_BEARER_TOKEN_MISSING: 'E1002',
   ADMIN_CREDENTIALS_INVALID: 'E1002',
+  ADMIN_JOB_CURSOR_INVALID: 'E1006',
   ADMIN_NOT_CONFIGURED: 'E4004',
   ADMIN_STORE_IO_ERROR: 'E4002',
   ADMIN_TOKEN_INVALID: 'E1002',
@@ -134,8 +135,10 @@ const INTERNAL_TO_PUBLIC: Record<string, PublicErrorCode> = {
   PLAN_MISSING: 'E3002',
   PLAN_TEMPLATE_META_INVALID: 'E3002',
   PLAN_TEMPLATE_META_NOT_FOUND: 'E3002',
+  QUEUE_BACKEND_UNSUPPORTED: 'E4003',
   QUEUE_DATA_CORRUPTED: 'E2002',
   QUEUE_IO_ERROR: 'E4002',
+  QUEUE_NOTIFIER_UNSUPPORTED: 'E4003',
   RESOURCE_OOM: 'E4002',
   SERVICE_SHUTTING_DOWN: 'E4002',
   SMOKE_SUITE_FIXTURE_COPY_FAILED: 'E4004',
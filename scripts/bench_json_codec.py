@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import argparse
+import platform
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Sequence
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from src.domain.models import (  # noqa: E402
+    JOB_SCHEMA_VERSION_CURRENT,
+    ArtifactKind,
+    ArtifactRef,
+    Draft,
+    Job,
+    JobStatus,
+    RunAttempt,
+)
+from src.utils.json_codec import JsonCodec, StdlibJsonCodec, default_codec  # noqa: E402
+
+# (label, runs, LLM calls); every LLM call adds three refs to artifacts_index.
+_SIZES: dict[str, tuple[int, int]] = {
+    "small": (1, 3),
+    "medium": (6, 60),
+    "large": (30, 600),
+}
+
+
+@dataclass(frozen=True)
+class BenchmarkResult:
+    size: str
+    codec: str
+    case: str
+    payload_bytes: int
+    per_op_us: float
+
+
+def build_job(*, runs: int, llm_calls: int) -> Job:
+    refs = [
+        ArtifactRef(kind=kind, rel_path=f"artifacts/llm/call_{i:05d}/{kind.value}.txt")
+        for i in range(llm_calls)
+        for kind in (ArtifactKind.LLM_PROMPT, ArtifactKind.LLM_RESPONSE, ArtifactKind.LLM_META)
+    ]
+    attempts = [
+        RunAttempt(
+            run_id=f"run_{i:04d}",
+            attempt=i + 1,
+            status="failed" if i + 1 < runs else "succeeded",
+            started_at="2026-01-01T00:00:00+00:00",
+            ended_at="2026-01-01T00:05:00+00:00",
+            artifacts=[
+                ArtifactRef(kind=ArtifactKind.STATA_LOG, rel_path=f"runs/run_{i:04d}/stata.log"),
+                ArtifactRef(kind=ArtifactKind.STATA_DO, rel_path=f"runs/run_{i:04d}/stata.do"),
+            ],
+        )
+        for i in range(runs)
+    ]
+    return Job(
+        schema_version=JOB_SCHEMA_VERSION_CURRENT,
+        job_id="job_benchmark",
+        trace_id="0" * 32,
+        status=JobStatus.SUCCEEDED,
+        requirement="估计最低工资对就业的影响，控制地区和年份固定效应。" * 4,
+        created_at="2026-01-01T00:00:00+00:00",
+        draft=Draft(text="draft " * 400, created_at="2026-01-01T00:00:00+00:00"),
+        runs=attempts,
+        artifacts_index=refs,
+    )
+
+
+def _time_per_op_us(func: Callable[[], object], *, iterations: int) -> float:
+    func()
+    start = time.perf_counter()
+    for _ in range(iterations):
+        func()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def run_benchmark(*, size: str, codec: JsonCodec, iterations: int) -> list[BenchmarkResult]:
+    runs, llm_calls = _SIZES[size]
+    job = build_job(runs=runs, llm_calls=llm_calls)
+    pretty = codec.dumps(job.model_dump(mode="json"))
+    compact = codec.dumps(job.model_dump(mode="json"), compact=True)
+    direct = job.model_dump_json().encode("utf-8")
+    cases: list[tuple[str, bytes, Callable[[], object]]] = [
+        ("encode_pretty", pretty, lambda: codec.dumps(job.model_dump(mode="json"))),
+        (
+            "encode_compact",
+            compact,
+            lambda: codec.dumps(job.model_dump(mode="json"), compact=True),
+        ),
+        ("encode_model_dump_json", direct, job.model_dump_json),
+        ("decode_validate", pretty, lambda: Job.model_validate(codec.loads(pretty))),
+        ("decode_model_validate_json", direct, lambda: Job.model_validate_json(direct)),
+    ]
+    return [
+        BenchmarkResult(
+            size=size,
+            codec=codec.name,
+            case=case,
+            payload_bytes=len(data),
+            per_op_us=_time_per_op_us(func, iterations=iterations),
+        )
+        for case, data, func in cases
+    ]
+
+
+def _print_result(result: BenchmarkResult) -> None:
+    print(
+        "result "
+        f"size={result.size} codec={result.codec} case={result.case} "
+        f"bytes={result.payload_bytes} per_op_us={result.per_op_us:.1f}"
+    )
+
+
+def _parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Benchmark job.json encode/decode across JSON codecs and job sizes."
+    )
+    parser.add_argument("--iterations", type=int, default=200)
+    parser.add_argument("--size", choices=sorted(_SIZES), action="append", default=None)
+    return parser.parse_args(argv)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    args = _parse_args(sys.argv[1:] if argv is None else argv)
+    if args.iterations <= 0:
+        raise ValueError("--iterations must be positive")
+    codecs: list[JsonCodec] = [StdlibJsonCodec()]
+    if default_codec().name != StdlibJsonCodec().name:
+        codecs.append(default_codec())
+    print(f"python={sys.version.split()[0]} platform={platform.platform()}")
+    for size in args.size or list(_SIZES):
+        for codec in codecs:
+            for result in run_benchmark(size=size, codec=codec, iterations=args.iterations):
+                _print_result(result)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
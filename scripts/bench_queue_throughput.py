@@ -9,17 +9,36 @@ from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
 from threading import Lock
-from typing import Sequence
+from typing import Callable, Sequence
 
 _REPO_ROOT = Path(__file__).resolve().parents[1]
 if str(_REPO_ROOT) not in sys.path:
     sys.path.insert(0, str(_REPO_ROOT))
 
+from src.domain.worker_queue import WorkerQueue  # noqa: E402
 from src.infra.file_worker_queue import FileWorkerQueue  # noqa: E402
+from src.infra.indexed_file_worker_queue import IndexedFileWorkerQueue  # noqa: E402
+from src.infra.sqlite_database import SQLiteDatabase  # noqa: E402
+from src.infra.sqlite_worker_queue import SQLiteWorkerQueue  # noqa: E402
+
+
+def _sqlite_queue(queue_dir: Path, lease_ttl_seconds: int) -> WorkerQueue:
+    db = SQLiteDatabase(path=queue_dir / "queue.sqlite3")
+    return SQLiteWorkerQueue(db=db, lease_ttl_seconds=lease_ttl_seconds)
+
+
+_BACKENDS: dict[str, Callable[[Path, int], WorkerQueue]] = {
+    "file": lambda queue_dir, ttl: FileWorkerQueue(queue_dir=queue_dir, lease_ttl_seconds=ttl),
+    "file_indexed": lambda queue_dir, ttl: IndexedFileWorkerQueue(
+        queue_dir=queue_dir, lease_ttl_seconds=ttl
+    ),
+    "sqlite": _sqlite_queue,
+}
 
 
 @dataclass(frozen=True)
 class BenchmarkResult:
+    backend: str
     queued_jobs: int
     claims: int
     workers: int
@@ -74,8 +93,9 @@ def run_benchmark(
     claims: int,
     workers: int,
     lease_ttl_seconds: int,
+    backend: str = "file",
 ) -> BenchmarkResult:
-    queue = FileWorkerQueue(queue_dir=queue_dir, lease_ttl_seconds=lease_ttl_seconds)
+    queue = _BACKENDS[backend](queue_dir, lease_ttl_seconds)
     for i in range(queued_jobs):
         queue.enqueue(job_id=f"job_{i:08d}")
 
@@ -103,6 +123,7 @@ def run_benchmark(
     claim_latencies = [v for worker_vals in latencies_by_worker for v in worker_vals]
     jobs_per_second = (processed_total / elapsed) if elapsed > 0 else 0.0
     return BenchmarkResult(
+        backend=backend,
         queued_jobs=queued_jobs,
         claims=processed_total,
         workers=workers,
@@ -124,6 +145,7 @@ def _print_result(result: BenchmarkResult) -> None:
     jobs_per_minute = result.jobs_per_second * 60.0
     print(
         "result "
+        f"backend={result.backend} "
         f"queued_jobs={result.queued_jobs} claims={result.claims} workers={result.workers} "
         f"elapsed_s={result.elapsed_seconds:.3f} "
         f"jobs_s={result.jobs_per_second:.2f} jobs_min={jobs_per_minute:.1f} "
@@ -135,13 +157,14 @@ def _print_result(result: BenchmarkResult) -> None:
 
 def _parse_args(argv: Sequence[str]) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
-        description="Benchmark FileWorkerQueue throughput (claim+ack)."
+        description="Benchmark file-backed WorkerQueue throughput (claim+ack)."
     )
     parser.add_argument("--queued-jobs", type=int, default=2000)
     parser.add_argument("--claims", type=int, default=None)
     parser.add_argument("--workers", type=int, default=4)
     parser.add_argument("--lease-ttl-seconds", type=int, default=60)
     parser.add_argument("--queue-dir", type=Path, default=None)
+    parser.add_argument("--backend", choices=sorted(_BACKENDS), default="file")
     return parser.parse_args(argv)
 
 
@@ -166,6 +189,7 @@ def main(argv: Sequence[str] | None = None) -> int:
                 claims=claims,
                 workers=args.workers,
                 lease_ttl_seconds=args.lease_ttl_seconds,
+                backend=args.backend,
             )
         )
         return 0
@@ -182,6 +206,7 @@ def main(argv: Sequence[str] | None = None) -> int:
                 claims=claims,
                 workers=args.workers,
                 lease_ttl_seconds=args.lease_ttl_seconds,
+                backend=args.backend,
             )
             _print_result(result)
             return 0
@@ -12,6 +12,8 @@ from src.api.admin.schemas import (
     AdminLoginResponse,
     AdminLogoutResponse,
 )
+from src.api.blocking_io import BlockingIO
+from src.api.io_deps import get_blocking_io
 from src.domain.admin_auth_service import AdminAuthService, AdminPrincipal
 from src.domain.admin_token_store import AdminTokenStore
 from src.utils.time import utc_now
@@ -23,8 +25,9 @@ router = APIRouter(prefix="/auth", tags=["admin-auth"])
 async def admin_login(
     payload: AdminLoginRequest = Body(...),
     auth: AdminAuthService = Depends(get_admin_auth_service),
+    io: BlockingIO = Depends(get_blocking_io),
 ) -> AdminLoginResponse:
-    issued = auth.login(username=payload.username, password=payload.password)
+    issued = await io.run(auth.login, username=payload.username, password=payload.password)
     return AdminLoginResponse(
         token=issued.token,
         token_id=issued.token_id,
@@ -36,6 +39,7 @@ async def admin_login(
 async def admin_logout(
     principal: AdminPrincipal = Depends(require_admin_principal),
     tokens: AdminTokenStore = Depends(get_admin_token_store),
+    io: BlockingIO = Depends(get_blocking_io),
 ) -> AdminLogoutResponse:
-    revoked = tokens.revoke_token(token_id=principal.token_id, now=utc_now())
+    revoked = await io.run(tokens.revoke_token, token_id=principal.token_id, now=utc_now())
     return AdminLogoutResponse(token_id=revoked.token_id, revoked_at=revoked.revoked_at)
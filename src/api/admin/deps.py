@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 from fastapi import Depends, Header
 
+from src.api.async_stores import AsyncJobIndexer
+from src.api.blocking_io import BlockingIO
 from src.api.deps import get_config
+from src.api.io_deps import get_blocking_io
 from src.config import Config
 from src.domain.admin_auth_service import AdminAuthService, AdminPrincipal
 from src.domain.admin_token_store import AdminTokenStore
@@ -10,8 +15,8 @@ from src.domain.job_indexer import JobIndexer
 from src.domain.task_code_store import TaskCodeStore
 from src.infra.admin_exceptions import AdminBearerTokenInvalidError, AdminBearerTokenMissingError
 from src.infra.file_admin_token_store import FileAdminTokenStore
-from src.infra.file_job_indexer import FileJobIndexer
 from src.infra.file_task_code_store import FileTaskCodeStore
+from src.infra.job_indexer_factory import build_job_indexer
 from src.utils.time import utc_now
 
 
@@ -23,8 +28,20 @@ async def get_task_code_store(config: Config = Depends(get_config)) -> TaskCodeS
     return FileTaskCodeStore(data_dir=config.admin_data_dir)
 
 
+@lru_cache
+def _job_indexer_cached(config: Config) -> JobIndexer:
+    return build_job_indexer(config=config)
+
+
 async def get_job_indexer(config: Config = Depends(get_config)) -> JobIndexer:
-    return FileJobIndexer(jobs_dir=config.jobs_dir)
+    return _job_indexer_cached(config)
+
+
+async def get_async_job_indexer(
+    indexer: JobIndexer = Depends(get_job_indexer),
+    io: BlockingIO = Depends(get_blocking_io),
+) -> AsyncJobIndexer:
+    return AsyncJobIndexer(inner=indexer, io=io)
 
 
 async def get_admin_auth_service(
@@ -42,9 +59,10 @@ async def get_admin_auth_service(
 async def require_admin_principal(
     authorization: str | None = Header(default=None, alias="Authorization"),
     auth: AdminAuthService = Depends(get_admin_auth_service),
+    io: BlockingIO = Depends(get_blocking_io),
 ) -> AdminPrincipal:
     token = _bearer_token_or_raise(authorization)
-    return auth.authenticate(token=token)
+    return await io.run(auth.authenticate, token=token)
 
 
 def _bearer_token_or_raise(authorization: str | None) -> str:
@@ -59,3 +77,7 @@ def _bearer_token_or_raise(authorization: str | None) -> str:
     if token == "":
         raise AdminBearerTokenInvalidError(reason="empty_token")
     return token
+
+
+def clear_admin_dependency_caches() -> None:
+    _job_indexer_cached.cache_clear()
@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, Query
-from fastapi.responses import FileResponse, Response
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import Response
 
-from src.api.admin.deps import get_job_indexer
+from src.api.admin.deps import get_async_job_indexer
 from src.api.admin.schemas import (
     AdminArtifactItem,
     AdminJobDetailResponse,
@@ -12,16 +12,13 @@ from src.api.admin.schemas import (
     AdminJobRetryResponse,
     AdminRunAttemptItem,
 )
-from src.api.deps import (
-    get_artifacts_service,
-    get_job_service,
-    get_job_store,
-    get_tenant_id,
-)
+from src.api.artifact_download import artifact_file_response
+from src.api.async_stores import AsyncJobIndexer, AsyncJobStore
+from src.api.blocking_io import BlockingIO
+from src.api.deps import get_artifacts_service, get_job_service, get_tenant_id
+from src.api.io_deps import get_async_job_store, get_blocking_io
 from src.domain.artifacts_service import ArtifactsService
-from src.domain.job_indexer import JobIndexer
 from src.domain.job_service import JobService
-from src.domain.job_store import JobStore
 from src.utils.json_types import JsonObject
 
 router = APIRouter(prefix="/jobs", tags=["admin-jobs"])
@@ -31,9 +28,11 @@ router = APIRouter(prefix="/jobs", tags=["admin-jobs"])
 async def list_jobs(
     status: str | None = Query(default=None),
     tenant_id: str | None = Query(default=None),
-    indexer: JobIndexer = Depends(get_job_indexer),
+    limit: int = Query(default=100, ge=1, le=1000),
+    cursor: str | None = Query(default=None),
+    indexer: AsyncJobIndexer = Depends(get_async_job_indexer),
 ) -> AdminJobListResponse:
-    items = indexer.list_jobs(tenant_id=tenant_id)
+    page = await indexer.list_page(tenant_id=tenant_id, status=status, limit=limit, cursor=cursor)
     jobs = [
         AdminJobListItem(
             tenant_id=item.tenant_id,
@@ -42,23 +41,23 @@ async def list_jobs(
             created_at=item.created_at,
             updated_at=item.updated_at,
         )
-        for item in items
-        if status is None or item.status == status
+        for item in page.items
     ]
-    return AdminJobListResponse(jobs=jobs)
+    return AdminJobListResponse(jobs=jobs, next_cursor=page.next_cursor)
 
 
 @router.get("/{job_id}", response_model=AdminJobDetailResponse)
 async def get_job_detail(
     job_id: str,
     tenant_id: str = Depends(get_tenant_id),
-    store: JobStore = Depends(get_job_store),
+    store: AsyncJobStore = Depends(get_async_job_store),
     artifacts: ArtifactsService = Depends(get_artifacts_service),
+    io: BlockingIO = Depends(get_blocking_io),
 ) -> AdminJobDetailResponse:
-    job = store.load(tenant_id=tenant_id, job_id=job_id)
+    job = await store.load(tenant_id=tenant_id, job_id=job_id)
     artifact_items = [
         _to_admin_artifact_item(item)
-        for item in artifacts.list_artifacts(tenant_id=tenant_id, job_id=job_id)
+        for item in await io.run(artifacts.list_artifacts, tenant_id=tenant_id, job_id=job_id)
     ]
     runs = [
         AdminRunAttemptItem(
@@ -93,10 +92,14 @@ async def get_job_detail(
 @router.post("/{job_id}/retry", response_model=AdminJobRetryResponse)
 async def retry_job(
     job_id: str,
+    bypass_run_cache: bool = Query(default=False),
     tenant_id: str = Depends(get_tenant_id),
     svc: JobService = Depends(get_job_service),
+    io: BlockingIO = Depends(get_blocking_io),
 ) -> AdminJobRetryResponse:
-    job = svc.trigger_run(tenant_id=tenant_id, job_id=job_id)
+    job = await io.run(
+        svc.trigger_run, tenant_id=tenant_id, job_id=job_id, bypass_run_cache=bypass_run_cache
+    )
     return AdminJobRetryResponse(
         tenant_id=tenant_id,
         job_id=job.job_id,
@@ -110,10 +113,11 @@ async def list_job_artifacts(
     job_id: str,
     tenant_id: str = Depends(get_tenant_id),
     artifacts: ArtifactsService = Depends(get_artifacts_service),
+    io: BlockingIO = Depends(get_blocking_io),
 ) -> list[AdminArtifactItem]:
     return [
         _to_admin_artifact_item(item)
-        for item in artifacts.list_artifacts(tenant_id=tenant_id, job_id=job_id)
+        for item in await io.run(artifacts.list_artifacts, tenant_id=tenant_id, job_id=job_id)
     ]
 
 
@@ -121,16 +125,16 @@ async def list_job_artifacts(
 async def download_job_artifact(
     job_id: str,
     artifact_id: str,
+    request: Request,
     tenant_id: str = Depends(get_tenant_id),
     artifacts: ArtifactsService = Depends(get_artifacts_service),
+    io: BlockingIO = Depends(get_blocking_io),
 ) -> Response:
-    path = artifacts.resolve_download_path(tenant_id=tenant_id, job_id=job_id, rel_path=artifact_id)
-    filename = artifact_id.rsplit("/", 1)[-1]
-    return FileResponse(
-        path=str(path),
-        media_type="application/octet-stream",
-        filename=filename,
+    path = await io.run(
+        artifacts.resolve_download_path, tenant_id=tenant_id, job_id=job_id, rel_path=artifact_id
     )
+    filename = artifact_id.rsplit("/", 1)[-1]
+    return await io.run(artifact_file_response, request=request, path=path, filename=filename)
 
 
 def _to_admin_artifact_item(item: JsonObject) -> AdminArtifactItem:
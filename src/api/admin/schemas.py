@@ -73,6 +73,7 @@ class AdminJobListItem(BaseModel):
 
 class AdminJobListResponse(BaseModel):
     jobs: list[AdminJobListItem] = Field(default_factory=list)
+    next_cursor: str | None = None
 
 
 class AdminArtifactItem(BaseModel):
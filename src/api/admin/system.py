@@ -14,7 +14,9 @@ from src.api.admin.schemas import (
     AdminSystemStatusResponse,
     AdminWorkerStatus,
 )
+from src.api.blocking_io import BlockingIO
 from src.api.deps import get_config, get_llm_client
+from src.api.io_deps import get_blocking_io
 from src.config import Config
 from src.domain.health_service import HealthService, ProductionGateConfig
 from src.domain.llm_client import LLMClient
@@ -32,6 +34,7 @@ async def get_system_status(
     request: Request,
     config: Config = Depends(get_config),
     llm: LLMClient = Depends(get_llm_client),
+    io: BlockingIO = Depends(get_blocking_io),
 ) -> AdminSystemStatusResponse:
     now = utc_now()
     gate = ProductionGateConfig(
@@ -47,18 +50,16 @@ async def get_system_status(
         upload_s3_access_key_id=config.upload_s3_access_key_id,
         upload_s3_secret_access_key=config.upload_s3_secret_access_key,
     )
-    health = HealthService(
-        jobs_dir=config.jobs_dir,
-        queue_dir=config.queue_dir,
-        llm=llm,
-        production_gate=gate,
-    ).readiness(shutting_down=bool(getattr(request.app.state, "shutting_down", False)))
-
-    workers = _summarize_workers(claimed_root=config.queue_dir / "claimed", now=now)
-    queue = AdminQueueDepth(
-        queued=_count_queue_records(config.queue_dir / "queued"),
-        claimed=_count_queue_records(config.queue_dir / "claimed"),
+    health = await io.run(
+        HealthService(
+            jobs_dir=config.jobs_dir,
+            queue_dir=config.queue_dir,
+            llm=llm,
+            production_gate=gate,
+        ).readiness,
+        shutting_down=bool(getattr(request.app.state, "shutting_down", False)),
     )
+    queue, workers = await io.run(_queue_snapshot, queue_dir=config.queue_dir, now=now)
     return AdminSystemStatusResponse(
         checked_at=now.isoformat(),
         health=AdminHealthSummary(
@@ -73,6 +74,16 @@ async def get_system_status(
     )
 
 
+def _queue_snapshot(
+    *, queue_dir: Path, now: datetime
+) -> tuple[AdminQueueDepth, list[AdminWorkerStatus]]:
+    queue = AdminQueueDepth(
+        queued=_count_queue_records(queue_dir / "queued"),
+        claimed=_count_queue_records(queue_dir / "claimed"),
+    )
+    return queue, _summarize_workers(claimed_root=queue_dir / "claimed", now=now)
+
+
 def _count_queue_records(root: Path) -> int:
     if not root.is_dir():
         return 0
@@ -10,6 +10,8 @@ from src.api.admin.schemas import (
     AdminTaskCodeItem,
     AdminTaskCodeListResponse,
 )
+from src.api.blocking_io import BlockingIO
+from src.api.io_deps import get_blocking_io
 from src.domain.task_code_store import TaskCodeRecord, TaskCodeStore
 from src.utils.time import utc_now
 
@@ -20,10 +22,12 @@ router = APIRouter(prefix="/task-codes", tags=["admin-task-codes"])
 async def create_task_codes(
     payload: AdminTaskCodeCreateRequest = Body(default_factory=AdminTaskCodeCreateRequest),
     store: TaskCodeStore = Depends(get_task_code_store),
+    io: BlockingIO = Depends(get_blocking_io),
 ) -> AdminTaskCodeListResponse:
     now = utc_now()
     expires_at = now + timedelta(days=payload.expires_in_days)
-    issued = store.issue_codes(
+    issued = await io.run(
+        store.issue_codes,
         tenant_id=payload.tenant_id,
         count=payload.count,
         expires_at=expires_at,
@@ -37,10 +41,11 @@ async def list_task_codes(
     tenant_id: str | None = Query(default=None),
     status: str | None = Query(default=None),
     store: TaskCodeStore = Depends(get_task_code_store),
+    io: BlockingIO = Depends(get_blocking_io),
 ) -> AdminTaskCodeListResponse:
     now = utc_now()
     items: list[AdminTaskCodeItem] = []
-    for record in store.list_codes(tenant_id=tenant_id):
+    for record in await io.run(store.list_codes, tenant_id=tenant_id):
         item = _to_item(record, now=now)
         if status is not None and item.status != status:
             continue
@@ -52,9 +57,10 @@ async def list_task_codes(
 async def revoke_task_code(
     code_id: str,
     store: TaskCodeStore = Depends(get_task_code_store),
+    io: BlockingIO = Depends(get_blocking_io),
 ) -> AdminTaskCodeItem:
     now = utc_now()
-    record = store.revoke(code_id=code_id, revoked_at=now)
+    record = await io.run(store.revoke, code_id=code_id, revoked_at=now)
     return _to_item(record, now=now)
 
 
@@ -62,8 +68,9 @@ async def revoke_task_code(
 async def delete_task_code(
     code_id: str,
     store: TaskCodeStore = Depends(get_task_code_store),
+    io: BlockingIO = Depends(get_blocking_io),
 ) -> Response:
-    store.delete(code_id=code_id)
+    await io.run(store.delete, code_id=code_id)
     return Response(status_code=204)
 
 
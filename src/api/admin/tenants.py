@@ -1,9 +1,13 @@
 from __future__ import annotations
 
+from pathlib import Path
+
 from fastapi import APIRouter, Depends
 
 from src.api.admin.schemas import AdminTenantListResponse
+from src.api.blocking_io import BlockingIO
 from src.api.deps import get_config
+from src.api.io_deps import get_blocking_io
 from src.config import Config
 from src.utils.tenancy import DEFAULT_TENANT_ID, TENANTS_DIRNAME, is_safe_tenant_id
 
@@ -11,13 +15,20 @@ router = APIRouter(prefix="/tenants", tags=["admin-tenants"])
 
 
 @router.get("", response_model=AdminTenantListResponse)
-async def list_tenants(config: Config = Depends(get_config)) -> AdminTenantListResponse:
+async def list_tenants(
+    config: Config = Depends(get_config),
+    io: BlockingIO = Depends(get_blocking_io),
+) -> AdminTenantListResponse:
+    return AdminTenantListResponse(tenants=await io.run(_tenant_ids, jobs_dir=config.jobs_dir))
+
+
+def _tenant_ids(*, jobs_dir: Path) -> list[str]:
     tenants = [DEFAULT_TENANT_ID]
-    tenants_dir = config.jobs_dir / TENANTS_DIRNAME
+    tenants_dir = jobs_dir / TENANTS_DIRNAME
     if tenants_dir.is_dir():
         for child in tenants_dir.iterdir():
             if child.is_dir() and is_safe_tenant_id(child.name):
                 tenants.append(child.name)
     tenants.sort()
-    return AdminTenantListResponse(tenants=tenants)
+    return tenants
 
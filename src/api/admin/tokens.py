@@ -9,6 +9,8 @@ from src.api.admin.schemas import (
     AdminTokenItem,
     AdminTokenListResponse,
 )
+from src.api.blocking_io import BlockingIO
+from src.api.io_deps import get_blocking_io
 from src.domain.admin_token_store import AdminTokenStore
 from src.utils.time import utc_now
 
@@ -18,6 +20,7 @@ router = APIRouter(prefix="/tokens", tags=["admin-tokens"])
 @router.get("", response_model=AdminTokenListResponse)
 async def list_admin_tokens(
     tokens: AdminTokenStore = Depends(get_admin_token_store),
+    io: BlockingIO = Depends(get_blocking_io),
 ) -> AdminTokenListResponse:
     items = [
         AdminTokenItem(
@@ -27,7 +30,7 @@ async def list_admin_tokens(
             last_used_at=token.last_used_at,
             revoked_at=token.revoked_at,
         )
-        for token in tokens.list_tokens()
+        for token in await io.run(tokens.list_tokens)
     ]
     return AdminTokenListResponse(tokens=items)
 
@@ -36,8 +39,9 @@ async def list_admin_tokens(
 async def create_admin_token(
     payload: AdminTokenCreateRequest = Body(default_factory=AdminTokenCreateRequest),
     tokens: AdminTokenStore = Depends(get_admin_token_store),
+    io: BlockingIO = Depends(get_blocking_io),
 ) -> AdminTokenCreateResponse:
-    issued = tokens.issue_token(name=payload.name, now=utc_now())
+    issued = await io.run(tokens.issue_token, name=payload.name, now=utc_now())
     return AdminTokenCreateResponse(
         token=issued.token,
         token_id=issued.token_id,
@@ -49,8 +53,9 @@ async def create_admin_token(
 async def revoke_admin_token(
     token_id: str,
     tokens: AdminTokenStore = Depends(get_admin_token_store),
+    io: BlockingIO = Depends(get_blocking_io),
 ) -> AdminTokenItem:
-    meta = tokens.revoke_token(token_id=token_id, now=utc_now())
+    meta = await io.run(tokens.revoke_token, token_id=token_id, now=utc_now())
     return AdminTokenItem(
         token_id=meta.token_id,
         name=meta.name,
@@ -64,6 +69,7 @@ async def revoke_admin_token(
 async def delete_admin_token(
     token_id: str,
     tokens: AdminTokenStore = Depends(get_admin_token_store),
+    io: BlockingIO = Depends(get_blocking_io),
 ) -> Response:
-    tokens.delete_token(token_id=token_id)
+    await io.run(tokens.delete_token, token_id=token_id)
     return Response(status_code=204)
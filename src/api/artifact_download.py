@@ -0,0 +1,53 @@
+from __future__ import annotations
+
+import os
+from email.utils import formatdate, parsedate_to_datetime
+from pathlib import Path
+
+from fastapi import Request
+from fastapi.responses import FileResponse, Response
+
+_CACHE_CONTROL = "private, no-cache"
+
+
+def artifact_file_response(*, request: Request, path: Path, filename: str) -> Response:
+    """Serve an artifact from disk with validators, conditional GET and Range support.
+
+    `FileResponse` streams the file (or hands it to the server via `pathsend`) and answers
+    `Range`/`If-Range`; this adds `304 Not Modified` for `If-None-Match`/`If-Modified-Since`
+    so polling clients only pay for a stat.
+    """
+    stat_result = os.stat(path)
+    validators = {
+        "etag": _etag(stat_result),
+        "last-modified": formatdate(stat_result.st_mtime, usegmt=True),
+        "cache-control": _CACHE_CONTROL,
+    }
+    if _not_modified(request=request, etag=validators["etag"], mtime=stat_result.st_mtime):
+        return Response(status_code=304, headers=validators)
+    return FileResponse(
+        path=str(path),
+        media_type="application/octet-stream",
+        filename=filename,
+        stat_result=stat_result,
+        headers=validators,
+    )
+
+
+def _etag(stat_result: os.stat_result) -> str:
+    return f'"{stat_result.st_ino:x}-{stat_result.st_mtime_ns:x}-{stat_result.st_size:x}"'
+
+
+def _not_modified(*, request: Request, etag: str, mtime: float) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in candidates or etag in candidates
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    return int(mtime) <= int(since.timestamp())
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from src.api.blocking_io import BlockingIO
+from src.domain.job_indexer import JobIndexer, JobIndexItem, JobIndexPage
+from src.domain.job_store import JobStore
+from src.domain.models import Draft, Job
+from src.utils.json_types import JsonObject
+from src.utils.tenancy import DEFAULT_TENANT_ID
+
+
+class AsyncJobStore:
+    """Awaitable view of a `JobStore` whose calls run on the API blocking I/O pool."""
+
+    def __init__(self, *, inner: JobStore, io: BlockingIO):
+        self._inner = inner
+        self._io = io
+
+    async def create(self, job: Job, *, tenant_id: str = DEFAULT_TENANT_ID) -> None:
+        await self._io.run(self._inner.create, job, tenant_id=tenant_id)
+
+    async def load(self, job_id: str, *, tenant_id: str = DEFAULT_TENANT_ID) -> Job:
+        return await self._io.run(self._inner.load, job_id, tenant_id=tenant_id)
+
+    async def save(self, job: Job, *, tenant_id: str = DEFAULT_TENANT_ID) -> None:
+        await self._io.run(self._inner.save, job, tenant_id=tenant_id)
+
+    async def write_draft(
+        self, *, job_id: str, draft: Draft, tenant_id: str = DEFAULT_TENANT_ID
+    ) -> None:
+        await self._io.run(
+            self._inner.write_draft, job_id=job_id, draft=draft, tenant_id=tenant_id
+        )
+
+    async def write_artifact_json(
+        self,
+        *,
+        job_id: str,
+        rel_path: str,
+        payload: JsonObject,
+        tenant_id: str = DEFAULT_TENANT_ID,
+    ) -> None:
+        await self._io.run(
+            self._inner.write_artifact_json,
+            job_id=job_id,
+            rel_path=rel_path,
+            payload=payload,
+            tenant_id=tenant_id,
+        )
+
+
+class AsyncJobIndexer:
+    """Awaitable view of a `JobIndexer` whose calls run on the API blocking I/O pool."""
+
+    def __init__(self, *, inner: JobIndexer, io: BlockingIO):
+        self._inner = inner
+        self._io = io
+
+    async def list_jobs(self, *, tenant_id: str | None = None) -> list[JobIndexItem]:
+        return await self._io.run(self._inner.list_jobs, tenant_id=tenant_id)
+
+    async def list_page(
+        self,
+        *,
+        tenant_id: str | None = None,
+        status: str | None = None,
+        limit: int,
+        cursor: str | None = None,
+    ) -> JobIndexPage:
+        return await self._io.run(
+            self._inner.list_page, tenant_id=tenant_id, status=status, limit=limit, cursor=cursor
+        )
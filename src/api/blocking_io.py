@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from functools import partial
+from typing import ParamSpec, TypeVar
+
+import anyio
+import anyio.to_thread
+
+from src.domain.metrics import BlockingIOMetrics, NoopMetrics
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+DEFAULT_BLOCKING_IO_MAX_WORKERS = 32
+
+
+class BlockingIO:
+    """Runs synchronous, disk-bound calls for async handlers on a dedicated bounded pool.
+
+    Calls go through `anyio.to_thread` with a private `CapacityLimiter`, so store, workspace
+    and preview work never blocks the event loop and never competes for AnyIO's default
+    thread budget (which FastAPI uses for sync dependencies and upload spooling). Slot wait,
+    call duration (labelled by the function name) and in-flight calls are reported to
+    `metrics`.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_workers: int = DEFAULT_BLOCKING_IO_MAX_WORKERS,
+        metrics: BlockingIOMetrics | None = None,
+    ):
+        self._limiter = anyio.CapacityLimiter(max(1, max_workers))
+        self._metrics: BlockingIOMetrics = NoopMetrics() if metrics is None else metrics
+
+    @property
+    def max_workers(self) -> int:
+        return int(self._limiter.total_tokens)
+
+    async def run(self, func: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs) -> T:
+        operation = _operation_name(func)
+        submitted_at = time.perf_counter()
+
+        def _call() -> T:
+            started_at = time.perf_counter()
+            self._metrics.blocking_io_inflight_inc()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self._metrics.blocking_io_inflight_dec()
+                self._metrics.observe_blocking_io(
+                    operation=operation,
+                    wait_seconds=started_at - submitted_at,
+                    duration_seconds=time.perf_counter() - started_at,
+                )
+
+        return await anyio.to_thread.run_sync(_call, limiter=self._limiter)
+
+
+def _operation_name(func: Callable[..., object]) -> str:
+    while isinstance(func, partial):
+        func = func.func
+    return str(getattr(func, "__name__", type(func).__name__))
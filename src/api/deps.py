@@ -8,6 +8,8 @@ from src.api.audit_context import get_audit_context
 from src.config import Config, load_config
 from src.domain.artifacts_service import ArtifactsService
 from src.domain.audit import AuditContext, AuditLogger
+from src.domain.dataset_preview_cache import DatasetPreviewCache
+from src.domain.dataset_sidecar_ingest import DatasetSidecarIngestor, build_dataset_sidecar_ingestor
 from src.domain.do_template_selection_service import DoTemplateSelectionService
 from src.domain.draft_service import DraftService
 from src.domain.idempotency import JobIdempotency
@@ -25,19 +27,22 @@ from src.domain.state_machine import JobStateMachine
 from src.domain.task_code_redeem_service import TaskCodeRedeemService
 from src.domain.upload_bundle_service import UploadBundleService
 from src.domain.upload_sessions_service import UploadSessionsService
+from src.domain.worker_queue import WorkerQueue
 from src.infra.audit_logger import LoggingAuditLogger
+from src.infra.dataset_preview_cache import build_dataset_preview_cache
 from src.infra.exceptions import SSError, TenantIdUnsafeError
 from src.infra.file_job_workspace_store import FileJobWorkspaceStore
 from src.infra.file_task_code_store import FileTaskCodeStore
 from src.infra.file_upload_session_store import FileUploadSessionStore
-from src.infra.file_worker_queue import FileWorkerQueue
 from src.infra.fs_do_template_catalog import FileSystemDoTemplateCatalog
 from src.infra.fs_do_template_repository import FileSystemDoTemplateRepository
+from src.infra.job_archive_cache import build_archive_reader
 from src.infra.job_store_factory import build_job_store
 from src.infra.llm_client_factory import build_llm_client
 from src.infra.object_store_factory import build_object_store
 from src.infra.prometheus_metrics import PrometheusMetrics
 from src.infra.queue_job_scheduler import QueueJobScheduler
+from src.infra.worker_queue_factory import build_worker_queue
 from src.utils.tenancy import DEFAULT_TENANT_ID, is_safe_tenant_id
 from src.utils.time import utc_now
 
@@ -68,7 +73,7 @@ async def get_tenant_id(
 
 @lru_cache
 def _job_store_cached() -> JobStore:
-    return build_job_store(config=_config_cached())
+    return build_job_store(config=_config_cached(), metrics=_metrics_cached())
 
 
 async def get_job_store() -> JobStore:
@@ -76,12 +81,8 @@ async def get_job_store() -> JobStore:
 
 
 @lru_cache
-def _worker_queue_cached() -> FileWorkerQueue:
-    config = _config_cached()
-    return FileWorkerQueue(
-        queue_dir=config.queue_dir,
-        lease_ttl_seconds=config.queue_lease_ttl_seconds,
-    )
+def _worker_queue_cached() -> WorkerQueue:
+    return build_worker_queue(config=_config_cached())
 
 
 @lru_cache
@@ -118,7 +119,7 @@ def _job_scheduler_cached() -> JobScheduler:
     return QueueJobScheduler(queue=_worker_queue_cached())
 
 
-async def get_worker_queue() -> FileWorkerQueue:
+async def get_worker_queue() -> WorkerQueue:
     return _worker_queue_cached()
 
 
@@ -162,7 +163,8 @@ async def get_job_service(audit_ctx: AuditContext = Depends(get_audit_context))
 @lru_cache
 def _artifacts_service_cached() -> ArtifactsService:
     config = _config_cached()
-    return ArtifactsService(store=_job_store_cached(), jobs_dir=config.jobs_dir)
+    archive = build_archive_reader(config=config)
+    return ArtifactsService(store=_job_store_cached(), jobs_dir=config.jobs_dir, archive=archive)
 
 
 async def get_artifacts_service() -> ArtifactsService:
@@ -174,9 +176,28 @@ async def get_draft_service() -> DraftService:
         store=_job_store_cached(), llm=_llm_client_cached(),
         state_machine=_job_state_machine_cached(), workspace=_job_workspace_store_cached(),
         do_template_selection=_do_template_selection_service_cached(),
+        preview_cache=_dataset_preview_cache_cached(),
     )
 
 
+@lru_cache
+def _dataset_preview_cache_cached() -> DatasetPreviewCache | None:
+    return build_dataset_preview_cache(config=_config_cached(), metrics=_metrics_cached())
+
+
+@lru_cache
+def _dataset_sidecar_ingestor_cached() -> DatasetSidecarIngestor | None:
+    return build_dataset_sidecar_ingestor(enabled=_config_cached().dataset_sidecar_enabled)
+
+
+async def get_dataset_preview_cache() -> DatasetPreviewCache | None:
+    return _dataset_preview_cache_cached()
+
+
+async def get_dataset_sidecar_ingestor() -> DatasetSidecarIngestor | None:
+    return _dataset_sidecar_ingestor_cached()
+
+
 @lru_cache
 def _job_workspace_store_cached() -> JobWorkspaceStore:
     return FileJobWorkspaceStore(jobs_dir=_config_cached().jobs_dir)
@@ -198,7 +219,10 @@ def _do_template_selection_service_cached() -> DoTemplateSelectionService:
 
 @lru_cache
 def _job_inputs_service_cached() -> JobInputsService:
-    return JobInputsService(store=_job_store_cached(), workspace=_job_workspace_store_cached())
+    return JobInputsService(
+        store=_job_store_cached(), workspace=_job_workspace_store_cached(),
+        preview_cache=_dataset_preview_cache_cached(), sidecars=_dataset_sidecar_ingestor_cached(),
+    )
 
 
 @lru_cache
@@ -213,7 +237,7 @@ def _plan_service_cached() -> PlanService:
         store=_job_store_cached(), workspace=_job_workspace_store_cached(),
         do_template_catalog=FileSystemDoTemplateCatalog(library_dir=config.do_template_library_dir),
         do_template_repo=FileSystemDoTemplateRepository(library_dir=config.do_template_library_dir),
-        llm=_llm_client_cached(),
+        llm=_llm_client_cached(), preview_cache=_dataset_preview_cache_cached(),
     )
 
 
@@ -258,7 +282,7 @@ def _upload_sessions_service_cached() -> UploadSessionsService:
     return UploadSessionsService(
         config=_config_cached(), store=_job_store_cached(), workspace=_job_workspace_store_cached(),
         object_store=_object_store_cached(), bundle_service=_upload_bundle_service_cached(),
-        session_store=_upload_session_store_cached(),
+        session_store=_upload_session_store_cached(), sidecars=_dataset_sidecar_ingestor_cached(),
     )
 
 
@@ -287,6 +311,11 @@ async def get_task_code_redeem_service() -> TaskCodeRedeemService:
 
 
 def clear_dependency_caches() -> None:
+    # Drain a running sidecar ingestor before dropping it; never build one just to stop it.
+    if _dataset_sidecar_ingestor_cached.cache_info().currsize > 0:
+        ingestor = _dataset_sidecar_ingestor_cached()
+        if ingestor is not None:
+            ingestor.shutdown()
     for cache in (
         _config_cached, _job_store_cached, _worker_queue_cached, _llm_client_cached,
         _job_state_machine_cached, _job_idempotency_cached, _metrics_cached, _audit_logger_cached,
@@ -294,6 +323,7 @@ def clear_dependency_caches() -> None:
         _do_template_catalog_cached, _do_template_selection_service_cached,
         _job_inputs_service_cached, _upload_bundle_service_cached, _object_store_cached,
         _upload_session_store_cached, _upload_sessions_service_cached, _job_query_service_cached,
-        _plan_service_cached, _task_code_redeem_service_cached,
+        _plan_service_cached, _task_code_redeem_service_cached, _dataset_preview_cache_cached,
+        _dataset_sidecar_ingestor_cached,
     ):
         cache.cache_clear()
@@ -4,10 +4,12 @@ from typing import Literal, cast
 
 from fastapi import APIRouter, Body, Depends, Query, Response
 
+from src.api.blocking_io import BlockingIO
 from src.api.column_normalization_schemas import DraftColumnNameNormalization
 from src.api.deps import get_draft_service, get_tenant_id
 from src.api.draft_column_candidate_schemas import DraftColumnCandidateV2
 from src.api.inputs_preview_schemas import InputsPreviewColumn
+from src.api.io_deps import get_blocking_io
 from src.api.required_variable_schemas import DraftRequiredVariable
 from src.api.schemas import (
     DraftDataQualityWarning,
@@ -59,8 +61,9 @@ async def draft_preview(
     main_data_source_id: str | None = Query(default=None),
     tenant_id: str = Depends(get_tenant_id),
     svc: DraftService = Depends(get_draft_service),
+    io: BlockingIO = Depends(get_blocking_io),
 ) -> DraftPreviewResponse | DraftPreviewPendingResponse:
-    result = await svc.preview_v1(tenant_id=tenant_id, job_id=job_id)
+    result = await svc.preview_v1(tenant_id=tenant_id, job_id=job_id, io=io)
     if result.pending is not None:
         if main_data_source_id is not None:
             raise InputMainDataSourceNotFoundError(main_data_source_id=main_data_source_id)
@@ -162,8 +165,11 @@ async def draft_patch(
     payload: DraftPatchRequest = Body(default_factory=DraftPatchRequest),
     tenant_id: str = Depends(get_tenant_id),
     svc: DraftService = Depends(get_draft_service),
+    io: BlockingIO = Depends(get_blocking_io),
 ) -> DraftPatchResponse:
-    patched = svc.patch_v1(tenant_id=tenant_id, job_id=job_id, field_updates=payload.field_updates)
+    patched = await io.run(
+        svc.patch_v1, tenant_id=tenant_id, job_id=job_id, field_updates=payload.field_updates
+    )
     draft_dump = patched.draft.model_dump(mode="json")
     return DraftPatchResponse(
         patched_fields=list(patched.patched_fields),
@@ -3,7 +3,9 @@ from __future__ import annotations
 from fastapi import APIRouter, Depends, Request
 from fastapi.responses import JSONResponse
 
+from src.api.blocking_io import BlockingIO
 from src.api.deps import get_config, get_llm_client
+from src.api.io_deps import get_blocking_io
 from src.api.schemas import HealthCheck, HealthResponse
 from src.config import Config
 from src.domain.health_service import HealthService, ProductionGateConfig
@@ -31,6 +33,7 @@ async def health_ready(
     request: Request,
     config: Config = Depends(get_config),
     llm: LLMClient = Depends(get_llm_client),
+    io: BlockingIO = Depends(get_blocking_io),
 ) -> HealthResponse | JSONResponse:
     gate = ProductionGateConfig(
         is_production=config.is_production(),
@@ -51,8 +54,9 @@ async def health_ready(
         llm=llm,
         production_gate=gate,
     )
-    report = service.readiness(
-        shutting_down=bool(getattr(request.app.state, "shutting_down", False))
+    report = await io.run(
+        service.readiness,
+        shutting_down=bool(getattr(request.app.state, "shutting_down", False)),
     )
 
     payload = HealthResponse(
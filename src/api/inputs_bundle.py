@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from fastapi import APIRouter, Body, Depends
 
+from src.api.blocking_io import BlockingIO
 from src.api.deps import get_tenant_id, get_upload_bundle_service
+from src.api.io_deps import get_blocking_io
 from src.api.schemas import BundleResponse, CreateBundleRequest
 from src.domain.upload_bundle_service import Bundle, BundleFileDeclaration, UploadBundleService
 
@@ -37,8 +39,10 @@ async def create_bundle(
     payload: CreateBundleRequest = Body(...),
     tenant_id: str = Depends(get_tenant_id),
     svc: UploadBundleService = Depends(get_upload_bundle_service),
+    io: BlockingIO = Depends(get_blocking_io),
 ) -> BundleResponse:
-    bundle = svc.create_bundle(
+    bundle = await io.run(
+        svc.create_bundle,
         tenant_id=tenant_id,
         job_id=job_id,
         files=[
@@ -63,6 +67,7 @@ async def get_bundle(
     job_id: str,
     tenant_id: str = Depends(get_tenant_id),
     svc: UploadBundleService = Depends(get_upload_bundle_service),
+    io: BlockingIO = Depends(get_blocking_io),
 ) -> BundleResponse:
-    bundle = svc.get_bundle(tenant_id=tenant_id, job_id=job_id)
+    bundle = await io.run(svc.get_bundle, tenant_id=tenant_id, job_id=job_id)
     return BundleResponse.model_validate(_bundle_payload(bundle))
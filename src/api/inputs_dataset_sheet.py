@@ -2,13 +2,19 @@ from __future__ import annotations
 
 from fastapi import APIRouter, Depends, Query
 
+from src.api.blocking_io import BlockingIO
 from src.api.deps import (
+    get_dataset_preview_cache,
+    get_dataset_sidecar_ingestor,
     get_job_inputs_service,
     get_job_store,
     get_job_workspace_store,
     get_tenant_id,
 )
 from src.api.inputs_preview_schemas import InputsPreviewResponse
+from src.api.io_deps import get_blocking_io
+from src.domain.dataset_preview_cache import DatasetPreviewCache
+from src.domain.dataset_sidecar_ingest import DatasetSidecarIngestor
 from src.domain.inputs_sheet_selection_service import InputsSheetSelectionService
 from src.domain.job_inputs_service import JobInputsService
 from src.domain.job_store import JobStore
@@ -30,15 +36,23 @@ async def select_dataset_excel_sheet(
     tenant_id: str = Depends(get_tenant_id),
     store: JobStore = Depends(get_job_store),
     workspace: JobWorkspaceStore = Depends(get_job_workspace_store),
+    preview_cache: DatasetPreviewCache | None = Depends(get_dataset_preview_cache),
+    sidecars: DatasetSidecarIngestor | None = Depends(get_dataset_sidecar_ingestor),
     inputs_svc: JobInputsService = Depends(get_job_inputs_service),
+    io: BlockingIO = Depends(get_blocking_io),
 ) -> InputsPreviewResponse:
-    InputsSheetSelectionService(store=store, workspace=workspace).select_dataset_excel_sheet(
+    selection = InputsSheetSelectionService(
+        store=store, workspace=workspace, preview_cache=preview_cache, sidecars=sidecars
+    )
+    await io.run(
+        selection.select_dataset_excel_sheet,
         tenant_id=tenant_id,
         job_id=job_id,
         dataset_key=dataset_key,
         sheet_name=sheet_name,
     )
-    payload = inputs_svc.preview_primary_dataset(
+    payload = await io.run(
+        inputs_svc.preview_primary_dataset,
         tenant_id=tenant_id,
         job_id=job_id,
         rows=rows,
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from fastapi import APIRouter, Body, Depends
 
+from src.api.blocking_io import BlockingIO
 from src.api.deps import get_tenant_id, get_upload_sessions_service
+from src.api.io_deps import get_blocking_io
 from src.api.schemas import (
     CreateUploadSessionRequest,
     FinalizeUploadFailure,
@@ -29,8 +31,10 @@ async def create_upload_session(
     payload: CreateUploadSessionRequest = Body(...),
     tenant_id: str = Depends(get_tenant_id),
     svc: UploadSessionsService = Depends(get_upload_sessions_service),
+    io: BlockingIO = Depends(get_blocking_io),
 ) -> UploadSessionResponse:
-    result = svc.create_upload_session(
+    result = await io.run(
+        svc.create_upload_session,
         tenant_id=tenant_id,
         job_id=job_id,
         bundle_id=payload.bundle_id,
@@ -50,8 +54,10 @@ async def refresh_upload_urls(
     payload: RefreshUploadUrlsRequest = Body(default_factory=RefreshUploadUrlsRequest),
     tenant_id: str = Depends(get_tenant_id),
     svc: UploadSessionsService = Depends(get_upload_sessions_service),
+    io: BlockingIO = Depends(get_blocking_io),
 ) -> RefreshUploadUrlsResponse:
-    result = svc.refresh_multipart_urls(
+    result = await io.run(
+        svc.refresh_multipart_urls,
         tenant_id=tenant_id,
         upload_session_id=upload_session_id,
         part_numbers=payload.part_numbers,
@@ -70,8 +76,10 @@ async def finalize_upload_session(
     payload: FinalizeUploadRequest = Body(...),
     tenant_id: str = Depends(get_tenant_id),
     svc: UploadSessionsService = Depends(get_upload_sessions_service),
+    io: BlockingIO = Depends(get_blocking_io),
 ) -> FinalizeUploadResponse:
-    result = svc.finalize(
+    result = await io.run(
+        svc.finalize,
         tenant_id=tenant_id,
         upload_session_id=upload_session_id,
         parts=[item.model_dump(mode="json") for item in payload.parts],
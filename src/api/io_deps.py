@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from functools import lru_cache
+
+from fastapi import Depends
+
+from src.api.async_stores import AsyncJobStore
+from src.api.blocking_io import BlockingIO
+from src.api.deps import get_config, get_job_store, get_metrics_sync
+from src.config import Config
+from src.domain.job_store import JobStore
+
+
+@lru_cache
+def _blocking_io_cached(max_workers: int) -> BlockingIO:
+    return BlockingIO(max_workers=max_workers, metrics=get_metrics_sync())
+
+
+async def get_blocking_io(config: Config = Depends(get_config)) -> BlockingIO:
+    return _blocking_io_cached(config.api_blocking_io_max_workers)
+
+
+async def get_async_job_store(
+    store: JobStore = Depends(get_job_store),
+    io: BlockingIO = Depends(get_blocking_io),
+) -> AsyncJobStore:
+    return AsyncJobStore(inner=store, io=io)
+
+
+def clear_io_dependency_caches() -> None:
+    _blocking_io_cached.cache_clear()
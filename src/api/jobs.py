@@ -1,12 +1,12 @@
 from __future__ import annotations
 
 from collections.abc import Sequence
-from functools import partial
 
-import anyio
-from fastapi import APIRouter, Body, Depends, File, Form, Query, UploadFile
+from fastapi import APIRouter, Body, Depends, File, Form, Query, Request, UploadFile
 from fastapi.responses import Response
 
+from src.api.artifact_download import artifact_file_response
+from src.api.blocking_io import BlockingIO
 from src.api.deps import (
     get_artifacts_service,
     get_job_inputs_service,
@@ -16,6 +16,7 @@ from src.api.deps import (
     get_tenant_id,
 )
 from src.api.inputs_preview_schemas import InputsPreviewResponse
+from src.api.io_deps import get_blocking_io
 from src.api.schemas import (
     ArtifactIndexItem,
     ArtifactsIndexResponse,
@@ -47,8 +48,10 @@ async def get_job(
     job_id: str,
     tenant_id: str = Depends(get_tenant_id),
     svc: JobQueryService = Depends(get_job_query_service),
+    io: BlockingIO = Depends(get_blocking_io),
 ) -> GetJobResponse:
-    return GetJobResponse.model_validate(svc.get_job_summary(tenant_id=tenant_id, job_id=job_id))
+    summary = await io.run(svc.get_job_summary, tenant_id=tenant_id, job_id=job_id)
+    return GetJobResponse.model_validate(summary)
 
 
 @router.post("/jobs/{job_id}/inputs/upload", response_model=InputsUploadResponse)
@@ -59,6 +62,7 @@ async def upload_job_inputs(
     filename: list[str] | None = Form(default=None),
     tenant_id: str = Depends(get_tenant_id),
     svc: JobInputsService = Depends(get_job_inputs_service),
+    io: BlockingIO = Depends(get_blocking_io),
 ) -> InputsUploadResponse:
     file_count = len(file)
     roles: Sequence[str]
@@ -80,14 +84,16 @@ async def upload_job_inputs(
     uploads = [
         DatasetUpload(
             role=roles[index],
-            data=await item.read(),
+            stream=item.file,
             original_name=item.filename,
             filename_override=filename_overrides[index],
             content_type=item.content_type,
         )
         for index, item in enumerate(file)
     ]
-    payload = svc.upload_datasets(tenant_id=tenant_id, job_id=job_id, uploads=uploads)
+    payload = await io.run(
+        svc.upload_datasets, tenant_id=tenant_id, job_id=job_id, uploads=uploads
+    )
     return InputsUploadResponse.model_validate(payload)
 
 
@@ -98,8 +104,10 @@ async def preview_job_inputs(
     columns: int = Query(default=50, ge=1, le=200),
     tenant_id: str = Depends(get_tenant_id),
     svc: JobInputsService = Depends(get_job_inputs_service),
+    io: BlockingIO = Depends(get_blocking_io),
 ) -> InputsPreviewResponse:
-    payload = svc.preview_primary_dataset(
+    payload = await io.run(
+        svc.preview_primary_dataset,
         tenant_id=tenant_id,
         job_id=job_id,
         rows=rows,
@@ -113,8 +121,9 @@ async def get_job_artifacts(
     job_id: str,
     tenant_id: str = Depends(get_tenant_id),
     svc: ArtifactsService = Depends(get_artifacts_service),
+    io: BlockingIO = Depends(get_blocking_io),
 ) -> ArtifactsIndexResponse:
-    artifacts = svc.list_artifacts(tenant_id=tenant_id, job_id=job_id)
+    artifacts = await io.run(svc.list_artifacts, tenant_id=tenant_id, job_id=job_id)
     items = [ArtifactIndexItem.model_validate(item) for item in artifacts]
     return ArtifactsIndexResponse(job_id=job_id, artifacts=items)
 
@@ -123,16 +132,16 @@ async def get_job_artifacts(
 async def download_job_artifact(
     job_id: str,
     artifact_id: str,
+    request: Request,
     tenant_id: str = Depends(get_tenant_id),
     svc: ArtifactsService = Depends(get_artifacts_service),
+    io: BlockingIO = Depends(get_blocking_io),
 ) -> Response:
-    path = svc.resolve_download_path(tenant_id=tenant_id, job_id=job_id, rel_path=artifact_id)
-    filename = artifact_id.rsplit("/", 1)[-1]
-    return Response(
-        content=path.read_bytes(),
-        media_type="application/octet-stream",
-        headers={"Content-Disposition": f'attachment; filename=\"{filename}\"'},
+    path = await io.run(
+        svc.resolve_download_path, tenant_id=tenant_id, job_id=job_id, rel_path=artifact_id
     )
+    filename = artifact_id.rsplit("/", 1)[-1]
+    return await io.run(artifact_file_response, request=request, path=path, filename=filename)
 
 
 @router.post("/jobs/{job_id}/run", response_model=RunJobResponse)
@@ -141,8 +150,11 @@ async def run_job(
     output_formats: list[str] | None = Query(default=None),
     tenant_id: str = Depends(get_tenant_id),
     svc: JobService = Depends(get_job_service),
+    io: BlockingIO = Depends(get_blocking_io),
 ) -> RunJobResponse:
-    job = svc.trigger_run(tenant_id=tenant_id, job_id=job_id, output_formats=output_formats)
+    job = await io.run(
+        svc.trigger_run, tenant_id=tenant_id, job_id=job_id, output_formats=output_formats
+    )
     return RunJobResponse(job_id=job.job_id, status=job.status.value, scheduled_at=job.scheduled_at)
 
 
@@ -152,20 +164,19 @@ async def confirm_job(
     payload: ConfirmJobRequest = Body(...),
     tenant_id: str = Depends(get_tenant_id),
     svc: JobService = Depends(get_job_service),
+    io: BlockingIO = Depends(get_blocking_io),
 ) -> ConfirmJobResponse:
-    job = await anyio.to_thread.run_sync(
-        partial(
-            svc.confirm_job,
-            tenant_id=tenant_id,
-            job_id=job_id,
-            confirmed=payload.confirmed,
-            notes=payload.notes,
-            output_formats=payload.output_formats,
-            variable_corrections=payload.variable_corrections,
-            answers=payload.answers,
-            default_overrides=payload.default_overrides,
-            expert_suggestions_feedback=payload.expert_suggestions_feedback,
-        )
+    job = await io.run(
+        svc.confirm_job,
+        tenant_id=tenant_id,
+        job_id=job_id,
+        confirmed=payload.confirmed,
+        notes=payload.notes,
+        output_formats=payload.output_formats,
+        variable_corrections=payload.variable_corrections,
+        answers=payload.answers,
+        default_overrides=payload.default_overrides,
+        expert_suggestions_feedback=payload.expert_suggestions_feedback,
     )
     return ConfirmJobResponse(
         job_id=job.job_id,
@@ -181,18 +192,17 @@ async def freeze_plan(
     payload: FreezePlanRequest = Body(default_factory=FreezePlanRequest),
     tenant_id: str = Depends(get_tenant_id),
     svc: PlanService = Depends(get_plan_service),
+    io: BlockingIO = Depends(get_blocking_io),
 ) -> FreezePlanResponse:
-    plan = await anyio.to_thread.run_sync(
-        partial(
-            svc.freeze_plan,
-            tenant_id=tenant_id,
-            job_id=job_id,
-            confirmation=JobConfirmation(
-                notes=payload.notes,
-                answers=payload.answers,
-                variable_corrections=payload.variable_corrections,
-            ),
-        )
+    plan = await io.run(
+        svc.freeze_plan,
+        tenant_id=tenant_id,
+        job_id=job_id,
+        confirmation=JobConfirmation(
+            notes=payload.notes,
+            answers=payload.answers,
+            variable_corrections=payload.variable_corrections,
+        ),
     )
     return FreezePlanResponse(
         job_id=job_id,
@@ -205,8 +215,9 @@ async def get_plan(
     job_id: str,
     tenant_id: str = Depends(get_tenant_id),
     svc: PlanService = Depends(get_plan_service),
+    io: BlockingIO = Depends(get_blocking_io),
 ) -> GetPlanResponse:
-    plan = svc.get_frozen_plan(tenant_id=tenant_id, job_id=job_id)
+    plan = await io.run(svc.get_frozen_plan, tenant_id=tenant_id, job_id=job_id)
     return GetPlanResponse(
         job_id=job_id,
         plan=LLMPlanResponse.model_validate(plan.model_dump(mode="json")),
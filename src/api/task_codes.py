@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from fastapi import APIRouter, Body, Depends
 
+from src.api.blocking_io import BlockingIO
 from src.api.deps import get_task_code_redeem_service, get_tenant_id
+from src.api.io_deps import get_blocking_io
 from src.api.schemas import TaskCodeRedeemRequest, TaskCodeRedeemResponse
 from src.domain.task_code_redeem_service import TaskCodeRedeemService
 
@@ -14,8 +16,10 @@ async def redeem_task_code(
     payload: TaskCodeRedeemRequest = Body(...),
     tenant_id: str = Depends(get_tenant_id),
     svc: TaskCodeRedeemService = Depends(get_task_code_redeem_service),
+    io: BlockingIO = Depends(get_blocking_io),
 ) -> TaskCodeRedeemResponse:
-    result = svc.redeem(
+    result = await io.run(
+        svc.redeem,
         tenant_id=tenant_id,
         task_code=payload.task_code,
         requirement=payload.requirement,
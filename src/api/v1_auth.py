@@ -4,8 +4,9 @@ from datetime import datetime
 
 from fastapi import Depends, Header
 
-from src.api.deps import get_job_store, get_tenant_id
-from src.domain.job_store import JobStore
+from src.api.async_stores import AsyncJobStore
+from src.api.deps import get_tenant_id
+from src.api.io_deps import get_async_job_store
 from src.domain.upload_session_id import job_id_from_upload_session_id
 from src.infra.auth_exceptions import (
     AuthBearerTokenInvalidError,
@@ -20,13 +21,13 @@ async def enforce_v1_job_bearer_auth(
     job_id: str | None = None,
     authorization: str | None = Header(default=None, alias="Authorization"),
     tenant_id: str = Depends(get_tenant_id),
-    store: JobStore = Depends(get_job_store),
+    store: AsyncJobStore = Depends(get_async_job_store),
 ) -> None:
     if job_id is None:
         return
     if not job_id.startswith("job_tc_"):
         return
-    job = store.load(tenant_id=tenant_id, job_id=job_id)
+    job = await store.load(tenant_id=tenant_id, job_id=job_id)
     required = getattr(job, "auth_token", None)
     if not isinstance(required, str) or required.strip() == "":
         return
@@ -45,7 +46,7 @@ async def enforce_v1_upload_session_bearer_auth(
     upload_session_id: str | None = None,
     authorization: str | None = Header(default=None, alias="Authorization"),
     tenant_id: str = Depends(get_tenant_id),
-    store: JobStore = Depends(get_job_store),
+    store: AsyncJobStore = Depends(get_async_job_store),
 ) -> None:
     if upload_session_id is None:
         return
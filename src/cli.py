@@ -1,11 +1,18 @@
 from __future__ import annotations
 
 import argparse
+import os
 
+from src.cli_archive_jobs import cmd_archive_jobs
+from src.cli_job_index import cmd_rebuild_job_index
+from src.cli_migrate_jobs import cmd_migrate_jobs
 from src.cli_run_template import cmd_run_template
 from src.cli_smoke_suite import cmd_run_smoke_suite
+from src.cli_sqlite_migrate import cmd_migrate_jobs_to_sqlite
 from src.cli_templates import cmd_list_templates
 from src.config import load_config
+from src.infra.durability import configure_durability
+from src.infra.job_archive import ARCHIVE_FILENAMES
 from src.infra.logging_config import configure_logging
 
 
@@ -33,6 +40,30 @@ def build_parser() -> argparse.ArgumentParser:
     smoke_cmd.add_argument("--manifest", help="Path to smoke-suite manifest JSON")
     smoke_cmd.add_argument("--report-path", default="smoke_suite_report.json")
     smoke_cmd.add_argument("--timeout-seconds", type=int, default=300)
+
+    sub.add_parser(
+        "migrate-jobs-to-sqlite",
+        help="Copy file-backed job.json documents into the SQLite job store (idempotent)",
+    )
+    migrate_cmd = sub.add_parser(
+        "migrate-jobs",
+        help="Rewrite every job.json at the current schema version (parallel, resumable)",
+    )
+    migrate_cmd.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    migrate_cmd.add_argument(
+        "--state-path", help="Resume file (default: <jobs_dir>/_migrate_jobs.state)"
+    )
+    migrate_cmd.add_argument("--restart", action="store_true", help="Ignore the resume file")
+    archive_cmd = sub.add_parser(
+        "archive-jobs",
+        help="Pack workspaces of finished jobs older than the configured age into one archive",
+    )
+    archive_cmd.add_argument("--min-age-days", type=int)
+    archive_cmd.add_argument("--format", choices=sorted(ARCHIVE_FILENAMES))
+    sub.add_parser(
+        "rebuild-job-index",
+        help="Rebuild the admin job index from job.json files (cold start or drift repair)",
+    )
     return parser
 
 
@@ -40,6 +71,7 @@ def main(argv: list[str] | None = None) -> int:
     args = build_parser().parse_args(argv)
     config = load_config()
     configure_logging(log_level=config.log_level)
+    configure_durability(config=config)
 
     if args.cmd == "list-templates":
         return cmd_list_templates(
@@ -65,6 +97,27 @@ def main(argv: list[str] | None = None) -> int:
             sample_data=bool(args.sample_data),
         )
 
+    if args.cmd == "migrate-jobs-to-sqlite":
+        return cmd_migrate_jobs_to_sqlite(config=config)
+
+    if args.cmd == "migrate-jobs":
+        return cmd_migrate_jobs(
+            config=config,
+            workers=int(args.workers),
+            state_path=str(args.state_path) if args.state_path is not None else None,
+            restart=bool(args.restart),
+        )
+
+    if args.cmd == "archive-jobs":
+        return cmd_archive_jobs(
+            config=config,
+            min_age_days=int(args.min_age_days) if args.min_age_days is not None else None,
+            archive_format=str(args.format) if args.format is not None else None,
+        )
+
+    if args.cmd == "rebuild-job-index":
+        return cmd_rebuild_job_index(config=config)
+
     return 2
 
 
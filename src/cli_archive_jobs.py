@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from datetime import timedelta
+
+from src.config import Config
+from src.infra.job_archive import ARCHIVE_FILENAMES, ARCHIVE_LOCKS_DIRNAME
+from src.infra.job_archiver import archive_terminal_jobs
+from src.infra.job_indexer_factory import build_job_indexer, ensure_job_index
+from src.infra.job_store_factory import build_job_store
+from src.utils.time import utc_now
+
+
+def cmd_archive_jobs(
+    *, config: Config, min_age_days: int | None, archive_format: str | None
+) -> int:
+    days = config.job_archive_min_age_days if min_age_days is None else min_age_days
+    resolved_format = config.job_archive_format if archive_format is None else archive_format
+    if resolved_format not in ARCHIVE_FILENAMES:
+        print(f"format={resolved_format} failed=1 reason=unsupported_archive_format")
+        return 2
+    ensure_job_index(config=config)
+    report = archive_terminal_jobs(
+        jobs_dir=config.jobs_dir,
+        lock_dir=config.job_archive_cache_dir / ARCHIVE_LOCKS_DIRNAME,
+        store=build_job_store(config=config),
+        indexer=build_job_indexer(config=config),
+        archive_format=resolved_format,
+        min_age=timedelta(days=max(0, days)),
+        now=utc_now(),
+    )
+    print(
+        f"jobs_dir={config.jobs_dir} archived={report.archived} skipped={report.skipped} "
+        f"failed={report.failed} files={report.files} bytes={report.bytes}"
+    )
+    return 0 if report.failed == 0 else 1
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+from src.config import Config
+from src.infra.file_job_indexer import FileJobIndexer
+from src.infra.sqlite_database import SQLiteDatabase
+from src.infra.sqlite_job_index import SQLiteJobIndex, rebuild_file_job_index
+
+
+def cmd_rebuild_job_index(*, config: Config) -> int:
+    if config.job_store_backend == "sqlite":
+        print(f"sqlite={config.sqlite_path} skipped=1 reason=sqlite_job_store_is_indexed")
+        return 0
+    report = rebuild_file_job_index(
+        scanner=FileJobIndexer(jobs_dir=config.jobs_dir),
+        index=SQLiteJobIndex(db=SQLiteDatabase(path=config.sqlite_path)),
+    )
+    print(f"sqlite={config.sqlite_path} indexed={report.indexed} removed={report.removed}")
+    return 0
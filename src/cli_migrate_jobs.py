@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+from src.config import Config
+from src.infra.job_schema_migration import (
+    DEFAULT_STATE_FILENAME,
+    JobSchemaMigrationProgress,
+    migrate_job_schemas,
+)
+
+
+def cmd_migrate_jobs(*, config: Config, workers: int, state_path: str | None, restart: bool) -> int:
+    if config.job_store_backend == "sqlite":
+        print(f"sqlite={config.sqlite_path} skipped=1 reason=file_job_store_only")
+        return 0
+    resolved_state = (
+        Path(state_path) if state_path is not None else config.jobs_dir / DEFAULT_STATE_FILENAME
+    )
+    report = migrate_job_schemas(
+        jobs_dir=config.jobs_dir,
+        state_path=resolved_state,
+        workers=max(1, workers),
+        compact_json=config.job_store_json_compact,
+        restart=restart,
+        on_progress=_print_progress,
+    )
+    print(
+        f"jobs_dir={config.jobs_dir} total={report.total} migrated={report.migrated} "
+        f"unchanged={report.unchanged} resumed={report.resumed} failed={report.failed}"
+    )
+    return 0 if report.failed == 0 else 1
+
+
+def _print_progress(progress: JobSchemaMigrationProgress) -> None:
+    print(
+        f"progress done={progress.done}/{progress.total} migrated={progress.migrated} "
+        f"unchanged={progress.unchanged} failed={progress.failed} "
+        f"rate={progress.rate_per_second:.1f}/s",
+        file=sys.stderr,
+        flush=True,
+    )
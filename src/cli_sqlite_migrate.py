@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from src.config import Config
+from src.infra.sqlite_database import SQLiteDatabase
+from src.infra.sqlite_job_migration import migrate_file_jobs_to_sqlite
+
+
+def cmd_migrate_jobs_to_sqlite(*, config: Config) -> int:
+    report = migrate_file_jobs_to_sqlite(
+        jobs_dir=config.jobs_dir,
+        db=SQLiteDatabase(path=config.sqlite_path),
+    )
+    print(
+        f"sqlite={config.sqlite_path} migrated={report.migrated} "
+        f"skipped={report.skipped} failed={report.failed}"
+    )
+    return 0 if report.failed == 0 else 1
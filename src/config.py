@@ -16,9 +16,15 @@ from src.utils.env import (
 from src.utils.env import (
     clamped_ratio as _clamped_ratio,
 )
+from src.utils.env import (
+    float_pairs as _float_pairs,
+)
 from src.utils.env import (
     float_value as _float_value,
 )
+from src.utils.env import (
+    int_pairs as _int_pairs,
+)
 from src.utils.env import (
     int_value as _int_value,
 )
@@ -57,6 +63,28 @@ class Config:
     upload_multipart_max_parts: int
     upload_max_bundle_files: int
     ss_env: str = field(default="development", kw_only=True)
+    queue_backend: str = field(default="file", kw_only=True)
+    sqlite_path: Path = field(default=Path("./jobs/_ss.sqlite3"), kw_only=True)
+    queue_notifier: str = field(default="none", kw_only=True)
+    queue_tenant_weights: tuple[tuple[str, float], ...] = field(default=(), kw_only=True)
+    queue_tenant_max_inflight: tuple[tuple[str, int], ...] = field(default=(), kw_only=True)
+    job_cache_max_entries: int = field(default=1024, kw_only=True)
+    job_journal_compact_entries: int = field(default=64, kw_only=True)
+    job_store_json_compact: bool = field(default=False, kw_only=True)
+    job_store_read_only_loads: bool = field(default=False, kw_only=True)
+    queue_json_compact: bool = field(default=False, kw_only=True)
+    durability_policy: str = field(default="always", kw_only=True)
+    durability_group_commit_ms: int = field(default=5, kw_only=True)
+    job_archive_format: str = field(default="zip", kw_only=True)
+    job_archive_min_age_days: int = field(default=30, kw_only=True)
+    job_archive_cache_dir: Path = field(default=Path("./jobs/_archive_cache"), kw_only=True)
+    job_archive_cache_max_jobs: int = field(default=64, kw_only=True)
+    dataset_preview_cache_dir: Path = field(default=Path("./jobs/_preview_cache"), kw_only=True)
+    dataset_preview_cache_max_bytes: int = field(default=256 * 1024 * 1024, kw_only=True)
+    dataset_sidecar_enabled: bool = field(default=True, kw_only=True)
+    run_result_cache_dir: Path = field(default=Path("./jobs/_run_cache"), kw_only=True)
+    run_result_cache_max_bytes: int = field(default=2 * 1024 * 1024 * 1024, kw_only=True)
+    api_blocking_io_max_workers: int = field(default=32, kw_only=True)
     llm_provider: str = field(default="", kw_only=True)
     llm_base_url: str = field(default="https://yunwu.ai/v1", kw_only=True)
     llm_api_key: str = field(default="", kw_only=True)
@@ -74,6 +102,8 @@ class Config:
     worker_retry_backoff_base_seconds: float
     worker_retry_backoff_max_seconds: float
     worker_metrics_port: int = 8001
+    worker_concurrency: int = field(default=1, kw_only=True)
+    composition_max_parallel_steps: int = field(default=1, kw_only=True)
     tracing_enabled: bool = field(default=False, kw_only=True)
     tracing_service_name: str = field(default="ss", kw_only=True)
     tracing_exporter: str = field(default="otlp", kw_only=True)
@@ -114,7 +144,52 @@ def load_config(env: Mapping[str, str] | None = None) -> Config:
     job_store_redis_url = str(e.get("SS_JOB_STORE_REDIS_URL", "")).strip()
     queue_dir = Path(str(e.get("SS_QUEUE_DIR", "./queue"))).expanduser()
     queue_lease_ttl_seconds = _int_value(str(e.get("SS_QUEUE_LEASE_TTL_SECONDS", "60")), default=60)
+    queue_backend = str(e.get("SS_QUEUE_BACKEND", "file")).strip().lower()
+    queue_notifier = str(e.get("SS_QUEUE_NOTIFIER", "none")).strip().lower()
+    queue_tenant_weights = _float_pairs(str(e.get("SS_QUEUE_TENANT_WEIGHTS", "")))
+    queue_tenant_max_inflight = _int_pairs(str(e.get("SS_QUEUE_TENANT_MAX_INFLIGHT", "")))
+    job_cache_max_entries = _int_value(str(e.get("SS_JOB_CACHE_MAX_ENTRIES", "1024")), default=1024)
+    job_journal_compact_entries = _int_value(
+        str(e.get("SS_JOB_JOURNAL_COMPACT_ENTRIES", "64")), default=64
+    )
+    job_store_json_compact = _bool_value(
+        str(e.get("SS_JOB_STORE_JSON_COMPACT", "0")), default=False
+    )
+    job_store_read_only_loads = _bool_value(
+        str(e.get("SS_JOB_STORE_READ_ONLY_LOADS", "0")), default=False
+    )
+    queue_json_compact = _bool_value(str(e.get("SS_QUEUE_JSON_COMPACT", "0")), default=False)
+    durability_policy = str(e.get("SS_DURABILITY_POLICY", "always")).strip().lower()
+    durability_group_commit_ms = _int_value(
+        str(e.get("SS_DURABILITY_GROUP_COMMIT_MS", "5")), default=5
+    )
+    sqlite_path = Path(str(e.get("SS_SQLITE_PATH", str(jobs_dir / "_ss.sqlite3")))).expanduser()
     admin_data_dir = Path(str(e.get("SS_ADMIN_DATA_DIR", str(jobs_dir / "_admin")))).expanduser()
+    job_archive_format = str(e.get("SS_JOB_ARCHIVE_FORMAT", "zip")).strip().lower()
+    job_archive_min_age_days = _int_value(
+        str(e.get("SS_JOB_ARCHIVE_MIN_AGE_DAYS", "30")), default=30
+    )
+    job_archive_cache_dir = Path(
+        str(e.get("SS_JOB_ARCHIVE_CACHE_DIR", str(jobs_dir / "_archive_cache")))
+    ).expanduser()
+    job_archive_cache_max_jobs = _int_value(
+        str(e.get("SS_JOB_ARCHIVE_CACHE_MAX_JOBS", "64")), default=64
+    )
+    dataset_preview_cache_dir = Path(
+        str(e.get("SS_DATASET_PREVIEW_CACHE_DIR", str(jobs_dir / "_preview_cache")))
+    ).expanduser()
+    dataset_preview_cache_max_bytes = _int_value(
+        str(e.get("SS_DATASET_PREVIEW_CACHE_MAX_BYTES", "268435456")), default=268435456
+    )
+    dataset_sidecar_enabled = _bool_value(
+        str(e.get("SS_DATASET_SIDECAR_ENABLED", "1")), default=True
+    )
+    run_result_cache_dir = Path(
+        str(e.get("SS_RUN_RESULT_CACHE_DIR", str(jobs_dir / "_run_cache")))
+    ).expanduser()
+    run_result_cache_max_bytes = _int_value(
+        str(e.get("SS_RUN_RESULT_CACHE_MAX_BYTES", "2147483648")), default=2147483648
+    )
     admin_username = str(e.get("SS_ADMIN_USERNAME", "admin")).strip()
     admin_username = "admin" if admin_username == "" else admin_username
     admin_password = str(e.get("SS_ADMIN_PASSWORD", "")).strip()
@@ -237,6 +312,13 @@ def load_config(env: Mapping[str, str] | None = None) -> Config:
         default=30.0,
     )
     worker_metrics_port = _int_value(str(e.get("SS_WORKER_METRICS_PORT", "8001")), default=8001)
+    worker_concurrency = max(1, _int_value(str(e.get("SS_WORKER_CONCURRENCY", "1")), default=1))
+    composition_max_parallel_steps = max(
+        1, _int_value(str(e.get("SS_COMPOSITION_MAX_PARALLEL_STEPS", "1")), default=1)
+    )
+    api_blocking_io_max_workers = max(
+        1, _int_value(str(e.get("SS_API_BLOCKING_IO_MAX_WORKERS", "32")), default=32)
+    )
     return Config(
         jobs_dir=jobs_dir,
         job_store_backend=job_store_backend,
@@ -244,6 +326,27 @@ def load_config(env: Mapping[str, str] | None = None) -> Config:
         job_store_redis_url=job_store_redis_url,
         queue_dir=queue_dir,
         queue_lease_ttl_seconds=queue_lease_ttl_seconds,
+        queue_backend=queue_backend,
+        sqlite_path=sqlite_path,
+        queue_notifier=queue_notifier,
+        queue_tenant_weights=queue_tenant_weights,
+        queue_tenant_max_inflight=queue_tenant_max_inflight,
+        job_cache_max_entries=job_cache_max_entries,
+        job_journal_compact_entries=job_journal_compact_entries,
+        job_store_json_compact=job_store_json_compact,
+        job_store_read_only_loads=job_store_read_only_loads,
+        queue_json_compact=queue_json_compact,
+        durability_policy=durability_policy,
+        durability_group_commit_ms=durability_group_commit_ms,
+        job_archive_format=job_archive_format,
+        job_archive_min_age_days=job_archive_min_age_days,
+        job_archive_cache_dir=job_archive_cache_dir,
+        job_archive_cache_max_jobs=job_archive_cache_max_jobs,
+        dataset_preview_cache_dir=dataset_preview_cache_dir,
+        dataset_preview_cache_max_bytes=dataset_preview_cache_max_bytes,
+        dataset_sidecar_enabled=dataset_sidecar_enabled,
+        run_result_cache_dir=run_result_cache_dir,
+        run_result_cache_max_bytes=run_result_cache_max_bytes,
         admin_data_dir=admin_data_dir,
         admin_username=admin_username,
         admin_password=admin_password,
@@ -288,4 +391,7 @@ def load_config(env: Mapping[str, str] | None = None) -> Config:
         worker_retry_backoff_base_seconds=worker_retry_backoff_base_seconds,
         worker_retry_backoff_max_seconds=worker_retry_backoff_max_seconds,
         worker_metrics_port=worker_metrics_port,
+        worker_concurrency=worker_concurrency,
+        composition_max_parallel_steps=composition_max_parallel_steps,
+        api_blocking_io_max_workers=api_blocking_io_max_workers,
     )
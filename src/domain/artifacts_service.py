@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 import logging
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import cast
 
+from src.domain.job_archive import JobArchiveReader
 from src.domain.job_store import JobStore
-from src.domain.models import is_safe_job_rel_path
+from src.domain.models import Job, is_safe_job_rel_path
 from src.infra.exceptions import ArtifactNotFoundError, ArtifactPathUnsafeError
 from src.utils.job_workspace import resolve_job_dir
 from src.utils.json_types import JsonObject
@@ -14,10 +17,49 @@ from src.utils.tenancy import DEFAULT_TENANT_ID
 logger = logging.getLogger(__name__)
 
 
+class ArtifactLookupCache:
+    """LRU of the artifact `rel_path`s known to be indexed for each job.
+
+    `artifacts_index` only ever grows, so a cached hit stays valid; a miss falls back to
+    loading the job and refreshes the entry.
+    """
+
+    def __init__(self, *, max_jobs: int = 1024):
+        self._max_jobs = max_jobs
+        self._entries: OrderedDict[tuple[str, str], frozenset[str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def contains(self, *, tenant_id: str, job_id: str, rel_path: str) -> bool:
+        key = (tenant_id, job_id)
+        with self._lock:
+            rel_paths = self._entries.get(key)
+            if rel_paths is None:
+                return False
+            self._entries.move_to_end(key)
+            return rel_path in rel_paths
+
+    def update(self, *, tenant_id: str, job_id: str, rel_paths: frozenset[str]) -> None:
+        key = (tenant_id, job_id)
+        with self._lock:
+            self._entries[key] = rel_paths
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_jobs:
+                self._entries.popitem(last=False)
+
+
 class ArtifactsService:
-    def __init__(self, *, store: JobStore, jobs_dir: Path):
+    def __init__(
+        self,
+        *,
+        store: JobStore,
+        jobs_dir: Path,
+        lookup_cache: ArtifactLookupCache | None = None,
+        archive: JobArchiveReader | None = None,
+    ):
         self._store = store
         self._jobs_dir = Path(jobs_dir)
+        self._lookup = ArtifactLookupCache() if lookup_cache is None else lookup_cache
+        self._archive = archive
 
     def list_artifacts(
         self,
@@ -26,6 +68,7 @@ class ArtifactsService:
         job_id: str,
     ) -> list[JsonObject]:
         job = self._store.load(tenant_id=tenant_id, job_id=job_id)
+        self._remember(tenant_id=tenant_id, job=job)
         items: list[JsonObject] = []
         for ref in job.artifacts_index:
             extra = ref.model_extra if ref.model_extra is not None else {}
@@ -59,8 +102,7 @@ class ArtifactsService:
             )
             raise ArtifactPathUnsafeError(job_id=job_id, rel_path=rel_path)
 
-        job = self._store.load(tenant_id=tenant_id, job_id=job_id)
-        if not any(ref.rel_path == rel_path for ref in job.artifacts_index):
+        if not self._is_indexed(tenant_id=tenant_id, job_id=job_id, rel_path=rel_path):
             raise ArtifactNotFoundError(job_id=job_id, rel_path=rel_path)
 
         job_dir = resolve_job_dir(jobs_dir=self._jobs_dir, tenant_id=tenant_id, job_id=job_id)
@@ -71,7 +113,12 @@ class ArtifactsService:
         try:
             resolved = candidate.resolve(strict=True)
         except FileNotFoundError as e:
-            raise ArtifactNotFoundError(job_id=job_id, rel_path=rel_path) from e
+            archived = self._resolve_archived(
+                tenant_id=tenant_id, job_id=job_id, job_dir=job_dir, rel_path=rel_path
+            )
+            if archived is None:
+                raise ArtifactNotFoundError(job_id=job_id, rel_path=rel_path) from e
+            return archived
 
         if not resolved.is_relative_to(base):
             logger.warning(
@@ -84,3 +131,23 @@ class ArtifactsService:
             raise ArtifactNotFoundError(job_id=job_id, rel_path=rel_path)
 
         return resolved
+
+    def _resolve_archived(
+        self, *, tenant_id: str, job_id: str, job_dir: Path, rel_path: str
+    ) -> Path | None:
+        if self._archive is None:
+            return None
+        return self._archive.resolve_archived(
+            tenant_id=tenant_id, job_id=job_id, job_dir=job_dir, rel_path=rel_path
+        )
+
+    def _is_indexed(self, *, tenant_id: str, job_id: str, rel_path: str) -> bool:
+        if self._lookup.contains(tenant_id=tenant_id, job_id=job_id, rel_path=rel_path):
+            return True
+        job = self._store.load(tenant_id=tenant_id, job_id=job_id)
+        return rel_path in self._remember(tenant_id=tenant_id, job=job)
+
+    def _remember(self, *, tenant_id: str, job: Job) -> frozenset[str]:
+        rel_paths = frozenset(ref.rel_path for ref in job.artifacts_index)
+        self._lookup.update(tenant_id=tenant_id, job_id=job.job_id, rel_paths=rel_paths)
+        return rel_paths
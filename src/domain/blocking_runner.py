@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import ParamSpec, Protocol, TypeVar
+
+P = ParamSpec("P")
+T = TypeVar("T")
+
+
+class BlockingRunner(Protocol):
+    """Runs a synchronous, disk- or CPU-bound call for async code (the API passes `BlockingIO`)."""
+
+    async def run(self, func: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs) -> T: ...
+
+
+class InlineBlockingRunner:
+    """Calls on the awaiting thread; for callers without an event loop to keep free."""
+
+    async def run(self, func: Callable[P, T], /, *args: P.args, **kwargs: P.kwargs) -> T:
+        return func(*args, **kwargs)
+
+
+INLINE_BLOCKING_RUNNER = InlineBlockingRunner()
@@ -0,0 +1,215 @@
+from __future__ import annotations
+
+import json
+import logging
+from collections.abc import Mapping
+from pathlib import Path
+
+from src.domain.models import ArtifactKind, ArtifactRef
+from src.domain.run_result_cache import (
+    RunResultCache,
+    run_cache_key,
+    staged_inputs_fingerprint,
+    template_is_deterministic,
+)
+from src.domain.stata_runner import RunResult, StataRunner
+from src.infra.stata_run_support import DO_FILENAME, META_FILENAME, RunDirs, write_json
+from src.utils.json_types import JsonObject, JsonValue
+
+logger = logging.getLogger(__name__)
+
+
+def run_with_result_cache(
+    *,
+    runner: StataRunner,
+    cache: RunResultCache | None,
+    dirs: RunDirs,
+    tenant_id: str,
+    job_id: str,
+    run_id: str,
+    do_file: str,
+    timeout_seconds: int | None,
+    template_id: str,
+    template_meta: Mapping[str, object],
+    bypass: bool = False,
+) -> RunResult:
+    """`runner.run`, unless an identical successful run is in `cache` (None disables it).
+
+    On a hit the cached `work/` outputs and runner artifacts are restored into `dirs` and
+    Stata is not started; callers archive outputs and write evidence exactly as after a run.
+    """
+    lookup = _cache_lookup(
+        cache=cache,
+        dirs=dirs,
+        tenant_id=tenant_id,
+        job_id=job_id,
+        run_id=run_id,
+        do_file=do_file,
+        template_id=template_id,
+        template_meta=template_meta,
+        bypass=bypass,
+    )
+    if lookup is not None:
+        cache, key = lookup
+        cached = cache.restore(key, run_dir=dirs.run_dir)
+        restored = None if cached is None else _restored_result(
+            cached=cached, dirs=dirs, job_id=job_id, run_id=run_id, key=key
+        )
+        if restored is not None:
+            return restored
+    result = runner.run(
+        tenant_id=tenant_id,
+        job_id=job_id,
+        run_id=run_id,
+        do_file=do_file,
+        timeout_seconds=timeout_seconds,
+    )
+    if lookup is not None and result.ok:
+        cache, key = lookup
+        cache.store(
+            key,
+            run_dir=dirs.run_dir,
+            files=_run_files(dirs=dirs, result=result),
+            result=_result_payload(dirs=dirs, result=result),
+        )
+    return result
+
+
+def _cache_lookup(
+    *,
+    cache: RunResultCache | None,
+    dirs: RunDirs,
+    tenant_id: str,
+    job_id: str,
+    run_id: str,
+    do_file: str,
+    template_id: str,
+    template_meta: Mapping[str, object],
+    bypass: bool,
+) -> tuple[RunResultCache, str] | None:
+    if cache is None:
+        return None
+    if bypass or not template_is_deterministic(template_meta):
+        logger.info(
+            "SS_RUN_RESULT_CACHE_BYPASS",
+            extra={
+                "job_id": job_id,
+                "run_id": run_id,
+                "template_id": template_id,
+                "reason": "requested" if bypass else "template_not_deterministic",
+            },
+        )
+        return None
+    key = _cache_key(
+        cache=cache,
+        dirs=dirs,
+        tenant_id=tenant_id,
+        do_file=do_file,
+        template_id=template_id,
+        template_meta=template_meta,
+    )
+    return None if key is None else (cache, key)
+
+
+def _cache_key(
+    *,
+    cache: RunResultCache,
+    dirs: RunDirs,
+    tenant_id: str,
+    do_file: str,
+    template_id: str,
+    template_meta: Mapping[str, object],
+) -> str | None:
+    version = template_meta.get("version")
+    try:
+        inputs = staged_inputs_fingerprint(dirs.job_dir / "inputs")
+    except OSError as e:
+        logger.warning("SS_RUN_RESULT_CACHE_KEY_FAILED", extra={"error": str(e)})
+        return None
+    return run_cache_key(
+        tenant_id=tenant_id,
+        do_file=do_file,
+        inputs=inputs,
+        stata_cmd=cache.stata_cmd,
+        template_id=template_id,
+        template_version=version if isinstance(version, str) else None,
+    )
+
+
+def _run_files(*, dirs: RunDirs, result: RunResult) -> list[str]:
+    # Staged inputs are rebuilt from the job; the do-file is the key itself.
+    files = [
+        path.relative_to(dirs.run_dir).as_posix()
+        for path in sorted(dirs.work_dir.rglob("*"))
+        if path.is_file()
+        and not path.is_symlink()
+        and path.relative_to(dirs.work_dir).parts[0] not in ("inputs", DO_FILENAME)
+    ]
+    files.extend(_run_relative(dirs=dirs, ref=ref) for ref in result.artifacts)
+    return files
+
+
+def _run_relative(*, dirs: RunDirs, ref: ArtifactRef) -> str:
+    return (dirs.job_dir / ref.rel_path).relative_to(dirs.run_dir).as_posix()
+
+
+def _result_payload(*, dirs: RunDirs, result: RunResult) -> JsonObject:
+    artifacts: list[JsonValue] = [
+        {"kind": ref.kind.value, "path": _run_relative(dirs=dirs, ref=ref)}
+        for ref in result.artifacts
+    ]
+    return {
+        "exit_code": result.exit_code,
+        "artifacts": artifacts,
+        "source_job_id": result.job_id,
+        "source_run_id": result.run_id,
+    }
+
+
+def _restored_result(
+    *, cached: JsonObject, dirs: RunDirs, job_id: str, run_id: str, key: str
+) -> RunResult | None:
+    raw_artifacts = cached.get("artifacts")
+    exit_code = cached.get("exit_code")
+    try:
+        artifacts = tuple(
+            ArtifactRef(
+                kind=ArtifactKind(str(item["kind"])),
+                rel_path=(dirs.run_dir / str(item["path"])).relative_to(dirs.job_dir).as_posix(),
+            )
+            for item in (raw_artifacts if isinstance(raw_artifacts, list) else [])
+            if isinstance(item, dict)
+        )
+    except (KeyError, ValueError):
+        return None
+    provenance: JsonObject = {
+        "key": key,
+        "source_job_id": cached.get("source_job_id"),
+        "source_run_id": cached.get("source_run_id"),
+    }
+    _rewrite_run_meta(
+        path=dirs.artifacts_dir / META_FILENAME, job_id=job_id, run_id=run_id, provenance=provenance
+    )
+    logger.info(
+        "SS_RUN_RESULT_CACHE_HIT",
+        extra={"job_id": job_id, "run_id": run_id, **provenance},
+    )
+    return RunResult(
+        job_id=job_id,
+        run_id=run_id,
+        ok=True,
+        exit_code=exit_code if isinstance(exit_code, int) else None,
+        timed_out=False,
+        artifacts=artifacts,
+    )
+
+
+def _rewrite_run_meta(*, path: Path, job_id: str, run_id: str, provenance: JsonObject) -> None:
+    try:
+        meta = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return
+    if not isinstance(meta, dict):
+        return
+    meta.update({"job_id": job_id, "run_id": run_id, "run_cache": provenance})
+    write_json(path, meta)
@@ -65,6 +65,14 @@ def apply_conditional_skip(
     return {sid: f"conditional_branch_not_selected (by {step.step_id})" for sid in skipped}
 
 
+def conditional_branch_step_ids(*, step: PlanStep) -> set[str]:
+    """Steps named in `step`'s condition branches, whichever branch is selected."""
+    raw = step.params.get("condition")
+    if not isinstance(raw, Mapping):
+        return set()
+    return _ids(raw.get("true_steps")) | _ids(raw.get("false_steps"))
+
+
 def ensure_no_depends_on_skipped(*, step: PlanStep, skip_reason: Mapping[str, str]) -> None:
     for dep in step.depends_on:
         if dep in skip_reason:
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+
+from src.domain.composition_exec.conditional import conditional_branch_step_ids
+from src.domain.composition_exec.pipeline import fail_pipeline
+from src.domain.composition_exec.step_execution import (
+    PipelineContext,
+    StartedStep,
+    finish_step,
+    reuse_step,
+    run_started_step,
+    start_step,
+)
+from src.domain.composition_exec.types import ExecutionState
+from src.domain.models import PlanStep
+from src.domain.stata_runner import RunError, RunResult
+
+logger = logging.getLogger(__name__)
+
+
+class DagScheduler:
+    """Runs composition steps as a DAG, with up to `max_parallel` Stata runs at once.
+
+    Staging, do-file rendering and recording results happen on the calling thread; only
+    `runner.run` goes to the pool, so `ExecutionState` is never shared across threads. Each
+    step records into its own fragment (sharing `products` and `skip_reason`), and fragments
+    are merged in `order`, so the summary does not depend on completion order. Steps named in
+    a conditional's branches also wait for that conditional, as they would run in `order`.
+    With `max_parallel == 1` steps run inline, one at a time, in `order`.
+    """
+
+    def __init__(self, *, ctx: PipelineContext, order: list[str], max_parallel: int):
+        self._ctx = ctx
+        self._order = order
+        self._index = {step_id: i for i, step_id in enumerate(order)}
+        self._limit = max(1, min(max_parallel, len(order)))
+        self._shared = ExecutionState(
+            products={}, step_summaries=[], skip_reason={}, decisions=[], artifacts=[]
+        )
+        self._fragments = {step_id: self._fragment() for step_id in order}
+        self._waits_on = _waits_on(order=order, steps_by_id=ctx.steps_by_id)
+        self._pending = list(order)
+        self._done: set[str] = set()
+        self._inflight: dict[Future[RunResult], StartedStep] = {}
+        self._error: tuple[int, RunError] | None = None
+
+    def run(self) -> ExecutionState | RunResult:
+        logger.info(
+            "SS_COMPOSITION_STEPS_SCHEDULED",
+            extra={
+                "job_id": self._ctx.job.job_id,
+                "run_id": self._ctx.pipeline_run_id,
+                "steps": len(self._order),
+                "max_parallel": self._limit,
+            },
+        )
+        if self._limit == 1:
+            self._dispatch(pool=None)
+        else:
+            with ThreadPoolExecutor(
+                max_workers=self._limit, thread_name_prefix="ss-composition-step"
+            ) as pool:
+                self._drive(pool=pool)
+        return self._result()
+
+    def _drive(self, *, pool: ThreadPoolExecutor) -> None:
+        while True:
+            if self._error is None:
+                self._dispatch(pool=pool)
+            if not self._inflight:
+                return
+            completed, _ = wait(self._inflight, return_when=FIRST_COMPLETED)
+            for future in sorted(completed, key=self._future_index):
+                started = self._inflight.pop(future)
+                self._finish(started=started, result=future.result())
+
+    def _future_index(self, future: Future[RunResult]) -> int:
+        return self._index[self._inflight[future].step.step_id]
+
+    def _dispatch(self, *, pool: ThreadPoolExecutor | None) -> None:
+        for step_id in list(self._pending):
+            if self._error is not None or len(self._inflight) >= self._limit:
+                return
+            if not self._waits_on[step_id] <= self._done:
+                continue
+            self._pending.remove(step_id)
+            started = start_step(
+                ctx=self._ctx,
+                step=self._ctx.steps_by_id[step_id],
+                state=self._fragments[step_id],
+            )
+            if started is None:
+                self._done.add(step_id)
+            elif isinstance(started, RunError):
+                self._fail(step_id=step_id, error=started)
+            elif reuse_step(ctx=self._ctx, started=started, state=self._fragments[step_id]):
+                self._done.add(step_id)
+            elif pool is None:
+                result = run_started_step(ctx=self._ctx, started=started)
+                self._finish(started=started, result=result)
+            else:
+                future = pool.submit(run_started_step, ctx=self._ctx, started=started)
+                self._inflight[future] = started
+
+    def _finish(self, *, started: StartedStep, result: RunResult) -> None:
+        step_id = started.step.step_id
+        error = finish_step(
+            ctx=self._ctx, started=started, result=result, state=self._fragments[step_id]
+        )
+        if error is not None:
+            self._fail(step_id=step_id, error=error)
+            return
+        self._done.add(step_id)
+
+    def _fail(self, *, step_id: str, error: RunError) -> None:
+        # Steps already running when the first one fails still finish; report the earliest.
+        index = self._index[step_id]
+        if self._error is None or index < self._error[0]:
+            self._error = (index, error)
+
+    def _fragment(self) -> ExecutionState:
+        return ExecutionState(
+            products=self._shared.products,
+            step_summaries=[],
+            skip_reason=self._shared.skip_reason,
+            decisions=[],
+            artifacts=[],
+        )
+
+    def _result(self) -> ExecutionState | RunResult:
+        state = self._shared
+        for step_id in self._order:
+            fragment = self._fragments[step_id]
+            state.step_summaries.extend(fragment.step_summaries)
+            state.decisions.extend(fragment.decisions)
+            state.artifacts.extend(fragment.artifacts)
+        if self._error is None:
+            return state
+        ctx = self._ctx
+        return fail_pipeline(
+            job=ctx.job,
+            pipeline_dirs=ctx.pipeline_dirs,
+            pipeline_run_id=ctx.pipeline_run_id,
+            inputs_manifest=ctx.inputs_manifest,
+            composition_mode=ctx.composition_mode,
+            steps=state.step_summaries,
+            decisions=state.decisions,
+            error=self._error[1],
+        )
+
+
+def _waits_on(*, order: list[str], steps_by_id: Mapping[str, PlanStep]) -> dict[str, set[str]]:
+    waits_on = {step_id: set(steps_by_id[step_id].depends_on) for step_id in order}
+    seen: set[str] = set()
+    for step_id in order:
+        for branch_step_id in conditional_branch_step_ids(step=steps_by_id[step_id]):
+            if branch_step_id in waits_on and branch_step_id not in seen:
+                waits_on[branch_step_id].add(step_id)
+        seen.add(step_id)
+    return waits_on
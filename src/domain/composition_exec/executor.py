@@ -31,6 +31,7 @@ def execute_composition_plan(
     shutdown_deadline: datetime | None,
     clock: Callable[[], datetime],
     do_file_generator: DoFileGenerator | None = None,
+    max_parallel_steps: int = 1,
 ) -> RunResult:
     plan = job.llm_plan
     if plan is None:
@@ -52,6 +53,7 @@ def execute_composition_plan(
         generator=generator,
         shutdown_deadline=shutdown_deadline,
         clock=clock,
+        max_parallel_steps=max_parallel_steps,
     )
 
 
@@ -67,6 +69,7 @@ def _execute_composition_plan_validated(
     generator: DoFileGenerator,
     shutdown_deadline: datetime | None,
     clock: Callable[[], datetime],
+    max_parallel_steps: int,
 ) -> RunResult:
     try:
         validate_step_ids(plan=plan)
@@ -83,6 +86,7 @@ def _execute_composition_plan_validated(
             generator=generator,
             shutdown_deadline=shutdown_deadline,
             clock=clock,
+            max_parallel_steps=max_parallel_steps,
         )
         return _finalize_pipeline(
             job=job,
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import logging
-import shutil
 from collections.abc import Mapping
 from pathlib import Path
 from typing import cast
@@ -17,6 +16,7 @@ from src.domain.composition_exec.types import (
     ResolvedProduct,
 )
 from src.domain.models import PlanStep
+from src.infra.input_blobs import BLOB_DIRNAME, InputBlobStore
 from src.infra.plan_exceptions import PlanCompositionInvalidError
 from src.infra.stata_run_support import RunDirs, write_json
 from src.utils.json_types import JsonObject, JsonValue
@@ -31,10 +31,17 @@ def materialize_step_inputs(
     dirs: RunDirs,
     inputs_by_key: Mapping[str, str],
     products: Mapping[tuple[str, str], ResolvedProduct],
+    input_sha256: Mapping[str, str] | None = None,
 ) -> MaterializedStepInputs:
+    """Link each bound dataset into the step's `inputs/` (job inputs via their blobs).
+
+    `input_sha256` maps job-relative input paths to the manifest sha256.
+    """
     bindings = _raw_input_bindings(step=step)
     inputs_dir = dirs.run_dir / "inputs"
     inputs_dir.mkdir(parents=True, exist_ok=True)
+    blobs = InputBlobStore(blobs_dir=job_dir / BLOB_DIRNAME)
+    sha256_by_rel_path = {} if input_sha256 is None else input_sha256
 
     resolved_bindings: list[ResolvedBinding] = []
     datasets: list[JsonObject] = []
@@ -47,10 +54,12 @@ def materialize_step_inputs(
             inputs_by_key=inputs_by_key,
             products=products,
         )
-        _copy_binding_to_inputs_dir(
+        _stage_binding_to_inputs_dir(
+            blobs=blobs,
             step_id=step.step_id,
             source=resolved.source_path,
             dest=inputs_dir / resolved.dest_filename,
+            sha256=sha256_by_rel_path.get(resolved.binding.source_rel_path),
         )
         resolved_bindings.append(resolved.binding)
         datasets.append(
@@ -200,10 +209,11 @@ def _resolve_product_binding(
     return _ResolvedBindingSource(binding=binding, source_path=source, dest_filename=dest_filename)
 
 
-def _copy_binding_to_inputs_dir(*, step_id: str, source: Path, dest: Path) -> None:
-    dest.parent.mkdir(parents=True, exist_ok=True)
+def _stage_binding_to_inputs_dir(
+    *, blobs: InputBlobStore, step_id: str, source: Path, dest: Path, sha256: str | None
+) -> None:
     try:
-        shutil.copy2(source, dest)
+        blobs.stage(source=source, dest=dest, sha256=sha256)
     except FileNotFoundError as e:
         raise PlanCompositionInvalidError(reason="binding_source_missing", step_id=step_id) from e
     except OSError as e:
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import cast
+
+from src.domain.composition_exec.types import ResolvedBinding, ResolvedProduct
+from src.domain.composition_plan import ProductKind
+from src.domain.dataset_preview_cache import content_sha256
+from src.domain.models import ArtifactKind, ArtifactRef, PlanStep, is_safe_job_rel_path
+from src.infra.stata_run_support import write_json
+from src.utils.json_types import JsonObject, JsonValue
+
+logger = logging.getLogger(__name__)
+
+STEP_MEMO_DIRNAME = ".step_memo"
+# Bump when what a memo records, or how a step's key is derived, changes.
+STEP_MEMO_VERSION = 1
+
+
+@dataclass(frozen=True)
+class StepMemo:
+    """A successful step run of this job that an identical step can reuse."""
+
+    key: str
+    run_id: str
+    products: tuple[ResolvedProduct, ...]
+    decisions: tuple[JsonObject, ...]
+    artifacts: tuple[ArtifactRef, ...]
+
+
+def step_memo_key(
+    *,
+    job_dir: Path,
+    step: PlanStep,
+    do_file: str,
+    bindings: tuple[ResolvedBinding, ...],
+    input_sha256: Mapping[str, str],
+) -> str:
+    """Step definition, rendered do-file and the content of every bound input or product."""
+    sources = sorted(
+        (
+            binding.role,
+            binding.dataset_ref,
+            input_sha256.get(binding.source_rel_path)
+            or content_sha256(job_dir / binding.source_rel_path),
+        )
+        for binding in bindings
+    )
+    canonical = json.dumps(
+        [
+            STEP_MEMO_VERSION,
+            step.model_dump(mode="json", exclude={"purpose", "fallback_step_id"}),
+            hashlib.sha256(do_file.encode("utf-8")).hexdigest(),
+            [list(item) for item in sources],
+        ],
+        ensure_ascii=False,
+        sort_keys=True,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    return hashlib.sha256(canonical).hexdigest()
+
+
+def write_step_memo(*, job_dir: Path, memo: StepMemo) -> None:
+    products: list[JsonValue] = []
+    try:
+        for product in memo.products:
+            products.append(
+                {
+                    "product_id": product.product_id,
+                    "kind": product.kind.value,
+                    "artifact_rel_path": product.artifact_rel_path,
+                    "sha256": content_sha256(job_dir / product.artifact_rel_path),
+                }
+            )
+        payload: JsonObject = {
+            "schema_version": STEP_MEMO_VERSION,
+            "key": memo.key,
+            "run_id": memo.run_id,
+            "products": products,
+            "decisions": cast(JsonValue, [dict(d) for d in memo.decisions]),
+            "artifacts": [
+                {"kind": ref.kind.value, "rel_path": ref.rel_path} for ref in memo.artifacts
+            ],
+        }
+        write_json(_memo_path(job_dir=job_dir, key=memo.key), payload)
+    except OSError as e:
+        logger.warning(
+            "SS_COMPOSITION_STEP_MEMO_WRITE_FAILED",
+            extra={"run_id": memo.run_id, "reason": str(e)},
+        )
+
+
+def load_step_memo(*, job_dir: Path, step_id: str, key: str) -> StepMemo | None:
+    """The memo for `key` if every product it recorded is still intact, else None."""
+    try:
+        raw = json.loads(_memo_path(job_dir=job_dir, key=key).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    if not isinstance(raw, dict) or raw.get("schema_version") != STEP_MEMO_VERSION:
+        return None
+    run_id = raw.get("run_id")
+    products = _intact_products(job_dir=job_dir, step_id=step_id, raw=raw.get("products"))
+    if not isinstance(run_id, str) or products is None:
+        return None
+    decisions = raw.get("decisions")
+    return StepMemo(
+        key=key,
+        run_id=run_id,
+        products=products,
+        decisions=tuple(d for d in decisions if isinstance(d, dict))
+        if isinstance(decisions, list)
+        else tuple(),
+        artifacts=_existing_artifacts(job_dir=job_dir, raw=raw.get("artifacts")),
+    )
+
+
+def _memo_path(*, job_dir: Path, key: str) -> Path:
+    return job_dir / STEP_MEMO_DIRNAME / f"{key}.json"
+
+
+def _intact_products(
+    *, job_dir: Path, step_id: str, raw: object
+) -> tuple[ResolvedProduct, ...] | None:
+    if not isinstance(raw, list):
+        return None
+    out: list[ResolvedProduct] = []
+    for item in raw:
+        if not isinstance(item, dict):
+            return None
+        rel_path, sha256 = item.get("artifact_rel_path"), item.get("sha256")
+        if not isinstance(rel_path, str) or not is_safe_job_rel_path(rel_path):
+            return None
+        try:
+            if content_sha256(job_dir / rel_path) != sha256:
+                return None
+            out.append(
+                ResolvedProduct(
+                    step_id=step_id,
+                    product_id=str(item["product_id"]),
+                    kind=ProductKind(str(item["kind"])),
+                    artifact_rel_path=rel_path,
+                )
+            )
+        except (OSError, KeyError, ValueError):
+            return None
+    return tuple(out)
+
+
+def _existing_artifacts(*, job_dir: Path, raw: object) -> tuple[ArtifactRef, ...]:
+    out: list[ArtifactRef] = []
+    for item in raw if isinstance(raw, list) else []:
+        if not isinstance(item, dict):
+            continue
+        try:
+            ref = ArtifactRef(kind=ArtifactKind(str(item["kind"])), rel_path=str(item["rel_path"]))
+        except (KeyError, ValueError):
+            continue
+        if (job_dir / ref.rel_path).is_file():
+            out.append(ref)
+    return tuple(out)
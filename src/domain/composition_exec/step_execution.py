@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import shutil
 from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import datetime
@@ -11,7 +12,12 @@ from src.domain.composition_exec.conditional import ensure_no_depends_on_skipped
 from src.domain.composition_exec.dofile import generate_step_do_file_or_error
 from src.domain.composition_exec.errors import error_or_default
 from src.domain.composition_exec.materialize import materialize_step_inputs
-from src.domain.composition_exec.pipeline import fail_pipeline
+from src.domain.composition_exec.memo import (
+    StepMemo,
+    load_step_memo,
+    step_memo_key,
+    write_step_memo,
+)
 from src.domain.composition_exec.products import create_products_and_decisions
 from src.domain.composition_exec.registry import register_decisions, register_products
 from src.domain.composition_exec.run_ids import step_run_id
@@ -23,156 +29,190 @@ from src.domain.models import ArtifactKind, ArtifactRef, Job, LLMPlan, PlanStep
 from src.domain.stata_runner import RunError, RunResult, StataRunner
 from src.infra.plan_exceptions import PlanCompositionInvalidError
 from src.infra.stata_run_support import RunDirs, job_rel_path, resolve_run_dirs
-from src.utils.json_types import JsonValue
+from src.utils.json_types import JsonObject, JsonValue
 
 logger = logging.getLogger(__name__)
 
 
 @dataclass(frozen=True)
-class _StepRunSuccess:
-    run_id: str
-    dirs: RunDirs
-    materialized: MaterializedStepInputs
-    result: RunResult
-
-
-@dataclass(frozen=True)
-class _StepPhaseContext:
+class PipelineContext:
     job: Job
     plan: LLMPlan
-    step: PlanStep
+    steps_by_id: Mapping[str, PlanStep]
     pipeline_dirs: RunDirs
     pipeline_run_id: str
     jobs_dir: Path
     inputs_manifest: Mapping[str, JsonValue]
     composition_mode: str
     manifest_by_key: Mapping[str, str]
+    input_sha256: Mapping[str, str]
     runner: StataRunner
     generator: DoFileGenerator
     shutdown_deadline: datetime | None
     clock: Callable[[], datetime]
-    state: ExecutionState
 
 
-def process_step(
-    *,
-    job: Job,
-    plan: LLMPlan,
-    step: PlanStep,
-    steps_by_id: Mapping[str, PlanStep],
-    pipeline_dirs: RunDirs,
-    pipeline_run_id: str,
-    jobs_dir: Path,
-    inputs_manifest: Mapping[str, JsonValue],
-    composition_mode: str,
-    manifest_by_key: Mapping[str, str],
-    runner: StataRunner,
-    generator: DoFileGenerator,
-    shutdown_deadline: datetime | None,
-    clock: Callable[[], datetime],
-    state: ExecutionState,
-) -> RunResult | None:
+@dataclass(frozen=True)
+class StartedStep:
+    """A step whose inputs are staged and do-file rendered, ready to hand to the runner."""
+
+    step: PlanStep
+    run_id: str
+    dirs: RunDirs
+    materialized: MaterializedStepInputs
+    do_file: str
+    timeout_seconds: int | None
+    memo_key: str | None
+
+
+def start_step(
+    *, ctx: PipelineContext, step: PlanStep, state: ExecutionState
+) -> StartedStep | RunError | None:
+    """Stage inputs and render the do-file; None when the step is skipped (summary recorded)."""
     if _maybe_skip_step(state=state, step=step):
         return None
     ensure_no_depends_on_skipped(step=step, skip_reason=state.skip_reason)
-    ctx = _StepPhaseContext(
-        job=job,
-        plan=plan,
-        step=step,
-        pipeline_dirs=pipeline_dirs,
-        pipeline_run_id=pipeline_run_id,
-        jobs_dir=jobs_dir,
-        inputs_manifest=inputs_manifest,
-        composition_mode=composition_mode,
-        manifest_by_key=manifest_by_key,
-        runner=runner,
-        generator=generator,
-        shutdown_deadline=shutdown_deadline,
-        clock=clock,
-        state=state,
-    )
-    run_phase = _execute_step_run_phase(ctx)
-    if isinstance(run_phase, RunResult):
-        return run_phase
-    return _execute_step_products_phase(
-        step=step,
-        steps_by_id=steps_by_id,
-        pipeline_dirs=pipeline_dirs,
-        run_phase=run_phase,
-        manifest_by_key=manifest_by_key,
-        state=state,
-    )
-
-
-def _execute_step_run_phase(ctx: _StepPhaseContext) -> _StepRunSuccess | RunResult:
-    run_id, dirs, materialized = _prepare_step_workspace(ctx=ctx)
+    run_id, dirs, materialized = _prepare_step_workspace(ctx=ctx, step=step, state=state)
     do_file_or_error = generate_step_do_file_or_error(
         generator=ctx.generator,
         plan=ctx.plan,
-        step=ctx.step,
+        step=step,
         inputs_manifest=materialized.manifest,
     )
     if isinstance(do_file_or_error, RunError):
-        return _fail_pipeline(ctx=ctx, error=do_file_or_error)
-    result = _run_step(
-        job=ctx.job,
-        runner=ctx.runner,
+        return do_file_or_error
+    try:
+        memo_key: str | None = step_memo_key(
+            job_dir=ctx.pipeline_dirs.job_dir,
+            step=step,
+            do_file=do_file_or_error,
+            bindings=materialized.bindings,
+            input_sha256=ctx.input_sha256,
+        )
+    except OSError:
+        memo_key = None
+    return StartedStep(
+        step=step,
         run_id=run_id,
+        dirs=dirs,
+        materialized=materialized,
         do_file=do_file_or_error,
-        shutdown_deadline=ctx.shutdown_deadline,
-        clock=ctx.clock,
-        step=ctx.step,
+        timeout_seconds=step_timeout_seconds(
+            step=step, shutdown_deadline=ctx.shutdown_deadline, clock=ctx.clock
+        ),
+        memo_key=memo_key,
     )
-    _record_step_artifacts(
-        state=ctx.state,
-        pipeline_dirs=ctx.pipeline_dirs,
-        result=result,
-        inputs_manifest_path=materialized.inputs_dir / "manifest.json",
+
+
+def reuse_step(*, ctx: PipelineContext, started: StartedStep, state: ExecutionState) -> bool:
+    """Record an earlier identical run of this step in place of running it; False if none.
+
+    Products are reused where the earlier run left them, so the summary points at its run.
+    `job.run_cache_bypass` forces a fresh run.
+    """
+    if started.memo_key is None or ctx.job.run_cache_bypass:
+        return False
+    job_dir = ctx.pipeline_dirs.job_dir
+    memo = load_step_memo(job_dir=job_dir, step_id=started.step.step_id, key=started.memo_key)
+    if memo is None:
+        return False
+    decisions = (*memo.decisions, _reuse_decision(step=started.step, memo=memo))
+    state.artifacts.extend(memo.artifacts)
+    register_products(state=state, products=memo.products)
+    register_decisions(
+        state=state, step=started.step, decisions=decisions, steps_by_id=ctx.steps_by_id
     )
-    if result.ok:
-        return _StepRunSuccess(run_id=run_id, dirs=dirs, materialized=materialized, result=result)
-    ctx.state.step_summaries.append(
+    state.step_summaries.append(
         executed_step_summary(
-            step=ctx.step,
-            run_id=run_id,
-            status="failed",
-            bindings=materialized.bindings,
-            products=tuple(),
-            decisions=tuple(),
+            step=started.step,
+            run_id=memo.run_id,
+            status="succeeded",
+            bindings=started.materialized.bindings,
+            products=memo.products,
+            decisions=decisions,
         )
     )
-    return _fail_pipeline(ctx=ctx, error=error_or_default(result=result))
+    if memo.run_id != started.run_id:
+        shutil.rmtree(started.dirs.run_dir, ignore_errors=True)
+    logger.info(
+        "SS_COMPOSITION_STEP_REUSED",
+        extra={
+            "job_id": ctx.job.job_id,
+            "step_id": started.step.step_id,
+            "run_id": started.run_id,
+            "source_run_id": memo.run_id,
+        },
+    )
+    return True
 
 
-def _execute_step_products_phase(
-    *,
-    step: PlanStep,
-    steps_by_id: Mapping[str, PlanStep],
-    pipeline_dirs: RunDirs,
-    run_phase: _StepRunSuccess,
-    manifest_by_key: Mapping[str, str],
-    state: ExecutionState,
-) -> RunResult | None:
+def run_started_step(*, ctx: PipelineContext, started: StartedStep) -> RunResult:
+    """The only phase that touches Stata; it reads `ctx` and `started` and nothing shared."""
+    return ctx.runner.run(
+        tenant_id=ctx.job.tenant_id,
+        job_id=ctx.job.job_id,
+        run_id=started.run_id,
+        do_file=started.do_file,
+        timeout_seconds=started.timeout_seconds,
+        inputs_dir_rel=f"runs/{started.run_id}/inputs",
+    )
+
+
+def finish_step(
+    *, ctx: PipelineContext, started: StartedStep, result: RunResult, state: ExecutionState
+) -> RunError | None:
+    """Record artifacts, products, decisions and the step summary; the error if it failed."""
+    step_artifacts = _record_step_artifacts(
+        state=state,
+        pipeline_dirs=ctx.pipeline_dirs,
+        result=result,
+        inputs_manifest_path=started.materialized.inputs_dir / "manifest.json",
+    )
+    if not result.ok:
+        state.step_summaries.append(
+            executed_step_summary(
+                step=started.step,
+                run_id=started.run_id,
+                status="failed",
+                bindings=started.materialized.bindings,
+                products=tuple(),
+                decisions=tuple(),
+            )
+        )
+        return error_or_default(result=result)
     products, decisions = create_products_and_decisions(
-        job_dir=pipeline_dirs.job_dir,
-        step=step,
-        dirs=run_phase.dirs,
-        bindings=run_phase.materialized.bindings,
-        inputs_by_key=manifest_by_key,
-        runner_artifacts=run_phase.result.artifacts,
+        job_dir=ctx.pipeline_dirs.job_dir,
+        step=started.step,
+        dirs=started.dirs,
+        bindings=started.materialized.bindings,
+        inputs_by_key=ctx.manifest_by_key,
+        runner_artifacts=result.artifacts,
     )
     register_products(state=state, products=products)
-    register_decisions(state=state, step=step, decisions=decisions, steps_by_id=steps_by_id)
+    register_decisions(
+        state=state, step=started.step, decisions=decisions, steps_by_id=ctx.steps_by_id
+    )
     state.step_summaries.append(
         executed_step_summary(
-            step=step,
-            run_id=run_phase.run_id,
+            step=started.step,
+            run_id=started.run_id,
             status="succeeded",
-            bindings=run_phase.materialized.bindings,
+            bindings=started.materialized.bindings,
             products=products,
             decisions=decisions,
         )
     )
+    if started.memo_key is not None:
+        write_step_memo(
+            job_dir=ctx.pipeline_dirs.job_dir,
+            memo=StepMemo(
+                key=started.memo_key,
+                run_id=started.run_id,
+                products=products,
+                decisions=decisions,
+                artifacts=step_artifacts,
+            ),
+        )
     return None
 
 
@@ -186,9 +226,11 @@ def _maybe_skip_step(*, state: ExecutionState, step: PlanStep) -> bool:
 
 def _prepare_step_workspace(
     *,
-    ctx: _StepPhaseContext,
+    ctx: PipelineContext,
+    step: PlanStep,
+    state: ExecutionState,
 ) -> tuple[str, RunDirs, MaterializedStepInputs]:
-    run_id = step_run_id(pipeline_run_id=ctx.pipeline_run_id, step_id=ctx.step.step_id)
+    run_id = step_run_id(pipeline_run_id=ctx.pipeline_run_id, step_id=step.step_id)
     dirs = resolve_run_dirs(
         jobs_dir=ctx.jobs_dir,
         tenant_id=ctx.job.tenant_id,
@@ -196,66 +238,38 @@ def _prepare_step_workspace(
         run_id=run_id,
     )
     if dirs is None:
-        raise PlanCompositionInvalidError(reason="step_run_dirs_invalid", step_id=ctx.step.step_id)
+        raise PlanCompositionInvalidError(reason="step_run_dirs_invalid", step_id=step.step_id)
     materialized = materialize_step_inputs(
         job_dir=ctx.pipeline_dirs.job_dir,
-        step=ctx.step,
+        step=step,
         dirs=dirs,
         inputs_by_key=ctx.manifest_by_key,
-        products=ctx.state.products,
+        products=state.products,
+        input_sha256=ctx.input_sha256,
     )
     return run_id, dirs, materialized
 
 
-def _run_step(
-    *,
-    job: Job,
-    runner: StataRunner,
-    run_id: str,
-    do_file: str,
-    shutdown_deadline: datetime | None,
-    clock: Callable[[], datetime],
-    step: PlanStep,
-) -> RunResult:
-    timeout_seconds = step_timeout_seconds(
-        step=step,
-        shutdown_deadline=shutdown_deadline,
-        clock=clock,
-    )
-    return runner.run(
-        tenant_id=job.tenant_id,
-        job_id=job.job_id,
-        run_id=run_id,
-        do_file=do_file,
-        timeout_seconds=timeout_seconds,
-        inputs_dir_rel=f"runs/{run_id}/inputs",
-    )
-
-
 def _record_step_artifacts(
     *,
     state: ExecutionState,
     pipeline_dirs: RunDirs,
     result: RunResult,
     inputs_manifest_path: Path,
-) -> None:
-    state.artifacts.extend(result.artifacts)
-    state.artifacts.append(
-        ArtifactRef(
-            kind=ArtifactKind.INPUTS_MANIFEST,
-            rel_path=job_rel_path(job_dir=pipeline_dirs.job_dir, path=inputs_manifest_path),
-        )
+) -> tuple[ArtifactRef, ...]:
+    inputs_manifest_ref = ArtifactRef(
+        kind=ArtifactKind.INPUTS_MANIFEST,
+        rel_path=job_rel_path(job_dir=pipeline_dirs.job_dir, path=inputs_manifest_path),
     )
+    recorded = (*result.artifacts, inputs_manifest_ref)
+    state.artifacts.extend(recorded)
+    return recorded
 
 
-def _fail_pipeline(*, ctx: _StepPhaseContext, error: RunError) -> RunResult:
-    return fail_pipeline(
-        job=ctx.job,
-        pipeline_dirs=ctx.pipeline_dirs,
-        pipeline_run_id=ctx.pipeline_run_id,
-        inputs_manifest=ctx.inputs_manifest,
-        composition_mode=ctx.composition_mode,
-        steps=ctx.state.step_summaries,
-        decisions=ctx.state.decisions,
-        error=error,
-    )
+def _reuse_decision(*, step: PlanStep, memo: StepMemo) -> JsonObject:
+    return {
+        "type": "step_reuse",
+        "step_id": step.step_id,
+        "source_run_id": memo.run_id,
+        "key": memo.key,
+    }
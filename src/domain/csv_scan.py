@@ -0,0 +1,173 @@
+from __future__ import annotations
+
+import codecs
+import csv
+from collections.abc import Iterable, Iterator, Mapping
+from dataclasses import dataclass
+from pathlib import Path
+
+from src.utils.json_types import JsonObject
+
+CSV_SCAN_CHUNK_BYTES = 8 * 1024 * 1024
+CSV_SNIFF_BYTES = 64 * 1024
+CSV_SNIFF_DELIMITERS = ",;\t|"
+# Tried in order on the sniff sample; files matching none keep the pandas default (utf-8).
+CSV_SNIFF_ENCODINGS = ("utf-8", "gb18030")
+# Bump when the counting rules change, so scans stored in manifests are recomputed.
+CSV_SCAN_VERSION = 2
+_QUOTE = b'"'
+# A quote opens a field only at the start of one: after a (candidate) delimiter, a line end or
+# at the start of the file. The delimiter is sniffed only once the scan is done, so every
+# candidate counts; elsewhere a quote is data, as in `5" tv`.
+_FIELD_START = frozenset({b"", b"\n", b"\r", *(bytes([c]) for c in CSV_SNIFF_DELIMITERS.encode())})
+
+
+@dataclass(frozen=True)
+class CsvScan:
+    """One pass over a CSV: record count (header included), encoding and delimiter."""
+
+    records: int
+    encoding: str | None
+    delimiter: str
+
+    def data_rows(self, *, header_row: bool) -> int:
+        return max(self.records - (1 if header_row else 0), 0)
+
+    def to_payload(self) -> JsonObject:
+        return {
+            "version": CSV_SCAN_VERSION,
+            "records": self.records,
+            "encoding": self.encoding,
+            "delimiter": self.delimiter,
+        }
+
+
+def csv_scan_from_payload(raw: object) -> CsvScan | None:
+    if not isinstance(raw, Mapping) or raw.get("version") != CSV_SCAN_VERSION:
+        return None
+    records, encoding, delimiter = raw.get("records"), raw.get("encoding"), raw.get("delimiter")
+    if not isinstance(records, int) or isinstance(records, bool) or records < 0:
+        return None
+    if not isinstance(delimiter, str) or len(delimiter) != 1:
+        return None
+    return CsvScan(
+        records=records,
+        encoding=encoding if isinstance(encoding, str) else None,
+        delimiter=delimiter,
+    )
+
+
+class CsvScanner:
+    """Incremental CSV scan fed chunk by chunk, e.g. while an upload streams to disk.
+
+    Record ends (`\n`, `\r\n` and a lone `\r`) are counted with `bytes.count`, so the cost
+    is a C loop per stretch of unquoted bytes. In the quote-aware mode (default) a quote that
+    starts a field opens a quoted field, `""` inside it is an escaped quote, and only record
+    ends outside quoted fields count, so multi-line fields are one record; any other quote is
+    data. The state carries across chunks. The first `CSV_SNIFF_BYTES` are kept to sniff
+    encoding and delimiter.
+    """
+
+    def __init__(self, *, quote_aware: bool = True):
+        self._quote_aware = quote_aware
+        self._sample = bytearray()
+        self._records = 0
+        self._in_quotes = False
+        # The last byte fed, and whether it closed a quoted field (`""` then reopens it).
+        self._prev = b""
+        self._prev_closed_quote = False
+
+    def feed(self, chunk: bytes) -> None:
+        if not chunk:
+            return
+        if len(self._sample) < CSV_SNIFF_BYTES:
+            self._sample += chunk[: CSV_SNIFF_BYTES - len(self._sample)]
+        if not self._quote_aware or (not self._in_quotes and _QUOTE not in chunk):
+            self._count(chunk)
+            return
+        pos = 0
+        while pos < len(chunk):
+            quote = chunk.find(_QUOTE, pos)
+            if self._in_quotes:
+                if quote < 0:
+                    self._set_prev(chunk[-1:])
+                    return
+                self._in_quotes = False
+                self._set_prev(_QUOTE, closed_quote=True)
+            else:
+                if quote < 0:
+                    self._count(chunk[pos:])
+                    return
+                if quote > pos:
+                    self._count(chunk[pos:quote])
+                self._in_quotes = self._prev_closed_quote or self._prev in _FIELD_START
+                self._set_prev(_QUOTE)
+            pos = quote + 1
+
+    def wrap(self, chunks: Iterable[bytes]) -> Iterator[bytes]:
+        for chunk in chunks:
+            self.feed(chunk)
+            yield chunk
+
+    def result(self) -> CsvScan:
+        records = self._records + (1 if self._prev not in (b"", b"\n", b"\r") else 0)
+        encoding, delimiter = sniff_csv_sample(bytes(self._sample))
+        return CsvScan(records=records, encoding=encoding, delimiter=delimiter)
+
+    def _count(self, data: bytes) -> None:
+        self._records += data.count(b"\n") + data.count(b"\r") - data.count(b"\r\n")
+        if self._prev == b"\r" and data.startswith(b"\n"):
+            # A `\r\n` split across chunks was counted as a lone `\r` already.
+            self._records -= 1
+        self._set_prev(data[-1:])
+
+    def _set_prev(self, byte: bytes, *, closed_quote: bool = False) -> None:
+        self._prev = byte
+        self._prev_closed_quote = closed_quote
+
+
+def scan_csv(path: Path, *, quote_aware: bool = True) -> CsvScan:
+    scanner = CsvScanner(quote_aware=quote_aware)
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(CSV_SCAN_CHUNK_BYTES), b""):
+            scanner.feed(chunk)
+    return scanner.result()
+
+
+def sniff_csv(path: Path) -> tuple[str | None, str]:
+    """(encoding, delimiter) from the head of `path` only, for callers that skip counting."""
+    with path.open("rb") as f:
+        return sniff_csv_sample(f.read(CSV_SNIFF_BYTES))
+
+
+def sniff_csv_sample(sample: bytes) -> tuple[str | None, str]:
+    if sample.startswith(codecs.BOM_UTF8):
+        encoding: str | None = "utf-8-sig"
+    else:
+        encoding = next((name for name in CSV_SNIFF_ENCODINGS if _decodes(sample, name)), None)
+    text = sample.decode(encoding or "utf-8", errors="replace")
+    return encoding, _sniff_delimiter(text)
+
+
+def _decodes(sample: bytes, encoding: str) -> bool:
+    # Incremental, so a multi-byte character cut at the end of the sample is not an error.
+    try:
+        codecs.getincrementaldecoder(encoding)().decode(sample, final=False)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def _sniff_delimiter(text: str) -> str:
+    lines = text.splitlines()[:50]
+    if len(lines) > 1 and not text.endswith(("\n", "\r")):
+        lines = lines[:-1]
+    if not lines:
+        return ","
+    try:
+        sniffed = csv.Sniffer().sniff("\n".join(lines), delimiters=CSV_SNIFF_DELIMITERS).delimiter
+    except csv.Error:
+        return ","
+    # Keep the comma unless the sniffed delimiter really splits the header into more fields.
+    header = lines[0]
+    return sniffed if header.count(sniffed) > header.count(",") else ","
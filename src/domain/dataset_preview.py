@@ -4,9 +4,23 @@ import math
 import re
 from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Literal, cast
-
-from src.utils.json_types import JsonObject
+from typing import Any, cast
+
+from src.domain.csv_scan import CsvScan, scan_csv
+from src.domain.dataset_preview_cache import (
+    PREVIEW_SOURCE_PARSE,
+    PREVIEW_SOURCE_SIDECAR,
+    DatasetPreviewCache,
+    content_sha256,
+    preview_cache_key,
+)
+from src.domain.dataset_sidecar import DatasetSidecar, find_sidecar, read_sidecar_frame
+from src.domain.excel_sheet_meta import (
+    excel_sheet_meta,
+    infer_header_row_from_rows,
+    read_excel_frame,
+)
+from src.utils.json_types import JsonObject, JsonValue
 
 _UNNAMED_RE = re.compile(r"^Unnamed:\s*\d+$")
 
@@ -43,136 +57,59 @@ def _normalize_column_names(raw_names: list[object]) -> list[str]:
     return normalized
 
 
-def _apply_normalized_columns(*, df: Any) -> Any:
+def apply_normalized_columns(*, df: Any) -> Any:
     cols = list(getattr(df, "columns", []))
     df.columns = _normalize_column_names(cols)
     return df
 
 
-def _infer_row_count_csv(*, path: Path, header_row: bool) -> int | None:
-    try:
-        with path.open("rb") as handle:
-            total = sum(1 for _ in handle)
-    except OSError:
-        return None
-    if total <= 0:
-        return 0
-    return max(total - (1 if header_row else 0), 0)
+def coerce_mixed_object_columns(*, df: Any) -> Any:
+    """Store object columns that mix value types (an Excel id column `1, 2, "x3"`) as pandas
+    `string`, rendering each value as previews display it; missing values stay missing.
+
+    Arrow cannot store such columns, so sidecar writers need this first.
+    """
+    import pandas as pd
+
+    for name in df.columns:
+        series = df[name]
+        if not pd.api.types.is_object_dtype(series.dtype):
+            continue
+        if len({type(value) for value in series.dropna()}) <= 1:
+            continue
+        df[name] = series.map(_display_text, na_action="ignore").astype("string")
+    return df
+
 
+def _display_text(value: Any) -> str:
+    return str(_jsonable_value(value))
 
-def _csv_preview(*, path: Path, rows: int, columns: int, header_row: bool) -> JsonObject:
+
+def _csv_preview(
+    *, path: Path, rows: int, columns: int, header_row: bool, csv_scan: CsvScan | None
+) -> JsonObject:
     import pandas as pd
 
-    header: int | None = 0 if header_row else None
-    df = pd.read_csv(path, nrows=rows, header=header)
-    df = _apply_normalized_columns(df=df)
-    column_count: int | None
-    try:
-        header_df = pd.read_csv(path, nrows=0, header=header)
-        column_count = int(header_df.shape[1])
-    except (ValueError, OSError):
-        column_count = int(df.shape[1])
+    scan = scan_csv(path) if csv_scan is None else csv_scan
+    df = pd.read_csv(
+        path,
+        nrows=rows,
+        header=0 if header_row else None,
+        sep=scan.delimiter,
+        encoding=scan.encoding or "utf-8",
+    )
+    df = apply_normalized_columns(df=df)
     return cast(
         JsonObject,
         {
-            "row_count": _infer_row_count_csv(path=path, header_row=header_row),
-            "column_count": column_count,
+            "row_count": scan.data_rows(header_row=header_row),
+            "column_count": int(df.shape[1]),
             "columns": _infer_columns(df=df, columns=columns),
             "sample_rows": _sample_rows(df=df, columns=columns),
         },
     )
 
 
-def excel_sheet_names(*, path: Path) -> list[str]:
-    if path.suffix.lower() == ".xls":
-        import xlrd
-
-        book = xlrd.open_workbook(str(path))
-        return [name for name in book.sheet_names() if isinstance(name, str) and name.strip()]
-
-    import openpyxl
-
-    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
-    try:
-        visible: list[str] = []
-        for ws in workbook.worksheets:
-            if getattr(ws, "sheet_state", "visible") != "visible":
-                continue
-            name = getattr(ws, "title", None)
-            if isinstance(name, str) and name.strip():
-                visible.append(name)
-        return visible
-    finally:
-        workbook.close()
-
-
-def _excel_sheet_meta(
-    *, path: Path, sheet_name: str | None
-) -> tuple[list[str], str | None, int | None, int | None, list[object], list[object]]:
-    names = excel_sheet_names(path=path)
-    selected = sheet_name if sheet_name in names else (names[0] if len(names) > 0 else None)
-    if selected is None:
-        return names, None, None, None, [], []
-
-    if path.suffix.lower() == ".xls":
-        import xlrd
-
-        book = xlrd.open_workbook(str(path))
-        sheet = book.sheet_by_name(selected)
-        first = sheet.row_values(0) if sheet.nrows >= 1 else []
-        second = sheet.row_values(1) if sheet.nrows >= 2 else []
-        return names, selected, sheet.nrows, sheet.ncols, list(first), list(second)
-
-    import openpyxl
-
-    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
-    try:
-        ws = workbook[selected]
-        first_row = next(ws.iter_rows(min_row=1, max_row=1, values_only=True), ())
-        second_row = next(ws.iter_rows(min_row=2, max_row=2, values_only=True), ())
-        return (
-            names,
-            selected,
-            int(ws.max_row),
-            int(ws.max_column),
-            list(first_row),
-            list(second_row),
-        )
-    finally:
-        workbook.close()
-
-
-_NUMERIC_RE = re.compile(r"^[-+]?\d+(?:\.\d+)?$")
-
-
-def _looks_numeric(value: str) -> bool:
-    if value.strip() == "":
-        return False
-    return _NUMERIC_RE.match(value.strip()) is not None
-
-
-def _infer_header_row_from_rows(*, first_row: list[object], second_row: list[object]) -> bool:
-    first = ["" if v is None else str(v).strip() for v in first_row]
-    second = ["" if v is None else str(v).strip() for v in second_row]
-
-    non_empty_first = [v for v in first if v != ""]
-    if len(non_empty_first) == 0:
-        return False
-
-    string_like = sum(1 for v in non_empty_first if not _looks_numeric(v)) / len(non_empty_first)
-    unique_ratio = len(set(non_empty_first)) / len(non_empty_first)
-    if string_like >= 0.7 and unique_ratio >= 0.7:
-        return True
-
-    non_empty_second = [v for v in second if v != ""]
-    numeric_ratio_second = (
-        sum(1 for v in non_empty_second if _looks_numeric(v)) / len(non_empty_second)
-        if len(non_empty_second) > 0
-        else 0.0
-    )
-    return string_like >= 0.5 and numeric_ratio_second >= 0.5
-
-
 def _excel_preview(
     *,
     path: Path,
@@ -181,28 +118,14 @@ def _excel_preview(
     sheet_name: str | None,
     header_row: bool | None,
 ) -> JsonObject:
-    import pandas as pd
-
-    sheet_names, selected, raw_rows, raw_cols, first_row, second_row = _excel_sheet_meta(
+    sheet_names, selected, raw_rows, raw_cols, first_row, second_row = excel_sheet_meta(
         path=path, sheet_name=sheet_name
     )
-    effective_header = header_row if header_row is not None else _infer_header_row_from_rows(
+    effective_header = header_row if header_row is not None else infer_header_row_from_rows(
         first_row=first_row, second_row=second_row
     )
-    header: int | None = 0 if effective_header else None
-    engine: Literal["xlrd", "openpyxl"] = "xlrd" if path.suffix.lower() == ".xls" else "openpyxl"
-    engine_kwargs: dict[str, object] | None = None
-    if engine == "openpyxl":
-        engine_kwargs = {"data_only": False}
-    df = pd.read_excel(
-        path,
-        nrows=rows,
-        sheet_name=selected,
-        engine=engine,
-        header=header,
-        engine_kwargs=engine_kwargs,
-    )
-    df = _apply_normalized_columns(df=df)
+    df = read_excel_frame(path=path, sheet_name=selected, header_row=effective_header, nrows=rows)
+    df = apply_normalized_columns(df=df)
     row_count = None if raw_rows is None else max(int(raw_rows) - (1 if effective_header else 0), 0)
     return cast(
         JsonObject,
@@ -235,7 +158,7 @@ def _dta_preview(*, path: Path, rows: int, columns: int) -> JsonObject:
         df = next(it)
     except StopIteration:
         df = pd.DataFrame()
-    df = _apply_normalized_columns(df=df)
+    df = apply_normalized_columns(df=df)
     return cast(
         JsonObject,
         {
@@ -283,6 +206,20 @@ def _sample_rows(
     return sample_rows
 
 
+def _sidecar_preview(*, sidecar: DatasetSidecar, rows: int, columns: int) -> JsonObject:
+    df = read_sidecar_frame(sidecar=sidecar, rows=rows, columns=columns)
+    preview: JsonObject = {
+        "row_count": sidecar.meta.get("row_count"),
+        "column_count": sidecar.meta.get("column_count"),
+        "columns": cast(JsonValue, _infer_columns(df=df, columns=columns)),
+        "sample_rows": cast(JsonValue, _sample_rows(df=df, columns=columns)),
+    }
+    for key in ("sheet_names", "selected_sheet", "header_row"):
+        if key in sidecar.meta:
+            preview[key] = sidecar.meta[key]
+    return preview
+
+
 def dataset_preview(*, path: Path, fmt: str, rows: int, columns: int) -> JsonObject:
     return dataset_preview_with_options(path=path, fmt=fmt, rows=rows, columns=columns)
 
@@ -295,10 +232,74 @@ def dataset_preview_with_options(
     columns: int,
     sheet_name: str | None = None,
     header_row: bool | None = None,
+    sha256: str | None = None,
+    csv_scan: CsvScan | None = None,
+    cache: DatasetPreviewCache | None = None,
+) -> JsonObject:
+    """Preview `path` through `cache` when given, parsing only on a miss.
+
+    Pass the manifest's `sha256` and `csv_scan` when known; otherwise the file is hashed to
+    build the key and a CSV is scanned for its row count, encoding and delimiter. A matching
+    sidecar is read instead of the original file, and its previews are cached separately.
+    """
+    sidecar = find_sidecar(
+        path=path, fmt=fmt, sheet_name=sheet_name, header_row=header_row, sha256=sha256
+    )
+    if cache is None:
+        return _parse_preview(
+            path=path,
+            fmt=fmt,
+            rows=rows,
+            columns=columns,
+            sheet_name=sheet_name,
+            header_row=header_row,
+            csv_scan=csv_scan,
+            sidecar=sidecar,
+        )
+    key = preview_cache_key(
+        sha256=content_sha256(path) if sha256 is None else sha256,
+        fmt=fmt,
+        sheet_name=sheet_name,
+        header_row=header_row,
+        rows=rows,
+        columns=columns,
+        source=PREVIEW_SOURCE_PARSE if sidecar is None else PREVIEW_SOURCE_SIDECAR,
+    )
+    cached = cache.get(key)
+    if cached is not None:
+        return cached
+    preview = _parse_preview(
+        path=path,
+        fmt=fmt,
+        rows=rows,
+        columns=columns,
+        sheet_name=sheet_name,
+        header_row=header_row,
+        csv_scan=csv_scan,
+        sidecar=sidecar,
+    )
+    cache.put(key, preview)
+    return preview
+
+
+def _parse_preview(
+    *,
+    path: Path,
+    fmt: str,
+    rows: int,
+    columns: int,
+    sheet_name: str | None,
+    header_row: bool | None,
+    csv_scan: CsvScan | None,
+    sidecar: DatasetSidecar | None,
 ) -> JsonObject:
+    if sidecar is not None:
+        return _sidecar_preview(sidecar=sidecar, rows=rows, columns=columns)
     if fmt == "csv":
         csv_header_row = header_row is not False
-        return _csv_preview(path=path, rows=rows, columns=columns, header_row=csv_header_row)
+        return _csv_preview(
+            path=path, rows=rows, columns=columns, header_row=csv_header_row, csv_scan=csv_scan
+        )
     if fmt == "excel":
         return _excel_preview(
             path=path,
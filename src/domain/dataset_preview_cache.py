@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Protocol
+
+from src.utils.json_types import JsonObject
+
+# Bump when the preview payload shape or parsing rules change so stale entries stop matching.
+PREVIEW_CACHE_VERSION = 2
+# Where a preview came from. A sidecar holds the full parse, so its column dtypes can differ
+# from those pandas infers from the first `rows` rows; the two never share an entry.
+PREVIEW_SOURCE_PARSE = "parse"
+PREVIEW_SOURCE_SIDECAR = "sidecar"
+_HASH_CHUNK_BYTES = 1024 * 1024
+_HASH_MEMO_MAX_ENTRIES = 256
+
+
+class DatasetPreviewCache(Protocol):
+    def get(self, key: str) -> JsonObject | None: ...
+
+    def put(self, key: str, preview: JsonObject) -> None: ...
+
+
+def preview_cache_key(
+    *,
+    sha256: str,
+    fmt: str,
+    sheet_name: str | None,
+    header_row: bool | None,
+    rows: int,
+    columns: int,
+    source: str = PREVIEW_SOURCE_PARSE,
+) -> str:
+    """Content address of one preview: the dataset bytes plus every option that shapes it."""
+    canonical = json.dumps(
+        [PREVIEW_CACHE_VERSION, sha256, fmt, sheet_name, header_row, rows, columns, source],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    return hashlib.sha256(canonical).hexdigest()
+
+
+_hash_memo: OrderedDict[tuple[str, int, int, int, int], str] = OrderedDict()
+_hash_memo_lock = threading.Lock()
+
+
+def content_sha256(path: Path) -> str:
+    """sha256 of `path`, memoized per stat for callers without a manifest.
+
+    The memo key includes ctime, which a rewrite always moves even when size and mtime are
+    put back.
+    """
+    stat = path.stat()
+    memo_key = (str(path), stat.st_size, stat.st_mtime_ns, stat.st_ctime_ns, stat.st_ino)
+    with _hash_memo_lock:
+        cached = _hash_memo.get(memo_key)
+        if cached is not None:
+            _hash_memo.move_to_end(memo_key)
+            return cached
+    digest = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(_HASH_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    sha256 = digest.hexdigest()
+    with _hash_memo_lock:
+        _hash_memo[memo_key] = sha256
+        while len(_hash_memo) > _HASH_MEMO_MAX_ENTRIES:
+            _hash_memo.popitem(last=False)
+    return sha256
+
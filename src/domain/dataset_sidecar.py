@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import hashlib
+import importlib
+import json
+import logging
+import math
+import os
+import tempfile
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date, datetime
+from functools import lru_cache
+from pathlib import Path
+from types import ModuleType
+from typing import Any, cast
+
+from src.domain.dataset_preview_cache import content_sha256
+from src.utils.json_types import JsonObject, JsonValue
+
+logger = logging.getLogger(__name__)
+
+SIDECAR_DIRNAME = ".columnar"
+SIDECAR_SCHEMA_VERSION = 2
+
+
+@dataclass(frozen=True)
+class DatasetSidecar:
+    """Parquet copy of one parsed dataset plus `meta` (schema, row count, column stats)."""
+
+    parquet_path: Path
+    meta: JsonObject
+
+    @property
+    def column_names(self) -> list[str]:
+        columns = self.meta.get("columns")
+        if not isinstance(columns, list):
+            return []
+        return [str(c.get("name")) for c in columns if isinstance(c, dict)]
+
+
+@lru_cache(maxsize=1)
+def parquet_module() -> ModuleType | None:
+    """`pyarrow.parquet` when installed (`pip install -e ".[columnar]"`), otherwise None."""
+    try:
+        return importlib.import_module("pyarrow.parquet")
+    except ImportError:
+        return None
+
+
+def sidecar_paths(
+    *, path: Path, fmt: str, sheet_name: str | None, header_row: bool | None
+) -> tuple[Path, Path]:
+    """(parquet, meta) paths for `path` parsed with the given options, under `.columnar/`."""
+    options = json.dumps([fmt, sheet_name, header_row], ensure_ascii=False).encode("utf-8")
+    variant = hashlib.sha256(options).hexdigest()[:16]
+    stem = path.parent / SIDECAR_DIRNAME / f"{path.name}.{variant}"
+    return stem.with_name(f"{stem.name}.parquet"), stem.with_name(f"{stem.name}.json")
+
+
+def find_sidecar(
+    *,
+    path: Path,
+    fmt: str,
+    sheet_name: str | None,
+    header_row: bool | None,
+    sha256: str | None = None,
+) -> DatasetSidecar | None:
+    """The sidecar for these options, if one was built from the current bytes of `path`.
+
+    Pass the manifest's `sha256` when known; otherwise `path` is hashed (memoized by stat).
+    """
+    if parquet_module() is None:
+        return None
+    parquet_path, meta_path = sidecar_paths(
+        path=path, fmt=fmt, sheet_name=sheet_name, header_row=header_row
+    )
+    try:
+        meta = json.loads(meta_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(meta, dict) or meta.get("schema_version") != SIDECAR_SCHEMA_VERSION:
+        return None
+    if not parquet_path.is_file():
+        return None
+    try:
+        current = content_sha256(path) if sha256 is None else sha256
+    except OSError:
+        return None
+    if meta.get("source_sha256") != current:
+        return None
+    return DatasetSidecar(parquet_path=parquet_path, meta=cast(JsonObject, meta))
+
+
+def read_sidecar_frame(*, sidecar: DatasetSidecar, rows: int, columns: int) -> Any:
+    """First `rows` rows of the first `columns` columns, reading only those column chunks."""
+    pq = parquet_module()
+    if pq is None:
+        raise FileNotFoundError(str(sidecar.parquet_path))
+    parquet_file = pq.ParquetFile(sidecar.parquet_path)
+    names = list(parquet_file.schema_arrow.names)[: max(columns, 0)]
+    batches = parquet_file.iter_batches(batch_size=max(rows, 1), columns=names)
+    batch = next(iter(batches), None)
+    if batch is None:
+        return parquet_file.schema_arrow.empty_table().select(names).to_pandas()
+    return batch.to_pandas().head(max(rows, 0))
+
+
+def sidecar_sheet_names(*, path: Path) -> list[str] | None:
+    """Workbook sheet names recorded by any sidecar of `path`, without opening the workbook."""
+    sidecar_dir = path.parent / SIDECAR_DIRNAME
+    try:
+        meta_paths = sorted(sidecar_dir.glob(f"{path.name}.*.json"))
+    except OSError:
+        return None
+    current: str | None = None
+    for meta_path in meta_paths:
+        try:
+            meta = json.loads(meta_path.read_bytes())
+        except (OSError, ValueError):
+            continue
+        if not isinstance(meta, dict) or meta.get("schema_version") != SIDECAR_SCHEMA_VERSION:
+            continue
+        try:
+            current = content_sha256(path) if current is None else current
+        except OSError:
+            return None
+        if meta.get("source_sha256") != current:
+            continue
+        names = meta.get("sheet_names")
+        if isinstance(names, list):
+            return [str(name) for name in names]
+    return None
+
+
+class SidecarChunkSchemaError(ValueError):
+    """A later row chunk cannot be stored with the Arrow schema of the first chunk."""
+
+
+def write_sidecar(
+    *,
+    path: Path,
+    fmt: str,
+    sheet_name: str | None,
+    header_row: bool | None,
+    frames: Iterable[Any],
+    extra: JsonObject,
+    source_sha256: str,
+) -> DatasetSidecar | None:
+    """Write `frames` (consecutive row chunks of one dataset) as Parquet, then its meta; the
+    meta is published last so readers never see a sidecar whose Parquet file is incomplete.
+
+    Chunks after the first are cast to the first chunk's Arrow schema (for example an int
+    column that gains missing values); one that does not fit raises `SidecarChunkSchemaError`.
+    `source_sha256` must be the hash of the bytes the chunks were parsed from, taken before
+    parsing.
+    """
+    pq = parquet_module()
+    if pq is None:
+        return None
+    pa = importlib.import_module("pyarrow")
+    parquet_path, meta_path = sidecar_paths(
+        path=path, fmt=fmt, sheet_name=sheet_name, header_row=header_row
+    )
+    parquet_path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(dir=str(parquet_path.parent), delete=False) as f:
+        tmp = Path(f.name)
+    writer: Any = None
+    columns: dict[str, _ColumnStats] = {}
+    row_count = 0
+    try:
+        for frame in frames:
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            if writer is None:
+                writer = pq.ParquetWriter(tmp, table.schema)
+            elif not table.schema.equals(writer.schema, check_metadata=False):
+                try:
+                    table = table.cast(writer.schema)
+                except (pa.ArrowInvalid, pa.ArrowNotImplementedError, pa.ArrowTypeError) as e:
+                    raise SidecarChunkSchemaError(str(e)) from e
+            writer.write_table(table)
+            row_count += int(frame.shape[0])
+            for name in frame.columns:
+                columns.setdefault(str(name), _ColumnStats(name=str(name))).add(frame[name])
+        if writer is None:
+            return None
+        writer.close()
+        writer = None
+        os.replace(tmp, parquet_path)
+    finally:
+        if writer is not None:
+            writer.close()
+        tmp.unlink(missing_ok=True)
+    meta: JsonObject = {
+        "schema_version": SIDECAR_SCHEMA_VERSION,
+        "source_sha256": source_sha256,
+        "format": fmt,
+        "row_count": row_count,
+        "column_count": len(columns),
+        "columns": [stats.to_json() for stats in columns.values()],
+        **extra,
+    }
+    with tempfile.NamedTemporaryFile("wb", dir=str(meta_path.parent), delete=False) as f:
+        tmp = Path(f.name)
+        f.write(json.dumps(meta, ensure_ascii=False).encode("utf-8"))
+    os.replace(tmp, meta_path)
+    return DatasetSidecar(parquet_path=parquet_path, meta=meta)
+
+
+class _ColumnStats:
+    """dtype, null count and (numeric/datetime) min/max of one column, merged over chunks."""
+
+    def __init__(self, *, name: str):
+        self._name = name
+        self._dtype: Any = None
+        self._null_count = 0
+        self._min: Any = None
+        self._max: Any = None
+
+    def add(self, series: Any) -> None:
+        dtype = series.dtype
+        self._dtype = dtype if self._dtype is None else _merged_dtype(self._dtype, dtype)
+        self._null_count += int(series.isna().sum())
+        if not _has_range(series.dtype):
+            return
+        non_null = series.dropna()
+        if len(non_null) == 0:
+            return
+        low, high = non_null.min(), non_null.max()
+        self._min = low if self._min is None else min(self._min, low)
+        self._max = high if self._max is None else max(self._max, high)
+
+    def to_json(self) -> JsonObject:
+        stats: JsonObject = {
+            "name": self._name,
+            "dtype": str(self._dtype),
+            "null_count": self._null_count,
+        }
+        if _has_range(self._dtype) and self._min is not None:
+            stats["min"] = _stat_value(self._min)
+            stats["max"] = _stat_value(self._max)
+        return stats
+
+
+def _has_range(dtype: Any) -> bool:
+    import pandas as pd
+
+    types = pd.api.types
+    return not types.is_bool_dtype(dtype) and (
+        types.is_numeric_dtype(dtype) or types.is_datetime64_any_dtype(dtype)
+    )
+
+
+def _merged_dtype(current: Any, new: Any) -> Any:
+    import numpy as np
+
+    if current == new:
+        return current
+    try:
+        return np.result_type(current, new)
+    except TypeError:
+        return np.dtype(object)
+
+
+def _stat_value(value: Any) -> JsonValue:
+    item = getattr(value, "item", None)
+    if callable(item) and not isinstance(value, (datetime, date)):
+        value = item()
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, float) and (math.isnan(value) or math.isinf(value)):
+        return None
+    if isinstance(value, (int, float)):
+        return value
+    return str(value)
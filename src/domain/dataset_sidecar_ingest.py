@@ -0,0 +1,264 @@
+from __future__ import annotations
+
+import logging
+import threading
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any
+from zipfile import BadZipFile
+
+from src.domain.csv_scan import CsvScan, csv_scan_from_payload, sniff_csv
+from src.domain.dataset_preview import apply_normalized_columns, coerce_mixed_object_columns
+from src.domain.dataset_preview_cache import content_sha256
+from src.domain.dataset_sidecar import (
+    DatasetSidecar,
+    SidecarChunkSchemaError,
+    find_sidecar,
+    parquet_module,
+    write_sidecar,
+)
+from src.domain.excel_sheet_meta import (
+    excel_sheet_meta,
+    infer_header_row_from_rows,
+    read_excel_frame,
+)
+from src.domain.inputs_manifest import MANIFEST_REL_PATH, read_manifest_json
+from src.domain.inputs_manifest_dataset_options import dataset_excel_options
+from src.domain.job_workspace_store import JobWorkspaceStore
+from src.infra.input_exceptions import InputPathUnsafeError
+from src.utils.json_types import JsonObject
+from src.utils.tenancy import DEFAULT_TENANT_ID
+
+logger = logging.getLogger(__name__)
+
+# CSVs are converted this many rows at a time, so building a sidecar does not hold the whole
+# parsed file in memory.
+CSV_CHUNK_ROWS = 100_000
+
+_BUILD_ERRORS = (
+    BadZipFile,
+    ImportError,
+    InputPathUnsafeError,
+    KeyError,
+    OSError,
+    TypeError,
+    UnicodeDecodeError,
+    ValueError,
+)
+
+
+def build_dataset_sidecar(
+    *,
+    path: Path,
+    fmt: str,
+    sheet_name: str | None,
+    header_row: bool | None,
+    csv_scan: CsvScan | None = None,
+    sha256: str | None = None,
+) -> DatasetSidecar | None:
+    """Parse `path` in full once and persist it as a columnar sidecar (no-op without pyarrow).
+
+    CSVs are converted in row chunks; if a later chunk changes a column's type beyond what the
+    first chunk's schema can hold, the file is converted again in one piece.
+    """
+    if parquet_module() is None:
+        return None
+    source_sha256 = content_sha256(path) if sha256 is None else sha256
+    existing = find_sidecar(
+        path=path, fmt=fmt, sheet_name=sheet_name, header_row=header_row, sha256=source_sha256
+    )
+    if existing is not None:
+        return existing
+    chunk_rows: int | None = CSV_CHUNK_ROWS
+    while True:
+        loaded = _load_frames(
+            path=path,
+            fmt=fmt,
+            sheet_name=sheet_name,
+            header_row=header_row,
+            csv_scan=csv_scan,
+            chunk_rows=chunk_rows,
+        )
+        if loaded is None:
+            return None
+        frames, extra = loaded
+        try:
+            return write_sidecar(
+                path=path,
+                fmt=fmt,
+                sheet_name=sheet_name,
+                header_row=header_row,
+                frames=(
+                    coerce_mixed_object_columns(df=apply_normalized_columns(df=frame))
+                    for frame in frames
+                ),
+                extra=extra,
+                source_sha256=source_sha256,
+            )
+        except SidecarChunkSchemaError as e:
+            if chunk_rows is None:
+                raise
+            logger.info(
+                "SS_DATASET_SIDECAR_CHUNK_SCHEMA_CHANGED",
+                extra={"path": str(path), "reason": str(e)},
+            )
+            chunk_rows = None
+
+
+def _load_frames(
+    *,
+    path: Path,
+    fmt: str,
+    sheet_name: str | None,
+    header_row: bool | None,
+    csv_scan: CsvScan | None,
+    chunk_rows: int | None,
+) -> tuple[Iterable[Any], JsonObject] | None:
+    import pandas as pd
+
+    if fmt == "csv":
+        encoding, delimiter = (
+            sniff_csv(path) if csv_scan is None else (csv_scan.encoding, csv_scan.delimiter)
+        )
+        header = None if header_row is False else 0
+        if chunk_rows is None:
+            frame = pd.read_csv(path, header=header, sep=delimiter, encoding=encoding or "utf-8")
+            return [frame], {}
+        return (
+            _csv_chunks(
+                path=path,
+                header=header,
+                delimiter=delimiter,
+                encoding=encoding or "utf-8",
+                chunk_rows=chunk_rows,
+            ),
+            {},
+        )
+    if fmt == "dta":
+        return [pd.read_stata(path)], {}
+    if fmt != "excel":
+        raise ValueError(f"unsupported format: {fmt}")
+    names, selected, _rows, _cols, first_row, second_row = excel_sheet_meta(
+        path=path, sheet_name=sheet_name
+    )
+    if selected is None:
+        return None
+    effective_header = header_row if header_row is not None else infer_header_row_from_rows(
+        first_row=first_row, second_row=second_row
+    )
+    frame = read_excel_frame(
+        path=path, sheet_name=selected, header_row=effective_header, nrows=None
+    )
+    extra: JsonObject = {
+        "sheet_names": list(names),
+        "selected_sheet": selected,
+        "header_row": effective_header,
+    }
+    return [frame], extra
+
+
+def _csv_chunks(
+    *, path: Path, header: int | None, delimiter: str | None, encoding: str, chunk_rows: int
+) -> Iterator[Any]:
+    import pandas as pd
+
+    with pd.read_csv(
+        path, header=header, sep=delimiter, encoding=encoding, chunksize=chunk_rows
+    ) as reader:
+        yield from reader
+
+
+def _manifest_sha256(item: Mapping[str, object]) -> str | None:
+    sha256 = item.get("sha256")
+    return sha256 if isinstance(sha256, str) and sha256.strip() != "" else None
+
+
+def ingest_job_datasets(
+    *, workspace: JobWorkspaceStore, job_id: str, tenant_id: str = DEFAULT_TENANT_ID
+) -> int:
+    """Build sidecars for every dataset in the job's manifest, with its current sheet options."""
+    try:
+        manifest_path = workspace.resolve_for_read(
+            tenant_id=tenant_id, job_id=job_id, rel_path=MANIFEST_REL_PATH
+        )
+        manifest = read_manifest_json(manifest_path)
+    except _BUILD_ERRORS:
+        return 0
+    datasets = manifest.get("datasets")
+    built = 0
+    for item in datasets if isinstance(datasets, list) else []:
+        if not isinstance(item, Mapping):
+            continue
+        rel_path, fmt, key = item.get("rel_path"), item.get("format"), item.get("dataset_key")
+        if not isinstance(rel_path, str) or not isinstance(fmt, str) or not isinstance(key, str):
+            continue
+        sheet_name, header_row = dataset_excel_options(manifest, dataset_key=key)
+        try:
+            path = workspace.resolve_for_read(tenant_id=tenant_id, job_id=job_id, rel_path=rel_path)
+            sidecar = build_dataset_sidecar(
+                path=path,
+                fmt=fmt,
+                sheet_name=sheet_name,
+                header_row=header_row,
+                csv_scan=csv_scan_from_payload(item.get("csv_scan")),
+                sha256=_manifest_sha256(item),
+            )
+        except _BUILD_ERRORS as e:
+            logger.warning(
+                "SS_DATASET_SIDECAR_FAILED",
+                extra={
+                    "tenant_id": tenant_id,
+                    "job_id": job_id,
+                    "rel_path": rel_path,
+                    "error": f"{type(e).__name__}: {e}",
+                },
+            )
+            continue
+        built += 0 if sidecar is None else 1
+    logger.info(
+        "SS_DATASET_SIDECARS_READY",
+        extra={"tenant_id": tenant_id, "job_id": job_id, "datasets": built},
+    )
+    return built
+
+
+class DatasetSidecarIngestor:
+    """Runs `ingest_job_datasets` on a background thread after uploads and sheet changes.
+
+    A job already waiting in the queue is not queued twice: the pending run reads the
+    manifest when it starts, so it picks up every change made before then.
+    """
+
+    def __init__(self, *, max_workers: int = 1):
+        self._executor = ThreadPoolExecutor(
+            max_workers=max(1, max_workers), thread_name_prefix="ss-dataset-sidecar"
+        )
+        self._pending: set[tuple[str, str]] = set()
+        self._lock = threading.Lock()
+
+    def schedule(self, *, workspace: JobWorkspaceStore, tenant_id: str, job_id: str) -> None:
+        key = (tenant_id, job_id)
+        with self._lock:
+            if key in self._pending:
+                return
+            self._pending.add(key)
+        self._executor.submit(self._run, workspace=workspace, tenant_id=tenant_id, job_id=job_id)
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=True, cancel_futures=True)
+
+    def _run(self, *, workspace: JobWorkspaceStore, tenant_id: str, job_id: str) -> None:
+        with self._lock:
+            self._pending.discard((tenant_id, job_id))
+        ingest_job_datasets(workspace=workspace, tenant_id=tenant_id, job_id=job_id)
+
+
+def build_dataset_sidecar_ingestor(*, enabled: bool) -> DatasetSidecarIngestor | None:
+    """Background sidecar ingestion for this process, or None when disabled or without pyarrow."""
+    if not enabled:
+        return None
+    if parquet_module() is None:
+        logger.warning("SS_DATASET_SIDECAR_UNAVAILABLE", extra={"missing": "pyarrow"})
+        return None
+    return DatasetSidecarIngestor()
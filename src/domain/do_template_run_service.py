@@ -6,6 +6,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Callable
 
+from src.domain.cached_stata_run import run_with_result_cache
 from src.domain.do_template_rendering import render_do_text, template_param_specs
 from src.domain.do_template_repository import DoTemplate, DoTemplateRepository
 from src.domain.do_template_run_evidence import (
@@ -16,6 +17,7 @@ from src.domain.do_template_run_evidence import (
 from src.domain.do_template_run_support import append_artifact_if_missing, ensure_job_status
 from src.domain.job_store import JobStore
 from src.domain.models import ArtifactRef, Job, JobStatus, RunAttempt
+from src.domain.run_result_cache import RunResultCache
 from src.domain.stata_runner import RunResult, StataRunner
 from src.domain.state_machine import JobStateMachine
 from src.infra.exceptions import DoTemplateContractInvalidError, SSError
@@ -33,6 +35,7 @@ class DoTemplateRunService:
     state_machine: JobStateMachine
     jobs_dir: Path
     clock: Callable[[], datetime] = utc_now
+    run_result_cache: RunResultCache | None = None
 
     def run(
         self,
@@ -95,12 +98,17 @@ class DoTemplateRunService:
             artifacts_dir=dirs.artifacts_dir,
             job_dir=dirs.job_dir,
         )
-        result = self.runner.run(
+        result = run_with_result_cache(
+            runner=self.runner,
+            cache=self.run_result_cache,
+            dirs=dirs,
             tenant_id=tenant_id,
             job_id=job_id,
             run_id=run_id,
             do_file=rendered_do,
             timeout_seconds=timeout_seconds,
+            template_id=template_id,
+            template_meta=template.meta,
         )
         run_meta_ref, output_refs = self._archive_and_write_meta(
             job_id=job_id,
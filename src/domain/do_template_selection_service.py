@@ -5,6 +5,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Callable
 
+from src.domain.blocking_runner import INLINE_BLOCKING_RUNNER, BlockingRunner
 from src.domain.do_template_catalog import DoTemplateCatalog, FamilySummary, TemplateSummary
 from src.domain.do_template_selection_evidence_writer import (
     finalize_selection_for_job,
@@ -68,9 +69,10 @@ class DoTemplateSelectionService:
         *,
         tenant_id: str = DEFAULT_TENANT_ID,
         job_id: str,
+        io: BlockingRunner = INLINE_BLOCKING_RUNNER,
     ) -> DoTemplateSelectionResult:
         logger.info("SS_DO_TEMPLATE_SELECT_START", extra={"tenant_id": tenant_id, "job_id": job_id})
-        job = self.store.load(tenant_id=tenant_id, job_id=job_id)
+        job = await io.run(self.store.load, tenant_id=tenant_id, job_id=job_id)
         existing_template_id = job.selected_template_id
         if isinstance(existing_template_id, str) and existing_template_id.strip() != "":
             logger.info(
@@ -87,11 +89,13 @@ class DoTemplateSelectionService:
                 selected_template_id=existing_template_id,
             )
         try:
-            result = await self._select_for_job(job=job)
+            result = await self._select_for_job(job=job, io=io)
         except SSError as e:
-            persist_best_effort(store=self.store, tenant_id=tenant_id, job=job, error=e)
+            await io.run(
+                persist_best_effort, store=self.store, tenant_id=tenant_id, job=job, error=e
+            )
             raise
-        self.store.save(tenant_id=tenant_id, job=job)
+        await io.run(self.store.save, tenant_id=tenant_id, job=job)
         logger.info(
             "SS_DO_TEMPLATE_SELECT_DONE",
             extra={
@@ -112,9 +116,9 @@ class DoTemplateSelectionService:
         )
         return eligible if eligible else families
 
-    async def _select_for_job(self, *, job: Job) -> DoTemplateSelectionResult:
+    async def _select_for_job(self, *, job: Job, io: BlockingRunner) -> DoTemplateSelectionResult:
         requirement = job.requirement if job.requirement is not None else ""
-        families = self.catalog.list_families()
+        families = await io.run(self.catalog.list_families)
         if not families:
             raise DoTemplateSelectionNoCandidatesError(stage="stage1")
 
@@ -123,7 +127,8 @@ class DoTemplateSelectionService:
             job=job, requirement=requirement, families=families_for_prompt
         )
         analysis_sequence, requires_combination, combination_reason = stage1_context(stage1=stage1)
-        candidates = build_stage2_candidates(
+        candidates = await io.run(
+            build_stage2_candidates,
             catalog=self.catalog,
             selected_family_ids=selected_family_ids,
             requirement=requirement,
@@ -141,7 +146,8 @@ class DoTemplateSelectionService:
             combination_reason=combination_reason,
             candidates=candidates,
         )
-        return finalize_selection_for_job(
+        return await io.run(
+            finalize_selection_for_job,
             store=self.store,
             job=job,
             requirement=requirement,
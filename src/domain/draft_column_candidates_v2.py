@@ -3,7 +3,9 @@ from __future__ import annotations
 import logging
 from typing import Sequence, cast
 
+from src.domain.csv_scan import csv_scan_from_payload
 from src.domain.dataset_preview import dataset_preview_with_options
+from src.domain.dataset_preview_cache import DatasetPreviewCache
 from src.domain.draft_column_candidate_models import DraftColumnCandidateV2
 from src.domain.draft_inputs_introspection import _load_inputs_manifest
 from src.domain.inputs_manifest import ROLE_PRIMARY_DATASET
@@ -30,6 +32,11 @@ def _dataset_excel_options(item: dict[str, object]) -> tuple[str | None, bool |
     return (None if sheet == "" else sheet, header_row if isinstance(header_row, bool) else None)
 
 
+def _dataset_sha256(item: dict[str, object]) -> str | None:
+    sha256 = item.get("sha256")
+    return sha256 if isinstance(sha256, str) and sha256.strip() != "" else None
+
+
 def _dataset_columns_payload(
     *,
     tenant_id: str,
@@ -38,6 +45,7 @@ def _dataset_columns_payload(
     item: dict[str, object],
     workspace: JobWorkspaceStore,
     manifest: dict[str, object],
+    preview_cache: DatasetPreviewCache | None,
 ) -> list[dict[str, object]] | None:
     rel_path = item.get("rel_path")
     try:
@@ -61,6 +69,9 @@ def _dataset_columns_payload(
             columns=300,
             sheet_name=sheet_name,
             header_row=header_row,
+            sha256=_dataset_sha256(item),
+            csv_scan=csv_scan_from_payload(item.get("csv_scan")),
+            cache=preview_cache,
         )
     except (FileNotFoundError, KeyError, OSError, ValueError, InputPathUnsafeError) as e:
         logger.warning(
@@ -117,6 +128,7 @@ def _append_non_primary_candidate_v2_items(
     workspace: JobWorkspaceStore,
     out: list[DraftColumnCandidateV2],
     limit: int,
+    preview_cache: DatasetPreviewCache | None,
 ) -> None:
     for item in datasets:
         if item.get("role") == ROLE_PRIMARY_DATASET:
@@ -135,6 +147,7 @@ def _append_non_primary_candidate_v2_items(
             item=item,
             workspace=workspace,
             manifest=manifest,
+            preview_cache=preview_cache,
         )
         if payload is None:
             continue
@@ -153,6 +166,7 @@ def column_candidates_v2(
     store: JobStore,
     workspace: JobWorkspaceStore,
     primary_candidates: Sequence[str],
+    preview_cache: DatasetPreviewCache | None = None,
 ) -> list[DraftColumnCandidateV2]:
     loaded = _load_inputs_manifest(
         tenant_id=tenant_id,
@@ -177,5 +191,6 @@ def column_candidates_v2(
         workspace=workspace,
         out=out,
         limit=900,
+        preview_cache=preview_cache,
     )
     return out
@@ -5,7 +5,13 @@ from json import JSONDecodeError
 from typing import cast
 
 from src.domain.dataset_preview import dataset_preview_with_options
-from src.domain.inputs_manifest import primary_dataset_details, read_manifest_json
+from src.domain.dataset_preview_cache import DatasetPreviewCache
+from src.domain.inputs_manifest import (
+    primary_dataset_csv_scan,
+    primary_dataset_details,
+    primary_dataset_sha256,
+    read_manifest_json,
+)
 from src.domain.inputs_manifest_dataset_options import primary_dataset_excel_options
 from src.domain.job_store import JobStore
 from src.domain.job_workspace_store import JobWorkspaceStore
@@ -99,6 +105,7 @@ def _primary_columns_payload(
     manifest_rel_path: str,
     manifest: dict[str, object],
     workspace: JobWorkspaceStore,
+    preview_cache: DatasetPreviewCache | None,
 ) -> list[dict[str, object]] | None:
     try:
         dataset_rel_path, fmt, _original_name = primary_dataset_details(manifest)
@@ -115,6 +122,9 @@ def _primary_columns_payload(
             columns=300,
             sheet_name=sheet_name,
             header_row=header_row,
+            sha256=primary_dataset_sha256(manifest),
+            csv_scan=primary_dataset_csv_scan(manifest),
+            cache=preview_cache,
         )
     except (FileNotFoundError, KeyError, OSError, ValueError) as e:
         logger.warning(
@@ -139,6 +149,7 @@ def primary_dataset_columns(
     job_id: str,
     store: JobStore,
     workspace: JobWorkspaceStore,
+    preview_cache: DatasetPreviewCache | None = None,
 ) -> tuple[list[str], list[DraftVariableType]]:
     loaded = _load_inputs_manifest(
         tenant_id=tenant_id,
@@ -155,6 +166,7 @@ def primary_dataset_columns(
         manifest_rel_path=manifest_rel_path,
         manifest=manifest,
         workspace=workspace,
+        preview_cache=preview_cache,
     )
     if payload is None:
         return [], []
@@ -3,7 +3,9 @@ from __future__ import annotations
 import logging
 from typing import cast
 
+from src.domain.blocking_runner import INLINE_BLOCKING_RUNNER, BlockingRunner
 from src.domain.column_normalizer import build_draft_column_name_normalizations
+from src.domain.dataset_preview_cache import DatasetPreviewCache
 from src.domain.do_template_selection_service import DoTemplateSelectionService
 from src.domain.draft_column_candidate_models import DraftColumnCandidateV2
 from src.domain.draft_column_candidates_v2 import column_candidates_v2
@@ -63,24 +65,40 @@ class DraftService:
         state_machine: JobStateMachine,
         workspace: JobWorkspaceStore,
         do_template_selection: DoTemplateSelectionService | None = None,
+        preview_cache: DatasetPreviewCache | None = None,
     ):
         self._store = store
         self._llm = llm
         self._state_machine = state_machine
         self._workspace = workspace
         self._do_template_selection = do_template_selection
+        self._preview_cache = preview_cache
 
-    async def preview(self, *, tenant_id: str = DEFAULT_TENANT_ID, job_id: str) -> Draft:
-        job = self._store.load(tenant_id=tenant_id, job_id=job_id)
-        return await self._preview_for_loaded_job(tenant_id=tenant_id, job=job)
+    async def preview(
+        self,
+        *,
+        tenant_id: str = DEFAULT_TENANT_ID,
+        job_id: str,
+        io: BlockingRunner = INLINE_BLOCKING_RUNNER,
+    ) -> Draft:
+        job = await io.run(self._store.load, tenant_id=tenant_id, job_id=job_id)
+        return await self._preview_for_loaded_job(tenant_id=tenant_id, job=job, io=io)
 
     async def preview_v1(
-        self, *, tenant_id: str = DEFAULT_TENANT_ID, job_id: str
+        self,
+        *,
+        tenant_id: str = DEFAULT_TENANT_ID,
+        job_id: str,
+        io: BlockingRunner = INLINE_BLOCKING_RUNNER,
     ) -> DraftPreviewResult:
-        job = self._store.load(tenant_id=tenant_id, job_id=job_id)
+        """Run store, dataset-preview and template-selection work through `io`.
+
+        Only the LLM calls are awaited on the caller's event loop.
+        """
+        job = await io.run(self._store.load, tenant_id=tenant_id, job_id=job_id)
         if is_v1_redeem_job(job_id) and not has_inputs(job):
             return pending_inputs_upload_result()
-        draft = await self._preview_for_loaded_job(tenant_id=tenant_id, job=job)
+        draft = await self._preview_for_loaded_job(tenant_id=tenant_id, job=job, io=io)
         if is_v1_redeem_job(job_id):
             selector = self._do_template_selection
             if selector is None:
@@ -89,7 +107,7 @@ class DraftService:
                     extra={"tenant_id": tenant_id, "job_id": job_id},
                 )
                 raise DoTemplateSelectionNotWiredError()
-            await selector.select_template_id(tenant_id=tenant_id, job_id=job_id)
+            await selector.select_template_id(tenant_id=tenant_id, job_id=job_id, io=io)
         return DraftPreviewResult(draft=draft, pending=None)
     def patch_v1(
         self,
@@ -136,9 +154,11 @@ class DraftService:
             remaining_unknowns_count=len(job.draft.open_unknowns),
         )
 
-    async def _preview_for_loaded_job(self, *, tenant_id: str, job: Job) -> Draft:
+    async def _preview_for_loaded_job(
+        self, *, tenant_id: str, job: Job, io: BlockingRunner
+    ) -> Draft:
         logger.info("SS_DRAFT_PREVIEW_START", extra={"tenant_id": tenant_id, "job_id": job.job_id})
-        prompt = self._draft_preview_prompt(tenant_id=tenant_id, job=job)
+        prompt = await io.run(self._draft_preview_prompt, tenant_id=tenant_id, job=job)
         try:
             draft = await self._llm.draft_preview(job=job, prompt=prompt)
         except (LLMCallFailedError, LLMArtifactsWriteError) as e:
@@ -152,7 +172,7 @@ class DraftService:
                 },
             )
             try:
-                self._store.save(tenant_id=tenant_id, job=job)
+                await io.run(self._store.save, tenant_id=tenant_id, job=job)
             except JobStoreIOError as persist_error:
                 logger.warning(
                     "SS_DRAFT_PREVIEW_PERSIST_FAILED",
@@ -184,7 +204,7 @@ class DraftService:
                 },
             )
             try:
-                self._store.save(tenant_id=tenant_id, job=job)
+                await io.run(self._store.save, tenant_id=tenant_id, job=job)
             except JobStoreIOError as persist_error:
                 logger.warning(
                     "SS_DRAFT_PREVIEW_PERSIST_FAILED",
@@ -196,14 +216,14 @@ class DraftService:
                     },
                 )
             raise LLMResponseInvalidError(job_id=job.job_id) from e
-        job.draft = self._enrich_draft(tenant_id=tenant_id, job=job, draft=draft)
+        job.draft = await io.run(self._enrich_draft, tenant_id=tenant_id, job=job, draft=draft)
         if job.status == JobStatus.CREATED and self._state_machine.ensure_transition(
             job_id=job.job_id,
             from_status=job.status,
             to_status=JobStatus.DRAFT_READY,
         ):
             job.status = JobStatus.DRAFT_READY
-        self._store.save(tenant_id=tenant_id, job=job)
+        await io.run(self._store.save, tenant_id=tenant_id, job=job)
         logger.info(
             "SS_DRAFT_PREVIEW_DONE",
             extra={"tenant_id": tenant_id, "job_id": job.job_id, "status": job.status.value},
@@ -217,6 +237,7 @@ class DraftService:
             job_id=job.job_id,
             store=self._store,
             workspace=self._workspace,
+            preview_cache=self._preview_cache,
         )
         candidates_v2 = column_candidates_v2(
             tenant_id=tenant_id,
@@ -224,6 +245,7 @@ class DraftService:
             store=self._store,
             workspace=self._workspace,
             primary_candidates=primary_candidates,
+            preview_cache=self._preview_cache,
         )
         merged_candidates = _merge_column_candidates(primary_candidates, candidates_v2)
         return build_draft_preview_prompt_v2(
@@ -243,6 +265,7 @@ class DraftService:
             job_id=job.job_id,
             store=self._store,
             workspace=self._workspace,
+            preview_cache=self._preview_cache,
         )
         candidates_v2 = column_candidates_v2(
             tenant_id=tenant_id,
@@ -250,6 +273,7 @@ class DraftService:
             store=self._store,
             workspace=self._workspace,
             primary_candidates=primary_candidates,
+            preview_cache=self._preview_cache,
         )
         merged_candidates = _merge_column_candidates(primary_candidates, candidates_v2)
         normalizations = build_draft_column_name_normalizations(candidates_v2)
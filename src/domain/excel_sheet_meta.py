@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import Any, Literal
+
+from src.domain.dataset_sidecar import sidecar_sheet_names
+
+
+def excel_sheet_names(*, path: Path) -> list[str]:
+    recorded = sidecar_sheet_names(path=path)
+    if recorded is not None:
+        return recorded
+    if path.suffix.lower() == ".xls":
+        import xlrd
+
+        book = xlrd.open_workbook(str(path))
+        return [name for name in book.sheet_names() if isinstance(name, str) and name.strip()]
+
+    import openpyxl
+
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        visible: list[str] = []
+        for ws in workbook.worksheets:
+            if getattr(ws, "sheet_state", "visible") != "visible":
+                continue
+            name = getattr(ws, "title", None)
+            if isinstance(name, str) and name.strip():
+                visible.append(name)
+        return visible
+    finally:
+        workbook.close()
+
+
+def excel_sheet_meta(
+    *, path: Path, sheet_name: str | None
+) -> tuple[list[str], str | None, int | None, int | None, list[object], list[object]]:
+    names = excel_sheet_names(path=path)
+    selected = sheet_name if sheet_name in names else (names[0] if len(names) > 0 else None)
+    if selected is None:
+        return names, None, None, None, [], []
+
+    if path.suffix.lower() == ".xls":
+        import xlrd
+
+        book = xlrd.open_workbook(str(path))
+        sheet = book.sheet_by_name(selected)
+        first = sheet.row_values(0) if sheet.nrows >= 1 else []
+        second = sheet.row_values(1) if sheet.nrows >= 2 else []
+        return names, selected, sheet.nrows, sheet.ncols, list(first), list(second)
+
+    import openpyxl
+
+    workbook = openpyxl.load_workbook(path, read_only=True, data_only=True)
+    try:
+        ws = workbook[selected]
+        first_row = next(ws.iter_rows(min_row=1, max_row=1, values_only=True), ())
+        second_row = next(ws.iter_rows(min_row=2, max_row=2, values_only=True), ())
+        return (
+            names,
+            selected,
+            int(ws.max_row),
+            int(ws.max_column),
+            list(first_row),
+            list(second_row),
+        )
+    finally:
+        workbook.close()
+
+
+_NUMERIC_RE = re.compile(r"^[-+]?\d+(?:\.\d+)?$")
+
+
+def _looks_numeric(value: str) -> bool:
+    if value.strip() == "":
+        return False
+    return _NUMERIC_RE.match(value.strip()) is not None
+
+
+def infer_header_row_from_rows(*, first_row: list[object], second_row: list[object]) -> bool:
+    first = ["" if v is None else str(v).strip() for v in first_row]
+    second = ["" if v is None else str(v).strip() for v in second_row]
+
+    non_empty_first = [v for v in first if v != ""]
+    if len(non_empty_first) == 0:
+        return False
+
+    string_like = sum(1 for v in non_empty_first if not _looks_numeric(v)) / len(non_empty_first)
+    unique_ratio = len(set(non_empty_first)) / len(non_empty_first)
+    if string_like >= 0.7 and unique_ratio >= 0.7:
+        return True
+
+    non_empty_second = [v for v in second if v != ""]
+    numeric_ratio_second = (
+        sum(1 for v in non_empty_second if _looks_numeric(v)) / len(non_empty_second)
+        if len(non_empty_second) > 0
+        else 0.0
+    )
+    return string_like >= 0.5 and numeric_ratio_second >= 0.5
+
+
+def read_excel_frame(
+    *, path: Path, sheet_name: str | None, header_row: bool, nrows: int | None
+) -> Any:
+    import pandas as pd
+
+    engine: Literal["xlrd", "openpyxl"] = "xlrd" if path.suffix.lower() == ".xls" else "openpyxl"
+    engine_kwargs: dict[str, object] | None = None
+    if engine == "openpyxl":
+        engine_kwargs = {"data_only": False}
+    return pd.read_excel(
+        path,
+        nrows=nrows,
+        sheet_name=sheet_name,
+        engine=engine,
+        header=0 if header_row else None,
+        engine_kwargs=engine_kwargs,
+    )
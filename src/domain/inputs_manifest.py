@@ -7,6 +7,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import cast
 
+from src.domain.csv_scan import CsvScan, csv_scan_from_payload
+from src.domain.job_workspace_store import StagedFile
 from src.infra.input_exceptions import (
     InputFilenameUnsafeError,
     InputRoleInvalidError,
@@ -53,7 +55,8 @@ class PreparedDataset:
     size_bytes: int
     uploaded_at: str
     content_type: str | None
-    data: bytes
+    staged: StagedFile | None = None
+    csv_scan: CsvScan | None = None
 
 
 def safe_filename(*, original_name: str | None, override_name: str | None) -> str:
@@ -84,10 +87,6 @@ def format_from_filename(filename: str) -> tuple[str, str]:
     raise InputUnsupportedFormatError(filename=filename)
 
 
-def sha256_hex(data: bytes) -> str:
-    return hashlib.sha256(data).hexdigest()
-
-
 def dataset_key_from_sha256(sha256: str) -> str:
     return f"ds_{sha256[:16]}"
 
@@ -98,30 +97,31 @@ def dataset_rel_path(*, dataset_key: str, ext: str) -> str:
 
 def prepare_dataset(
     *,
-    data: bytes,
+    staged: StagedFile,
     original_name: str | None,
     filename_override: str | None,
     role: str,
     content_type: str | None,
     uploaded_at: str,
+    csv_scan: CsvScan | None = None,
 ) -> PreparedDataset:
+    """Describe a dataset already spooled and hashed into the workspace as `staged`."""
     safe_name = safe_filename(original_name=original_name, override_name=filename_override)
     fmt, ext = format_from_filename(safe_name)
-    sha256 = sha256_hex(data)
-    dataset_key = dataset_key_from_sha256(sha256)
-    rel_path = dataset_rel_path(dataset_key=dataset_key, ext=ext)
+    dataset_key = dataset_key_from_sha256(staged.sha256)
     return PreparedDataset(
         dataset_key=dataset_key,
         role=validate_dataset_role(role),
-        rel_path=rel_path,
-        sha256=sha256,
-        fingerprint=f"sha256:{sha256}",
+        rel_path=dataset_rel_path(dataset_key=dataset_key, ext=ext),
+        sha256=staged.sha256,
+        fingerprint=f"sha256:{staged.sha256}",
         format=fmt,
         original_name=safe_name,
-        size_bytes=len(data),
+        size_bytes=staged.size_bytes,
         uploaded_at=uploaded_at,
         content_type=content_type,
-        data=data,
+        staged=staged,
+        csv_scan=csv_scan if fmt == "csv" else None,
     )
 
 
@@ -131,20 +131,7 @@ def manifest_payload(*, datasets: Sequence[PreparedDataset]) -> JsonObject:
 
     payload_datasets: list[JsonObject] = []
     for item in sorted(datasets, key=_sort_key):
-        payload_datasets.append(
-            {
-                "dataset_key": item.dataset_key,
-                "role": item.role,
-                "rel_path": item.rel_path,
-                "original_name": item.original_name,
-                "size_bytes": item.size_bytes,
-                "sha256": item.sha256,
-                "fingerprint": item.fingerprint,
-                "format": item.format,
-                "uploaded_at": item.uploaded_at,
-                "content_type": item.content_type,
-            }
-        )
+        payload_datasets.append(dataset_payload(item))
     return cast(
         JsonObject,
         {
@@ -154,6 +141,24 @@ def manifest_payload(*, datasets: Sequence[PreparedDataset]) -> JsonObject:
     )
 
 
+def dataset_payload(dataset: PreparedDataset) -> JsonObject:
+    payload: JsonObject = {
+        "dataset_key": dataset.dataset_key,
+        "role": dataset.role,
+        "rel_path": dataset.rel_path,
+        "original_name": dataset.original_name,
+        "size_bytes": dataset.size_bytes,
+        "sha256": dataset.sha256,
+        "fingerprint": dataset.fingerprint,
+        "format": dataset.format,
+        "uploaded_at": dataset.uploaded_at,
+        "content_type": dataset.content_type,
+    }
+    if dataset.csv_scan is not None:
+        payload["csv_scan"] = dataset.csv_scan.to_payload()
+    return payload
+
+
 def inputs_fingerprint(*, datasets: Sequence[PreparedDataset]) -> str:
     canonical = [
         {"sha256": item.sha256, "size_bytes": item.size_bytes, "role": item.role}
@@ -176,6 +181,36 @@ def read_manifest_json(path: Path) -> JsonObject:
     return cast(JsonObject, raw)
 
 
+def _primary_dataset_item(manifest: Mapping[str, object]) -> Mapping[str, object] | None:
+    datasets = manifest.get("datasets")
+    primary: object
+    if isinstance(datasets, list):
+        primary = next(
+            (
+                item
+                for item in datasets
+                if isinstance(item, Mapping) and item.get("role") == ROLE_PRIMARY_DATASET
+            ),
+            None,
+        )
+    else:
+        primary = manifest.get("primary_dataset")
+    return primary if isinstance(primary, Mapping) else None
+
+
+def primary_dataset_sha256(manifest: Mapping[str, object]) -> str | None:
+    """Content hash of the primary dataset, or None for manifests that never recorded one."""
+    primary = _primary_dataset_item(manifest)
+    sha256 = None if primary is None else primary.get("sha256")
+    return sha256 if isinstance(sha256, str) and sha256.strip() != "" else None
+
+
+def primary_dataset_csv_scan(manifest: Mapping[str, object]) -> CsvScan | None:
+    """CSV scan recorded at upload time; None for non-CSV or older manifests."""
+    primary = _primary_dataset_item(manifest)
+    return None if primary is None else csv_scan_from_payload(primary.get("csv_scan"))
+
+
 def primary_dataset_details(manifest: Mapping[str, object]) -> tuple[str, str, str]:
     datasets = manifest.get("datasets")
     if isinstance(datasets, list):
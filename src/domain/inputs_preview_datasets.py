@@ -5,7 +5,7 @@ from collections.abc import Mapping
 from typing import cast
 from zipfile import BadZipFile
 
-from src.domain.dataset_preview import excel_sheet_names
+from src.domain.excel_sheet_meta import excel_sheet_names
 from src.domain.inputs_manifest import ROLE_OTHER, ROLE_PRIMARY_DATASET
 from src.domain.inputs_manifest_dataset_options import primary_dataset_excel_options
 from src.domain.job_workspace_store import JobWorkspaceStore
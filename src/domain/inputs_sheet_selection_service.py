@@ -6,7 +6,10 @@ from pathlib import Path
 from typing import cast
 from zipfile import BadZipFile
 
-from src.domain.dataset_preview import dataset_preview_with_options, excel_sheet_names
+from src.domain.dataset_preview import dataset_preview_with_options
+from src.domain.dataset_preview_cache import DatasetPreviewCache
+from src.domain.dataset_sidecar_ingest import DatasetSidecarIngestor
+from src.domain.excel_sheet_meta import excel_sheet_names
 from src.domain.inputs_manifest import (
     MANIFEST_REL_PATH,
     primary_dataset_details,
@@ -42,9 +45,18 @@ def _clean_sheet_name(sheet_name: str) -> str:
 
 
 class InputsSheetSelectionService:
-    def __init__(self, *, store: JobStore, workspace: JobWorkspaceStore):
+    def __init__(
+        self,
+        *,
+        store: JobStore,
+        workspace: JobWorkspaceStore,
+        preview_cache: DatasetPreviewCache | None = None,
+        sidecars: DatasetSidecarIngestor | None = None,
+    ):
         self._store = store
         self._workspace = workspace
+        self._preview_cache = preview_cache
+        self._sidecars = sidecars
 
     def _load_manifest(self, *, tenant_id: str, job_id: str) -> tuple[str, JsonObject]:
         job = self._store.load(tenant_id=tenant_id, job_id=job_id)
@@ -118,6 +130,7 @@ class InputsSheetSelectionService:
                 columns=1,
                 sheet_name=sheet_name,
                 header_row=None,
+                cache=self._preview_cache,
             )
         except (BadZipFile, ImportError, KeyError, OSError, UnicodeDecodeError, ValueError) as exc:
             raise InputParseFailedError(
@@ -148,6 +161,9 @@ class InputsSheetSelectionService:
                 },
             )
             raise InputStorageFailedError(job_id=job_id, rel_path=manifest_rel_path) from exc
+        # New sheet options parse differently, so they get their own sidecar.
+        if self._sidecars is not None:
+            self._sidecars.schedule(workspace=self._workspace, tenant_id=tenant_id, job_id=job_id)
 
     def select_primary_excel_sheet(
         self,
@@ -0,0 +1,19 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Protocol
+
+from src.utils.tenancy import DEFAULT_TENANT_ID
+
+
+class JobArchiveReader(Protocol):
+    def resolve_archived(
+        self,
+        *,
+        job_id: str,
+        job_dir: Path,
+        rel_path: str,
+        tenant_id: str = DEFAULT_TENANT_ID,
+    ) -> Path | None:
+        """Local copy of `rel_path` from the job's workspace archive; None if not archived."""
+        ...
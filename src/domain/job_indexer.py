@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+import base64
+import binascii
+import json
+from collections.abc import Iterable
 from dataclasses import dataclass
 from typing import Protocol
 
+from src.infra.admin_exceptions import AdminJobCursorInvalidError
 from src.utils.tenancy import DEFAULT_TENANT_ID
 
 
@@ -13,8 +18,76 @@ class JobIndexItem:
     created_at: str
     updated_at: str | None = None
     tenant_id: str = DEFAULT_TENANT_ID
+    # The job's optimistic-lock `version` (0 when unknown); orders index updates.
+    version: int = 0
+
+    def sort_key(self) -> tuple[str, str, str]:
+        """Listing order key: newest `updated_at` first (falls back to `created_at`)."""
+        return (self.updated_at or self.created_at, self.tenant_id, self.job_id)
+
+
+@dataclass(frozen=True)
+class JobIndexPage:
+    items: list[JobIndexItem]
+    next_cursor: str | None = None
 
 
 class JobIndexer(Protocol):
     def list_jobs(self, *, tenant_id: str | None = None) -> list[JobIndexItem]: ...
 
+    def list_page(
+        self,
+        *,
+        tenant_id: str | None = None,
+        status: str | None = None,
+        limit: int,
+        cursor: str | None = None,
+    ) -> JobIndexPage:
+        """Newest-first page; pass `next_cursor` back to continue after the last item."""
+        ...
+
+
+class JobIndexWriter(Protocol):
+    def upsert(self, item: JobIndexItem) -> None:
+        """Record the job's current summary; must never fail the job write it follows."""
+        ...
+
+
+def encode_job_cursor(item: JobIndexItem) -> str:
+    raw = json.dumps(list(item.sort_key()), ensure_ascii=False, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_job_cursor(cursor: str) -> tuple[str, str, str]:
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        raw = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")).decode("utf-8"))
+    except (UnicodeError, binascii.Error, json.JSONDecodeError) as e:
+        raise AdminJobCursorInvalidError() from e
+    if not isinstance(raw, list) or len(raw) != 3 or not all(isinstance(v, str) for v in raw):
+        raise AdminJobCursorInvalidError()
+    return (raw[0], raw[1], raw[2])
+
+
+def page_job_items(
+    items: Iterable[JobIndexItem],
+    *,
+    status: str | None,
+    limit: int,
+    cursor: str | None,
+) -> JobIndexPage:
+    """Page an in-memory listing with the same keyset order as the persistent indexes."""
+    after = None if cursor is None else decode_job_cursor(cursor)
+    selected = sorted(
+        (
+            item
+            for item in items
+            if (status is None or item.status == status)
+            and (after is None or item.sort_key() < after)
+        ),
+        key=JobIndexItem.sort_key,
+        reverse=True,
+    )
+    page = selected[:limit]
+    next_cursor = encode_job_cursor(page[-1]) if len(selected) > limit else None
+    return JobIndexPage(items=page, next_cursor=next_cursor)
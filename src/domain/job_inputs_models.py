@@ -1,13 +1,15 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from typing import BinaryIO
 
 
 @dataclass(frozen=True)
 class DatasetUpload:
+    """One uploaded file; `stream` is read chunk-by-chunk and never loaded whole."""
+
     role: str
-    data: bytes
+    stream: BinaryIO
     original_name: str | None
     filename_override: str | None
     content_type: str | None
-
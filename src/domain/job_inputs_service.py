@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import io
 import logging
 from collections.abc import Sequence
 from typing import cast
 from zipfile import BadZipFile
 
 from src.domain.dataset_preview import dataset_preview_with_options
+from src.domain.dataset_preview_cache import DatasetPreviewCache
+from src.domain.dataset_sidecar_ingest import DatasetSidecarIngestor
 from src.domain.excel_file_checks import looks_like_encrypted_xlsx
 from src.domain.inputs_manifest import (
     MANIFEST_REL_PATH,
@@ -13,13 +16,15 @@ from src.domain.inputs_manifest import (
     PreparedDataset,
     inputs_fingerprint,
     manifest_payload,
-    prepare_dataset,
+    primary_dataset_csv_scan,
     primary_dataset_details,
+    primary_dataset_sha256,
     read_manifest_json,
 )
 from src.domain.inputs_manifest_dataset_options import primary_dataset_excel_options
 from src.domain.inputs_preview_datasets import datasets_preview_payload
 from src.domain.job_inputs_models import DatasetUpload
+from src.domain.job_inputs_staging import discard_staged_datasets, stage_uploads
 from src.domain.job_store import JobStore
 from src.domain.job_workspace_store import JobWorkspaceStore
 from src.domain.models import ArtifactKind, ArtifactRef, Job, JobInputs, JobStatus
@@ -41,9 +46,18 @@ logger = logging.getLogger(__name__)
 
 
 class JobInputsService:
-    def __init__(self, *, store: JobStore, workspace: JobWorkspaceStore):
+    def __init__(
+        self,
+        *,
+        store: JobStore,
+        workspace: JobWorkspaceStore,
+        preview_cache: DatasetPreviewCache | None = None,
+        sidecars: DatasetSidecarIngestor | None = None,
+    ):
         self._store = store
         self._workspace = workspace
+        self._preview_cache = preview_cache
+        self._sidecars = sidecars
 
     def _write_manifest(self, *, tenant_id: str, job_id: str, manifest: JsonObject) -> None:
         try:
@@ -132,7 +146,7 @@ class JobInputsService:
             uploads=[
                 DatasetUpload(
                     role=ROLE_PRIMARY_DATASET,
-                    data=data,
+                    stream=io.BytesIO(data),
                     original_name=original_name,
                     filename_override=filename_override,
                     content_type=content_type,
@@ -140,44 +154,17 @@ class JobInputsService:
             ],
         )
 
-    def _prepare_datasets(
-        self, *, tenant_id: str, job_id: str, uploads: Sequence[DatasetUpload]
-    ) -> list[PreparedDataset]:
-        prepared: list[PreparedDataset] = []
-        uploaded_at = utc_now().isoformat()
-        for upload in uploads:
-            if len(upload.data) == 0:
-                logger.warning(
-                    "SS_INPUT_EMPTY_FILE",
-                    extra={
-                        "tenant_id": tenant_id,
-                        "job_id": job_id,
-                        "input_filename": upload.original_name,
-                        "role": upload.role,
-                    },
-                )
-                raise InputEmptyFileError()
-            prepared.append(
-                prepare_dataset(
-                    data=upload.data,
-                    original_name=upload.original_name,
-                    filename_override=upload.filename_override,
-                    role=upload.role,
-                    content_type=upload.content_type,
-                    uploaded_at=uploaded_at,
-                )
-            )
-        return prepared
-
     def _persist_datasets(
         self, *, tenant_id: str, job_id: str, datasets: Sequence[PreparedDataset]
     ) -> None:
         for dataset in datasets:
-            self._workspace.write_bytes(
+            if dataset.staged is None:
+                continue
+            self._workspace.promote_staged(
                 tenant_id=tenant_id,
                 job_id=job_id,
+                staged=dataset.staged,
                 rel_path=dataset.rel_path,
-                data=dataset.data,
             )
         self._write_manifest(
             tenant_id=tenant_id,
@@ -188,6 +175,7 @@ class JobInputsService:
     def upload_datasets(
         self, *, tenant_id: str = DEFAULT_TENANT_ID, job_id: str, uploads: Sequence[DatasetUpload]
     ) -> JsonObject:
+        """Spool, validate and commit uploads; blocking IO, so async callers use a thread."""
         if len(uploads) == 0:
             raise InputParseFailedError(filename=MANIFEST_REL_PATH, detail="no datasets uploaded")
 
@@ -198,32 +186,48 @@ class JobInputsService:
         }:
             raise JobLockedError(job_id=job_id, status=job.status.value, operation="inputs.upload")
 
-        prepared = self._prepare_datasets(tenant_id=tenant_id, job_id=job_id, uploads=uploads)
-        self._validate_dataset_set(datasets=prepared)
-        fingerprint = inputs_fingerprint(datasets=prepared)
+        prepared = stage_uploads(
+            workspace=self._workspace, tenant_id=tenant_id, job_id=job_id,
+            uploads=uploads, uploaded_at=utc_now().isoformat(),
+        )
+        try:
+            fingerprint = self._commit_datasets(tenant_id=tenant_id, job=job, datasets=prepared)
+        finally:
+            discard_staged_datasets(
+                workspace=self._workspace, tenant_id=tenant_id, job_id=job_id, datasets=prepared
+            )
+        if self._sidecars is not None:
+            self._sidecars.schedule(workspace=self._workspace, tenant_id=tenant_id, job_id=job_id)
+        logger.info(
+            "SS_INPUT_UPLOAD_DONE",
+            extra={"tenant_id": tenant_id, "job_id": job_id, "datasets": len(prepared)},
+        )
+        payload = dict(job_id=job_id, manifest_rel_path=MANIFEST_REL_PATH, fingerprint=fingerprint)
+        return cast(JsonObject, payload)
+
+    def _commit_datasets(
+        self, *, tenant_id: str, job: Job, datasets: Sequence[PreparedDataset]
+    ) -> str:
+        self._validate_dataset_set(datasets=datasets)
+        fingerprint = inputs_fingerprint(datasets=datasets)
         logger.info(
             "SS_INPUT_UPLOAD_START",
             extra={
                 "tenant_id": tenant_id,
-                "job_id": job_id,
-                "datasets": len(prepared),
+                "job_id": job.job_id,
+                "datasets": len(datasets),
                 "fingerprint": fingerprint,
+                "size_bytes": sum(dataset.size_bytes for dataset in datasets),
             },
         )
-
-        self._persist_datasets(tenant_id=tenant_id, job_id=job_id, datasets=prepared)
+        self._persist_datasets(tenant_id=tenant_id, job_id=job.job_id, datasets=datasets)
         self._save_job_inputs(
             tenant_id=tenant_id,
             job=job,
             fingerprint=fingerprint,
-            datasets=prepared,
+            datasets=datasets,
         )
-        logger.info(
-            "SS_INPUT_UPLOAD_DONE",
-            extra={"tenant_id": tenant_id, "job_id": job_id, "datasets": len(prepared)},
-        )
-        payload = dict(job_id=job_id, manifest_rel_path=MANIFEST_REL_PATH, fingerprint=fingerprint)
-        return cast(JsonObject, payload)
+        return fingerprint
 
     def _load_primary_manifest(
         self, *, tenant_id: str, job_id: str, manifest_rel_path: str
@@ -280,7 +284,9 @@ class JobInputsService:
         try:
             preview = dataset_preview_with_options(
                 path=dataset_path, fmt=fmt, rows=rows, columns=columns,
-                sheet_name=sheet_name, header_row=header_row
+                sheet_name=sheet_name, header_row=header_row,
+                sha256=primary_dataset_sha256(manifest),
+                csv_scan=primary_dataset_csv_scan(manifest), cache=self._preview_cache,
             )
         except (KeyError, UnicodeDecodeError, ValueError, OSError, ImportError, BadZipFile) as e:
             logger.warning(
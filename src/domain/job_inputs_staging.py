@@ -0,0 +1,120 @@
+from __future__ import annotations
+
+import logging
+from collections.abc import Iterator, Sequence
+from pathlib import Path
+from typing import BinaryIO
+
+from src.domain.csv_scan import CsvScanner
+from src.domain.inputs_manifest import INPUTS_DIR, PreparedDataset, prepare_dataset
+from src.domain.job_inputs_models import DatasetUpload
+from src.domain.job_workspace_store import JobWorkspaceStore
+from src.infra.input_exceptions import InputEmptyFileError
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+
+def iter_stream_chunks(stream: BinaryIO, *, chunk_size: int = UPLOAD_CHUNK_SIZE) -> Iterator[bytes]:
+    while True:
+        chunk = stream.read(chunk_size)
+        if not chunk:
+            return
+        yield chunk
+
+
+def csv_scanner_for(filename: str | None) -> CsvScanner | None:
+    """A scanner to run over the upload stream when `filename` names a CSV, else None."""
+    if filename is None or Path(filename.strip()).suffix.lower() != ".csv":
+        return None
+    return CsvScanner()
+
+
+def stage_uploads(
+    *,
+    workspace: JobWorkspaceStore,
+    tenant_id: str,
+    job_id: str,
+    uploads: Sequence[DatasetUpload],
+    uploaded_at: str,
+) -> list[PreparedDataset]:
+    """Spool each upload into `inputs/` (hashing on the way) and describe it.
+
+    Memory stays at one chunk per upload. On any failure the files staged so far are removed;
+    on success the caller owns them and must promote or `discard_staged_datasets` them.
+    """
+    prepared: list[PreparedDataset] = []
+    try:
+        for upload in uploads:
+            prepared.append(
+                _stage_one(
+                    workspace=workspace,
+                    tenant_id=tenant_id,
+                    job_id=job_id,
+                    upload=upload,
+                    uploaded_at=uploaded_at,
+                )
+            )
+    except BaseException:
+        discard_staged_datasets(
+            workspace=workspace, tenant_id=tenant_id, job_id=job_id, datasets=prepared
+        )
+        raise
+    return prepared
+
+
+def discard_staged_datasets(
+    *,
+    workspace: JobWorkspaceStore,
+    tenant_id: str,
+    job_id: str,
+    datasets: Sequence[PreparedDataset],
+) -> None:
+    for dataset in datasets:
+        if dataset.staged is not None:
+            workspace.discard_staged(tenant_id=tenant_id, job_id=job_id, staged=dataset.staged)
+
+
+def _stage_one(
+    *,
+    workspace: JobWorkspaceStore,
+    tenant_id: str,
+    job_id: str,
+    upload: DatasetUpload,
+    uploaded_at: str,
+) -> PreparedDataset:
+    chunks = iter_stream_chunks(upload.stream)
+    scanner = csv_scanner_for(
+        upload.original_name if upload.filename_override is None else upload.filename_override
+    )
+    staged = workspace.stage_stream(
+        tenant_id=tenant_id,
+        job_id=job_id,
+        rel_dir=INPUTS_DIR,
+        chunks=chunks if scanner is None else scanner.wrap(chunks),
+    )
+    try:
+        if staged.size_bytes == 0:
+            logger.warning(
+                "SS_INPUT_EMPTY_FILE",
+                extra={
+                    "tenant_id": tenant_id,
+                    "job_id": job_id,
+                    "input_filename": upload.original_name,
+                    "role": upload.role,
+                },
+            )
+            raise InputEmptyFileError()
+        return prepare_dataset(
+            staged=staged,
+            original_name=upload.original_name,
+            filename_override=upload.filename_override,
+            role=upload.role,
+            content_type=upload.content_type,
+            uploaded_at=uploaded_at,
+            csv_scan=None if scanner is None else scanner.result(),
+        )
+    except BaseException:
+        workspace.discard_staged(tenant_id=tenant_id, job_id=job_id, staged=staged)
+        raise
@@ -24,10 +24,12 @@ def retry_failed_job(
     tenant_id: str = DEFAULT_TENANT_ID,
     job: Job,
     output_formats: list[str] | None,
+    bypass_run_cache: bool = False,
 ) -> Job:
     from_status = job.status.value
     if output_formats is not None or job.output_formats is None:
         job.output_formats = list(normalize_output_formats(output_formats))
+    job.run_cache_bypass = bypass_run_cache
     state_machine.ensure_transition(
         job_id=job.job_id,
         from_status=job.status,
@@ -53,6 +55,6 @@ def retry_failed_job(
             "to_status": job.status.value,
             "scheduled_at": job.scheduled_at,
         },
-        metadata={"retry": True},
+        metadata={"retry": True, "bypass_run_cache": bypass_run_cache},
     )
     return job
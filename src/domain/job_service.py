@@ -147,6 +147,7 @@ class JobService:
         answers: dict[str, JsonValue] | None = None,
         default_overrides: dict[str, JsonValue] | None = None,
         expert_suggestions_feedback: dict[str, JsonValue] | None = None,
+        bypass_run_cache: bool = False,
     ) -> Job:
         for attempt in range(3):
             job = self._store.load(tenant_id=tenant_id, job_id=job_id)
@@ -156,10 +157,11 @@ class JobService:
                 return retry_failed_job(
                     store=self._store, scheduler=self._scheduler, state_machine=self._state_machine,
                     audit=self._audit, audit_context=self._audit_context, tenant_id=tenant_id,
-                    job=job, output_formats=output_formats,
+                    job=job, output_formats=output_formats, bypass_run_cache=bypass_run_cache,
                 )
             try:
                 job.output_formats = list(normalize_output_formats(output_formats))
+                job.run_cache_bypass = bypass_run_cache
                 self._state_machine.ensure_transition(
                     job_id=job_id, from_status=job.status, to_status=JobStatus.CONFIRMED
                 )
@@ -280,5 +282,6 @@ class JobService:
                 "transitions": cast(JsonValue, transitions),
                 "scheduled_at": job.scheduled_at,
             },
+            metadata={"bypass_run_cache": job.run_cache_bypass},
         )
         return job
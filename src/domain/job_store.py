@@ -30,3 +30,11 @@ class JobStore(Protocol):
         payload: JsonObject,
         tenant_id: str = DEFAULT_TENANT_ID,
     ) -> None: ...
+
+
+class JobRevisionSource(Protocol):
+    def revision(
+        self, job_id: str, *, tenant_id: str = DEFAULT_TENANT_ID
+    ) -> tuple[int, ...] | None:
+        """Cheap fingerprint that changes whenever the stored job changes; None if missing."""
+        ...
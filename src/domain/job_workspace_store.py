@@ -1,11 +1,22 @@
 from __future__ import annotations
 
+from collections.abc import Iterable
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Protocol
 
 from src.utils.tenancy import DEFAULT_TENANT_ID
 
 
+@dataclass(frozen=True)
+class StagedFile:
+    """Temp file written by `stage_stream`, not yet visible at its final `rel_path`."""
+
+    rel_path: str
+    sha256: str
+    size_bytes: int
+
+
 class JobWorkspaceStore(Protocol):
     def write_bytes(
         self,
@@ -24,3 +35,34 @@ class JobWorkspaceStore(Protocol):
         tenant_id: str = DEFAULT_TENANT_ID,
     ) -> Path: ...
 
+    def stage_stream(
+        self,
+        *,
+        job_id: str,
+        rel_dir: str,
+        chunks: Iterable[bytes],
+        tenant_id: str = DEFAULT_TENANT_ID,
+    ) -> StagedFile:
+        """Write `chunks` to a temp file under `rel_dir`, hashing as they arrive."""
+        ...
+
+    def promote_staged(
+        self,
+        *,
+        job_id: str,
+        staged: StagedFile,
+        rel_path: str,
+        tenant_id: str = DEFAULT_TENANT_ID,
+    ) -> None:
+        """Atomically rename a staged file into place at `rel_path`."""
+        ...
+
+    def discard_staged(
+        self,
+        *,
+        job_id: str,
+        staged: StagedFile,
+        tenant_id: str = DEFAULT_TENANT_ID,
+    ) -> None:
+        """Remove a staged file; a no-op once it has been promoted."""
+        ...
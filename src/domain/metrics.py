@@ -16,8 +16,43 @@ class RuntimeMetrics(Protocol):
     def set_worker_up(self, *, worker_id: str, up: bool) -> None: ...
 
 
+class JobCacheMetrics(Protocol):
+    def record_job_cache_lookup(self, *, hit: bool) -> None: ...
+
+
+class DatasetPreviewCacheMetrics(Protocol):
+    def record_dataset_preview_cache_lookup(self, *, hit: bool) -> None: ...
+
+
+class RunResultCacheMetrics(Protocol):
+    def record_run_result_cache_lookup(self, *, hit: bool) -> None: ...
+
+
+class BlockingIOMetrics(Protocol):
+    def blocking_io_inflight_inc(self) -> None: ...
+
+    def blocking_io_inflight_dec(self) -> None: ...
+
+    def observe_blocking_io(
+        self, *, operation: str, wait_seconds: float, duration_seconds: float
+    ) -> None: ...
+
+
+class DurabilityMetrics(Protocol):
+    def observe_durable_commit(self, *, policy: str, seconds: float) -> None: ...
+
+    def observe_durable_commit_batch(self, *, policy: str, files: int) -> None: ...
+
+
 @dataclass(frozen=True)
-class NoopMetrics(RuntimeMetrics):
+class NoopMetrics(
+    RuntimeMetrics,
+    JobCacheMetrics,
+    DatasetPreviewCacheMetrics,
+    RunResultCacheMetrics,
+    BlockingIOMetrics,
+    DurabilityMetrics,
+):
     def record_job_created(self) -> None:
         return None
 
@@ -33,3 +68,28 @@ class NoopMetrics(RuntimeMetrics):
     def set_worker_up(self, *, worker_id: str, up: bool) -> None:
         return None
 
+    def record_job_cache_lookup(self, *, hit: bool) -> None:
+        return None
+
+    def record_dataset_preview_cache_lookup(self, *, hit: bool) -> None:
+        return None
+
+    def record_run_result_cache_lookup(self, *, hit: bool) -> None:
+        return None
+
+    def blocking_io_inflight_inc(self) -> None:
+        return None
+
+    def blocking_io_inflight_dec(self) -> None:
+        return None
+
+    def observe_blocking_io(
+        self, *, operation: str, wait_seconds: float, duration_seconds: float
+    ) -> None:
+        return None
+
+    def observe_durable_commit(self, *, policy: str, seconds: float) -> None:
+        return None
+
+    def observe_durable_commit_batch(self, *, policy: str, files: int) -> None:
+        return None
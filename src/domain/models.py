@@ -282,6 +282,7 @@ class Job(BaseModel):
     redeem_task_code: str | None = None
     auth_token: str | None = None
     auth_expires_at: str | None = None
+    run_cache_bypass: bool = False
 
     @field_validator("schema_version")
     @classmethod
@@ -5,7 +5,13 @@ from collections.abc import Mapping
 from json import JSONDecodeError
 
 from src.domain.dataset_preview import dataset_preview_with_options
-from src.domain.inputs_manifest import primary_dataset_details, read_manifest_json
+from src.domain.dataset_preview_cache import DatasetPreviewCache
+from src.domain.inputs_manifest import (
+    primary_dataset_csv_scan,
+    primary_dataset_details,
+    primary_dataset_sha256,
+    read_manifest_json,
+)
 from src.domain.inputs_manifest_dataset_options import primary_dataset_excel_options
 from src.domain.job_workspace_store import JobWorkspaceStore
 from src.domain.models import Draft, Job, JobConfirmation
@@ -63,7 +69,13 @@ def analysis_spec_from_draft(*, job: Job) -> dict[str, JsonValue]:
     }
 
 
-def validate_contract_columns(*, workspace: JobWorkspaceStore, tenant_id: str, job: Job) -> None:
+def validate_contract_columns(
+    *,
+    workspace: JobWorkspaceStore,
+    tenant_id: str,
+    job: Job,
+    preview_cache: DatasetPreviewCache | None = None,
+) -> None:
     if job.draft is None:
         return
     if job.inputs is None or job.inputs.manifest_rel_path is None:
@@ -88,7 +100,8 @@ def validate_contract_columns(*, workspace: JobWorkspaceStore, tenant_id: str, j
         sheet_name, header_row = primary_dataset_excel_options(manifest)
         preview = dataset_preview_with_options(
             path=dataset_path, fmt=fmt, rows=1, columns=300, sheet_name=sheet_name,
-            header_row=header_row
+            header_row=header_row, sha256=primary_dataset_sha256(manifest),
+            csv_scan=primary_dataset_csv_scan(manifest), cache=preview_cache,
         )
         names = _preview_column_names(preview=preview)
     except (FileNotFoundError, KeyError, OSError, JSONDecodeError, ValueError,
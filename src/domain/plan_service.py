@@ -5,6 +5,7 @@ from typing import cast
 
 from src.domain import do_template_plan_support
 from src.domain import plan_contract as pc
+from src.domain.dataset_preview_cache import DatasetPreviewCache
 from src.domain.do_template_catalog import DoTemplateCatalog
 from src.domain.do_template_repository import DoTemplateRepository
 from src.domain.job_store import JobStore
@@ -46,6 +47,7 @@ class PlanService:
         do_template_repo: DoTemplateRepository,
         llm: LLMClient | None = None,
         plan_generation_max_steps: int = _DEFAULT_PLAN_GENERATION_MAX_STEPS,
+        preview_cache: DatasetPreviewCache | None = None,
     ):
         self._store = store
         self._workspace = workspace
@@ -53,6 +55,7 @@ class PlanService:
         self._do_template_repo = do_template_repo
         self._llm = llm
         self._plan_generation_max_steps = int(plan_generation_max_steps)
+        self._preview_cache = preview_cache
 
     def _return_existing_plan_if_idempotent(
         self, *, job: Job, expected_plan_id: str
@@ -121,7 +124,10 @@ class PlanService:
             analysis_spec=analysis_spec,
             do_template_repo=self._do_template_repo,
         )
-        pc.validate_contract_columns(workspace=self._workspace, tenant_id=tenant_id, job=job)
+        pc.validate_contract_columns(
+            workspace=self._workspace, tenant_id=tenant_id, job=job,
+            preview_cache=self._preview_cache,
+        )
         plan = self._build_plan_with_fallback(
             tenant_id=tenant_id, job=job, confirmation=confirmation, plan_id=expected_plan_id
         )
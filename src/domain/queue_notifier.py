@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from typing import Protocol
+
+
+class QueueNotifier(Protocol):
+    """Lets an idle worker block until new queue work is signalled instead of polling."""
+
+    def wait(self, *, timeout_seconds: float) -> bool:
+        """Block until work is signalled (True), or timeout/interrupt (False)."""
+        ...
+
+    def interrupt(self) -> None:
+        """Wake every current and future `wait` immediately (used on shutdown)."""
+        ...
+
+    def close(self) -> None: ...
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass, field
+
+DEFAULT_JOB_PRIORITY = 0
+DEFAULT_TENANT_KEY = "*"
+
+
+@dataclass(frozen=True)
+class TenantQueueLoad:
+    """Snapshot of one tenant; `ready` only needs to be positive when jobs are waiting."""
+
+    tenant_id: str
+    ready: int
+    inflight: int
+
+
+@dataclass(frozen=True)
+class QueueSchedulingPolicy:
+    """Per-tenant weights and concurrency caps; the `*` key sets the default for other tenants.
+
+    A missing or non-positive cap means unlimited.
+    """
+
+    tenant_weights: Mapping[str, float] = field(default_factory=dict)
+    tenant_max_inflight: Mapping[str, int] = field(default_factory=dict)
+
+    def weight(self, tenant_id: str) -> float:
+        default = self.tenant_weights.get(DEFAULT_TENANT_KEY, 1.0)
+        weight = self.tenant_weights.get(tenant_id, default)
+        return weight if weight > 0 else 1.0
+
+    def max_inflight(self, tenant_id: str) -> int | None:
+        cap = self.tenant_max_inflight.get(
+            tenant_id, self.tenant_max_inflight.get(DEFAULT_TENANT_KEY, 0)
+        )
+        return cap if cap > 0 else None
+
+    def is_default(self) -> bool:
+        return not self.tenant_weights and not self.tenant_max_inflight
+
+
+class FairShareScheduler:
+    """Orders tenants for the next claim: weighted fair share across tenants, with caps.
+
+    Tenants at their concurrency cap or without ready jobs are skipped. The rest are ordered
+    by in-flight jobs per unit of weight (the share held right now, shared by every worker
+    through the queue), then by a start-time virtual clock advanced by `1 / weight` per claim
+    in this process, so a single worker still alternates tenants in proportion to their
+    weights. A tenant that was idle re-enters at the current virtual time instead of
+    replaying the credit it did not use. Job priority only orders jobs within a tenant.
+    """
+
+    def __init__(self, *, policy: QueueSchedulingPolicy | None = None):
+        self._policy = QueueSchedulingPolicy() if policy is None else policy
+        self._lock = threading.Lock()
+        self._virtual_finish: dict[str, float] = {}
+        self._virtual_now = 0.0
+
+    @property
+    def policy(self) -> QueueSchedulingPolicy:
+        return self._policy
+
+    def order(self, loads: Iterable[TenantQueueLoad]) -> list[str]:
+        eligible = [load for load in loads if load.ready > 0 and not self._at_cap(load)]
+        with self._lock:
+            tags = [self._virtual_finish.get(load.tenant_id, 0.0) for load in eligible]
+            self._virtual_now = max(self._virtual_now, min(tags, default=self._virtual_now))
+            self._virtual_finish = {
+                tenant_id: tag
+                for tenant_id, tag in self._virtual_finish.items()
+                if tag > self._virtual_now
+            }
+            now = self._virtual_now
+        ranked = sorted(
+            eligible,
+            key=lambda load: (
+                load.inflight / self._policy.weight(load.tenant_id),
+                max(self._virtual_finish.get(load.tenant_id, now), now),
+                load.tenant_id,
+            ),
+        )
+        return [load.tenant_id for load in ranked]
+
+    def record_claim(self, *, tenant_id: str) -> None:
+        with self._lock:
+            start = max(self._virtual_finish.get(tenant_id, self._virtual_now), self._virtual_now)
+            self._virtual_finish[tenant_id] = start + 1.0 / self._policy.weight(tenant_id)
+
+    def _at_cap(self, load: TenantQueueLoad) -> bool:
+        cap = self._policy.max_inflight(load.tenant_id)
+        return cap is not None and load.inflight >= cap
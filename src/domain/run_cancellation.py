@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+import threading
+
+from src.utils.tenancy import DEFAULT_TENANT_ID
+
+
+class RunCancellation:
+    """Jobs whose running Stata processes must stop, shared by the worker and its runner.
+
+    The worker cancels a job when it loses the job's lease (another worker may already be
+    running it); the runner polls `cancelled` while supervising the process and terminates it.
+    The worker clears the job once it is done with the claim.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._cancelled: set[tuple[str, str]] = set()
+
+    def cancel(self, *, tenant_id: str = DEFAULT_TENANT_ID, job_id: str) -> None:
+        with self._lock:
+            self._cancelled.add((tenant_id, job_id))
+
+    def cancelled(self, *, tenant_id: str = DEFAULT_TENANT_ID, job_id: str) -> bool:
+        with self._lock:
+            return (tenant_id, job_id) in self._cancelled
+
+    def clear(self, *, tenant_id: str = DEFAULT_TENANT_ID, job_id: str) -> None:
+        with self._lock:
+            self._cancelled.discard((tenant_id, job_id))
@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+from collections.abc import Mapping, Sequence
+from pathlib import Path
+from typing import Protocol
+
+from src.domain.dataset_preview_cache import content_sha256
+from src.domain.dataset_sidecar import SIDECAR_DIRNAME
+from src.infra.input_blobs import input_sha256_by_rel_path
+from src.utils.json_types import JsonObject
+
+logger = logging.getLogger(__name__)
+
+# Bump when what a cache entry holds, or how it is restored, changes.
+RUN_RESULT_CACHE_VERSION = 1
+_INPUTS_MANIFEST_FILENAME = "manifest.json"
+
+
+class RunResultCache(Protocol):
+    """Successful Stata runs by content address, restored into a new run directory."""
+
+    @property
+    def stata_cmd(self) -> tuple[str, ...]: ...
+
+    def restore(self, key: str, *, run_dir: Path) -> JsonObject | None:
+        """Unpack the entry's files under `run_dir` and return its result payload, or None."""
+        ...
+
+    def store(self, key: str, *, run_dir: Path, files: Sequence[str], result: JsonObject) -> None:
+        """Pack `files` (relative to `run_dir`) with `result`; failures only log."""
+        ...
+
+
+def template_is_deterministic(meta: Mapping[str, object]) -> bool:
+    """Templates opt out of run caching with `"deterministic": false` in their meta."""
+    return meta.get("deterministic") is not False
+
+
+def run_cache_key(
+    *,
+    tenant_id: str,
+    do_file: str,
+    inputs: Sequence[tuple[str, str]],
+    stata_cmd: Sequence[str],
+    template_id: str,
+    template_version: str | None,
+) -> str:
+    """Content address of one run: everything that can change what Stata produces."""
+    canonical = json.dumps(
+        [
+            RUN_RESULT_CACHE_VERSION,
+            tenant_id,
+            hashlib.sha256(do_file.encode("utf-8")).hexdigest(),
+            [list(item) for item in sorted(inputs)],
+            list(stata_cmd),
+            template_id,
+            template_version,
+        ],
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+    return hashlib.sha256(canonical).hexdigest()
+
+
+def staged_inputs_fingerprint(inputs_dir: Path) -> list[tuple[str, str]]:
+    """(rel_path, sha256) for each file a run stages from `inputs_dir`.
+
+    Datasets reuse the manifest sha256; other files are hashed (memoized by stat). The
+    manifest itself only carries upload metadata and is left out.
+    """
+    try:
+        raw = json.loads((inputs_dir / _INPUTS_MANIFEST_FILENAME).read_bytes())
+    except (OSError, ValueError):
+        raw = {}
+    known = input_sha256_by_rel_path(raw) if isinstance(raw, dict) else {}
+    out: list[tuple[str, str]] = []
+    for root, dirs, names in os.walk(inputs_dir, followlinks=False):
+        dirs[:] = [name for name in dirs if name != SIDECAR_DIRNAME]
+        for name in names:
+            path = Path(root) / name
+            rel = path.relative_to(inputs_dir).as_posix()
+            if rel == _INPUTS_MANIFEST_FILENAME or path.is_symlink():
+                continue
+            sha256 = known.get(f"inputs/{rel}")
+            out.append((rel, content_sha256(path) if sha256 is None else sha256))
+    return sorted(out)
+
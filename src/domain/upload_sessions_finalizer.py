@@ -1,20 +1,23 @@
 from __future__ import annotations
 
-import hashlib
 import logging
-from dataclasses import dataclass, replace
+from dataclasses import replace
 from datetime import datetime
 from typing import cast
 
 from src.config import Config
+from src.domain.csv_scan import CsvScan, CsvScanner
+from src.domain.dataset_sidecar_ingest import DatasetSidecarIngestor
 from src.domain.inputs_manifest import (
+    INPUTS_DIR,
     MANIFEST_REL_PATH,
     PreparedDataset,
     inputs_fingerprint,
     prepare_dataset,
 )
+from src.domain.job_inputs_staging import csv_scanner_for
 from src.domain.job_store import JobStore
-from src.domain.job_workspace_store import JobWorkspaceStore
+from src.domain.job_workspace_store import JobWorkspaceStore, StagedFile
 from src.domain.object_store import CompletedPart, ObjectStore
 from src.domain.upload_session_id import job_id_from_upload_session_id
 from src.domain.upload_session_store import UploadSessionStore
@@ -25,6 +28,11 @@ from src.domain.upload_sessions_manifest import (
     upsert_manifest_dataset,
 )
 from src.domain.upload_sessions_models import FinalizeSuccessPayload, UploadSessionRecord
+from src.domain.upload_sessions_parts import (
+    FinalizePart,
+    normalize_etag,
+    parse_finalize_parts,
+)
 from src.infra.object_store_exceptions import ObjectStoreOperationFailedError
 from src.infra.upload_session_exceptions import (
     UploadPartsInvalidError,
@@ -37,19 +45,7 @@ from src.utils.time import utc_now
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass(frozen=True)
-class _FinalizePart:
-    part_number: int
-    etag: str
-    sha256: str | None
-
-
-def _normalize_etag(etag: str) -> str:
-    candidate = etag.strip()
-    if candidate.startswith('"') and candidate.endswith('"') and len(candidate) >= 2:
-        candidate = candidate[1:-1]
-    return candidate.strip()
+_STREAM_CHUNK_SIZE = 1024 * 1024
 
 
 def _failure(*, error_code: str, message: str, retryable: bool) -> JsonObject:
@@ -73,12 +69,14 @@ class UploadSessionFinalizer:
         workspace: JobWorkspaceStore,
         object_store: ObjectStore,
         session_store: UploadSessionStore,
+        sidecars: DatasetSidecarIngestor | None = None,
     ):
         self._config = config
         self._store = store
         self._workspace = workspace
         self._object_store = object_store
         self._sessions = session_store
+        self._sidecars = sidecars
 
     def finalize(
         self,
@@ -87,6 +85,12 @@ class UploadSessionFinalizer:
         upload_session_id: str,
         parts: list[dict[str, object]],
     ) -> JsonObject:
+        """Verify the upload, stream it into the job workspace and record it in the manifest.
+
+        The object is streamed into a staged temp file (hashed on the way) outside the job's
+        upload lock, so memory stays bounded and other sessions of the job are not blocked;
+        the lock is re-taken only to promote the file and update the manifest.
+        """
         job_id = self._job_id(upload_session_id=upload_session_id)
         now = utc_now()
         with self._sessions.lock_job(tenant_id=tenant_id, job_id=job_id):
@@ -97,55 +101,119 @@ class UploadSessionFinalizer:
             self._assert_not_expired(session=session, now=now)
             if session.finalized is not None:
                 return session.finalized.to_payload()
-            parsed_parts = self._parse_parts(parts=parts, upload_strategy=session.upload_strategy)
-            if session.upload_strategy == "multipart":
-                incomplete = self._ensure_multipart_complete(session=session, parts=parsed_parts)
-                if incomplete is not None:
-                    return incomplete
-            else:
-                etag_failure = self._direct_etag_failure(session=session, part=parsed_parts[0])
-                if etag_failure is not None:
-                    return etag_failure
-            data = self._read_object_bytes(object_key=session.object_key)
-            if data is None:
-                return _failure(
-                    error_code="UPLOAD_INCOMPLETE",
-                    message="uploaded object not found",
-                    retryable=True,
-                )
-            if len(data) != int(session.size_bytes):
-                return _failure(
-                    error_code="UPLOAD_INCOMPLETE",
-                    message="uploaded object size mismatch",
-                    retryable=True,
-                )
-            sha256_hex = hashlib.sha256(data).hexdigest()
-            if self._direct_sha256_mismatch(
-                upload_strategy=session.upload_strategy,
-                parts=parsed_parts,
-                actual_sha256=sha256_hex,
-            ):
-                return _failure(
-                    error_code="CHECKSUM_MISMATCH",
-                    message="sha256 mismatch",
-                    retryable=True,
-                )
-            finalized, updated_session = self._materialize_and_update_state(
+            parsed_parts = parse_finalize_parts(
+                parts=parts, upload_strategy=session.upload_strategy
+            )
+            failure = self._upload_failure(session=session, parts=parsed_parts)
+            if failure is not None:
+                return failure
+        scanner = csv_scanner_for(session.original_name)
+        staged = self._stage_object(
+            tenant_id=tenant_id, job_id=job_id, session=session, scanner=scanner
+        )
+        if staged is None:
+            return _failure(
+                error_code="UPLOAD_INCOMPLETE",
+                message="uploaded object not found",
+                retryable=True,
+            )
+        try:
+            return self._commit_staged(
                 tenant_id=tenant_id,
                 job_id=job_id,
                 session=session,
-                upload_session_id=upload_session_id,
-                data=data,
-                sha256_hex=sha256_hex,
+                parts=parsed_parts,
+                staged=staged,
                 uploaded_at=now.isoformat(),
+                csv_scan=None if scanner is None else scanner.result(),
+            )
+        finally:
+            self._workspace.discard_staged(tenant_id=tenant_id, job_id=job_id, staged=staged)
+
+    def _upload_failure(
+        self,
+        *,
+        session: UploadSessionRecord,
+        parts: list[FinalizePart],
+    ) -> JsonObject | None:
+        if session.upload_strategy == "multipart":
+            return self._ensure_multipart_complete(session=session, parts=parts)
+        return self._direct_etag_failure(session=session, part=parts[0])
+
+    def _stage_object(
+        self,
+        *,
+        tenant_id: str,
+        job_id: str,
+        session: UploadSessionRecord,
+        scanner: CsvScanner | None,
+    ) -> StagedFile | None:
+        try:
+            chunks = self._object_store.iter_bytes(
+                object_key=session.object_key,
+                chunk_size=_STREAM_CHUNK_SIZE,
+            )
+            return self._workspace.stage_stream(
+                tenant_id=tenant_id,
+                job_id=job_id,
+                rel_dir=INPUTS_DIR,
+                chunks=chunks if scanner is None else scanner.wrap(chunks),
+            )
+        except (KeyError, ObjectStoreOperationFailedError):
+            return None
+
+    def _commit_staged(
+        self,
+        *,
+        tenant_id: str,
+        job_id: str,
+        session: UploadSessionRecord,
+        parts: list[FinalizePart],
+        staged: StagedFile,
+        uploaded_at: str,
+        csv_scan: CsvScan | None,
+    ) -> JsonObject:
+        if staged.size_bytes != int(session.size_bytes):
+            return _failure(
+                error_code="UPLOAD_INCOMPLETE",
+                message="uploaded object size mismatch",
+                retryable=True,
+            )
+        if self._direct_sha256_mismatch(
+            upload_strategy=session.upload_strategy,
+            parts=parts,
+            actual_sha256=staged.sha256,
+        ):
+            return _failure(
+                error_code="CHECKSUM_MISMATCH",
+                message="sha256 mismatch",
+                retryable=True,
+            )
+        with self._sessions.lock_job(tenant_id=tenant_id, job_id=job_id):
+            current = self._sessions.load_session(
+                tenant_id=tenant_id,
+                upload_session_id=session.upload_session_id,
+            )
+            if current.finalized is not None:
+                return current.finalized.to_payload()
+            finalized, updated_session = self._materialize_and_update_state(
+                tenant_id=tenant_id,
+                job_id=job_id,
+                session=current,
+                staged=staged,
+                uploaded_at=uploaded_at,
+                csv_scan=csv_scan,
             )
             self._sessions.save_session(tenant_id=tenant_id, job_id=job_id, session=updated_session)
+        if self._sidecars is not None:
+            self._sidecars.schedule(workspace=self._workspace, tenant_id=tenant_id, job_id=job_id)
         logger.info(
             "SS_UPLOAD_SESSION_FINALIZE",
             extra={
                 "tenant_id": tenant_id,
                 "job_id": job_id,
-                "upload_session_id": upload_session_id,
+                "upload_session_id": session.upload_session_id,
+                "size_bytes": staged.size_bytes,
             },
         )
         return finalized.to_payload()
@@ -164,40 +232,11 @@ class UploadSessionFinalizer:
         if expires_at <= now:
             raise UploadSessionExpiredError(upload_session_id=session.upload_session_id)
 
-    def _parse_parts(
-        self,
-        *,
-        parts: list[dict[str, object]],
-        upload_strategy: str,
-    ) -> list[_FinalizePart]:
-        if not isinstance(parts, list) or len(parts) == 0:
-            raise UploadPartsInvalidError(reason="parts_empty")
-        parsed: list[_FinalizePart] = []
-        for item in parts:
-            parsed.append(self._parse_part(item=item))
-        if upload_strategy == "direct" and (len(parsed) != 1 or parsed[0].part_number != 1):
-            raise UploadPartsInvalidError(reason="direct_requires_single_part_1")
-        return parsed
-
-    def _parse_part(self, *, item: object) -> _FinalizePart:
-        if not isinstance(item, dict):
-            raise UploadPartsInvalidError(reason="parts_not_objects")
-        part_number = item.get("part_number")
-        etag = item.get("etag")
-        sha256 = item.get("sha256")
-        if not isinstance(part_number, int) or part_number < 1:
-            raise UploadPartsInvalidError(reason="part_number_invalid")
-        if not isinstance(etag, str) or etag.strip() == "":
-            raise UploadPartsInvalidError(reason="etag_invalid")
-        if sha256 is not None and (not isinstance(sha256, str) or sha256.strip() == ""):
-            raise UploadPartsInvalidError(reason="sha256_invalid")
-        return _FinalizePart(part_number=part_number, etag=_normalize_etag(etag), sha256=sha256)
-
     def _direct_etag_failure(
         self,
         *,
         session: UploadSessionRecord,
-        part: _FinalizePart,
+        part: FinalizePart,
     ) -> JsonObject | None:
         head = self._object_store.head_object(object_key=session.object_key)
         if head is None:
@@ -208,7 +247,7 @@ class UploadSessionFinalizer:
             )
         if head.etag is None or head.etag.strip() == "":
             return None
-        if _normalize_etag(head.etag) != part.etag:
+        if normalize_etag(head.etag) != part.etag:
             return _failure(
                 error_code="UPLOAD_INCOMPLETE",
                 message="uploaded object etag mismatch",
@@ -220,7 +259,7 @@ class UploadSessionFinalizer:
         self,
         *,
         session: UploadSessionRecord,
-        parts: list[_FinalizePart],
+        parts: list[FinalizePart],
     ) -> JsonObject | None:
         if session.part_count is None or session.upload_id is None:
             raise UploadPartsInvalidError(reason="multipart_session_missing_fields")
@@ -252,17 +291,11 @@ class UploadSessionFinalizer:
             )
         return None
 
-    def _read_object_bytes(self, *, object_key: str) -> bytes | None:
-        try:
-            return self._object_store.read_bytes(object_key=object_key)
-        except (KeyError, ObjectStoreOperationFailedError):
-            return None
-
     def _direct_sha256_mismatch(
         self,
         *,
         upload_strategy: str,
-        parts: list[_FinalizePart],
+        parts: list[FinalizePart],
         actual_sha256: str,
     ) -> bool:
         if upload_strategy != "direct":
@@ -278,17 +311,24 @@ class UploadSessionFinalizer:
         tenant_id: str,
         job_id: str,
         session: UploadSessionRecord,
-        upload_session_id: str,
-        data: bytes,
-        sha256_hex: str,
+        staged: StagedFile,
         uploaded_at: str,
+        csv_scan: CsvScan | None,
     ) -> tuple[FinalizeSuccessPayload, UploadSessionRecord]:
-        dataset = self._prepare_dataset(session=session, data=data, uploaded_at=uploaded_at)
-        self._write_dataset_bytes(
+        dataset = prepare_dataset(
+            staged=staged,
+            original_name=session.original_name,
+            filename_override=None,
+            role=session.role,
+            content_type=session.content_type,
+            uploaded_at=uploaded_at,
+            csv_scan=csv_scan,
+        )
+        self._workspace.promote_staged(
             tenant_id=tenant_id,
             job_id=job_id,
+            staged=staged,
             rel_path=dataset.rel_path,
-            data=data,
         )
         self._persist_manifest_and_job_inputs(
             tenant_id=tenant_id,
@@ -298,44 +338,13 @@ class UploadSessionFinalizer:
         finalized = FinalizeSuccessPayload(
             success=True,
             status="finalized",
-            upload_session_id=upload_session_id,
+            upload_session_id=session.upload_session_id,
             file_id=session.file_id,
-            sha256=sha256_hex,
-            size_bytes=len(data),
+            sha256=staged.sha256,
+            size_bytes=staged.size_bytes,
         )
         return finalized, replace(session, finalized=finalized)
 
-    def _prepare_dataset(
-        self,
-        *,
-        session: UploadSessionRecord,
-        data: bytes,
-        uploaded_at: str,
-    ) -> PreparedDataset:
-        return prepare_dataset(
-            data=data,
-            original_name=session.original_name,
-            filename_override=None,
-            role=session.role,
-            content_type=session.content_type,
-            uploaded_at=uploaded_at,
-        )
-
-    def _write_dataset_bytes(
-        self,
-        *,
-        tenant_id: str,
-        job_id: str,
-        rel_path: str,
-        data: bytes,
-    ) -> None:
-        self._workspace.write_bytes(
-            tenant_id=tenant_id,
-            job_id=job_id,
-            rel_path=rel_path,
-            data=data,
-        )
-
     def _persist_manifest_and_job_inputs(
         self,
         *,
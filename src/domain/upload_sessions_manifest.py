@@ -2,7 +2,13 @@ from __future__ import annotations
 
 from typing import cast
 
-from src.domain.inputs_manifest import MANIFEST_REL_PATH, PreparedDataset, read_manifest_json
+from src.domain.csv_scan import csv_scan_from_payload
+from src.domain.inputs_manifest import (
+    MANIFEST_REL_PATH,
+    PreparedDataset,
+    dataset_payload,
+    read_manifest_json,
+)
 from src.domain.job_store import JobStore
 from src.domain.job_workspace_store import JobWorkspaceStore
 from src.domain.models import ArtifactKind, ArtifactRef, Job, JobInputs
@@ -38,7 +44,7 @@ def upsert_manifest_dataset(*, manifest: JsonObject, dataset: PreparedDataset) -
                 raise UploadPartsInvalidError(reason="dataset_key_role_conflict")
             continue
         updated.append(item)
-    updated.append(_dataset_payload(dataset=dataset))
+    updated.append(dataset_payload(dataset))
     return cast(JsonObject, {"schema_version": 2, "datasets": updated})
 
 
@@ -93,24 +99,6 @@ def _manifest_datasets_list(*, manifest: JsonObject) -> list[JsonObject]:
     return parsed
 
 
-def _dataset_payload(*, dataset: PreparedDataset) -> JsonObject:
-    return cast(
-        JsonObject,
-        {
-            "dataset_key": dataset.dataset_key,
-            "role": dataset.role,
-            "rel_path": dataset.rel_path,
-            "original_name": dataset.original_name,
-            "size_bytes": dataset.size_bytes,
-            "sha256": dataset.sha256,
-            "fingerprint": dataset.fingerprint,
-            "format": dataset.format,
-            "uploaded_at": dataset.uploaded_at,
-            "content_type": dataset.content_type,
-        },
-    )
-
-
 def _prepared_dataset_from_item(*, item: JsonObject) -> PreparedDataset | None:
     dataset_key = item.get("dataset_key")
     role = item.get("role")
@@ -153,5 +141,5 @@ def _prepared_dataset_from_item(*, item: JsonObject) -> PreparedDataset | None:
         size_bytes=size_bytes,
         uploaded_at=uploaded_at,
         content_type=None if content_type is None else str(content_type),
-        data=b"",
+        csv_scan=csv_scan_from_payload(item.get("csv_scan")),
     )
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from src.infra.upload_session_exceptions import UploadPartsInvalidError
+
+
+@dataclass(frozen=True)
+class FinalizePart:
+    part_number: int
+    etag: str
+    sha256: str | None
+
+
+def normalize_etag(etag: str) -> str:
+    candidate = etag.strip()
+    if candidate.startswith('"') and candidate.endswith('"') and len(candidate) >= 2:
+        candidate = candidate[1:-1]
+    return candidate.strip()
+
+
+def parse_finalize_parts(
+    *,
+    parts: list[dict[str, object]],
+    upload_strategy: str,
+) -> list[FinalizePart]:
+    if not isinstance(parts, list) or len(parts) == 0:
+        raise UploadPartsInvalidError(reason="parts_empty")
+    parsed = [_parse_part(item=item) for item in parts]
+    if upload_strategy == "direct" and (len(parsed) != 1 or parsed[0].part_number != 1):
+        raise UploadPartsInvalidError(reason="direct_requires_single_part_1")
+    return parsed
+
+
+def _parse_part(*, item: object) -> FinalizePart:
+    if not isinstance(item, dict):
+        raise UploadPartsInvalidError(reason="parts_not_objects")
+    part_number = item.get("part_number")
+    etag = item.get("etag")
+    sha256 = item.get("sha256")
+    if not isinstance(part_number, int) or part_number < 1:
+        raise UploadPartsInvalidError(reason="part_number_invalid")
+    if not isinstance(etag, str) or etag.strip() == "":
+        raise UploadPartsInvalidError(reason="etag_invalid")
+    if sha256 is not None and (not isinstance(sha256, str) or sha256.strip() == ""):
+        raise UploadPartsInvalidError(reason="sha256_invalid")
+    return FinalizePart(part_number=part_number, etag=normalize_etag(etag), sha256=sha256)
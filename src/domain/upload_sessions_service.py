@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from src.config import Config
+from src.domain.dataset_sidecar_ingest import DatasetSidecarIngestor
 from src.domain.job_store import JobStore
 from src.domain.job_workspace_store import JobWorkspaceStore
 from src.domain.object_store import ObjectStore
@@ -23,6 +24,7 @@ class UploadSessionsService:
         object_store: ObjectStore,
         bundle_service: UploadBundleService,
         session_store: UploadSessionStore,
+        sidecars: DatasetSidecarIngestor | None = None,
     ):
         self._issuer = UploadSessionIssuer(
             config=config,
@@ -41,6 +43,7 @@ class UploadSessionsService:
             workspace=workspace,
             object_store=object_store,
             session_store=session_store,
+            sidecars=sidecars,
         )
 
     def create_upload_session(
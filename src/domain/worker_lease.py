@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Callable
+
+from src.domain.worker_queue import QueueClaim, WorkerQueue
+from src.infra.exceptions import QueueDataCorruptedError, QueueIOError
+
+logger = logging.getLogger(__name__)
+
+_RENEW_FRACTION = 3
+_MIN_RENEW_INTERVAL_SECONDS = 0.1
+
+
+def renew_interval_seconds(claim: QueueClaim) -> float:
+    ttl = (claim.lease_expires_at - claim.claimed_at).total_seconds()
+    return max(ttl / _RENEW_FRACTION, _MIN_RENEW_INTERVAL_SECONDS)
+
+
+class LeaseHeartbeat:
+    """Background thread that keeps a claim's queue lease alive while the job runs.
+
+    The lease is renewed every third of its TTL. When the queue reports the claim gone
+    (reclaimed by another worker after a missed renewal), `lost()` turns true and renewal
+    stops and `on_lost` is called (to stop the job's running Stata process); the owner must
+    then abandon the job without saving, acking or releasing it.
+    Queue IO/data errors are logged and retried on the next tick.
+    """
+
+    def __init__(
+        self,
+        *,
+        queue: WorkerQueue,
+        claim: QueueClaim,
+        on_lost: Callable[[], None] | None = None,
+    ):
+        self._queue = queue
+        self._claim = claim
+        self._on_lost = on_lost
+        self._interval = renew_interval_seconds(claim)
+        self._stopped = threading.Event()
+        self._lost = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            name=f"lease-{claim.claim_id}",
+            daemon=True,
+        )
+
+    def __enter__(self) -> LeaseHeartbeat:
+        self._thread.start()
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        self.stop()
+
+    def lost(self) -> bool:
+        return self._lost.is_set()
+
+    def stop(self) -> None:
+        """Stop renewing; waits for an in-flight renewal so ack/release never race it."""
+        self._stopped.set()
+        if self._thread.is_alive():
+            self._thread.join()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(timeout=self._interval):
+            if not self._renew_once():
+                return
+
+    def _renew_once(self) -> bool:
+        claim = self._claim
+        try:
+            renewed = self._queue.renew(claim=claim)
+        except (QueueIOError, QueueDataCorruptedError) as e:
+            logger.warning(
+                "SS_WORKER_LEASE_RENEW_FAILED",
+                extra={
+                    "job_id": claim.job_id,
+                    "claim_id": claim.claim_id,
+                    "error_code": e.error_code,
+                },
+            )
+            return True
+        if renewed is None:
+            self._lost.set()
+            logger.warning(
+                "SS_WORKER_LEASE_LOST",
+                extra={
+                    "tenant_id": claim.tenant_id,
+                    "job_id": claim.job_id,
+                    "claim_id": claim.claim_id,
+                    "worker_id": claim.worker_id,
+                },
+            )
+            if self._on_lost is not None:
+                self._on_lost()
+            return False
+        self._claim = renewed
+        return True
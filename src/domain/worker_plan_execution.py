@@ -6,9 +6,11 @@ from datetime import datetime
 from pathlib import Path
 from typing import Callable, cast
 
+from src.domain.cached_stata_run import run_with_result_cache
 from src.domain.composition_executor import execute_composition_plan
 from src.domain.do_file_generator import DoFileGenerator, GeneratedDoFile, PreparedDoTemplate
 from src.domain.models import ArtifactRef, Job, PlanStep
+from src.domain.run_result_cache import RunResultCache
 from src.domain.stata_runner import RunError, RunResult, StataRunner
 from src.domain.worker_do_template_artifacts import (
     archive_outputs_or_error,
@@ -40,6 +42,8 @@ def execute_in_dirs(
     shutdown_deadline: datetime | None,
     clock: Callable[[], datetime],
     do_file_generator: DoFileGenerator | None,
+    max_parallel_steps: int = 1,
+    run_result_cache: RunResultCache | None = None,
 ) -> RunResult:
     if job.llm_plan is None:
         return write_pre_run_error(
@@ -68,6 +72,8 @@ def execute_in_dirs(
         clock=clock,
         do_file_generator=do_file_generator,
         inputs_manifest=inputs_manifest,
+        max_parallel_steps=max_parallel_steps,
+        run_result_cache=run_result_cache,
     )
 
 
@@ -82,6 +88,8 @@ def _execute_with_inputs(
     clock: Callable[[], datetime],
     do_file_generator: DoFileGenerator | None,
     inputs_manifest: dict[str, JsonValue],
+    max_parallel_steps: int,
+    run_result_cache: RunResultCache | None,
 ) -> RunResult:
     plan = job.llm_plan
     if plan is None:
@@ -103,6 +111,7 @@ def _execute_with_inputs(
             shutdown_deadline=shutdown_deadline,
             clock=clock,
             do_file_generator=generator,
+            max_parallel_steps=max_parallel_steps,
         )
 
     return _execute_run_step(
@@ -115,6 +124,7 @@ def _execute_with_inputs(
         clock=clock,
         run_step=run_step,
         inputs_manifest=cast(Mapping[str, object], inputs_manifest),
+        run_result_cache=run_result_cache,
     )
 
 
@@ -129,6 +139,7 @@ def _execute_run_step(
     clock: Callable[[], datetime],
     run_step: PlanStep,
     inputs_manifest: Mapping[str, object],
+    run_result_cache: RunResultCache | None,
 ) -> RunResult:
     dirs.work_dir.mkdir(parents=True, exist_ok=True)
     dirs.artifacts_dir.mkdir(parents=True, exist_ok=True)
@@ -149,12 +160,18 @@ def _execute_run_step(
         shutdown_deadline=shutdown_deadline,
         clock=clock,
     )
-    runner_result = runner.run(
+    runner_result = run_with_result_cache(
+        runner=runner,
+        cache=run_result_cache,
+        dirs=dirs,
         tenant_id=job.tenant_id,
         job_id=job.job_id,
         run_id=run_id,
         do_file=generated.do_file,
         timeout_seconds=effective_timeout,
+        template_id=generated.template_id,
+        template_meta=generated.template_meta,
+        bypass=job.run_cache_bypass,
     )
     return _finalize_template_run(
         job=job,
@@ -7,6 +7,7 @@ from typing import Callable
 
 from src.domain.do_file_generator import DoFileGenerator
 from src.domain.models import Job
+from src.domain.run_result_cache import RunResultCache
 from src.domain.stata_dependency_checker import StataDependencyChecker
 from src.domain.stata_runner import RunError, RunResult, StataRunner
 from src.domain.worker_plan_execution import execute_in_dirs
@@ -30,6 +31,8 @@ def execute_plan(
     shutdown_deadline: datetime | None,
     clock: Callable[[], datetime],
     do_file_generator: DoFileGenerator | None = None,
+    max_parallel_steps: int = 1,
+    run_result_cache: RunResultCache | None = None,
 ) -> RunResult:
     dirs = resolve_run_dirs(
         jobs_dir=Path(jobs_dir),
@@ -77,6 +80,8 @@ def execute_plan(
         shutdown_deadline=shutdown_deadline,
         clock=clock,
         do_file_generator=do_file_generator,
+        max_parallel_steps=max_parallel_steps,
+        run_result_cache=run_result_cache,
     )
 
 
@@ -4,6 +4,7 @@ from dataclasses import dataclass
 from datetime import datetime
 from typing import Protocol
 
+from src.domain.queue_scheduling import DEFAULT_JOB_PRIORITY
 from src.utils.tenancy import DEFAULT_TENANT_ID
 
 
@@ -25,10 +26,17 @@ class WorkerQueue(Protocol):
         *,
         tenant_id: str = DEFAULT_TENANT_ID,
         traceparent: str | None = None,
-    ) -> None: ...
+        priority: int = DEFAULT_JOB_PRIORITY,
+    ) -> None:
+        """Queue a job; higher `priority` is claimed first among the tenant's ready jobs."""
+        ...
 
     def claim(self, *, worker_id: str) -> QueueClaim | None: ...
 
     def ack(self, *, claim: QueueClaim) -> None: ...
 
     def release(self, *, claim: QueueClaim) -> None: ...
+
+    def renew(self, *, claim: QueueClaim) -> QueueClaim | None:
+        """Extend the claim's lease by the queue TTL; `None` means the claim is no longer held."""
+        ...
@@ -15,10 +15,13 @@ from src.domain.job_store import JobStore
 from src.domain.metrics import NoopMetrics, RuntimeMetrics
 from src.domain.models import Job, JobStatus
 from src.domain.output_formatter_service import OutputFormatterService
+from src.domain.run_cancellation import RunCancellation
+from src.domain.run_result_cache import RunResultCache
 from src.domain.stata_dependency_checker import StataDependencyChecker
 from src.domain.stata_runner import RunResult, StataRunner
 from src.domain.state_machine import JobStateMachine
 from src.domain.worker_claim_handling import ensure_job_claimable, load_job_or_handle
+from src.domain.worker_lease import LeaseHeartbeat
 from src.domain.worker_plan_executor import execute_plan
 from src.domain.worker_queue import QueueClaim, WorkerQueue
 from src.domain.worker_retry import backoff_seconds, normalized_max_attempts
@@ -79,6 +82,9 @@ class WorkerService:
         audit: AuditLogger | None = None,
         clock: Callable[[], datetime] = utc_now,
         sleep: Callable[[float], None] = time.sleep,
+        composition_max_parallel_steps: int = 1,
+        run_cancellation: RunCancellation | None = None,
+        run_result_cache: RunResultCache | None = None,
     ) -> None:
         self._store = store
         self._queue = queue
@@ -93,6 +99,9 @@ class WorkerService:
         self._audit = NoopAuditLogger() if audit is None else audit
         self._clock = clock
         self._sleep = sleep
+        self._composition_max_parallel_steps = composition_max_parallel_steps
+        self._run_cancellation = RunCancellation() if run_cancellation is None else run_cancellation
+        self._run_result_cache = run_result_cache
 
     def _should_retry(self, *, result: RunResult) -> bool:
         error = result.error
@@ -180,14 +189,22 @@ class WorkerService:
         ):
             return
         self._metrics.worker_inflight_inc(worker_id=claim.worker_id)
+        cancellation = self._run_cancellation
+
+        def _stop_running_job() -> None:
+            cancellation.cancel(tenant_id=claim.tenant_id, job_id=claim.job_id)
+
         try:
-            self._run_job_with_retries(
-                job=job,
-                claim=claim,
-                stop_requested=stop,
-                shutdown_deadline=deadline,
-            )
+            with LeaseHeartbeat(queue=self._queue, claim=claim, on_lost=_stop_running_job) as lease:
+                self._run_job_with_retries(
+                    job=job,
+                    claim=claim,
+                    stop_requested=stop,
+                    shutdown_deadline=deadline,
+                    lease=lease,
+                )
         finally:
+            cancellation.clear(tenant_id=claim.tenant_id, job_id=claim.job_id)
             self._metrics.worker_inflight_dec(worker_id=claim.worker_id)
 
     def _run_job_with_retries(
@@ -197,11 +214,16 @@ class WorkerService:
         claim: QueueClaim,
         stop_requested: Callable[[], bool],
         shutdown_deadline: Callable[[], datetime | None],
+        lease: LeaseHeartbeat,
     ) -> None:
         max_attempts = normalized_max_attempts(self._retry.max_attempts)
         attempt = len(job.runs) + 1
         while attempt <= max_attempts:
+            if lease.lost():
+                self._abandon_lost_lease(claim=claim, run_id=None)
+                return
             if stop_requested():
+                lease.stop()
                 self._release_claim_on_shutdown(claim=claim, event=_SHUTDOWN_RELEASE_CLAIM_EVENT)
                 return
             run_id = uuid.uuid4().hex
@@ -212,32 +234,14 @@ class WorkerService:
                 store=self._store,
                 clock=self._clock,
             )
-            result = execute_plan(
+            result = self._execute_attempt(
                 job=job,
                 run_id=run_id,
-                jobs_dir=self._jobs_dir,
-                runner=self._runner,
-                dependency_checker=self._dependency_checker,
                 shutdown_deadline=shutdown_deadline(),
-                clock=self._clock,
-                do_file_generator=self._do_file_generator,
             )
-            if result.ok:
-                formatted = self._output_formatter.format_run_outputs(
-                    job=job,
-                    run_id=run_id,
-                    artifacts=result.artifacts,
-                )
-                if formatted.error is not None or formatted.artifacts:
-                    result = RunResult(
-                        job_id=result.job_id,
-                        run_id=result.run_id,
-                        ok=result.ok if formatted.error is None else False,
-                        exit_code=result.exit_code,
-                        timed_out=result.timed_out,
-                        artifacts=(*result.artifacts, *formatted.artifacts),
-                        error=formatted.error if formatted.error is not None else result.error,
-                    )
+            if lease.lost():
+                self._abandon_lost_lease(claim=claim, run_id=run_id)
+                return
             record_attempt_finished(
                 job=job,
                 run_id=run_id,
@@ -247,8 +251,7 @@ class WorkerService:
             self._store.save(tenant_id=claim.tenant_id, job=job)
 
             if result.ok:
-                self._finish_job(job=job, status=JobStatus.SUCCEEDED, claim=claim)
-                self._ack(claim)
+                self._complete_job(job=job, status=JobStatus.SUCCEEDED, claim=claim, lease=lease)
                 return
 
             if not self._should_retry(result=result):
@@ -260,16 +263,15 @@ class WorkerService:
                         "error_code": None if result.error is None else result.error.error_code,
                     },
                 )
-                self._finish_job(job=job, status=JobStatus.FAILED, claim=claim)
-                self._ack(claim)
+                self._complete_job(job=job, status=JobStatus.FAILED, claim=claim, lease=lease)
                 return
 
             if attempt >= max_attempts:
-                self._finish_job(job=job, status=JobStatus.FAILED, claim=claim)
-                self._ack(claim)
+                self._complete_job(job=job, status=JobStatus.FAILED, claim=claim, lease=lease)
                 return
 
             if stop_requested():
+                lease.stop()
                 self._release_claim_on_shutdown(claim=claim, event=_SHUTDOWN_RELEASE_CLAIM_EVENT)
                 return
 
@@ -285,6 +287,70 @@ class WorkerService:
             self._sleep(backoff)
             attempt += 1
 
+    def _execute_attempt(
+        self,
+        *,
+        job: Job,
+        run_id: str,
+        shutdown_deadline: datetime | None,
+    ) -> RunResult:
+        result = execute_plan(
+            job=job,
+            run_id=run_id,
+            jobs_dir=self._jobs_dir,
+            runner=self._runner,
+            dependency_checker=self._dependency_checker,
+            shutdown_deadline=shutdown_deadline,
+            clock=self._clock,
+            do_file_generator=self._do_file_generator,
+            max_parallel_steps=self._composition_max_parallel_steps,
+            run_result_cache=self._run_result_cache,
+        )
+        if not result.ok:
+            return result
+        formatted = self._output_formatter.format_run_outputs(
+            job=job,
+            run_id=run_id,
+            artifacts=result.artifacts,
+        )
+        if formatted.error is None and not formatted.artifacts:
+            return result
+        return RunResult(
+            job_id=result.job_id,
+            run_id=result.run_id,
+            ok=result.ok if formatted.error is None else False,
+            exit_code=result.exit_code,
+            timed_out=result.timed_out,
+            artifacts=(*result.artifacts, *formatted.artifacts),
+            error=formatted.error if formatted.error is not None else result.error,
+        )
+
+    def _complete_job(
+        self,
+        *,
+        job: Job,
+        status: JobStatus,
+        claim: QueueClaim,
+        lease: LeaseHeartbeat,
+    ) -> None:
+        lease.stop()
+        if lease.lost():
+            self._abandon_lost_lease(claim=claim, run_id=None)
+            return
+        self._finish_job(job=job, status=status, claim=claim)
+        self._ack(claim)
+
+    def _abandon_lost_lease(self, *, claim: QueueClaim, run_id: str | None) -> None:
+        logger.warning(
+            "SS_WORKER_JOB_ABANDONED_LEASE_LOST",
+            extra={
+                "tenant_id": claim.tenant_id,
+                "job_id": claim.job_id,
+                "claim_id": claim.claim_id,
+                "run_id": run_id,
+            },
+        )
+
     def _finish_job(self, *, job: Job, status: JobStatus, claim: QueueClaim) -> None:
         from_status = job.status.value
         if self._state_machine.ensure_transition(
@@ -65,3 +65,12 @@ class AdminStoreIOError(SSError):
             status_code=500,
         )
 
+
+
+class AdminJobCursorInvalidError(SSError):
+    def __init__(self) -> None:
+        super().__init__(
+            error_code="ADMIN_JOB_CURSOR_INVALID",
+            message="invalid job list cursor",
+            status_code=400,
+        )
@@ -0,0 +1,79 @@
+from __future__ import annotations
+
+import logging
+from pathlib import Path
+
+from src.domain.job_store import JobStore
+from src.domain.models import Draft, Job, JobStatus
+from src.infra.exceptions import JobStoreIOError
+from src.infra.job_archive import (
+    ARCHIVE_INDEX_FILENAME,
+    ARCHIVE_READ_ERRORS,
+    archive_lock,
+    restore_job_workspace,
+)
+from src.utils.job_workspace import resolve_job_dir
+from src.utils.json_types import JsonObject
+from src.utils.tenancy import DEFAULT_TENANT_ID
+
+logger = logging.getLogger(__name__)
+
+
+class ArchiveRestoringJobStore:
+    """Job store decorator that unpacks an archived workspace when its job is queued again.
+
+    Archived jobs keep `job.json` live, so reads pass straight through. A save that moves a job
+    to `queued` (a retry) restores the workspace first, under the same lock the archiver holds
+    while it re-checks the job's status, so a worker never claims a job without its inputs.
+    """
+
+    def __init__(self, *, inner: JobStore, jobs_dir: Path, lock_dir: Path):
+        self._inner = inner
+        self._jobs_dir = Path(jobs_dir)
+        self._lock_dir = Path(lock_dir)
+
+    @property
+    def inner(self) -> JobStore:
+        return self._inner
+
+    def create(self, job: Job, *, tenant_id: str = DEFAULT_TENANT_ID) -> None:
+        self._inner.create(job, tenant_id=tenant_id)
+
+    def load(self, job_id: str, *, tenant_id: str = DEFAULT_TENANT_ID) -> Job:
+        return self._inner.load(job_id, tenant_id=tenant_id)
+
+    def save(self, job: Job, *, tenant_id: str = DEFAULT_TENANT_ID) -> None:
+        job_dir = resolve_job_dir(jobs_dir=self._jobs_dir, tenant_id=tenant_id, job_id=job.job_id)
+        if job.status != JobStatus.QUEUED or job_dir is None or not job_dir.is_dir():
+            self._inner.save(job, tenant_id=tenant_id)
+            return
+        try:
+            with archive_lock(lock_dir=self._lock_dir, tenant_id=tenant_id, job_id=job.job_id):
+                if (job_dir / ARCHIVE_INDEX_FILENAME).exists():
+                    restore_job_workspace(job_dir=job_dir)
+                    logger.info(
+                        "SS_JOB_ARCHIVE_RESTORED",
+                        extra={"tenant_id": tenant_id, "job_id": job.job_id},
+                    )
+                self._inner.save(job, tenant_id=tenant_id)
+        except ARCHIVE_READ_ERRORS as e:
+            logger.warning(
+                "SS_JOB_ARCHIVE_RESTORE_FAILED",
+                extra={"tenant_id": tenant_id, "job_id": job.job_id, "error": str(e)},
+            )
+            raise JobStoreIOError(operation="archive_restore", job_id=job.job_id) from e
+
+    def write_draft(self, *, job_id: str, draft: Draft, tenant_id: str = DEFAULT_TENANT_ID) -> None:
+        self._inner.write_draft(job_id=job_id, draft=draft, tenant_id=tenant_id)
+
+    def write_artifact_json(
+        self,
+        *,
+        job_id: str,
+        rel_path: str,
+        payload: JsonObject,
+        tenant_id: str = DEFAULT_TENANT_ID,
+    ) -> None:
+        self._inner.write_artifact_json(
+            job_id=job_id, rel_path=rel_path, payload=payload, tenant_id=tenant_id
+        )
@@ -1,32 +1,42 @@
 from __future__ import annotations
 
-import json
 import logging
-import os
 import tempfile
 from pathlib import Path
 
+from src.infra.durability import Durability, current_durability
+from src.utils.json_codec import default_codec
 from src.utils.json_types import JsonObject
 
 logger = logging.getLogger(__name__)
 
 
-def atomic_write_json(*, path: Path, payload: JsonObject) -> None:
+def atomic_write_json(
+    *,
+    path: Path,
+    payload: JsonObject,
+    compact: bool = False,
+    durability: Durability | None = None,
+) -> None:
+    """Write `payload` through a temp file and rename it over `path`.
+
+    `durability` defaults to the configured policy; callers about to delete data pass their
+    own so the write is on disk regardless of it.
+    """
+    durable = current_durability() if durability is None else durability
     path.parent.mkdir(parents=True, exist_ok=True)
-    data = json.dumps(payload, ensure_ascii=False, indent=2, sort_keys=True)
+    data = default_codec().dumps(payload, compact=compact)
     tmp: Path | None = None
     try:
         with tempfile.NamedTemporaryFile(
-            "w",
-            encoding="utf-8",
+            "wb",
             dir=str(path.parent),
             delete=False,
         ) as f:
             tmp = Path(f.name)
             f.write(data)
-            f.flush()
-            os.fsync(f.fileno())
-        os.replace(tmp, path)
+            durable.sync_file(f)
+        durable.replace(tmp=tmp, path=path)
     except OSError:
         if tmp is not None:
             try:
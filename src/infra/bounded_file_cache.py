@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# After an eviction pass the directory is trimmed to this share of `max_bytes`, so a full cache
+# does not rescan its directory on every write.
+_EVICT_TO_RATIO = 0.9
+
+
+class BoundedFileCacheDir:
+    """Immutable content-addressed entries at `cache_dir/<key[:2]>/<key><suffix>`.
+
+    Hits bump the entry mtime (`touch`) and eviction removes the oldest mtimes first. The
+    byte count is only an in-process estimate; eviction rescans the directory, so the bound
+    holds when several processes share it.
+    """
+
+    def __init__(self, *, cache_dir: Path, max_bytes: int, suffix: str, evicted_event: str):
+        self._cache_dir = Path(cache_dir)
+        self._max_bytes = max(0, max_bytes)
+        self._suffix = suffix
+        self._evicted_event = evicted_event
+        self._lock = threading.Lock()
+        self._approx_bytes = sum(size for _path, size, _mtime in self._scan())
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes
+
+    def entry_path(self, key: str) -> Path:
+        return self._cache_dir / key[:2] / f"{key}{self._suffix}"
+
+    def touch(self, path: Path) -> None:
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+
+    def record_write(self, size: int) -> None:
+        with self._lock:
+            self._approx_bytes += size
+            if self._approx_bytes > self._max_bytes:
+                self._evict()
+
+    def _scan(self) -> list[tuple[Path, int, float]]:
+        entries: list[tuple[Path, int, float]] = []
+        try:
+            shards = [shard for shard in self._cache_dir.iterdir() if shard.is_dir()]
+        except OSError:
+            return entries
+        for shard in shards:
+            try:
+                for path in shard.iterdir():
+                    if path.suffix != self._suffix:
+                        continue
+                    stat = path.stat()
+                    entries.append((path, stat.st_size, stat.st_mtime))
+            except OSError:
+                continue
+        return entries
+
+    def _evict(self) -> None:
+        # Other processes write to the same directory, so the disk is the source of truth.
+        entries = sorted(self._scan(), key=lambda entry: entry[2])
+        total = sum(size for _path, size, _mtime in entries)
+        target = int(self._max_bytes * _EVICT_TO_RATIO)
+        evicted = 0
+        for path, size, _mtime in entries:
+            if total <= target:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            evicted += 1
+        self._approx_bytes = total
+        logger.info(
+            self._evicted_event,
+            extra={"evicted": evicted, "bytes": total, "max_bytes": self._max_bytes},
+        )
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from src.domain.job_store import JobRevisionSource, JobStore
+from src.domain.metrics import JobCacheMetrics, NoopMetrics
+from src.domain.models import Draft, Job
+from src.utils.json_types import JsonObject
+from src.utils.tenancy import DEFAULT_TENANT_ID
+
+DEFAULT_JOB_CACHE_MAX_ENTRIES = 1024
+
+
+@dataclass(frozen=True)
+class _CachedJob:
+    revision: tuple[int, ...]
+    job: Job
+
+
+class CachingJobStore:
+    """Job store decorator that answers repeated `load` calls from a bounded in-process LRU.
+
+    Every `load` asks `revisions` for the job's current revision (stat fields plus a content
+    hash of `job.json` for the file store, the `version` column for SQLite) and only reuses the
+    cached job when it still matches, so writes from other processes are never served stale.
+    The revision is read before the inner load; a write racing the load leaves a mismatch that
+    the next call re-reads. Cached jobs are handed out as deep copies, and every write through
+    this store drops the entry.
+    """
+
+    def __init__(
+        self,
+        *,
+        inner: JobStore,
+        revisions: JobRevisionSource,
+        max_entries: int = DEFAULT_JOB_CACHE_MAX_ENTRIES,
+        metrics: JobCacheMetrics | None = None,
+    ):
+        self._inner = inner
+        self._revisions = revisions
+        self._max_entries = max(1, max_entries)
+        self._metrics: JobCacheMetrics = NoopMetrics() if metrics is None else metrics
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[tuple[str, str], _CachedJob] = OrderedDict()
+
+    @property
+    def inner(self) -> JobStore:
+        return self._inner
+
+    def create(self, job: Job, *, tenant_id: str = DEFAULT_TENANT_ID) -> None:
+        self._invalidate(tenant_id=tenant_id, job_id=job.job_id)
+        self._inner.create(job, tenant_id=tenant_id)
+
+    def load(self, job_id: str, *, tenant_id: str = DEFAULT_TENANT_ID) -> Job:
+        key = (tenant_id, job_id)
+        revision = self._revisions.revision(job_id, tenant_id=tenant_id)
+        cached = self._lookup(key=key, revision=revision)
+        self._metrics.record_job_cache_lookup(hit=cached is not None)
+        if cached is not None:
+            return cached.model_copy(deep=True)
+        job = self._inner.load(job_id, tenant_id=tenant_id)
+        if revision is not None:
+            entry = _CachedJob(revision=revision, job=job.model_copy(deep=True))
+            self._remember(key=key, entry=entry)
+        return job
+
+    def save(self, job: Job, *, tenant_id: str = DEFAULT_TENANT_ID) -> None:
+        try:
+            self._inner.save(job, tenant_id=tenant_id)
+        finally:
+            self._invalidate(tenant_id=tenant_id, job_id=job.job_id)
+
+    def write_draft(self, *, job_id: str, draft: Draft, tenant_id: str = DEFAULT_TENANT_ID) -> None:
+        try:
+            self._inner.write_draft(job_id=job_id, draft=draft, tenant_id=tenant_id)
+        finally:
+            self._invalidate(tenant_id=tenant_id, job_id=job_id)
+
+    def write_artifact_json(
+        self,
+        *,
+        job_id: str,
+        rel_path: str,
+        payload: JsonObject,
+        tenant_id: str = DEFAULT_TENANT_ID,
+    ) -> None:
+        self._inner.write_artifact_json(
+            job_id=job_id, rel_path=rel_path, payload=payload, tenant_id=tenant_id
+        )
+
+    def _lookup(self, *, key: tuple[str, str], revision: tuple[int, ...] | None) -> Job | None:
+        if revision is None:
+            return None
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.revision != revision:
+                return None
+            self._entries.move_to_end(key)
+            return entry.job
+
+    def _remember(self, *, key: tuple[str, str], entry: _CachedJob) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def _invalidate(self, *, tenant_id: str, job_id: str) -> None:
+        with self._lock:
+            self._entries.pop((tenant_id, job_id), None)
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import tempfile
+from pathlib import Path
+
+from src.config import Config
+from src.domain.dataset_preview_cache import DatasetPreviewCache
+from src.domain.metrics import DatasetPreviewCacheMetrics, NoopMetrics
+from src.infra.bounded_file_cache import BoundedFileCacheDir
+from src.utils.json_types import JsonObject
+
+logger = logging.getLogger(__name__)
+
+_ENTRY_SUFFIX = ".json"
+
+
+class FileDatasetPreviewCache(DatasetPreviewCache):
+    """Previews as JSON files at `cache_dir/<key[:2]>/<key>.json`, bounded by `max_bytes`.
+
+    Entries are immutable (the key is a content address), so writes skip fsync: a torn or
+    missing entry is just a miss. Hits bump the file mtime and eviction removes the oldest
+    mtimes first, which keeps the bound shared between the API and worker processes.
+    """
+
+    def __init__(
+        self,
+        *,
+        cache_dir: Path,
+        max_bytes: int,
+        metrics: DatasetPreviewCacheMetrics | None = None,
+    ):
+        self._entries = BoundedFileCacheDir(
+            cache_dir=cache_dir,
+            max_bytes=max_bytes,
+            suffix=_ENTRY_SUFFIX,
+            evicted_event="SS_DATASET_PREVIEW_CACHE_EVICTED",
+        )
+        self._metrics: DatasetPreviewCacheMetrics = NoopMetrics() if metrics is None else metrics
+
+    def get(self, key: str) -> JsonObject | None:
+        path = self._entries.entry_path(key)
+        try:
+            raw = json.loads(path.read_bytes())
+        except FileNotFoundError:
+            raw = None
+        except (OSError, ValueError) as e:
+            logger.warning(
+                "SS_DATASET_PREVIEW_CACHE_ENTRY_INVALID",
+                extra={"path": str(path), "error": str(e)},
+            )
+            path.unlink(missing_ok=True)
+            raw = None
+        hit = isinstance(raw, dict)
+        self._metrics.record_dataset_preview_cache_lookup(hit=hit)
+        if not isinstance(raw, dict):
+            return None
+        self._entries.touch(path)
+        return raw
+
+    def put(self, key: str, preview: JsonObject) -> None:
+        path = self._entries.entry_path(key)
+        # Key order is part of the payload (sample rows follow column order), so no sort_keys.
+        data = json.dumps(preview, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        tmp: Path | None = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile("wb", dir=str(path.parent), delete=False) as f:
+                tmp = Path(f.name)
+                f.write(data)
+            os.replace(tmp, path)
+        except OSError as e:
+            if tmp is not None:
+                tmp.unlink(missing_ok=True)
+            logger.warning(
+                "SS_DATASET_PREVIEW_CACHE_WRITE_FAILED",
+                extra={"path": str(path), "error": str(e)},
+            )
+            return
+        self._entries.record_write(len(data))
+
+def build_dataset_preview_cache(
+    *, config: Config, metrics: DatasetPreviewCacheMetrics | None = None
+) -> FileDatasetPreviewCache | None:
+    if config.dataset_preview_cache_max_bytes <= 0:
+        return None
+    return FileDatasetPreviewCache(
+        cache_dir=config.dataset_preview_cache_dir,
+        max_bytes=config.dataset_preview_cache_max_bytes,
+        metrics=metrics,
+    )
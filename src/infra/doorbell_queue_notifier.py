@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import uuid
+from pathlib import Path
+
+from src.infra.select_queue_notifier import SelectQueueNotifier
+
+logger = logging.getLogger(__name__)
+
+DOORBELL_DIRNAME = "doorbell"
+_SOCKET_SUFFIX = ".sock"
+
+
+def ring_doorbell(*, doorbell_dir: Path) -> None:
+    """Ping every worker socket registered under `doorbell_dir`; never raises.
+
+    A missing directory means no worker uses the doorbell. Sockets whose owner is gone are
+    removed; a full socket buffer already means a pending wakeup and is ignored.
+    """
+    try:
+        entries = list(os.scandir(doorbell_dir))
+    except FileNotFoundError:
+        return
+    except OSError as e:
+        logger.warning(
+            "SS_QUEUE_DOORBELL_LIST_FAILED",
+            extra={"path": str(doorbell_dir), "error": str(e)},
+        )
+        return
+    with socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM) as sender:
+        sender.setblocking(False)
+        for entry in entries:
+            if entry.name.endswith(_SOCKET_SUFFIX):
+                _ring_one(sender=sender, path=Path(entry.path))
+
+
+def _ring_one(*, sender: socket.socket, path: Path) -> None:
+    try:
+        sender.sendto(b"1", str(path))
+    except BlockingIOError:
+        return
+    except (ConnectionRefusedError, FileNotFoundError):
+        logger.info("SS_QUEUE_DOORBELL_STALE_SOCKET_REMOVED", extra={"path": str(path)})
+        path.unlink(missing_ok=True)
+    except OSError as e:
+        logger.warning("SS_QUEUE_DOORBELL_RING_FAILED", extra={"path": str(path), "error": str(e)})
+
+
+class DoorbellQueueNotifier(SelectQueueNotifier):
+    """Wakes when `ring_doorbell` pings this worker's Unix datagram socket.
+
+    Each notifier binds its own socket under `doorbell_dir`; `FileWorkerQueue.enqueue` and
+    `release` ring every socket there. Works wherever AF_UNIX exists, but only for
+    producers on the same host.
+    """
+
+    def __init__(self, *, doorbell_dir: Path):
+        super().__init__()
+        doorbell_dir.mkdir(parents=True, exist_ok=True)
+        self._path = doorbell_dir / f"{uuid.uuid4().hex[:16]}{_SOCKET_SUFFIX}"
+        self._sock = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        self._sock.setblocking(False)
+        self._sock.bind(str(self._path))
+
+    def _fileno(self) -> int:
+        return self._sock.fileno()
+
+    def _drain(self) -> bool:
+        while True:
+            try:
+                self._sock.recv(64)
+            except BlockingIOError:
+                return True
+
+    def _close_source(self) -> None:
+        self._sock.close()
+        self._path.unlink(missing_ok=True)
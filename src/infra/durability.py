@@ -0,0 +1,300 @@
+from __future__ import annotations
+
+import atexit
+import ctypes
+import logging
+import os
+import sys
+import threading
+import time
+from collections.abc import Callable
+from functools import lru_cache
+from pathlib import Path
+from typing import IO
+
+from src.config import Config
+from src.domain.metrics import DurabilityMetrics, NoopMetrics
+
+logger = logging.getLogger(__name__)
+
+DURABILITY_ALWAYS = "always"
+DURABILITY_GROUP = "group"
+DURABILITY_OS = "os"
+SUPPORTED_DURABILITY_POLICIES = (DURABILITY_ALWAYS, DURABILITY_GROUP, DURABILITY_OS)
+DEFAULT_GROUP_COMMIT_MS = 5
+
+
+def fsync_path(path: Path) -> None:
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def fsync_directory(path: Path) -> None:
+    """fsync a directory so renames/creates inside it survive a crash (no-op on Windows)."""
+    if os.name == "nt":
+        return
+    fsync_path(path)
+
+
+def fsync_file(file: IO[bytes]) -> None:
+    """Flush and fsync an open file through its own (writable) handle."""
+    file.flush()
+    os.fsync(file.fileno())
+
+
+def syncfs(fd: int) -> bool:
+    """Flush the whole filesystem holding `fd` with one `syncfs(2)` call (Linux only).
+
+    Returns False when the call is unavailable or fails, so callers fall back to fsync per file.
+    """
+    func = _libc_syncfs()
+    if func is None:
+        return False
+    return int(func(fd)) == 0
+
+
+@lru_cache(maxsize=1)
+def _libc_syncfs() -> Callable[[int], int] | None:
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        func: Callable[[int], int] = ctypes.CDLL(None, use_errno=True).syncfs
+    except (AttributeError, OSError):
+        return None
+    return func
+
+
+class _Ticket:
+    def __init__(self, file: IO[bytes]):
+        self.file = file
+        self.done = False
+        self.error: OSError | None = None
+
+
+class GroupCommitter:
+    """Group commit for file contents, with directory fsyncs deferred to a background thread.
+
+    `sync_file` blocks until the file is on disk. The first writer to arrive while no commit
+    is running becomes the leader. A leader alone in the queue commits at once; otherwise it
+    waits `window_seconds` so that more concurrent writers can join. Files of a batch that
+    share a filesystem are flushed by one `syncfs` call where available, and the rest through
+    their writers' handles; then every writer in the batch is woken.
+    Writers rename only after `sync_file` returns, so a crash never exposes a renamed file
+    whose data is not on disk. The rename itself becomes durable when a daemon thread fsyncs
+    the parent directories queued by `submit_directory`; `flush` does that synchronously.
+    """
+
+    def __init__(self, *, window_seconds: float, metrics: DurabilityMetrics | None = None):
+        self._window_seconds = max(0.0, window_seconds)
+        self._metrics: DurabilityMetrics = NoopMetrics() if metrics is None else metrics
+        self._cond = threading.Condition()
+        self._tickets: list[_Ticket] = []
+        self._leading = False
+        self._dir_lock = threading.Lock()
+        self._dirs_cond = threading.Condition()
+        self._pending_dirs: dict[Path, None] = {}
+        self._thread: threading.Thread | None = None
+
+    def sync_file(self, file: IO[bytes]) -> None:
+        started = time.perf_counter()
+        file.flush()
+        ticket = _Ticket(file)
+        with self._cond:
+            self._tickets.append(ticket)
+            while not ticket.done and self._leading:
+                self._cond.wait()
+            if not ticket.done:
+                self._leading = True
+        try:
+            if not ticket.done:
+                self._lead()
+        finally:
+            self._metrics.observe_durable_commit(
+                policy=DURABILITY_GROUP, seconds=time.perf_counter() - started
+            )
+        if ticket.error is not None:
+            raise ticket.error
+
+    def submit_directory(self, directory: Path) -> None:
+        with self._dirs_cond:
+            self._pending_dirs[directory] = None
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="ss-group-commit", daemon=True
+                )
+                self._thread.start()
+            self._dirs_cond.notify()
+
+    def flush(self) -> None:
+        with self._dir_lock:
+            with self._dirs_cond:
+                batch, self._pending_dirs = list(self._pending_dirs), {}
+            for directory in batch:
+                _fsync_quietly(directory, fsync=fsync_directory)
+
+    def _lead(self) -> None:
+        batch: list[_Ticket] = []
+        try:
+            with self._cond:
+                alone = len(self._tickets) == 1
+            if not alone:
+                time.sleep(self._window_seconds)
+            with self._cond:
+                batch, self._tickets = self._tickets, []
+            _sync_batch(batch)
+            self._metrics.observe_durable_commit_batch(policy=DURABILITY_GROUP, files=len(batch))
+        finally:
+            with self._cond:
+                for ticket in batch:
+                    ticket.done = True
+                self._leading = False
+                self._cond.notify_all()
+
+    def _run(self) -> None:
+        while True:
+            with self._dirs_cond:
+                while not self._pending_dirs:
+                    self._dirs_cond.wait()
+            time.sleep(self._window_seconds)
+            self.flush()
+
+
+def _sync_batch(batch: list[_Ticket]) -> None:
+    remaining = batch
+    if len(batch) > 1:
+        remaining = []
+        for group in _group_by_device(batch):
+            if len(group) < 2 or not syncfs(group[0].file.fileno()):
+                remaining.extend(group)
+    for ticket in remaining:
+        try:
+            os.fsync(ticket.file.fileno())
+        except OSError as e:
+            ticket.error = e
+
+
+def _group_by_device(batch: list[_Ticket]) -> list[list[_Ticket]]:
+    groups: dict[int, list[_Ticket]] = {}
+    singles: list[list[_Ticket]] = []
+    for ticket in batch:
+        try:
+            device = os.fstat(ticket.file.fileno()).st_dev
+        except OSError:
+            singles.append([ticket])
+            continue
+        groups.setdefault(device, []).append(ticket)
+    return [*groups.values(), *singles]
+
+
+class Durability:
+    """Durability policy for atomic file replacement.
+
+    Writers call `sync_file` on the temp file's open handle before closing it, then
+    `replace` to rename it over the target:
+
+    - `always`: fsync the temp file, and the directory right after the rename.
+    - `group`: fsync temp files in batches through a `GroupCommitter` (writers block until
+      their batch commits) and fsync directories in the background, so a crash can lose a
+      rename from the last `group_commit_ms` but never exposes a torn file.
+    - `os`: never fsync; the OS page cache decides (scratch/dev deployments, where a crash
+      can leave renamed files without their contents).
+
+    Writes that a later write depends on being on disk first (the job journal before the
+    core that points into it) use `sync_ordered`, which fsyncs under every policy but `os`.
+    """
+
+    def __init__(
+        self,
+        *,
+        policy: str = DURABILITY_ALWAYS,
+        group_commit_ms: int = DEFAULT_GROUP_COMMIT_MS,
+        metrics: DurabilityMetrics | None = None,
+    ):
+        self._policy = policy if policy in SUPPORTED_DURABILITY_POLICIES else DURABILITY_ALWAYS
+        self._metrics: DurabilityMetrics = NoopMetrics() if metrics is None else metrics
+        self._committer = GroupCommitter(
+            window_seconds=max(0, group_commit_ms) / 1000.0, metrics=metrics
+        )
+
+    @property
+    def policy(self) -> str:
+        return self._policy
+
+    def sync_file(self, file: IO[bytes]) -> None:
+        if self._policy == DURABILITY_OS:
+            return
+        if self._policy == DURABILITY_GROUP:
+            self._committer.sync_file(file)
+            return
+        started = time.perf_counter()
+        fsync_file(file)
+        self._metrics.observe_durable_commit(
+            policy=DURABILITY_ALWAYS, seconds=time.perf_counter() - started
+        )
+        self._metrics.observe_durable_commit_batch(policy=DURABILITY_ALWAYS, files=1)
+
+    def replace(self, *, tmp: Path, path: Path) -> None:
+        os.replace(tmp, path)
+        if self._policy == DURABILITY_ALWAYS:
+            fsync_directory(path.parent)
+        elif self._policy == DURABILITY_GROUP:
+            self._committer.submit_directory(path.parent)
+
+    def sync_ordered(self, fileno: int) -> None:
+        if self._policy != DURABILITY_OS:
+            os.fsync(fileno)
+
+    def sync_ordered_directory(self, directory: Path) -> None:
+        if self._policy != DURABILITY_OS:
+            fsync_directory(directory)
+
+    def flush(self) -> None:
+        self._committer.flush()
+
+
+_durability = Durability()
+
+
+def current_durability() -> Durability:
+    return _durability
+
+
+def configure_durability(*, config: Config, metrics: DurabilityMetrics | None = None) -> None:
+    global _durability
+    policy = config.durability_policy
+    if policy not in SUPPORTED_DURABILITY_POLICIES:
+        logger.warning(
+            "SS_DURABILITY_POLICY_UNSUPPORTED",
+            extra={"policy": policy, "fallback": DURABILITY_ALWAYS},
+        )
+    previous = _durability
+    _durability = Durability(
+        policy=policy, group_commit_ms=config.durability_group_commit_ms, metrics=metrics
+    )
+    previous.flush()
+    logger.info(
+        "SS_DURABILITY_CONFIGURED",
+        extra={
+            "policy": _durability.policy,
+            "group_commit_ms": config.durability_group_commit_ms,
+        },
+    )
+
+
+def flush_durability() -> None:
+    _durability.flush()
+
+
+def _fsync_quietly(path: Path, *, fsync: Callable[[Path], None]) -> None:
+    try:
+        fsync(path)
+    except FileNotFoundError:
+        return
+    except OSError as e:
+        logger.warning("SS_DURABLE_COMMIT_FAILED", extra={"path": str(path), "error": str(e)})
+
+
+atexit.register(flush_durability)
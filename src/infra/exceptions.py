@@ -169,6 +169,24 @@ class QueueDataCorruptedError(SSError):
         )
 
 
+class QueueBackendUnsupportedError(SSError):
+    def __init__(self, *, backend: str):
+        super().__init__(
+            error_code="QUEUE_BACKEND_UNSUPPORTED",
+            message=f"queue backend unsupported: {backend}",
+            status_code=500,
+        )
+
+
+class QueueNotifierUnsupportedError(SSError):
+    def __init__(self, *, notifier: str):
+        super().__init__(
+            error_code="QUEUE_NOTIFIER_UNSUPPORTED",
+            message=f"queue notifier unsupported: {notifier}",
+            status_code=500,
+        )
+
+
 class OutputFormatsInvalidError(SSError):
     def __init__(self, *, reason: str, supported: tuple[str, ...]):
         supported_csv = ",".join(supported)
@@ -4,16 +4,17 @@ import json
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import cast
 
-from src.domain.job_indexer import JobIndexer, JobIndexItem
-from src.utils.json_types import JsonObject
+from src.domain.job_indexer import JobIndexer, JobIndexItem, JobIndexPage, page_job_items
+from src.utils.json_codec import default_codec
 from src.utils.tenancy import DEFAULT_TENANT_ID, TENANTS_DIRNAME, is_safe_tenant_id
 
 logger = logging.getLogger(__name__)
 
 
 class FileJobIndexer(JobIndexer):
+    """Lists jobs by walking `jobs_dir`; used directly in tests and to rebuild `SQLiteJobIndex`."""
+
     def __init__(self, *, jobs_dir: Path):
         self._jobs_dir = Path(jobs_dir)
 
@@ -24,6 +25,17 @@ class FileJobIndexer(JobIndexer):
         items.sort(key=lambda item: item.updated_at or item.created_at, reverse=True)
         return items
 
+    def list_page(
+        self,
+        *,
+        tenant_id: str | None = None,
+        status: str | None = None,
+        limit: int,
+        cursor: str | None = None,
+    ) -> JobIndexPage:
+        items = self.list_jobs(tenant_id=tenant_id)
+        return page_job_items(items, status=status, limit=limit, cursor=cursor)
+
     def _iter_tenant_roots(self, *, tenant_id: str | None) -> list[tuple[str, Path]]:
         if tenant_id is not None:
             resolved = tenant_id.strip()
@@ -86,18 +98,19 @@ class FileJobIndexer(JobIndexer):
 
 def _read_job_summary(*, path: Path, tenant_id: str) -> JobIndexItem | None:
     try:
-        raw = json.loads(path.read_text(encoding="utf-8"))
+        raw = default_codec().loads(path.read_bytes())
     except (OSError, json.JSONDecodeError) as e:
         logger.warning("SS_JOB_INDEX_READ_FAILED", extra={"path": str(path), "error": str(e)})
         return None
     if not isinstance(raw, dict):
         logger.warning("SS_JOB_INDEX_INVALID", extra={"path": str(path), "reason": "not_object"})
         return None
-    payload = cast(JsonObject, raw)
+    payload = raw
     job_id = str(payload.get("job_id", "")).strip()
     status = str(payload.get("status", "")).strip()
     created_at = str(payload.get("created_at", "")).strip()
     updated_at = _mtime_iso(path)
+    version = payload.get("version", 1)
     if job_id == "":
         return None
     return JobIndexItem(
@@ -106,6 +119,7 @@ def _read_job_summary(*, path: Path, tenant_id: str) -> JobIndexItem | None:
         status=status,
         created_at=created_at,
         updated_at=updated_at,
+        version=version if isinstance(version, int) and not isinstance(version, bool) else 0,
     )
 
 
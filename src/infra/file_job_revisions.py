@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+
+from src.utils.job_workspace import legacy_job_dir, sharded_job_dir
+from src.utils.tenancy import DEFAULT_TENANT_ID
+
+_DIGEST_BYTES = 8
+
+
+class FileJobRevisions:
+    """Revision of a file-store job: `job.json` inode, mtime, size and a hash of its bytes.
+
+    The stat fields alone can repeat: an inode number is reused once the replaced file is
+    freed, and mtime ticks are coarse on some filesystems. The content hash makes the revision
+    change whenever the stored job does; hashing is still far cheaper than parsing the job.
+    """
+
+    def __init__(self, *, jobs_dir: Path):
+        self._jobs_dir = jobs_dir
+
+    def revision(
+        self, job_id: str, *, tenant_id: str = DEFAULT_TENANT_ID
+    ) -> tuple[int, ...] | None:
+        for job_dir in (
+            sharded_job_dir(jobs_dir=self._jobs_dir, tenant_id=tenant_id, job_id=job_id),
+            legacy_job_dir(jobs_dir=self._jobs_dir, tenant_id=tenant_id, job_id=job_id),
+        ):
+            if job_dir is None:
+                continue
+            try:
+                with open(job_dir / "job.json", "rb") as f:
+                    stat_result = os.fstat(f.fileno())
+                    data = f.read()
+            except OSError:
+                continue
+            digest = hashlib.blake2b(data, digest_size=_DIGEST_BYTES).digest()
+            return (
+                stat_result.st_ino,
+                stat_result.st_mtime_ns,
+                stat_result.st_size,
+                int.from_bytes(digest, "big"),
+            )
+        return None
@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import hashlib
 import logging
 import os
 import tempfile
+import uuid
+from collections.abc import Iterable
 from pathlib import Path
 
-from src.domain.job_workspace_store import JobWorkspaceStore
+from src.domain.job_workspace_store import JobWorkspaceStore, StagedFile
 from src.domain.models import is_safe_job_rel_path
 from src.infra.exceptions import JobNotFoundError
 from src.infra.input_exceptions import InputPathUnsafeError, InputStorageFailedError
@@ -14,6 +17,9 @@ from src.utils.tenancy import DEFAULT_TENANT_ID
 
 logger = logging.getLogger(__name__)
 
+_STAGED_PREFIX = ".staged-"
+_STAGED_SUFFIX = ".part"
+
 
 class FileJobWorkspaceStore(JobWorkspaceStore):
     def __init__(self, *, jobs_dir: Path):
@@ -21,7 +27,7 @@ class FileJobWorkspaceStore(JobWorkspaceStore):
 
     def _job_dir(self, *, tenant_id: str, job_id: str) -> Path:
         job_dir = resolve_job_dir(jobs_dir=self._jobs_dir, tenant_id=tenant_id, job_id=job_id)
-        if job_dir is None or not (job_dir / "job.json").exists():
+        if job_dir is None or not job_dir.is_dir():
             raise JobNotFoundError(job_id=job_id)
         return job_dir
 
@@ -33,6 +39,85 @@ class FileJobWorkspaceStore(JobWorkspaceStore):
         data: bytes,
         tenant_id: str = DEFAULT_TENANT_ID,
     ) -> None:
+        path = self._resolve_for_write(tenant_id=tenant_id, job_id=job_id, rel_path=rel_path)
+        try:
+            self._atomic_write_bytes(path, data)
+        except OSError as e:
+            logger.warning(
+                "SS_INPUT_WRITE_FAILED",
+                extra={"tenant_id": tenant_id, "job_id": job_id, "path": str(path)},
+            )
+            raise InputStorageFailedError(job_id=job_id, rel_path=rel_path) from e
+
+    def stage_stream(
+        self,
+        *,
+        job_id: str,
+        rel_dir: str,
+        chunks: Iterable[bytes],
+        tenant_id: str = DEFAULT_TENANT_ID,
+    ) -> StagedFile:
+        rel_path = f"{rel_dir}/{_STAGED_PREFIX}{uuid.uuid4().hex}{_STAGED_SUFFIX}"
+        path = self._resolve_for_write(tenant_id=tenant_id, job_id=job_id, rel_path=rel_path)
+        digest = hashlib.sha256()
+        size_bytes = 0
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with path.open("xb") as f:
+                for chunk in chunks:
+                    digest.update(chunk)
+                    size_bytes += len(chunk)
+                    f.write(chunk)
+                f.flush()
+                os.fsync(f.fileno())
+        except BaseException as e:
+            path.unlink(missing_ok=True)
+            if not isinstance(e, OSError):
+                raise
+            logger.warning(
+                "SS_INPUT_WRITE_FAILED",
+                extra={"tenant_id": tenant_id, "job_id": job_id, "path": str(path)},
+            )
+            raise InputStorageFailedError(job_id=job_id, rel_path=rel_path) from e
+        return StagedFile(rel_path=rel_path, sha256=digest.hexdigest(), size_bytes=size_bytes)
+
+    def promote_staged(
+        self,
+        *,
+        job_id: str,
+        staged: StagedFile,
+        rel_path: str,
+        tenant_id: str = DEFAULT_TENANT_ID,
+    ) -> None:
+        src = self._resolve_for_write(tenant_id=tenant_id, job_id=job_id, rel_path=staged.rel_path)
+        dst = self._resolve_for_write(tenant_id=tenant_id, job_id=job_id, rel_path=rel_path)
+        try:
+            dst.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(src, dst)
+        except OSError as e:
+            logger.warning(
+                "SS_INPUT_WRITE_FAILED",
+                extra={"tenant_id": tenant_id, "job_id": job_id, "path": str(dst)},
+            )
+            raise InputStorageFailedError(job_id=job_id, rel_path=rel_path) from e
+
+    def discard_staged(
+        self,
+        *,
+        job_id: str,
+        staged: StagedFile,
+        tenant_id: str = DEFAULT_TENANT_ID,
+    ) -> None:
+        path = self._resolve_for_write(tenant_id=tenant_id, job_id=job_id, rel_path=staged.rel_path)
+        try:
+            path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning(
+                "SS_INPUT_STAGED_CLEANUP_FAILED",
+                extra={"job_id": job_id, "path": str(path), "error": str(e)},
+            )
+
+    def _resolve_for_write(self, *, tenant_id: str, job_id: str, rel_path: str) -> Path:
         if not is_safe_job_rel_path(rel_path):
             logger.warning(
                 "SS_INPUT_PATH_UNSAFE",
@@ -52,14 +137,7 @@ class FileJobWorkspaceStore(JobWorkspaceStore):
                 },
             )
             raise InputPathUnsafeError(job_id=job_id, rel_path=rel_path)
-        try:
-            self._atomic_write_bytes(path, data)
-        except OSError as e:
-            logger.warning(
-                "SS_INPUT_WRITE_FAILED",
-                extra={"tenant_id": tenant_id, "job_id": job_id, "path": str(path)},
-            )
-            raise InputStorageFailedError(job_id=job_id, rel_path=rel_path) from e
+        return path
 
     def resolve_for_read(
         self,
@@ -0,0 +1,158 @@
+from __future__ import annotations
+
+import logging
+import struct
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO
+
+from src.infra.exceptions import QueueDataCorruptedError, QueueIOError
+
+logger = logging.getLogger(__name__)
+
+_MAGIC = b"SSLHEAP1"
+_HEADER = struct.Struct("<8sQ")
+_RECORD = struct.Struct("<dH502s")
+_KEY_SEPARATOR = "\t"
+
+
+@dataclass(frozen=True)
+class LeaseEntry:
+    expires_at: float
+    tenant_id: str
+    job_id: str
+    claim_id: str
+
+
+def _encode(entry: LeaseEntry) -> bytes:
+    key = _KEY_SEPARATOR.join((entry.tenant_id, entry.job_id, entry.claim_id)).encode("utf-8")
+    if len(key) > _RECORD.size - 10:
+        raise ValueError("lease key too long for heap record")
+    return _RECORD.pack(entry.expires_at, len(key), key)
+
+
+def _decode(*, raw: bytes, path: Path) -> LeaseEntry:
+    expires_at, key_len, key = _RECORD.unpack(raw)
+    parts = key[:key_len].decode("utf-8", errors="replace").split(_KEY_SEPARATOR)
+    if len(parts) != 3 or any(part == "" for part in parts):
+        logger.warning("SS_QUEUE_LEASE_HEAP_RECORD_CORRUPTED", extra={"path": str(path)})
+        raise QueueDataCorruptedError(path=str(path))
+    return LeaseEntry(expires_at=expires_at, tenant_id=parts[0], job_id=parts[1], claim_id=parts[2])
+
+
+class FileLeaseHeap:
+    """Binary min-heap of lease expiries persisted as fixed-size records.
+
+    push/pop touch O(log n) records; peek reads a single record. The heap does no locking
+    of its own: callers must serialize access (see `FileQueueIndex.locked`).
+    """
+
+    def __init__(self, *, path: Path):
+        self._path = Path(path)
+
+    def peek(self) -> LeaseEntry | None:
+        if not self._path.exists():
+            return None
+        with self._open() as f:
+            if self._read_size(f) == 0:
+                return None
+            return self._read(f, 0)
+
+    def push(self, entry: LeaseEntry) -> None:
+        with self._open() as f:
+            size = self._read_size(f)
+            index = size
+            while index > 0:
+                parent_index = (index - 1) // 2
+                parent = self._read(f, parent_index)
+                if parent.expires_at <= entry.expires_at:
+                    break
+                self._write(f, index, parent)
+                index = parent_index
+            self._write(f, index, entry)
+            self._write_size(f, size + 1)
+
+    def pop(self) -> LeaseEntry | None:
+        with self._open() as f:
+            size = self._read_size(f)
+            if size == 0:
+                return None
+            top = self._read(f, 0)
+            last = self._read(f, size - 1)
+            size -= 1
+            if size > 0:
+                self._sift_down(f, entry=last, size=size)
+            self._write_size(f, size)
+            f.truncate(_HEADER.size + size * _RECORD.size)
+            return top
+
+    def reset(self, entries: Iterable[LeaseEntry]) -> None:
+        ordered = sorted(entries, key=lambda entry: entry.expires_at)
+        with self._open() as f:
+            f.truncate(_HEADER.size)
+            for index, entry in enumerate(ordered):
+                self._write(f, index, entry)
+            self._write_size(f, len(ordered))
+
+    def _sift_down(self, f: BinaryIO, *, entry: LeaseEntry, size: int) -> None:
+        index = 0
+        while True:
+            child_index = 2 * index + 1
+            if child_index >= size:
+                break
+            child = self._read(f, child_index)
+            right_index = child_index + 1
+            if right_index < size:
+                right = self._read(f, right_index)
+                if right.expires_at < child.expires_at:
+                    child_index, child = right_index, right
+            if entry.expires_at <= child.expires_at:
+                break
+            self._write(f, index, child)
+            index = child_index
+        self._write(f, index, entry)
+
+    def _open(self) -> BinaryIO:
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            if not self._path.exists():
+                self._path.write_bytes(_HEADER.pack(_MAGIC, 0))
+            return self._path.open("r+b", buffering=0)
+        except OSError as e:
+            logger.warning(
+                "SS_QUEUE_LEASE_HEAP_OPEN_FAILED",
+                extra={"path": str(self._path), "error": str(e)},
+            )
+            raise QueueIOError(operation="lease_heap_open", path=str(self._path)) from e
+
+    def _read_size(self, f: BinaryIO) -> int:
+        f.seek(0)
+        raw = f.read(_HEADER.size)
+        if len(raw) != _HEADER.size:
+            logger.warning("SS_QUEUE_LEASE_HEAP_HEADER_CORRUPTED", extra={"path": str(self._path)})
+            raise QueueDataCorruptedError(path=str(self._path))
+        magic, size = _HEADER.unpack(raw)
+        if magic != _MAGIC:
+            logger.warning("SS_QUEUE_LEASE_HEAP_HEADER_CORRUPTED", extra={"path": str(self._path)})
+            raise QueueDataCorruptedError(path=str(self._path))
+        return int(size)
+
+    def _write_size(self, f: BinaryIO, size: int) -> None:
+        f.seek(0)
+        f.write(_HEADER.pack(_MAGIC, size))
+
+    def _read(self, f: BinaryIO, index: int) -> LeaseEntry:
+        f.seek(_HEADER.size + index * _RECORD.size)
+        raw = f.read(_RECORD.size)
+        if len(raw) != _RECORD.size:
+            logger.warning(
+                "SS_QUEUE_LEASE_HEAP_RECORD_CORRUPTED",
+                extra={"path": str(self._path), "index": index},
+            )
+            raise QueueDataCorruptedError(path=str(self._path))
+        return _decode(raw=raw, path=self._path)
+
+    def _write(self, f: BinaryIO, index: int, entry: LeaseEntry) -> None:
+        f.seek(_HEADER.size + index * _RECORD.size)
+        f.write(_encode(entry))
@@ -0,0 +1,163 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import struct
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+
+from src.infra.file_lease_heap import FileLeaseHeap, LeaseEntry
+from src.utils.file_lock import exclusive_lock
+from src.utils.json_codec import default_codec
+
+logger = logging.getLogger(__name__)
+
+_CURSOR = struct.Struct("<Q")
+DEFAULT_COMPACT_THRESHOLD_BYTES = 1024 * 1024
+
+
+@dataclass(frozen=True)
+class ReadyEntry:
+    tenant_id: str
+    job_id: str
+    next_offset: int
+
+
+class FileQueueIndex:
+    """Persistent claim index: an append-only ready log plus a lease-expiry min-heap.
+
+    Layout under `index_dir`:
+    - `ready.log`: one JSON line per enqueued/released job, consumed in order
+    - `ready.cursor`: byte offset of the first unconsumed ready line
+    - `leases.heap`: `FileLeaseHeap` keyed by lease expiry
+    - `index.lock`: guards every read-modify-write through `locked()`
+    """
+
+    def __init__(
+        self,
+        *,
+        index_dir: Path,
+        compact_threshold_bytes: int = DEFAULT_COMPACT_THRESHOLD_BYTES,
+    ):
+        self._index_dir = Path(index_dir)
+        self._compact_threshold_bytes = compact_threshold_bytes
+        self._leases = FileLeaseHeap(path=self._index_dir / "leases.heap")
+
+    @property
+    def leases(self) -> FileLeaseHeap:
+        return self._leases
+
+    def is_initialized(self) -> bool:
+        return self._cursor_path().exists()
+
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        self._index_dir.mkdir(parents=True, exist_ok=True)
+        with (self._index_dir / "index.lock").open("a+", encoding="utf-8") as lock_file:
+            with exclusive_lock(lock_file):
+                yield
+
+    def append_ready(self, *, tenant_id: str, job_id: str) -> None:
+        line = json.dumps({"tenant_id": tenant_id, "job_id": job_id}, ensure_ascii=False)
+        path = self._ready_path()
+        with path.open("a+b") as f:
+            prefix = b""
+            if f.seek(0, os.SEEK_END) > 0:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    prefix = b"\n"
+            f.write(prefix + line.encode("utf-8") + b"\n")
+
+    def peek_ready(self) -> ReadyEntry | None:
+        path = self._ready_path()
+        if not path.exists():
+            return None
+        offset = self._read_cursor()
+        with path.open("rb") as f:
+            f.seek(offset)
+            while True:
+                line = f.readline()
+                if line == b"" or not line.endswith(b"\n"):
+                    return None
+                offset += len(line)
+                entry = _parse_ready_line(line=line, next_offset=offset)
+                if entry is not None:
+                    return entry
+                logger.warning(
+                    "SS_QUEUE_INDEX_READY_ENTRY_CORRUPTED",
+                    extra={"path": str(path), "offset": offset - len(line)},
+                )
+                self._write_cursor(offset)
+
+    def advance_ready(self, *, entry: ReadyEntry) -> None:
+        path = self._ready_path()
+        size = path.stat().st_size if path.exists() else 0
+        if entry.next_offset >= size:
+            with path.open("wb"):
+                pass
+            self._write_cursor(0)
+            return
+        if entry.next_offset >= self._compact_threshold_bytes and entry.next_offset * 2 >= size:
+            self._compact(offset=entry.next_offset)
+            return
+        self._write_cursor(entry.next_offset)
+
+    def reset(self, *, ready: Iterable[tuple[str, str]], leases: Iterable[LeaseEntry]) -> None:
+        self._index_dir.mkdir(parents=True, exist_ok=True)
+        with self._ready_path().open("wb"):
+            pass
+        for tenant_id, job_id in ready:
+            self.append_ready(tenant_id=tenant_id, job_id=job_id)
+        self._leases.reset(leases)
+        self._write_cursor(0)
+
+    def _compact(self, *, offset: int) -> None:
+        path = self._ready_path()
+        tmp = path.with_suffix(".log.tmp")
+        with path.open("rb") as src, tmp.open("wb") as dst:
+            src.seek(offset)
+            while chunk := src.read(1024 * 1024):
+                dst.write(chunk)
+        os.replace(tmp, path)
+        self._write_cursor(0)
+        logger.info("SS_QUEUE_INDEX_READY_LOG_COMPACTED", extra={"path": str(path)})
+
+    def _ready_path(self) -> Path:
+        return self._index_dir / "ready.log"
+
+    def _cursor_path(self) -> Path:
+        return self._index_dir / "ready.cursor"
+
+    def _read_cursor(self) -> int:
+        path = self._cursor_path()
+        if not path.exists():
+            return 0
+        raw = path.read_bytes()
+        if len(raw) != _CURSOR.size:
+            logger.warning("SS_QUEUE_INDEX_CURSOR_CORRUPTED", extra={"path": str(path)})
+            return 0
+        return int(_CURSOR.unpack(raw)[0])
+
+    def _write_cursor(self, offset: int) -> None:
+        path = self._cursor_path()
+        with path.open("r+b" if path.exists() else "wb") as f:
+            f.write(_CURSOR.pack(offset))
+
+
+def _parse_ready_line(*, line: bytes, next_offset: int) -> ReadyEntry | None:
+    try:
+        raw = default_codec().loads(line)
+    except (UnicodeDecodeError, json.JSONDecodeError):
+        return None
+    if not isinstance(raw, dict):
+        return None
+    tenant_id = raw.get("tenant_id")
+    job_id = raw.get("job_id")
+    if not isinstance(tenant_id, str) or not isinstance(job_id, str):
+        return None
+    if tenant_id == "" or job_id == "":
+        return None
+    return ReadyEntry(tenant_id=tenant_id, job_id=job_id, next_offset=next_offset)
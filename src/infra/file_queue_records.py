@@ -4,17 +4,22 @@ import json
 import logging
 import os
 import tempfile
+import threading
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import cast
 
+from src.domain.queue_scheduling import DEFAULT_JOB_PRIORITY
 from src.domain.worker_queue import QueueClaim
 from src.infra.exceptions import QueueDataCorruptedError, QueueIOError
+from src.utils.json_codec import default_codec
 from src.utils.json_types import JsonObject
 from src.utils.tenancy import DEFAULT_TENANT_ID, is_safe_tenant_id
 
 logger = logging.getLogger(__name__)
 
+# Claim records are renamed to this suffix while their lease is being renewed.
+RENEWING_SUFFIX = ".renewing"
+
 
 def assert_safe_segment(value: str) -> None:
     if value == "":
@@ -25,12 +30,11 @@ def assert_safe_segment(value: str) -> None:
         raise ValueError("path segment must not traverse")
 
 
-def atomic_write_json(*, path: Path, payload: JsonObject) -> None:
+def atomic_write_json(*, path: Path, payload: JsonObject, compact: bool = False) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    data = json.dumps(payload, ensure_ascii=False, indent=2, sort_keys=True)
+    data = default_codec().dumps(payload, compact=compact)
     with tempfile.NamedTemporaryFile(
-        "w",
-        encoding="utf-8",
+        "wb",
         dir=str(path.parent),
         delete=False,
     ) as f:
@@ -41,7 +45,7 @@ def atomic_write_json(*, path: Path, payload: JsonObject) -> None:
 
 def read_queue_record(*, path: Path) -> JsonObject:
     try:
-        raw = json.loads(path.read_text(encoding="utf-8"))
+        raw = default_codec().loads(path.read_bytes())
     except FileNotFoundError:
         raise
     except json.JSONDecodeError as e:
@@ -52,7 +56,67 @@ def read_queue_record(*, path: Path) -> JsonObject:
         raise QueueIOError(operation="read", path=str(path)) from e
     if not isinstance(raw, dict):
         raise QueueDataCorruptedError(path=str(path))
-    return cast(JsonObject, raw)
+    return raw
+
+
+def read_queue_order_key(*, path: Path) -> tuple[int, str]:
+    """Claim order within a tenant: higher `priority` first, then oldest `enqueued_at`.
+
+    Unreadable records sort as default priority so the claim itself surfaces the error.
+    """
+    try:
+        record = read_queue_record(path=path)
+    except (FileNotFoundError, QueueDataCorruptedError, QueueIOError):
+        return (-DEFAULT_JOB_PRIORITY, "")
+    priority = record.get("priority", DEFAULT_JOB_PRIORITY)
+    if not isinstance(priority, int) or isinstance(priority, bool):
+        priority = DEFAULT_JOB_PRIORITY
+    return (-priority, str(record.get("enqueued_at", "")))
+
+
+class QueueOrderCache:
+    """Claim-order keys of queued records, keyed by (path, inode).
+
+    Records are never rewritten in place while queued (enqueue creates them, release renames
+    a rewritten claim back), so a key stays valid until the path points at a new inode. This
+    keeps a claim from re-reading every queued record of the tenant it picked.
+    """
+
+    def __init__(self, *, max_entries: int = 100_000):
+        self._max_entries = max_entries
+        self._keys: dict[tuple[str, int], tuple[int, str]] = {}
+        self._lock = threading.Lock()
+
+    def sorted_paths(self, entries: list[os.DirEntry[str]]) -> list[Path]:
+        keyed: list[tuple[tuple[int, str], str, Path]] = []
+        for entry in entries:
+            try:
+                cache_key = (entry.path, entry.inode())
+            except OSError:
+                continue
+            with self._lock:
+                order_key = self._keys.get(cache_key)
+            if order_key is None:
+                order_key = read_queue_order_key(path=Path(entry.path))
+                with self._lock:
+                    if len(self._keys) >= self._max_entries:
+                        self._keys.clear()
+                    self._keys[cache_key] = order_key
+            keyed.append((order_key, entry.name, Path(entry.path)))
+        keyed.sort(key=lambda item: (item[0], item[1]))
+        return [path for _key, _name, path in keyed]
+
+
+def read_lease_expires_at(*, record: JsonObject, path: Path) -> datetime:
+    lease_expires_at = record.get("lease_expires_at", "")
+    if not isinstance(lease_expires_at, str):
+        logger.warning("SS_QUEUE_CLAIM_EXPIRES_AT_INVALID", extra={"path": str(path)})
+        raise QueueDataCorruptedError(path=str(path))
+    try:
+        return datetime.fromisoformat(lease_expires_at)
+    except (TypeError, ValueError):
+        logger.warning("SS_QUEUE_CLAIM_EXPIRES_AT_INVALID", extra={"path": str(path)})
+        raise QueueDataCorruptedError(path=str(path))
 
 
 def build_claim_fields(
@@ -111,3 +175,36 @@ def load_claim(*, record: JsonObject) -> QueueClaim:
         lease_expires_at=lease_expires_at_parsed,
         traceparent=traceparent,
     )
+
+
+def scan_records_by_tenant(
+    *, root: Path, suffix: str = ".json"
+) -> dict[str, list[os.DirEntry[str]]]:
+    """`*<suffix>` records directly under `root` (default tenant) and in each safe tenant dir."""
+    records: dict[str, list[os.DirEntry[str]]] = {}
+    if not root.exists():
+        return records
+    default_records = _scan_records(root, suffix=suffix)
+    if default_records:
+        records[DEFAULT_TENANT_ID] = default_records
+    for tenant_dir in sorted(p for p in root.iterdir() if p.is_dir()):
+        tenant_id = tenant_dir.name
+        if not is_safe_tenant_id(tenant_id):
+            logger.warning(
+                "SS_TENANT_ID_UNSAFE",
+                extra={"tenant_id": tenant_id, "path": str(tenant_dir)},
+            )
+            continue
+        tenant_records = _scan_records(tenant_dir, suffix=suffix)
+        if tenant_records:
+            records[tenant_id] = tenant_records
+    return records
+
+
+def _scan_records(directory: Path, *, suffix: str) -> list[os.DirEntry[str]]:
+    try:
+        with os.scandir(directory) as entries:
+            found = [e for e in entries if e.name.endswith(suffix) and not e.name.startswith(".")]
+    except FileNotFoundError:
+        return []
+    return sorted(found, key=lambda entry: entry.name)
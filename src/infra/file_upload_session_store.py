@@ -32,7 +32,7 @@ class FileUploadSessionStore(UploadSessionStore):
     @contextmanager
     def lock_job(self, *, tenant_id: str = DEFAULT_TENANT_ID, job_id: str) -> Iterator[None]:
         job_dir = resolve_job_dir(jobs_dir=self._jobs_dir, tenant_id=tenant_id, job_id=job_id)
-        if job_dir is None or not (job_dir / "job.json").exists():
+        if job_dir is None or not job_dir.is_dir():
             raise JobNotFoundError(job_id=job_id)
         lock_path = job_dir / "inputs" / "upload_sessions.lock"
         lock_path.parent.mkdir(parents=True, exist_ok=True)
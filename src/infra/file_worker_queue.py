@@ -1,22 +1,33 @@
 from __future__ import annotations
 
-import json
 import logging
+import os
 import uuid
-from dataclasses import dataclass
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Callable
 
+from src.domain.queue_scheduling import (
+    DEFAULT_JOB_PRIORITY,
+    FairShareScheduler,
+    TenantQueueLoad,
+)
 from src.domain.worker_queue import QueueClaim, WorkerQueue
+from src.infra.doorbell_queue_notifier import DOORBELL_DIRNAME, ring_doorbell
 from src.infra.exceptions import QueueDataCorruptedError, QueueIOError
 from src.infra.file_queue_records import (
+    RENEWING_SUFFIX,
+    QueueOrderCache,
     assert_safe_segment,
     atomic_write_json,
     build_claim_fields,
     load_claim,
+    read_lease_expires_at,
     read_queue_record,
+    scan_records_by_tenant,
 )
+from src.utils.json_codec import default_codec
 from src.utils.tenancy import DEFAULT_TENANT_ID, is_safe_tenant_id
 from src.utils.time import utc_now
 
@@ -28,6 +39,14 @@ class FileWorkerQueue(WorkerQueue):
     queue_dir: Path
     lease_ttl_seconds: int = 60
     clock: Callable[[], datetime] = utc_now
+    scheduler: FairShareScheduler = field(default_factory=FairShareScheduler, compare=False)
+    compact_json: bool = False
+    _order_cache: QueueOrderCache = field(
+        default_factory=QueueOrderCache,
+        init=False,
+        repr=False,
+        compare=False,
+    )
 
     def enqueue(
         self,
@@ -35,6 +54,7 @@ class FileWorkerQueue(WorkerQueue):
         *,
         tenant_id: str = DEFAULT_TENANT_ID,
         traceparent: str | None = None,
+        priority: int = DEFAULT_JOB_PRIORITY,
     ) -> None:
         self._ensure_dirs()
         path = self._queued_path(tenant_id=tenant_id, job_id=job_id)
@@ -43,12 +63,13 @@ class FileWorkerQueue(WorkerQueue):
             "tenant_id": tenant_id,
             "job_id": job_id,
             "enqueued_at": self.clock().isoformat(),
+            "priority": priority,
         }
         if traceparent is not None:
             payload["traceparent"] = traceparent
         try:
-            with path.open("x", encoding="utf-8") as f:
-                json.dump(payload, f, ensure_ascii=False, indent=2, sort_keys=True)
+            with path.open("xb") as f:
+                f.write(default_codec().dumps(payload, compact=self.compact_json))
         except FileExistsError:
             logger.info(
                 "SS_QUEUE_ENQUEUE_IDEMPOTENT",
@@ -66,6 +87,7 @@ class FileWorkerQueue(WorkerQueue):
                 },
             )
             raise QueueIOError(operation="enqueue", path=str(path)) from e
+        ring_doorbell(doorbell_dir=self.queue_dir / DOORBELL_DIRNAME)
 
     def claim(self, *, worker_id: str) -> QueueClaim | None:
         self._ensure_dirs()
@@ -134,6 +156,81 @@ class FileWorkerQueue(WorkerQueue):
                 },
             )
             raise QueueIOError(operation="release", path=str(source)) from e
+        ring_doorbell(doorbell_dir=self.queue_dir / DOORBELL_DIRNAME)
+
+    def renew(self, *, claim: QueueClaim) -> QueueClaim | None:
+        """Push the claim's lease out by one TTL, only while this worker still owns the record.
+
+        The record is first renamed to a private `.renewing` name: a reclaimer that renamed
+        it away first makes that rename fail, and one that comes later no longer finds it in
+        `claimed/`. The rewritten record goes back under its claim name and the `.renewing`
+        file is removed last; if it has vanished by then (recovered as stale, see
+        `_recover_stale_renewals`), the renewed record is dropped and the claim reported lost.
+        A lease that has already expired is not revived.
+        """
+        path = self._claimed_path(
+            tenant_id=claim.tenant_id,
+            job_id=claim.job_id,
+            claim_id=claim.claim_id,
+        )
+        renewing = path.with_suffix(RENEWING_SUFFIX)
+        now = self.clock()
+        try:
+            path.rename(renewing)
+        except FileNotFoundError:
+            logger.info(
+                "SS_QUEUE_RENEW_CLAIM_GONE",
+                extra={"tenant_id": claim.tenant_id, "job_id": claim.job_id, "path": str(path)},
+            )
+            return None
+        except OSError as e:
+            logger.warning(
+                "SS_QUEUE_RENEW_RENAME_FAILED",
+                extra={"job_id": claim.job_id, "src": str(path), "dst": str(renewing)},
+            )
+            raise QueueIOError(operation="renew_rename", path=str(path)) from e
+        try:
+            record = read_queue_record(path=renewing)
+            expires = read_lease_expires_at(record=record, path=renewing)
+        except FileNotFoundError:
+            return None
+        except (QueueDataCorruptedError, QueueIOError):
+            self._restore_renewing(renewing=renewing)
+            raise
+        if now >= expires:
+            self._restore_renewing(renewing=renewing)
+            logger.info(
+                "SS_QUEUE_RENEW_LEASE_EXPIRED",
+                extra={"tenant_id": claim.tenant_id, "job_id": claim.job_id, "path": str(path)},
+            )
+            return None
+        expires_at = now + self._ttl()
+        record["lease_expires_at"] = expires_at.isoformat()
+        try:
+            atomic_write_json(path=path, payload=record, compact=self.compact_json)
+        except OSError as e:
+            logger.warning(
+                "SS_QUEUE_RENEW_WRITE_FAILED",
+                extra={"job_id": claim.job_id, "path": str(path), "error": str(e)},
+            )
+            self._restore_renewing(renewing=renewing)
+            raise QueueIOError(operation="renew_write", path=str(path)) from e
+        try:
+            renewing.unlink()
+        except FileNotFoundError:
+            path.unlink(missing_ok=True)
+            logger.warning(
+                "SS_QUEUE_RENEW_CLAIM_GONE",
+                extra={"tenant_id": claim.tenant_id, "job_id": claim.job_id, "path": str(path)},
+            )
+            return None
+        except OSError as e:
+            # The renewed record is already in place; the leftover is dropped on recovery.
+            logger.warning(
+                "SS_QUEUE_RENEW_CLEANUP_FAILED",
+                extra={"job_id": claim.job_id, "path": str(renewing), "error": str(e)},
+            )
+        return replace(claim, lease_expires_at=expires_at)
 
     def _ensure_dirs(self) -> None:
         self.queue_dir.mkdir(parents=True, exist_ok=True)
@@ -169,37 +266,47 @@ class FileWorkerQueue(WorkerQueue):
         return self._claimed_dir(tenant_id=tenant_id) / f"{job_id}__{claim_id}.json"
 
     def _claim_from_queued(self, *, worker_id: str, now: datetime) -> QueueClaim | None:
-        for tenant_id, queued_path in self._iter_queued_records():
-            job_id = queued_path.stem
-            try:
-                claim = self._claim_file(
-                    source=queued_path,
-                    tenant_id=tenant_id,
-                    job_id=job_id,
-                    worker_id=worker_id,
-                    now=now,
-                )
-            except FileNotFoundError:
-                continue
-            if claim is not None:
-                return claim
+        """Claim from the tenant the scheduler ranks first, highest-priority job first.
+
+        Caps are checked against `claimed/` at scan time, so concurrent claimers on other
+        processes may overshoot a tenant's cap by the number of racing workers.
+        """
+        queued = scan_records_by_tenant(root=self._queued_root_dir())
+        claimed = scan_records_by_tenant(root=self._claimed_root_dir())
+        loads = [
+            TenantQueueLoad(
+                tenant_id=tenant_id,
+                ready=len(entries),
+                inflight=len(claimed.get(tenant_id, [])),
+            )
+            for tenant_id, entries in queued.items()
+        ]
+        for tenant_id in self.scheduler.order(loads):
+            for queued_path in self._order_cache.sorted_paths(queued[tenant_id]):
+                try:
+                    claim = self._claim_file(
+                        source=queued_path,
+                        tenant_id=tenant_id,
+                        job_id=queued_path.stem,
+                        worker_id=worker_id,
+                        now=now,
+                        claim_id=uuid.uuid4().hex,
+                    )
+                except FileNotFoundError:
+                    continue
+                if claim is not None:
+                    self.scheduler.record_claim(tenant_id=tenant_id)
+                    return claim
         return None
 
     def _claim_from_expired(self, *, worker_id: str, now: datetime) -> QueueClaim | None:
+        self._recover_stale_renewals(now=now)
         for tenant_id, claim_path in self._iter_claimed_records():
             try:
                 record = read_queue_record(path=claim_path)
             except FileNotFoundError:
                 continue
-            lease_expires_at = record.get("lease_expires_at", "")
-            if not isinstance(lease_expires_at, str):
-                logger.warning("SS_QUEUE_CLAIM_EXPIRES_AT_INVALID", extra={"path": str(claim_path)})
-                raise QueueDataCorruptedError(path=str(claim_path))
-            try:
-                expires = datetime.fromisoformat(lease_expires_at)
-            except (TypeError, ValueError):
-                logger.warning("SS_QUEUE_CLAIM_EXPIRES_AT_INVALID", extra={"path": str(claim_path)})
-                raise QueueDataCorruptedError(path=str(claim_path))
+            expires = read_lease_expires_at(record=record, path=claim_path)
             if now < expires:
                 continue
             job_id = str(record.get("job_id", ""))
@@ -212,6 +319,7 @@ class FileWorkerQueue(WorkerQueue):
                     job_id=job_id,
                     worker_id=worker_id,
                     now=now,
+                    claim_id=uuid.uuid4().hex,
                 )
             except FileNotFoundError:
                 continue
@@ -227,8 +335,8 @@ class FileWorkerQueue(WorkerQueue):
         job_id: str,
         worker_id: str,
         now: datetime,
+        claim_id: str,
     ) -> QueueClaim | None:
-        claim_id = uuid.uuid4().hex
         target = self._claimed_path(tenant_id=tenant_id, job_id=job_id, claim_id=claim_id)
         tmp_target = target.with_suffix(".tmp")
         tmp_target.parent.mkdir(parents=True, exist_ok=True)
@@ -255,7 +363,7 @@ class FileWorkerQueue(WorkerQueue):
             )
         )
         try:
-            atomic_write_json(path=tmp_target, payload=record)
+            atomic_write_json(path=tmp_target, payload=record, compact=self.compact_json)
         except OSError as e:
             logger.warning(
                 "SS_QUEUE_CLAIM_WRITE_FAILED",
@@ -286,6 +394,40 @@ class FileWorkerQueue(WorkerQueue):
         )
         return claim
 
+    def _recover_stale_renewals(self, *, now: datetime) -> None:
+        """Put `.renewing` records left by a crashed renewal back into `claimed/`.
+
+        A live renewal only proceeds while its lease is unexpired and finishes in one rewrite,
+        so a `.renewing` record is taken as abandoned once a further TTL has passed since its
+        lease expired; the grace also absorbs clock skew between workers.
+        """
+        for _tenant_id, renewing in self._iter_renewing_records():
+            try:
+                record = read_queue_record(path=renewing)
+            except FileNotFoundError:
+                continue
+            if now < read_lease_expires_at(record=record, path=renewing) + self._ttl():
+                continue
+            logger.warning("SS_QUEUE_RENEW_STALE_RECOVERED", extra={"path": str(renewing)})
+            self._restore_renewing(renewing=renewing)
+
+    def _restore_renewing(self, *, renewing: Path) -> None:
+        target = renewing.with_suffix(".json")
+        try:
+            if target.exists():
+                # The renewal already wrote its record; only the leftover remains.
+                renewing.unlink()
+            else:
+                renewing.rename(target)
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            logger.warning(
+                "SS_QUEUE_RENEW_RESTORE_FAILED",
+                extra={"src": str(renewing), "dst": str(target), "error": str(e)},
+            )
+            raise QueueIOError(operation="renew_restore", path=str(renewing)) from e
+
     def _ttl(self) -> timedelta:
         try:
             ttl = int(self.lease_ttl_seconds)
@@ -314,37 +456,18 @@ class FileWorkerQueue(WorkerQueue):
             )
 
     def _iter_queued_records(self) -> list[tuple[str, Path]]:
-        root = self._queued_root_dir()
-        records: list[tuple[str, Path]] = []
-        if root.exists():
-            for path in sorted(root.glob("*.json")):
-                records.append((DEFAULT_TENANT_ID, path))
-            for tenant_dir in sorted(p for p in root.iterdir() if p.is_dir()):
-                tenant_id = tenant_dir.name
-                if not is_safe_tenant_id(tenant_id):
-                    logger.warning(
-                        "SS_TENANT_ID_UNSAFE",
-                        extra={"tenant_id": tenant_id, "path": str(tenant_dir)},
-                    )
-                    continue
-                for path in sorted(tenant_dir.glob("*.json")):
-                    records.append((tenant_id, path))
-        return records
+        return _flatten(scan_records_by_tenant(root=self._queued_root_dir()))
 
     def _iter_claimed_records(self) -> list[tuple[str, Path]]:
-        root = self._claimed_root_dir()
-        records: list[tuple[str, Path]] = []
-        if root.exists():
-            for path in sorted(root.glob("*.json")):
-                records.append((DEFAULT_TENANT_ID, path))
-            for tenant_dir in sorted(p for p in root.iterdir() if p.is_dir()):
-                tenant_id = tenant_dir.name
-                if not is_safe_tenant_id(tenant_id):
-                    logger.warning(
-                        "SS_TENANT_ID_UNSAFE",
-                        extra={"tenant_id": tenant_id, "path": str(tenant_dir)},
-                    )
-                    continue
-                for path in sorted(tenant_dir.glob("*.json")):
-                    records.append((tenant_id, path))
-        return records
+        return _flatten(scan_records_by_tenant(root=self._claimed_root_dir()))
+
+    def _iter_renewing_records(self) -> list[tuple[str, Path]]:
+        return _flatten(
+            scan_records_by_tenant(root=self._claimed_root_dir(), suffix=RENEWING_SUFFIX)
+        )
+
+
+def _flatten(records: dict[str, list[os.DirEntry[str]]]) -> list[tuple[str, Path]]:
+    return [
+        (tenant_id, Path(entry.path)) for tenant_id, entries in records.items() for entry in entries
+    ]
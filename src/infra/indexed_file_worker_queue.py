@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import logging
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+
+from src.domain.queue_scheduling import DEFAULT_JOB_PRIORITY
+from src.domain.worker_queue import QueueClaim
+from src.infra.exceptions import QueueIOError
+from src.infra.file_lease_heap import LeaseEntry
+from src.infra.file_queue_index import FileQueueIndex, ReadyEntry
+from src.infra.file_queue_records import (
+    RENEWING_SUFFIX,
+    read_lease_expires_at,
+    read_queue_record,
+)
+from src.infra.file_worker_queue import FileWorkerQueue
+from src.utils.tenancy import DEFAULT_TENANT_ID, is_safe_tenant_id
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class IndexedFileWorkerQueue(FileWorkerQueue):
+    """FileWorkerQueue that claims through `FileQueueIndex` instead of directory scans.
+
+    The `queued/` and `claimed/` records keep their layout and stay the source of truth;
+    the index only decides which record to try next, so stale index entries are skipped.
+    A missing index is rebuilt from a one-time scan, which makes switching an existing
+    queue directory to this mode safe. Claims follow the ready log in FIFO order: job
+    priority is recorded but tenant fair share and caps do not apply in this mode.
+    """
+
+    def enqueue(
+        self,
+        job_id: str,
+        *,
+        tenant_id: str = DEFAULT_TENANT_ID,
+        traceparent: str | None = None,
+        priority: int = DEFAULT_JOB_PRIORITY,
+    ) -> None:
+        self._ensure_dirs()
+        with self._locked_index(operation="enqueue") as index:
+            if not self._queued_path(tenant_id=tenant_id, job_id=job_id).exists():
+                index.append_ready(tenant_id=tenant_id, job_id=job_id)
+            super().enqueue(
+                job_id,
+                tenant_id=tenant_id,
+                traceparent=traceparent,
+                priority=priority,
+            )
+
+    def claim(self, *, worker_id: str) -> QueueClaim | None:
+        self._ensure_dirs()
+        now = self.clock()
+        with self._locked_index(operation="claim") as index:
+            claim = self._claim_next_ready(index=index, worker_id=worker_id, now=now)
+            if claim is not None:
+                return claim
+            return self._claim_next_expired(index=index, worker_id=worker_id, now=now)
+
+    def release(self, *, claim: QueueClaim) -> None:
+        self._ensure_dirs()
+        with self._locked_index(operation="release") as index:
+            super().release(claim=claim)
+            if self._queued_path(tenant_id=claim.tenant_id, job_id=claim.job_id).exists():
+                index.append_ready(tenant_id=claim.tenant_id, job_id=claim.job_id)
+
+    def renew(self, *, claim: QueueClaim) -> QueueClaim | None:
+        self._ensure_dirs()
+        with self._locked_index(operation="renew") as index:
+            renewed = super().renew(claim=claim)
+            if renewed is not None:
+                index.leases.push(
+                    LeaseEntry(
+                        expires_at=renewed.lease_expires_at.timestamp(),
+                        tenant_id=renewed.tenant_id,
+                        job_id=renewed.job_id,
+                        claim_id=renewed.claim_id,
+                    )
+                )
+            return renewed
+
+    def rebuild_index(self) -> None:
+        self._ensure_dirs()
+        with self._locked_index(operation="rebuild") as index:
+            self._rebuild_locked(index=index)
+
+    @contextmanager
+    def _locked_index(self, *, operation: str) -> Iterator[FileQueueIndex]:
+        index_dir = self.queue_dir / "index"
+        index = FileQueueIndex(index_dir=index_dir)
+        try:
+            with index.locked():
+                if not index.is_initialized():
+                    self._rebuild_locked(index=index)
+                yield index
+        except OSError as e:
+            logger.warning(
+                "SS_QUEUE_INDEX_IO_FAILED",
+                extra={"operation": operation, "path": str(index_dir), "error": str(e)},
+            )
+            raise QueueIOError(operation=f"index_{operation}", path=str(index_dir)) from e
+
+    def _claim_next_ready(
+        self,
+        *,
+        index: FileQueueIndex,
+        worker_id: str,
+        now: datetime,
+    ) -> QueueClaim | None:
+        while True:
+            entry = index.peek_ready()
+            if entry is None:
+                return None
+            if not self._is_claimable_ready(entry=entry):
+                index.advance_ready(entry=entry)
+                continue
+            claim = self._claim_tracked(
+                index=index,
+                source=self._queued_path(tenant_id=entry.tenant_id, job_id=entry.job_id),
+                tenant_id=entry.tenant_id,
+                job_id=entry.job_id,
+                worker_id=worker_id,
+                now=now,
+            )
+            index.advance_ready(entry=entry)
+            if claim is not None:
+                return claim
+
+    def _claim_next_expired(
+        self,
+        *,
+        index: FileQueueIndex,
+        worker_id: str,
+        now: datetime,
+    ) -> QueueClaim | None:
+        now_ts = now.timestamp()
+        while True:
+            lease = index.leases.peek()
+            if lease is None or lease.expires_at > now_ts:
+                return None
+            index.leases.pop()
+            path = self._claimed_path(
+                tenant_id=lease.tenant_id,
+                job_id=lease.job_id,
+                claim_id=lease.claim_id,
+            )
+            # Renewals hold the index lock, so a `.renewing` record seen here was left by a
+            # crashed renewal and goes straight back to its claim name.
+            self._restore_renewing(renewing=path.with_suffix(RENEWING_SUFFIX))
+            try:
+                record = read_queue_record(path=path)
+            except FileNotFoundError:
+                continue
+            if now < read_lease_expires_at(record=record, path=path):
+                continue
+            claim = self._claim_tracked(
+                index=index,
+                source=path,
+                tenant_id=lease.tenant_id,
+                job_id=lease.job_id,
+                worker_id=worker_id,
+                now=now,
+            )
+            if claim is not None:
+                return claim
+
+    def _claim_tracked(
+        self,
+        *,
+        index: FileQueueIndex,
+        source: Path,
+        tenant_id: str,
+        job_id: str,
+        worker_id: str,
+        now: datetime,
+    ) -> QueueClaim | None:
+        claim_id = uuid.uuid4().hex
+        index.leases.push(
+            LeaseEntry(
+                expires_at=(now + self._ttl()).timestamp(),
+                tenant_id=tenant_id,
+                job_id=job_id,
+                claim_id=claim_id,
+            )
+        )
+        try:
+            return self._claim_file(
+                source=source,
+                tenant_id=tenant_id,
+                job_id=job_id,
+                worker_id=worker_id,
+                now=now,
+                claim_id=claim_id,
+            )
+        except FileNotFoundError:
+            return None
+
+    def _is_claimable_ready(self, *, entry: ReadyEntry) -> bool:
+        if entry.tenant_id != DEFAULT_TENANT_ID and not is_safe_tenant_id(entry.tenant_id):
+            logger.warning(
+                "SS_TENANT_ID_UNSAFE",
+                extra={"tenant_id": entry.tenant_id, "source": "queue_index"},
+            )
+            return False
+        try:
+            path = self._queued_path(tenant_id=entry.tenant_id, job_id=entry.job_id)
+        except ValueError:
+            logger.warning(
+                "SS_QUEUE_INDEX_READY_ENTRY_UNSAFE",
+                extra={"tenant_id": entry.tenant_id, "job_id": entry.job_id},
+            )
+            return False
+        return path.exists()
+
+    def _rebuild_locked(self, *, index: FileQueueIndex) -> None:
+        for _tenant_id, renewing in self._iter_renewing_records():
+            self._restore_renewing(renewing=renewing)
+        ready = [(tenant_id, path.stem) for tenant_id, path in self._iter_queued_records()]
+        leases: list[LeaseEntry] = []
+        for tenant_id, path in self._iter_claimed_records():
+            job_id, sep, claim_id = path.stem.rpartition("__")
+            if sep == "" or job_id == "" or claim_id == "":
+                logger.warning("SS_QUEUE_CLAIM_FILENAME_INVALID", extra={"path": str(path)})
+                continue
+            try:
+                record = read_queue_record(path=path)
+            except FileNotFoundError:
+                continue
+            expires = read_lease_expires_at(record=record, path=path)
+            leases.append(
+                LeaseEntry(
+                    expires_at=expires.timestamp(),
+                    tenant_id=tenant_id,
+                    job_id=job_id,
+                    claim_id=claim_id,
+                )
+            )
+        index.reset(ready=ready, leases=leases)
+        logger.info(
+            "SS_QUEUE_INDEX_REBUILT",
+            extra={"queue_dir": str(self.queue_dir), "queued": len(ready), "claimed": len(leases)},
+        )
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from src.domain.job_indexer import JobIndexItem, JobIndexWriter
+from src.domain.job_store import JobStore
+from src.domain.models import Draft, Job
+from src.utils.json_types import JsonObject
+from src.utils.tenancy import DEFAULT_TENANT_ID
+from src.utils.time import utc_now
+
+
+class IndexedJobStore:
+    """Job store decorator that keeps a `JobIndexWriter` in step with every job write.
+
+    The index row is written after the inner store succeeds and carries the `version` the
+    store just assigned, which is what orders racing index writes; index failures are logged
+    by the writer and never fail the job write (the rebuild command repairs any drift).
+    """
+
+    def __init__(self, *, inner: JobStore, index: JobIndexWriter):
+        self._inner = inner
+        self._index = index
+
+    @property
+    def inner(self) -> JobStore:
+        return self._inner
+
+    def create(self, job: Job, *, tenant_id: str = DEFAULT_TENANT_ID) -> None:
+        self._inner.create(job, tenant_id=tenant_id)
+        self._record(job=job, tenant_id=tenant_id)
+
+    def load(self, job_id: str, *, tenant_id: str = DEFAULT_TENANT_ID) -> Job:
+        return self._inner.load(job_id, tenant_id=tenant_id)
+
+    def save(self, job: Job, *, tenant_id: str = DEFAULT_TENANT_ID) -> None:
+        self._inner.save(job, tenant_id=tenant_id)
+        self._record(job=job, tenant_id=tenant_id)
+
+    def write_draft(self, *, job_id: str, draft: Draft, tenant_id: str = DEFAULT_TENANT_ID) -> None:
+        self._inner.write_draft(job_id=job_id, draft=draft, tenant_id=tenant_id)
+        self._record(job=self._inner.load(job_id, tenant_id=tenant_id), tenant_id=tenant_id)
+
+    def write_artifact_json(
+        self,
+        *,
+        job_id: str,
+        rel_path: str,
+        payload: JsonObject,
+        tenant_id: str = DEFAULT_TENANT_ID,
+    ) -> None:
+        self._inner.write_artifact_json(
+            job_id=job_id, rel_path=rel_path, payload=payload, tenant_id=tenant_id
+        )
+
+    def _record(self, *, job: Job, tenant_id: str) -> None:
+        self._index.upsert(
+            JobIndexItem(
+                tenant_id=tenant_id,
+                job_id=job.job_id,
+                status=job.status.value,
+                created_at=job.created_at,
+                updated_at=utc_now().isoformat(),
+                version=job.version,
+            )
+        )
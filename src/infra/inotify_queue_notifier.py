@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import ctypes
+import ctypes.util
+import logging
+import os
+import struct
+import sys
+import threading
+from pathlib import Path
+
+from src.infra.select_queue_notifier import SelectQueueNotifier
+from src.utils.tenancy import is_safe_tenant_id
+
+logger = logging.getLogger(__name__)
+
+_IN_CLOSE_WRITE = 0x00000008
+_IN_MOVED_TO = 0x00000080
+_IN_CREATE = 0x00000100
+_IN_ONLYDIR = 0x01000000
+_IN_ISDIR = 0x40000000
+_IN_NONBLOCK = os.O_NONBLOCK
+_IN_CLOEXEC = getattr(os, "O_CLOEXEC", 0o2000000)
+# A record is complete once its writer closes it (`enqueue`) or it is renamed in (`release`);
+# IN_CREATE fires before `enqueue` writes any bytes, so it is only watched on `queued/` itself
+# to discover new tenant directories.
+_RECORD_EVENTS = _IN_CLOSE_WRITE | _IN_MOVED_TO
+_TENANT_WATCH_MASK = _RECORD_EVENTS | _IN_ONLYDIR
+_ROOT_WATCH_MASK = _TENANT_WATCH_MASK | _IN_CREATE
+_EVENT_HEADER = struct.Struct("iIII")
+_READ_SIZE = 64 * 1024
+
+
+def _load_libc() -> ctypes.CDLL | None:
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    except OSError:
+        return None
+    if not hasattr(libc, "inotify_init1") or not hasattr(libc, "inotify_add_watch"):
+        return None
+    return libc
+
+
+_LIBC = _load_libc()
+
+
+def inotify_available() -> bool:
+    return _LIBC is not None
+
+
+class InotifyQueueNotifier(SelectQueueNotifier):
+    """Wakes on inotify events under `queued/` (new records, releases, new tenant dirs).
+
+    `queued/` and each tenant subdirectory are watched; tenant directories created later
+    are picked up from the IN_CREATE event of `queued/`. Only finished records (closed after
+    writing, or renamed in) wake a waiter. A record written into a new tenant directory
+    before its watch is added is found by the next idle poll. Local filesystems only:
+    inotify does not see writes made by other hosts on network filesystems.
+    """
+
+    def __init__(self, *, queued_dir: Path):
+        if _LIBC is None:
+            raise OSError("inotify is not available on this platform")
+        super().__init__()
+        self._libc = _LIBC
+        self._queued_dir = Path(queued_dir)
+        self._queued_dir.mkdir(parents=True, exist_ok=True)
+        self._fd = int(self._libc.inotify_init1(_IN_NONBLOCK | _IN_CLOEXEC))
+        if self._fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self._root_wd = self._add_watch(self._queued_dir, mask=_ROOT_WATCH_MASK)
+        self._lock = threading.Lock()
+        for child in self._queued_dir.iterdir():
+            if child.is_dir() and is_safe_tenant_id(child.name):
+                self._add_watch(child, mask=_TENANT_WATCH_MASK)
+
+    def _fileno(self) -> int:
+        return self._fd
+
+    def _close_source(self) -> None:
+        os.close(self._fd)
+
+    def _drain(self) -> bool:
+        woke = False
+        with self._lock:
+            while True:
+                try:
+                    data = os.read(self._fd, _READ_SIZE)
+                except BlockingIOError:
+                    return woke
+                if not data:
+                    return woke
+                woke = self._handle_events(data) or woke
+
+    def _handle_events(self, data: bytes) -> bool:
+        """Watch new tenant directories; True if any event is a finished record."""
+        woke = False
+        offset = 0
+        while offset + _EVENT_HEADER.size <= len(data):
+            wd, mask, _cookie, length = _EVENT_HEADER.unpack_from(data, offset)
+            start = offset + _EVENT_HEADER.size
+            name = data[start : start + length].split(b"\0", 1)[0].decode("utf-8", "replace")
+            offset = start + length
+            if mask & _RECORD_EVENTS and not mask & _IN_ISDIR:
+                woke = True
+                continue
+            if wd != self._root_wd or not (mask & _IN_ISDIR) or not (mask & _IN_CREATE):
+                continue
+            if not is_safe_tenant_id(name):
+                continue
+            try:
+                self._add_watch(self._queued_dir / name, mask=_TENANT_WATCH_MASK)
+            except OSError:
+                continue
+        return woke
+
+    def _add_watch(self, path: Path, *, mask: int) -> int:
+        wd = int(self._libc.inotify_add_watch(self._fd, str(path).encode("utf-8"), mask))
+        if wd < 0:
+            errno = ctypes.get_errno()
+            logger.warning(
+                "SS_QUEUE_NOTIFIER_WATCH_FAILED",
+                extra={"path": str(path), "error": os.strerror(errno)},
+            )
+            raise OSError(errno, os.strerror(errno), str(path))
+        return wd
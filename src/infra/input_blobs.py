@@ -0,0 +1,130 @@
+from __future__ import annotations
+
+import logging
+import os
+import re
+import shutil
+import stat
+import sys
+import uuid
+from collections.abc import Mapping
+from pathlib import Path
+
+from src.domain.dataset_preview_cache import content_sha256
+
+logger = logging.getLogger(__name__)
+
+BLOB_DIRNAME = ".blobs"
+STAGE_REFLINK = "reflink"
+STAGE_HARDLINK = "hardlink"
+STAGE_COPY = "copy"
+
+# ioctl(dest_fd, FICLONE, src_fd): share the source extents copy-on-write (btrfs, XFS, ...).
+_FICLONE = 0x40049409
+_READ_ONLY = stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH
+_SHA256_RE = re.compile(r"^[0-9a-f]{64}$")
+
+
+def stage_file(*, source: Path, dest: Path, allow_hardlink: bool = True) -> str:
+    """Materialize `source` at `dest`: reflink, else hardlink, else copy.
+
+    Returns the method used. `dest` is replaced atomically. A reflinked or copied `dest` has
+    its own inode and is made read-only; a hardlinked `dest` shares the inode (and mode) of
+    `source`, which is left as it is, so staged inputs must never be written to.
+    """
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    tmp = dest.with_name(f".{dest.name}.{uuid.uuid4().hex}.tmp")
+    try:
+        method = _link_or_copy(source=source, tmp=tmp, allow_hardlink=allow_hardlink)
+        if method != STAGE_HARDLINK:
+            os.chmod(tmp, _READ_ONLY)
+        os.replace(tmp, dest)
+    finally:
+        tmp.unlink(missing_ok=True)
+    return method
+
+
+def _link_or_copy(*, source: Path, tmp: Path, allow_hardlink: bool) -> str:
+    if _try_reflink(source=source, tmp=tmp):
+        return STAGE_REFLINK
+    if allow_hardlink:
+        try:
+            os.link(source, tmp)
+            return STAGE_HARDLINK
+        except OSError:
+            tmp.unlink(missing_ok=True)
+    shutil.copy2(source, tmp)
+    return STAGE_COPY
+
+
+def _try_reflink(*, source: Path, tmp: Path) -> bool:
+    if not sys.platform.startswith("linux"):
+        return False
+    import fcntl
+
+    try:
+        with source.open("rb") as src, tmp.open("xb") as dst:
+            fcntl.ioctl(dst.fileno(), _FICLONE, src.fileno())
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        return False
+    return True
+
+
+class InputBlobStore:
+    """Content-addressed copies of job inputs under `<job_dir>/.blobs/<sha256>`.
+
+    Each input is stored once per job, as a reflink or copy of the upload (never a hardlink,
+    so the upload keeps its own inode and mode); every run and composition step hardlinks
+    the read-only blob instead of copying the upload again. A blob is used only while its
+    content still hashes to its name.
+    """
+
+    def __init__(self, *, blobs_dir: Path):
+        self._blobs_dir = blobs_dir
+
+    def stage(self, *, source: Path, dest: Path, sha256: str | None) -> str:
+        """Materialize `source` at `dest` through its blob when `sha256` is known."""
+        if sha256 is None or _SHA256_RE.fullmatch(sha256) is None:
+            return stage_file(source=source, dest=dest)
+        blob = self._blobs_dir / sha256
+        if not _is_blob_of(blob=blob, sha256=sha256):
+            stage_file(source=source, dest=blob, allow_hardlink=False)
+            if not _is_blob_of(blob=blob, sha256=sha256):
+                # The manifest hash is stale for this upload; never keep a mislabelled blob.
+                logger.warning(
+                    "SS_INPUT_BLOB_SHA256_MISMATCH",
+                    extra={"source": str(source), "sha256": sha256},
+                )
+                _discard(blob)
+                return stage_file(source=source, dest=dest)
+        return stage_file(source=blob, dest=dest)
+
+
+def _is_blob_of(*, blob: Path, sha256: str) -> bool:
+    # content_sha256 is memoized by (path, size, mtime, inode), so a blob is hashed once.
+    try:
+        return content_sha256(blob) == sha256
+    except OSError:
+        return False
+
+
+def _discard(path: Path) -> None:
+    try:
+        os.chmod(path, stat.S_IRUSR | stat.S_IWUSR)
+        path.unlink()
+    except OSError:
+        return
+
+
+def input_sha256_by_rel_path(manifest: Mapping[str, object]) -> dict[str, str]:
+    """`rel_path -> sha256` for the datasets of a job inputs manifest."""
+    out: dict[str, str] = {}
+    datasets = manifest.get("datasets")
+    for item in datasets if isinstance(datasets, list) else []:
+        if not isinstance(item, Mapping):
+            continue
+        rel_path, sha256 = item.get("rel_path"), item.get("sha256")
+        if isinstance(rel_path, str) and isinstance(sha256, str):
+            out[rel_path.strip()] = sha256.strip()
+    return out
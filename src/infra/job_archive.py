@@ -0,0 +1,248 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import shutil
+import tarfile
+import tempfile
+import zipfile
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import IO
+
+from src.domain.models import is_safe_job_rel_path
+from src.infra.atomic_write import atomic_write_json
+from src.infra.durability import (
+    DURABILITY_ALWAYS,
+    Durability,
+    fsync_directory,
+    fsync_file,
+)
+from src.utils.file_lock import exclusive_lock
+from src.utils.json_codec import default_codec
+from src.utils.json_types import JsonObject
+
+logger = logging.getLogger(__name__)
+
+# Archiving and restoring delete the only other copy of the data, so their writes are fsynced
+# whatever `SS_DURABILITY_POLICY` says.
+_DELETES_DATA = Durability(policy=DURABILITY_ALWAYS)
+
+ARCHIVE_INDEX_FILENAME = "archive.json"
+ARCHIVE_LOCKS_DIRNAME = ".locks"
+ARCHIVE_LOCK_STRIPES = 1024
+ARCHIVE_FORMAT_ZIP = "zip"
+ARCHIVE_FORMAT_TAR_GZ = "tar.gz"
+ARCHIVE_FILENAMES = {
+    ARCHIVE_FORMAT_ZIP: "workspace.zip",
+    ARCHIVE_FORMAT_TAR_GZ: "workspace.tar.gz",
+}
+ARCHIVE_READ_ERRORS = (OSError, KeyError, tarfile.TarError, zipfile.BadZipFile)
+
+# Top-level files that stay live so the job store, index walks and locks keep working.
+_KEPT_FILENAMES = frozenset(
+    {"job.json", "job.json.lock", ARCHIVE_INDEX_FILENAME} | set(ARCHIVE_FILENAMES.values())
+)
+_KEPT_PREFIXES = ("job.journal.",)
+
+
+@dataclass(frozen=True)
+class ArchiveIndex:
+    """`archive.json`: what was packed, so reads never have to open the archive to miss."""
+
+    archive_format: str
+    archive_name: str
+    archived_at: str
+    files: dict[str, int]
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(self.files.values())
+
+    def to_payload(self) -> JsonObject:
+        return {
+            "format": self.archive_format,
+            "archive": self.archive_name,
+            "archived_at": self.archived_at,
+            "files": dict(self.files),
+        }
+
+
+def workspace_files(job_dir: Path) -> list[str]:
+    """Regular files under `job_dir` that archiving packs (symlinks are left alone)."""
+    rel_paths: list[str] = []
+    for root, _dirs, names in os.walk(job_dir):
+        for name in names:
+            path = Path(root) / name
+            rel_path = path.relative_to(job_dir).as_posix()
+            if path.parent == job_dir and (
+                name in _KEPT_FILENAMES or name.startswith(_KEPT_PREFIXES)
+            ):
+                continue
+            if path.is_symlink() or not path.is_file():
+                continue
+            rel_paths.append(rel_path)
+    return sorted(rel_paths)
+
+
+def read_archive_index(job_dir: Path) -> ArchiveIndex | None:
+    path = job_dir / ARCHIVE_INDEX_FILENAME
+    try:
+        raw = default_codec().loads(path.read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning("SS_JOB_ARCHIVE_INDEX_INVALID", extra={"path": str(path), "error": str(e)})
+        return None
+    if not isinstance(raw, dict):
+        logger.warning("SS_JOB_ARCHIVE_INDEX_INVALID", extra={"path": str(path)})
+        return None
+    files = raw.get("files")
+    archive_format = str(raw.get("format", ""))
+    if not isinstance(files, dict) or archive_format not in ARCHIVE_FILENAMES:
+        logger.warning("SS_JOB_ARCHIVE_INDEX_INVALID", extra={"path": str(path)})
+        return None
+    return ArchiveIndex(
+        archive_format=archive_format,
+        archive_name=ARCHIVE_FILENAMES[archive_format],
+        archived_at=str(raw.get("archived_at", "")),
+        files={str(k): int(v) for k, v in files.items() if isinstance(v, int)},
+    )
+
+
+@contextmanager
+def archive_lock(*, lock_dir: Path, tenant_id: str, job_id: str) -> Iterator[None]:
+    """Serializes archiving with workspace restores for one job.
+
+    Locks are striped over a fixed set of files in `lock_dir` rather than one per job
+    directory, so queueing a job never adds an inode to its workspace.
+    """
+    digest = hashlib.sha256(f"{tenant_id}/{job_id}".encode("utf-8")).digest()
+    stripe = int.from_bytes(digest[:4], "big") % ARCHIVE_LOCK_STRIPES
+    lock_dir.mkdir(parents=True, exist_ok=True)
+    with (lock_dir / f"{stripe:04d}.lock").open("a+", encoding="utf-8") as lock_file:
+        with exclusive_lock(lock_file):
+            yield
+
+
+def archive_job_workspace(*, job_dir: Path, archive_format: str, now: str) -> ArchiveIndex | None:
+    """Pack the workspace into one archive, publish `archive.json`, then drop the originals.
+
+    Call with `archive_lock` held. The archive, the index and the directory are fsynced
+    under every durability policy before any original is removed, so a crash at any point
+    leaves every file readable.
+    """
+    rel_paths = workspace_files(job_dir)
+    if not rel_paths:
+        return None
+    index = ArchiveIndex(
+        archive_format=archive_format,
+        archive_name=ARCHIVE_FILENAMES[archive_format],
+        archived_at=now,
+        files={rel_path: (job_dir / rel_path).stat().st_size for rel_path in rel_paths},
+    )
+    _write_archive(job_dir=job_dir, index=index)
+    atomic_write_json(
+        path=job_dir / ARCHIVE_INDEX_FILENAME, payload=index.to_payload(), durability=_DELETES_DATA
+    )
+    for rel_path in rel_paths:
+        (job_dir / rel_path).unlink(missing_ok=True)
+    _remove_empty_dirs(job_dir)
+    return index
+
+
+def restore_job_workspace(*, job_dir: Path) -> bool:
+    """Unpack an archived workspace back in place; call with `archive_lock` held.
+
+    Restored files and their directories are fsynced before the archive is removed.
+    """
+    index = read_archive_index(job_dir)
+    if index is None:
+        return False
+    restored_dirs: dict[Path, None] = {job_dir: None}
+    for rel_path in index.files:
+        if is_safe_job_rel_path(rel_path):
+            dest = job_dir / rel_path
+            extract_archive_member(
+                job_dir=job_dir, index=index, rel_path=rel_path, dest=dest, durable=True
+            )
+            restored_dirs[dest.parent] = None
+    for directory in restored_dirs:
+        fsync_directory(directory)
+    (job_dir / ARCHIVE_INDEX_FILENAME).unlink()
+    (job_dir / index.archive_name).unlink(missing_ok=True)
+    return True
+
+
+def extract_archive_member(
+    *, job_dir: Path, index: ArchiveIndex, rel_path: str, dest: Path, durable: bool = False
+) -> None:
+    """Copy one member to `dest` through a temp file, so readers never see a partial file.
+
+    `durable` fsyncs the copy before the rename (the caller fsyncs the directory).
+    """
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    with _open_member(job_dir / index.archive_name, index.archive_format, rel_path) as src:
+        with tempfile.NamedTemporaryFile("wb", dir=str(dest.parent), delete=False) as f:
+            tmp = Path(f.name)
+            try:
+                shutil.copyfileobj(src, f)
+                if durable:
+                    fsync_file(f)
+            except BaseException:
+                f.close()
+                tmp.unlink(missing_ok=True)
+                raise
+    os.replace(tmp, dest)
+
+
+@contextmanager
+def _open_member(archive: Path, archive_format: str, rel_path: str) -> Iterator[IO[bytes]]:
+    if archive_format == ARCHIVE_FORMAT_ZIP:
+        with zipfile.ZipFile(archive) as zf, zf.open(rel_path) as member:
+            yield member
+        return
+    with tarfile.open(archive, "r:gz") as tf:
+        extracted = tf.extractfile(rel_path)
+        if extracted is None:
+            raise KeyError(rel_path)
+        with extracted:
+            yield extracted
+
+
+def _write_archive(*, job_dir: Path, index: ArchiveIndex) -> None:
+    path = job_dir / index.archive_name
+    with tempfile.NamedTemporaryFile("wb", dir=str(job_dir), delete=False) as f:
+        tmp = Path(f.name)
+        try:
+            if index.archive_format == ARCHIVE_FORMAT_ZIP:
+                with zipfile.ZipFile(f, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+                    for rel_path in index.files:
+                        zf.write(job_dir / rel_path, arcname=rel_path)
+            else:
+                with tarfile.open(fileobj=f, mode="w:gz") as tf:
+                    for rel_path in index.files:
+                        tf.add(job_dir / rel_path, arcname=rel_path, recursive=False)
+            _DELETES_DATA.sync_file(f)
+        except BaseException:
+            f.close()
+            tmp.unlink(missing_ok=True)
+            raise
+    try:
+        _DELETES_DATA.replace(tmp=tmp, path=path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _remove_empty_dirs(job_dir: Path) -> None:
+    for root, _dirs, _names in os.walk(job_dir, topdown=False):
+        if Path(root) == job_dir:
+            continue
+        try:
+            os.rmdir(root)
+        except OSError:
+            continue
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import shutil
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+from src.config import Config
+from src.domain.job_archive import JobArchiveReader
+from src.domain.models import is_safe_job_rel_path
+from src.infra.job_archive import (
+    ARCHIVE_LOCKS_DIRNAME,
+    ARCHIVE_READ_ERRORS,
+    extract_archive_member,
+    read_archive_index,
+)
+from src.utils.tenancy import DEFAULT_TENANT_ID
+
+logger = logging.getLogger(__name__)
+
+
+class ArchiveExtractionCache(JobArchiveReader):
+    """LRU of archived job workspaces, extracted member by member under `cache_dir`.
+
+    Each job gets `cache_dir/<tenant_id>/<job_id>/<generation>/`; once more than `max_jobs`
+    jobs have extracted files, the least recently read job's directory is removed. Directories
+    left by an earlier process are adopted (oldest mtime first) so the bound survives restarts.
+    """
+
+    def __init__(self, *, cache_dir: Path, max_jobs: int = 64):
+        self._cache_dir = Path(cache_dir)
+        self._max_jobs = max(1, max_jobs)
+        self._entries: OrderedDict[tuple[str, str], Path] = OrderedDict()
+        self._lock = threading.Lock()
+        self._adopt_existing()
+
+    def resolve_archived(
+        self,
+        *,
+        job_id: str,
+        job_dir: Path,
+        rel_path: str,
+        tenant_id: str = DEFAULT_TENANT_ID,
+    ) -> Path | None:
+        if not is_safe_job_rel_path(rel_path):
+            return None
+        index = read_archive_index(job_dir)
+        if index is None or rel_path not in index.files:
+            return None
+        key = (tenant_id, job_id)
+        entry_dir = self._cache_dir / tenant_id / job_id
+        # A job re-archived after a retry gets a fresh generation directory.
+        generation = hashlib.sha256(index.archived_at.encode("utf-8")).hexdigest()[:16]
+        target = entry_dir / generation / rel_path
+        with self._lock:
+            if not target.is_file():
+                try:
+                    extract_archive_member(
+                        job_dir=job_dir, index=index, rel_path=rel_path, dest=target
+                    )
+                except ARCHIVE_READ_ERRORS as e:
+                    logger.warning(
+                        "SS_JOB_ARCHIVE_EXTRACT_FAILED",
+                        extra={
+                            "tenant_id": tenant_id,
+                            "job_id": job_id,
+                            "rel_path": rel_path,
+                            "error": str(e),
+                        },
+                    )
+                    return None
+            self._touch(key=key, entry_dir=entry_dir)
+        return target
+
+    def _touch(self, *, key: tuple[str, str], entry_dir: Path) -> None:
+        self._entries[key] = entry_dir
+        self._entries.move_to_end(key)
+        try:
+            os.utime(entry_dir)
+        except OSError:
+            pass
+        while len(self._entries) > self._max_jobs:
+            _evicted, evicted_dir = self._entries.popitem(last=False)
+            shutil.rmtree(evicted_dir, ignore_errors=True)
+            logger.info("SS_JOB_ARCHIVE_CACHE_EVICTED", extra={"path": str(evicted_dir)})
+
+    def _adopt_existing(self) -> None:
+        try:
+            entry_dirs = [
+                entry_dir
+                for tenant_dir in self._cache_dir.iterdir()
+                if tenant_dir.is_dir() and tenant_dir.name != ARCHIVE_LOCKS_DIRNAME
+                for entry_dir in tenant_dir.iterdir()
+                if entry_dir.is_dir()
+            ]
+        except OSError:
+            return
+        entry_dirs.sort(key=lambda path: path.stat().st_mtime)
+        for entry_dir in entry_dirs:
+            self._touch(key=(entry_dir.parent.name, entry_dir.name), entry_dir=entry_dir)
+
+
+def build_archive_reader(*, config: Config) -> ArchiveExtractionCache:
+    return ArchiveExtractionCache(
+        cache_dir=config.job_archive_cache_dir, max_jobs=config.job_archive_cache_max_jobs
+    )
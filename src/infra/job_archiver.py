@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+
+from src.domain.job_indexer import JobIndexer, JobIndexItem
+from src.domain.job_store import JobStore
+from src.domain.models import JobStatus
+from src.infra.exceptions import SSError
+from src.infra.job_archive import (
+    ARCHIVE_FILENAMES,
+    ARCHIVE_INDEX_FILENAME,
+    ARCHIVE_READ_ERRORS,
+    archive_job_workspace,
+    archive_lock,
+)
+from src.utils.job_workspace import resolve_job_dir
+
+logger = logging.getLogger(__name__)
+
+ARCHIVABLE_STATUSES = frozenset({JobStatus.SUCCEEDED, JobStatus.FAILED})
+
+
+@dataclass(frozen=True)
+class JobArchiveReport:
+    archived: int
+    skipped: int
+    failed: int
+    files: int
+    bytes: int
+
+
+def archive_terminal_jobs(
+    *,
+    jobs_dir: Path,
+    lock_dir: Path,
+    store: JobStore,
+    indexer: JobIndexer,
+    archive_format: str,
+    min_age: timedelta,
+    now: datetime,
+) -> JobArchiveReport:
+    """Pack the workspaces of succeeded/failed jobs idle for at least `min_age`.
+
+    The index only nominates candidates: each job is re-loaded under its archive lock and
+    skipped unless it is still terminal, so a concurrent retry never loses its workspace.
+    """
+    if archive_format not in ARCHIVE_FILENAMES:
+        raise ValueError(f"unsupported archive format: {archive_format}")
+    cutoff = now - min_age
+    archived = skipped = failed = files = total_bytes = 0
+    for item in indexer.list_jobs():
+        if not _is_candidate(item=item, cutoff=cutoff):
+            skipped += 1
+            continue
+        try:
+            packed = _archive_one(
+                jobs_dir=jobs_dir,
+                lock_dir=lock_dir,
+                store=store,
+                item=item,
+                archive_format=archive_format,
+                now=now,
+            )
+        except (SSError, *ARCHIVE_READ_ERRORS) as e:
+            logger.warning(
+                "SS_JOB_ARCHIVE_FAILED",
+                extra={"tenant_id": item.tenant_id, "job_id": item.job_id, "error": str(e)},
+            )
+            failed += 1
+            continue
+        if packed is None:
+            skipped += 1
+            continue
+        archived += 1
+        files += packed[0]
+        total_bytes += packed[1]
+    logger.info(
+        "SS_JOB_ARCHIVE_DONE",
+        extra={"archived": archived, "skipped": skipped, "failed": failed, "bytes": total_bytes},
+    )
+    return JobArchiveReport(
+        archived=archived, skipped=skipped, failed=failed, files=files, bytes=total_bytes
+    )
+
+
+def _is_candidate(*, item: JobIndexItem, cutoff: datetime) -> bool:
+    if item.status not in {status.value for status in ARCHIVABLE_STATUSES}:
+        return False
+    try:
+        last_touched = datetime.fromisoformat(item.updated_at or item.created_at)
+    except ValueError:
+        return False
+    if last_touched.tzinfo is None:
+        return False
+    return last_touched <= cutoff
+
+
+def _archive_one(
+    *,
+    jobs_dir: Path,
+    lock_dir: Path,
+    store: JobStore,
+    item: JobIndexItem,
+    archive_format: str,
+    now: datetime,
+) -> tuple[int, int] | None:
+    job_dir = resolve_job_dir(jobs_dir=jobs_dir, tenant_id=item.tenant_id, job_id=item.job_id)
+    if job_dir is None or not job_dir.is_dir() or (job_dir / ARCHIVE_INDEX_FILENAME).exists():
+        return None
+    with archive_lock(lock_dir=lock_dir, tenant_id=item.tenant_id, job_id=item.job_id):
+        job = store.load(item.job_id, tenant_id=item.tenant_id)
+        if job.status not in ARCHIVABLE_STATUSES:
+            return None
+        index = archive_job_workspace(
+            job_dir=job_dir, archive_format=archive_format, now=now.isoformat()
+        )
+    if index is None:
+        return None
+    logger.info(
+        "SS_JOB_ARCHIVED",
+        extra={
+            "tenant_id": item.tenant_id,
+            "job_id": item.job_id,
+            "format": archive_format,
+            "files": len(index.files),
+            "bytes": index.total_bytes,
+        },
+    )
+    return len(index.files), index.total_bytes
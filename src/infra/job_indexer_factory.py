@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import logging
+import sqlite3
+
+from src.config import Config
+from src.domain.job_indexer import JobIndexer
+from src.infra.file_job_indexer import FileJobIndexer
+from src.infra.sqlite_database import SQLiteDatabase
+from src.infra.sqlite_job_index import SQLiteJobIndex, rebuild_file_job_index
+from src.infra.sqlite_job_indexer import SQLiteJobIndexer
+
+logger = logging.getLogger(__name__)
+
+
+def build_job_indexer(*, config: Config) -> JobIndexer:
+    """The job indexer for `config`; never rebuilds the file job index.
+
+    While that index is cold, jobs are listed by scanning `job.json` files until
+    `ensure_job_index` (API startup, `ss archive-jobs`) or `ss rebuild-job-index` builds it.
+    """
+    db = SQLiteDatabase(path=config.sqlite_path)
+    if config.job_store_backend == "sqlite":
+        return SQLiteJobIndexer(db=db)
+    index = SQLiteJobIndex(db=db)
+    if index.is_built():
+        return index
+    logger.warning("SS_JOB_INDEX_NOT_BUILT", extra={"path": str(config.sqlite_path)})
+    return FileJobIndexer(jobs_dir=config.jobs_dir)
+
+
+def ensure_job_index(*, config: Config) -> None:
+    """Build the file job index on a cold start; blocking, so keep it off the event loop."""
+    if config.job_store_backend == "sqlite":
+        return
+    index = SQLiteJobIndex(db=SQLiteDatabase(path=config.sqlite_path))
+    if index.is_built():
+        return
+    logger.info("SS_JOB_INDEX_COLD_START", extra={"jobs_dir": str(config.jobs_dir)})
+    try:
+        rebuild_file_job_index(scanner=FileJobIndexer(jobs_dir=config.jobs_dir), index=index)
+    except sqlite3.Error as e:
+        logger.warning(
+            "SS_JOB_INDEX_REBUILD_FAILED",
+            extra={"path": str(config.sqlite_path), "error": str(e)},
+        )
@@ -0,0 +1,252 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+
+from src.infra.atomic_write import atomic_write_json
+from src.infra.durability import current_durability
+from src.infra.exceptions import JobDataCorruptedError, JobStoreIOError
+from src.utils.json_codec import default_codec
+from src.utils.json_types import JsonObject, JsonValue
+
+logger = logging.getLogger("src.infra.job_store")
+
+JOURNAL_KEY = "journal"
+JOURNAL_FIELDS = ("runs", "artifacts_index")
+DEFAULT_JOURNAL_COMPACT_ENTRIES = 64
+
+
+@dataclass(frozen=True)
+class JournalPointer:
+    """Committed prefix of a job's journal file, as recorded in the core `job.json`."""
+
+    file: str
+    bytes: int
+    entries: int
+
+    def to_json(self) -> JsonObject:
+        return {"file": self.file, "bytes": self.bytes, "entries": self.entries}
+
+
+def read_job_document(*, job_id: str, path: Path) -> tuple[JsonObject, JournalPointer | None]:
+    """Read `job.json` and fold its journal, retrying when a compaction swaps generations."""
+    for _ in range(3):
+        core = _read_core(job_id=job_id, path=path)
+        try:
+            return fold_job_document(job_id=job_id, job_dir=path.parent, core=core)
+        except FileNotFoundError:
+            continue
+        except OSError as e:
+            logger.warning(
+                "SS_JOB_JOURNAL_READ_FAILED", extra={"job_id": job_id, "path": str(path)}
+            )
+            raise JobStoreIOError(operation="read", job_id=job_id) from e
+    logger.warning(
+        "SS_JOB_JOURNAL_READ_FAILED",
+        extra={"job_id": job_id, "path": str(path), "reason": "generation_missing"},
+    )
+    raise JobStoreIOError(operation="read", job_id=job_id)
+
+
+def _read_core(*, job_id: str, path: Path) -> JsonObject:
+    try:
+        raw = default_codec().loads(path.read_bytes())
+    except json.JSONDecodeError as e:
+        logger.warning("SS_JOB_JSON_CORRUPTED", extra={"job_id": job_id, "path": str(path)})
+        raise JobDataCorruptedError(job_id=job_id) from e
+    except OSError as e:
+        logger.warning("SS_JOB_JSON_READ_FAILED", extra={"job_id": job_id, "path": str(path)})
+        raise JobStoreIOError(operation="read", job_id=job_id) from e
+    if not isinstance(raw, dict):
+        logger.warning(
+            "SS_JOB_JSON_CORRUPTED",
+            extra={"job_id": job_id, "path": str(path), "reason": "not_object"},
+        )
+        raise JobDataCorruptedError(job_id=job_id)
+    return raw
+
+
+def fold_job_document(
+    *, job_id: str, job_dir: Path, core: JsonObject
+) -> tuple[JsonObject, JournalPointer | None]:
+    """Return the full job payload for `core`, replaying its journal into the collections.
+
+    A core without a `journal` pointer is an inline document (fresh or legacy jobs) and is
+    returned as-is. Otherwise only the first `bytes` of the journal are replayed: anything
+    past that belongs to a save whose core write never landed and is ignored.
+    """
+    pointer = _parse_pointer(job_id=job_id, raw=core.get(JOURNAL_KEY))
+    if pointer is None:
+        return core, None
+    payload: JsonObject = {k: v for k, v in core.items() if k != JOURNAL_KEY}
+    lists: dict[str, list[JsonValue]] = {field: [] for field in JOURNAL_FIELDS}
+    for line in _read_committed_lines(job_id=job_id, path=job_dir / pointer.file, pointer=pointer):
+        for field in JOURNAL_FIELDS:
+            splice = line.get(field)
+            if splice is not None:
+                lists[field] = _apply_splice(job_id=job_id, items=lists[field], splice=splice)
+    for field in JOURNAL_FIELDS:
+        payload[field] = lists[field]
+    return payload, pointer
+
+
+def write_job_document(
+    *,
+    job_dir: Path,
+    path: Path,
+    disk: JsonObject,
+    pointer: JournalPointer | None,
+    payload: JsonObject,
+    compact_entries: int = DEFAULT_JOURNAL_COMPACT_ENTRIES,
+    compact_json: bool = False,
+) -> None:
+    """Persist `payload` over the folded on-disk document `disk` (caller holds the job lock).
+
+    Changes to `runs` / `artifacts_index` are appended to the journal as splices from the first
+    differing item, so the write cost follows the delta; the compact core is then rewritten
+    atomically with the new committed journal length. Every `compact_entries` appends the
+    collections are snapshotted into a fresh journal generation and the old file is removed.
+    """
+    splices: JsonObject = {}
+    for field in JOURNAL_FIELDS:
+        splice = _splice_between(old=disk.get(field), new=payload.get(field))
+        if splice is not None:
+            splices[field] = splice
+    if not splices:
+        if pointer is None:
+            atomic_write_json(path=path, payload=payload, compact=compact_json)
+            return
+        new_pointer = pointer
+    elif pointer is None or pointer.entries >= max(1, compact_entries):
+        new_pointer = _start_generation(job_dir=job_dir, payload=payload)
+    else:
+        new_pointer = _append_line(job_dir=job_dir, pointer=pointer, payload=payload, line=splices)
+    core: JsonObject = {k: v for k, v in payload.items() if k not in JOURNAL_FIELDS}
+    core[JOURNAL_KEY] = new_pointer.to_json()
+    atomic_write_json(path=path, payload=core, compact=compact_json)
+    if pointer is not None and pointer.file != new_pointer.file:
+        _remove_generation(job_dir=job_dir, pointer=pointer, current=new_pointer)
+
+
+def _splice_between(*, old: JsonValue | None, new: JsonValue | None) -> JsonObject | None:
+    old_items = old if isinstance(old, list) else []
+    new_items = new if isinstance(new, list) else []
+    at = 0
+    common = min(len(old_items), len(new_items))
+    while at < common and old_items[at] == new_items[at]:
+        at += 1
+    if at == len(old_items) == len(new_items):
+        return None
+    return {"at": at, "items": new_items[at:]}
+
+
+def _apply_splice(*, job_id: str, items: list[JsonValue], splice: JsonValue) -> list[JsonValue]:
+    if not isinstance(splice, dict):
+        raise _corrupted(job_id=job_id, reason="splice_not_object")
+    at = splice.get("at")
+    new_items = splice.get("items")
+    if not isinstance(at, int) or not 0 <= at <= len(items) or not isinstance(new_items, list):
+        raise _corrupted(job_id=job_id, reason="splice_invalid")
+    return items[:at] + new_items
+
+
+def _encode_line(*, payload: JsonObject, line: JsonObject) -> bytes:
+    entry: JsonObject = {"version": payload.get("version"), **line}
+    return default_codec().dumps(entry, compact=True) + b"\n"
+
+
+def _start_generation(*, job_dir: Path, payload: JsonObject) -> JournalPointer:
+    snapshot: JsonObject = {
+        field: {"at": 0, "items": payload.get(field, [])} for field in JOURNAL_FIELDS
+    }
+    data = _encode_line(payload=payload, line=snapshot)
+    name = f"job.journal.{payload.get('version')}.jsonl"
+    tmp = job_dir / f".{name}.tmp"
+    try:
+        with tmp.open("wb") as f:
+            f.write(data)
+            f.flush()
+            current_durability().sync_ordered(f.fileno())
+        os.replace(tmp, job_dir / name)
+        current_durability().sync_ordered_directory(job_dir)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        raise
+    return JournalPointer(file=name, bytes=len(data), entries=1)
+
+
+def _append_line(
+    *, job_dir: Path, pointer: JournalPointer, payload: JsonObject, line: JsonObject
+) -> JournalPointer:
+    data = _encode_line(payload=payload, line=line)
+    with (job_dir / pointer.file).open("r+b") as f:
+        f.truncate(pointer.bytes)
+        f.seek(pointer.bytes)
+        f.write(data)
+        f.flush()
+        current_durability().sync_ordered(f.fileno())
+    return JournalPointer(
+        file=pointer.file, bytes=pointer.bytes + len(data), entries=pointer.entries + 1
+    )
+
+
+def _remove_generation(*, job_dir: Path, pointer: JournalPointer, current: JournalPointer) -> None:
+    try:
+        (job_dir / pointer.file).unlink(missing_ok=True)
+    except OSError as e:
+        logger.warning(
+            "SS_JOB_JOURNAL_CLEANUP_FAILED",
+            extra={"path": str(job_dir / pointer.file), "error": str(e)},
+        )
+        return
+    logger.info(
+        "SS_JOB_JOURNAL_COMPACTED",
+        extra={"job_dir": str(job_dir), "entries": pointer.entries, "file": current.file},
+    )
+
+
+def _read_committed_lines(*, job_id: str, path: Path, pointer: JournalPointer) -> list[JsonObject]:
+    with path.open("rb") as f:
+        data = f.read(pointer.bytes)
+    if len(data) != pointer.bytes or (data and not data.endswith(b"\n")):
+        raise _corrupted(job_id=job_id, reason="journal_truncated", path=path)
+    lines: list[JsonObject] = []
+    for raw in data.splitlines():
+        try:
+            parsed = default_codec().loads(raw)
+        except ValueError as e:
+            raise _corrupted(job_id=job_id, reason="journal_line_invalid", path=path) from e
+        if not isinstance(parsed, dict):
+            raise _corrupted(job_id=job_id, reason="journal_line_not_object", path=path)
+        lines.append(parsed)
+    return lines
+
+
+def _parse_pointer(*, job_id: str, raw: JsonValue | None) -> JournalPointer | None:
+    if raw is None:
+        return None
+    if not isinstance(raw, dict):
+        raise _corrupted(job_id=job_id, reason="journal_pointer_invalid")
+    file = raw.get("file")
+    size = raw.get("bytes")
+    entries = raw.get("entries")
+    if (
+        not isinstance(file, str)
+        or not file.startswith("job.journal.")
+        or "/" in file
+        or not isinstance(size, int)
+        or not isinstance(entries, int)
+    ):
+        raise _corrupted(job_id=job_id, reason="journal_pointer_invalid")
+    return JournalPointer(file=file, bytes=size, entries=entries)
+
+
+def _corrupted(*, job_id: str, reason: str, path: Path | None = None) -> JobDataCorruptedError:
+    logger.warning(
+        "SS_JOB_JOURNAL_CORRUPTED",
+        extra={"job_id": job_id, "reason": reason, "path": "" if path is None else str(path)},
+    )
+    return JobDataCorruptedError(job_id=job_id)
@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import logging
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from src.infra.durability import flush_durability
+from src.infra.exceptions import SSError
+from src.infra.file_job_indexer import FileJobIndexer
+from src.infra.job_store import JobStore as FileJobStore
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STATE_FILENAME = "_migrate_jobs.state"
+DEFAULT_CHUNK_SIZE = 64
+
+OUTCOME_MIGRATED = "migrated"
+OUTCOME_UNCHANGED = "unchanged"
+OUTCOME_FAILED = "failed"
+
+JobKey = tuple[str, str]
+
+
+@dataclass(frozen=True)
+class JobSchemaMigrationProgress:
+    total: int
+    done: int
+    migrated: int
+    unchanged: int
+    resumed: int
+    failed: int
+    elapsed_seconds: float
+
+    @property
+    def rate_per_second(self) -> float:
+        processed = self.done - self.resumed
+        return processed / self.elapsed_seconds if self.elapsed_seconds > 0 else 0.0
+
+
+def migrate_job_schemas(
+    *,
+    jobs_dir: Path,
+    state_path: Path,
+    workers: int = 1,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    compact_json: bool = False,
+    restart: bool = False,
+    on_progress: Callable[[JobSchemaMigrationProgress], None] | None = None,
+) -> JobSchemaMigrationProgress:
+    """Persist the current-schema form of every file-backed job, across tenants.
+
+    Jobs are migrated in chunks on a process pool (`workers > 1`) or in-process. Each finished
+    chunk appends its migrated/unchanged keys to `state_path`, so an interrupted run resumes
+    where it stopped; failed jobs are not recorded and are retried by the next run.
+    """
+    items = FileJobIndexer(jobs_dir=jobs_dir).list_jobs()
+    keys = sorted((item.tenant_id, item.job_id) for item in items)
+    if restart:
+        state_path.unlink(missing_ok=True)
+    completed = _read_state(state_path)
+    pending = [key for key in keys if _state_line(key) not in completed]
+    tally = _Tally(total=len(keys), resumed=len(keys) - len(pending))
+    size = max(1, chunk_size)
+    chunks = [pending[i : i + size] for i in range(0, len(pending), size)]
+    state_path.parent.mkdir(parents=True, exist_ok=True)
+    with state_path.open("a", encoding="utf-8") as state:
+        for outcomes in _chunk_outcomes(
+            jobs_dir=jobs_dir, compact_json=compact_json, chunks=chunks, workers=workers
+        ):
+            for key, outcome in outcomes:
+                tally.counts[outcome] += 1
+                if outcome != OUTCOME_FAILED:
+                    state.write(_state_line(key) + "\n")
+            state.flush()
+            if on_progress is not None:
+                on_progress(tally.snapshot())
+    report = tally.snapshot()
+    logger.info(
+        "SS_JOB_SCHEMA_MIGRATION_DONE", extra={"jobs_dir": str(jobs_dir), **asdict(report)}
+    )
+    return report
+
+
+def migrate_job_chunk(
+    jobs_dir: str, compact_json: bool, keys: list[JobKey]
+) -> list[tuple[JobKey, str]]:
+    """Pool worker: migrate one chunk of jobs (module-level so it pickles)."""
+    store = FileJobStore(jobs_dir=Path(jobs_dir), compact_json=compact_json)
+    outcomes: list[tuple[JobKey, str]] = []
+    for tenant_id, job_id in keys:
+        try:
+            changed = store.migrate(job_id, tenant_id=tenant_id)
+        except SSError as e:
+            logger.warning(
+                "SS_JOB_SCHEMA_MIGRATION_FAILED",
+                extra={"tenant_id": tenant_id, "job_id": job_id, "error_code": e.error_code},
+            )
+            outcomes.append(((tenant_id, job_id), OUTCOME_FAILED))
+            continue
+        outcomes.append(((tenant_id, job_id), OUTCOME_MIGRATED if changed else OUTCOME_UNCHANGED))
+    flush_durability()
+    return outcomes
+
+
+class _Tally:
+    def __init__(self, *, total: int, resumed: int):
+        self.total = total
+        self.resumed = resumed
+        self.counts = {OUTCOME_MIGRATED: 0, OUTCOME_UNCHANGED: 0, OUTCOME_FAILED: 0}
+        self._started = time.monotonic()
+
+    def snapshot(self) -> JobSchemaMigrationProgress:
+        return JobSchemaMigrationProgress(
+            total=self.total,
+            done=self.resumed + sum(self.counts.values()),
+            migrated=self.counts[OUTCOME_MIGRATED],
+            unchanged=self.counts[OUTCOME_UNCHANGED],
+            resumed=self.resumed,
+            failed=self.counts[OUTCOME_FAILED],
+            elapsed_seconds=time.monotonic() - self._started,
+        )
+
+
+def _chunk_outcomes(
+    *, jobs_dir: Path, compact_json: bool, chunks: list[list[JobKey]], workers: int
+) -> Iterator[list[tuple[JobKey, str]]]:
+    if workers <= 1:
+        for chunk in chunks:
+            yield migrate_job_chunk(str(jobs_dir), compact_json, chunk)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(migrate_job_chunk, str(jobs_dir), compact_json, chunk) for chunk in chunks
+        ]
+        for future in as_completed(futures):
+            yield future.result()
+
+
+def _state_line(key: JobKey) -> str:
+    return f"{key[0]}/{key[1]}"
+
+
+def _read_state(path: Path) -> set[str]:
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError:
+        return set()
+    return {line.strip() for line in lines if line.strip() != ""}
@@ -1,32 +1,31 @@
 from __future__ import annotations
 
-import json
 import logging
 from pathlib import Path
 from typing import cast
 
-from pydantic import ValidationError
-
-from src.domain.models import (
-    JOB_SCHEMA_VERSION_CURRENT,
-    Draft,
-    Job,
-    is_safe_job_rel_path,
-)
+from src.domain.models import Draft, Job, is_safe_job_rel_path
 from src.infra.atomic_write import atomic_write_json
 from src.infra.exceptions import (
     ArtifactPathUnsafeError,
     JobAlreadyExistsError,
-    JobDataCorruptedError,
     JobIdUnsafeError,
     JobNotFoundError,
     JobStoreIOError,
     JobVersionConflictError,
     TenantIdUnsafeError,
 )
+from src.infra.job_journal import (
+    DEFAULT_JOURNAL_COMPACT_ENTRIES,
+    read_job_document,
+    write_job_document,
+)
 from src.infra.job_store_migrations import (
+    assert_current_schema_version,
     assert_supported_schema_version,
+    disk_version_of,
     migrate_payload_to_current,
+    validate_job_payload,
 )
 from src.utils.file_lock import exclusive_lock
 from src.utils.job_workspace import is_safe_path_segment, shard_for_job_id
@@ -37,10 +36,26 @@ logger = logging.getLogger(__name__)
 
 
 class JobStore:
-    """File-based job store with sharded job directories and atomic writes."""
+    """File-based job store with sharded job directories and atomic writes.
+
+    `runs` and `artifacts_index` are kept in an append-only journal beside a compact
+    `job.json` core once they change (see `job_journal`), so saves cost the delta.
+    `compact_json` drops the indentation from `job.json` writes. With `read_only_loads`,
+    `load` migrates old schema versions in memory only; `migrate` (or the next save) persists.
+    """
 
-    def __init__(self, *, jobs_dir: Path):
+    def __init__(
+        self,
+        *,
+        jobs_dir: Path,
+        journal_compact_entries: int = DEFAULT_JOURNAL_COMPACT_ENTRIES,
+        compact_json: bool = False,
+        read_only_loads: bool = False,
+    ):
         self._jobs_dir = Path(jobs_dir)
+        self._journal_compact_entries = journal_compact_entries
+        self._compact_json = compact_json
+        self._read_only_loads = read_only_loads
 
     def _tenant_root_dir(self, *, tenant_id: str) -> Path:
         root = tenant_jobs_dir(jobs_dir=self._jobs_dir, tenant_id=tenant_id)
@@ -53,9 +68,7 @@ class JobStore:
         return root
 
     def _resolve_sharded_job_dir(self, *, tenant_id: str, job_id: str) -> Path:
-        if not is_safe_path_segment(job_id):
-            logger.warning("SS_JOB_ID_UNSAFE", extra={"job_id": job_id, "reason": "segment"})
-            raise JobIdUnsafeError(job_id=job_id)
+        _require_safe_job_id(job_id)
         shard = shard_for_job_id(job_id)
         if not is_safe_path_segment(shard):
             logger.warning(
@@ -63,31 +76,22 @@ class JobStore:
                 extra={"job_id": job_id, "reason": "shard_segment", "shard": shard},
             )
             raise JobIdUnsafeError(job_id=job_id)
-
-        root = self._tenant_root_dir(tenant_id=tenant_id)
-        base = root.resolve(strict=False)
-        job_dir = (root / shard / job_id).resolve(strict=False)
-        if not job_dir.is_relative_to(base):
-            logger.warning(
-                "SS_JOB_ID_UNSAFE",
-                extra={
-                    "tenant_id": tenant_id,
-                    "job_id": job_id,
-                    "reason": "symlink_escape",
-                    "layout": "sharded",
-                },
-            )
-            raise JobIdUnsafeError(job_id=job_id)
-        return job_dir
+        return self._contained_job_dir(
+            tenant_id=tenant_id, job_id=job_id, parts=(shard, job_id), layout="sharded"
+        )
 
     def _resolve_legacy_job_dir(self, *, tenant_id: str, job_id: str) -> Path:
-        if not is_safe_path_segment(job_id):
-            logger.warning("SS_JOB_ID_UNSAFE", extra={"job_id": job_id, "reason": "segment"})
-            raise JobIdUnsafeError(job_id=job_id)
+        _require_safe_job_id(job_id)
+        return self._contained_job_dir(
+            tenant_id=tenant_id, job_id=job_id, parts=(job_id,), layout="legacy"
+        )
 
+    def _contained_job_dir(
+        self, *, tenant_id: str, job_id: str, parts: tuple[str, ...], layout: str
+    ) -> Path:
         root = self._tenant_root_dir(tenant_id=tenant_id)
         base = root.resolve(strict=False)
-        job_dir = (root / job_id).resolve(strict=False)
+        job_dir = root.joinpath(*parts).resolve(strict=False)
         if not job_dir.is_relative_to(base):
             logger.warning(
                 "SS_JOB_ID_UNSAFE",
@@ -95,7 +99,7 @@ class JobStore:
                     "tenant_id": tenant_id,
                     "job_id": job_id,
                     "reason": "symlink_escape",
-                    "layout": "legacy",
+                    "layout": layout,
                 },
             )
             raise JobIdUnsafeError(job_id=job_id)
@@ -122,23 +126,6 @@ class JobStore:
     def _job_lock_path(self, *, tenant_id: str, job_id: str) -> Path:
         return self._job_dir(tenant_id=tenant_id, job_id=job_id) / "job.json.lock"
 
-    def _read_job_payload(self, *, job_id: str, path: Path) -> JsonObject:
-        try:
-            raw = json.loads(path.read_text(encoding="utf-8"))
-        except json.JSONDecodeError as e:
-            logger.warning("SS_JOB_JSON_CORRUPTED", extra={"job_id": job_id, "path": str(path)})
-            raise JobDataCorruptedError(job_id=job_id) from e
-        except OSError as e:
-            logger.warning("SS_JOB_JSON_READ_FAILED", extra={"job_id": job_id, "path": str(path)})
-            raise JobStoreIOError(operation="read", job_id=job_id) from e
-        if not isinstance(raw, dict):
-            logger.warning(
-                "SS_JOB_JSON_CORRUPTED",
-                extra={"job_id": job_id, "path": str(path), "reason": "not_object"},
-            )
-            raise JobDataCorruptedError(job_id=job_id)
-        return cast(JsonObject, raw)
-
     def create(self, job: Job, *, tenant_id: str = DEFAULT_TENANT_ID) -> None:
         sharded_dir = self._resolve_sharded_job_dir(tenant_id=tenant_id, job_id=job.job_id)
         legacy_dir = self._resolve_legacy_job_dir(tenant_id=tenant_id, job_id=job.job_id)
@@ -146,21 +133,11 @@ class JobStore:
         legacy_path = legacy_dir / "job.json"
         if sharded_path.exists() or legacy_path.exists():
             raise JobAlreadyExistsError(job_id=job.job_id)
-        if job.schema_version != JOB_SCHEMA_VERSION_CURRENT:
-            logger.warning(
-                "SS_JOB_JSON_SCHEMA_VERSION_UNSUPPORTED",
-                extra={
-                    "job_id": job.job_id,
-                    "path": str(sharded_path),
-                    "schema_version": job.schema_version,
-                    "expected_schema_version": JOB_SCHEMA_VERSION_CURRENT,
-                },
-            )
-            raise JobDataCorruptedError(job_id=job.job_id)
+        assert_current_schema_version(job=job, path=sharded_path)
         sharded_dir.mkdir(parents=True, exist_ok=True)
         try:
             payload = cast(JsonObject, job.model_dump(mode="json"))
-            atomic_write_json(path=sharded_path, payload=payload)
+            atomic_write_json(path=sharded_path, payload=payload, compact=self._compact_json)
         except OSError as e:
             logger.warning(
                 "SS_JOB_JSON_CREATE_FAILED",
@@ -169,31 +146,57 @@ class JobStore:
             raise JobStoreIOError(operation="create", job_id=job.job_id) from e
 
     def load(self, job_id: str, *, tenant_id: str = DEFAULT_TENANT_ID) -> Job:
+        path, payload, migrated = self._read_migrated(tenant_id=tenant_id, job_id=job_id)
+        job = validate_job_payload(job_id=job_id, path=path, payload=migrated)
+        if migrated is not payload and not self._read_only_loads:
+            self._persist_migration(tenant_id=tenant_id, path=path, read=payload, migrated=migrated)
+        return job
+
+    def migrate(self, job_id: str, *, tenant_id: str = DEFAULT_TENANT_ID) -> bool:
+        """Persist the current-schema form of a job; False when there was nothing to migrate."""
+        path, payload, migrated = self._read_migrated(tenant_id=tenant_id, job_id=job_id)
+        if migrated is payload:
+            return False
+        validate_job_payload(job_id=job_id, path=path, payload=migrated)
+        return self._persist_migration(
+            tenant_id=tenant_id, path=path, read=payload, migrated=migrated
+        )
+
+    def _read_migrated(self, *, tenant_id: str, job_id: str) -> tuple[Path, JsonObject, JsonObject]:
         job_dir = self._resolve_job_dir_for_existing_job(tenant_id=tenant_id, job_id=job_id)
         if job_dir is None:
             raise JobNotFoundError(job_id=job_id)
         path = job_dir / "job.json"
-        payload = self._read_job_payload(job_id=job_id, path=path)
+        payload, _ = read_job_document(job_id=job_id, path=path)
         assert_supported_schema_version(job_id=job_id, path=path, payload=payload)
         migrated = migrate_payload_to_current(job_id=job_id, path=path, payload=payload)
+        return path, payload, migrated
+
+    def _persist_migration(
+        self, *, tenant_id: str, path: Path, read: JsonObject, migrated: JsonObject
+    ) -> bool:
+        job_id = str(read.get("job_id", path.parent.name))
         try:
-            job = Job.model_validate(migrated)
-        except ValidationError as e:
+            with (path.parent / "job.json.lock").open("a+", encoding="utf-8") as lock_file:
+                with exclusive_lock(lock_file):
+                    disk, pointer = read_job_document(job_id=job_id, path=path)
+                    if disk != read:
+                        return False  # rewritten since we read it; writers store the current form
+                    write_job_document(
+                        job_dir=path.parent,
+                        path=path,
+                        disk=disk,
+                        pointer=pointer,
+                        payload=migrated,
+                        compact_json=self._compact_json,
+                    )
+        except OSError as e:
             logger.warning(
-                "SS_JOB_JSON_INVALID",
-                extra={"job_id": job_id, "path": str(path), "errors": e.errors()},
+                "SS_JOB_JSON_MIGRATION_WRITE_FAILED",
+                extra={"tenant_id": tenant_id, "job_id": job_id, "path": str(path)},
             )
-            raise JobDataCorruptedError(job_id=job_id) from e
-        if migrated is not payload:
-            try:
-                atomic_write_json(path=path, payload=migrated)
-            except OSError as e:
-                logger.warning(
-                    "SS_JOB_JSON_MIGRATION_WRITE_FAILED",
-                    extra={"tenant_id": tenant_id, "job_id": job_id, "path": str(path)},
-                )
-                raise JobStoreIOError(operation="migrate_write", job_id=job_id) from e
-        return job
+            raise JobStoreIOError(operation="migrate_write", job_id=job_id) from e
+        return True
 
     def save(self, job: Job, *, tenant_id: str = DEFAULT_TENANT_ID) -> None:
         job_id = job.job_id
@@ -201,35 +204,15 @@ class JobStore:
         if job_dir is None:
             raise JobNotFoundError(job_id=job_id)
         path = job_dir / "job.json"
-        if job.schema_version != JOB_SCHEMA_VERSION_CURRENT:
-            logger.warning(
-                "SS_JOB_JSON_SCHEMA_VERSION_UNSUPPORTED",
-                extra={
-                    "job_id": job_id,
-                    "path": str(path),
-                    "schema_version": job.schema_version,
-                    "expected_schema_version": JOB_SCHEMA_VERSION_CURRENT,
-                },
-            )
-            raise JobDataCorruptedError(job_id=job_id)
+        assert_current_schema_version(job=job, path=path)
         lock_path = self._job_lock_path(tenant_id=tenant_id, job_id=job_id)
         try:
             with lock_path.open("a+", encoding="utf-8") as lock_file:
                 with exclusive_lock(lock_file):
-                    payload = self._read_job_payload(job_id=job_id, path=path)
+                    payload, pointer = read_job_document(job_id=job_id, path=path)
                     assert_supported_schema_version(job_id=job_id, path=path, payload=payload)
                     current = migrate_payload_to_current(job_id=job_id, path=path, payload=payload)
-                    disk_version = current.get("version", 1)
-                    if not isinstance(disk_version, int) or disk_version < 1:
-                        logger.warning(
-                            "SS_JOB_JSON_CORRUPTED",
-                            extra={
-                                "job_id": job_id,
-                                "path": str(path),
-                                "reason": "version_invalid",
-                            },
-                        )
-                        raise JobDataCorruptedError(job_id=job_id)
+                    disk_version = disk_version_of(job_id=job_id, path=path, payload=current)
                     if job.version != disk_version:
                         logger.warning(
                             "SS_JOB_JSON_VERSION_CONFLICT",
@@ -248,7 +231,15 @@ class JobStore:
                     new_version = disk_version + 1
                     to_write = job.model_copy(update={"version": new_version})
                     payload_to_write = cast(JsonObject, to_write.model_dump(mode="json"))
-                    atomic_write_json(path=path, payload=payload_to_write)
+                    write_job_document(
+                        job_dir=job_dir,
+                        path=path,
+                        disk=current,
+                        pointer=pointer,
+                        payload=payload_to_write,
+                        compact_entries=self._journal_compact_entries,
+                        compact_json=self._compact_json,
+                    )
                     job.version = new_version
         except OSError as e:
             logger.warning(
@@ -296,3 +287,9 @@ class JobStore:
                 extra={"tenant_id": tenant_id, "job_id": job_id, "path": str(path)},
             )
             raise JobStoreIOError(operation="artifact_write", job_id=job_id) from e
+
+
+def _require_safe_job_id(job_id: str) -> None:
+    if not is_safe_path_segment(job_id):
+        logger.warning("SS_JOB_ID_UNSAFE", extra={"job_id": job_id, "reason": "segment"})
+        raise JobIdUnsafeError(job_id=job_id)
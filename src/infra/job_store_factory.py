@@ -3,17 +3,75 @@ from __future__ import annotations
 import logging
 
 from src.config import Config
-from src.domain.job_store import JobStore
+from src.domain.job_store import JobRevisionSource, JobStore
+from src.domain.metrics import JobCacheMetrics
+from src.infra.archive_restoring_job_store import ArchiveRestoringJobStore
+from src.infra.caching_job_store import CachingJobStore
 from src.infra.exceptions import JobStoreBackendUnsupportedError
+from src.infra.file_job_revisions import FileJobRevisions
+from src.infra.indexed_job_store import IndexedJobStore
+from src.infra.job_archive import ARCHIVE_LOCKS_DIRNAME
 from src.infra.job_store import JobStore as FileJobStore
+from src.infra.sqlite_database import SQLiteDatabase
+from src.infra.sqlite_job_index import SQLiteJobIndex
+from src.infra.sqlite_job_store import SQLiteJobStore
 
 logger = logging.getLogger(__name__)
 
 
-def build_job_store(*, config: Config) -> JobStore:
+def build_job_store(*, config: Config, metrics: JobCacheMetrics | None = None) -> JobStore:
     backend = config.job_store_backend
     if backend == "file":
-        return FileJobStore(jobs_dir=config.jobs_dir)
+        file_store = FileJobStore(
+            jobs_dir=config.jobs_dir,
+            journal_compact_entries=config.job_journal_compact_entries,
+            compact_json=config.job_store_json_compact,
+            read_only_loads=config.job_store_read_only_loads,
+        )
+        indexed = IndexedJobStore(
+            inner=_with_cache(
+                config=config,
+                inner=file_store,
+                revisions=FileJobRevisions(jobs_dir=config.jobs_dir),
+                metrics=metrics,
+            ),
+            index=SQLiteJobIndex(db=SQLiteDatabase(path=config.sqlite_path)),
+        )
+        return _with_archive_restore(config=config, inner=indexed)
+    if backend == "sqlite":
+        sqlite_store = SQLiteJobStore(
+            db=SQLiteDatabase(path=config.sqlite_path),
+            jobs_dir=config.jobs_dir,
+            read_only_loads=config.job_store_read_only_loads,
+        )
+        cached = _with_cache(
+            config=config, inner=sqlite_store, revisions=sqlite_store, metrics=metrics
+        )
+        return _with_archive_restore(config=config, inner=cached)
     logger.warning("SS_JOB_STORE_BACKEND_UNSUPPORTED", extra={"backend": backend})
     raise JobStoreBackendUnsupportedError(backend=backend)
 
+
+def _with_cache(
+    *,
+    config: Config,
+    inner: JobStore,
+    revisions: JobRevisionSource,
+    metrics: JobCacheMetrics | None,
+) -> JobStore:
+    if config.job_cache_max_entries <= 0:
+        return inner
+    return CachingJobStore(
+        inner=inner,
+        revisions=revisions,
+        max_entries=config.job_cache_max_entries,
+        metrics=metrics,
+    )
+
+
+def _with_archive_restore(*, config: Config, inner: JobStore) -> JobStore:
+    return ArchiveRestoringJobStore(
+        inner=inner,
+        jobs_dir=config.jobs_dir,
+        lock_dir=config.job_archive_cache_dir / ARCHIVE_LOCKS_DIRNAME,
+    )
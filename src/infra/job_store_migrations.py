@@ -1,15 +1,18 @@
 from __future__ import annotations
 
+import hashlib
 import logging
-import secrets
 from pathlib import Path
 
+from pydantic import ValidationError
+
 from src.domain.models import (
     JOB_SCHEMA_VERSION_CURRENT,
     JOB_SCHEMA_VERSION_V1,
     JOB_SCHEMA_VERSION_V2,
     JOB_SCHEMA_VERSION_V3,
     SUPPORTED_JOB_SCHEMA_VERSIONS,
+    Job,
 )
 from src.infra.exceptions import JobDataCorruptedError
 from src.utils.json_types import JsonObject
@@ -33,6 +36,43 @@ def assert_supported_schema_version(*, job_id: str, path: Path, payload: JsonObj
     raise JobDataCorruptedError(job_id=job_id)
 
 
+def assert_current_schema_version(*, job: Job, path: Path) -> None:
+    if job.schema_version == JOB_SCHEMA_VERSION_CURRENT:
+        return
+    logger.warning(
+        "SS_JOB_JSON_SCHEMA_VERSION_UNSUPPORTED",
+        extra={
+            "job_id": job.job_id,
+            "path": str(path),
+            "schema_version": job.schema_version,
+            "expected_schema_version": JOB_SCHEMA_VERSION_CURRENT,
+        },
+    )
+    raise JobDataCorruptedError(job_id=job.job_id)
+
+
+def validate_job_payload(*, job_id: str, path: Path, payload: JsonObject) -> Job:
+    try:
+        return Job.model_validate(payload)
+    except ValidationError as e:
+        logger.warning(
+            "SS_JOB_JSON_INVALID",
+            extra={"job_id": job_id, "path": str(path), "errors": e.errors()},
+        )
+        raise JobDataCorruptedError(job_id=job_id) from e
+
+
+def disk_version_of(*, job_id: str, path: Path, payload: JsonObject) -> int:
+    disk_version = payload.get("version", 1)
+    if not isinstance(disk_version, int) or disk_version < 1:
+        logger.warning(
+            "SS_JOB_JSON_CORRUPTED",
+            extra={"job_id": job_id, "path": str(path), "reason": "version_invalid"},
+        )
+        raise JobDataCorruptedError(job_id=job_id)
+    return disk_version
+
+
 def migrate_payload_to_current(*, job_id: str, path: Path, payload: JsonObject) -> JsonObject:
     schema_version = payload.get("schema_version")
     migrated = payload
@@ -56,7 +96,8 @@ def _ensure_trace_id(*, job_id: str, path: Path, payload: JsonObject) -> JsonObj
     if isinstance(trace_id, str) and trace_id.strip() != "":
         return payload
     migrated: JsonObject = dict(payload)
-    migrated["trace_id"] = secrets.token_hex(16)
+    # Derived from the job id so in-memory (read-only) migrations hand out a stable trace id.
+    migrated["trace_id"] = hashlib.sha256(f"ss-trace:{job_id}".encode()).hexdigest()[:32]
     logger.info("SS_JOB_TRACE_ID_BACKFILLED", extra={"job_id": job_id, "path": str(path)})
     return migrated
 
@@ -4,8 +4,10 @@ import subprocess
 from pathlib import Path
 from typing import Callable, Sequence
 
+from src.domain.run_cancellation import RunCancellation
 from src.domain.stata_runner import RunResult, StataRunner
 from src.infra.stata_run_attempt import run_local_stata_attempt
+from src.infra.stata_run_stream import ProgressCallback
 from src.utils.tenancy import DEFAULT_TENANT_ID
 
 
@@ -16,10 +18,14 @@ class LocalStataRunner(StataRunner):
         jobs_dir: Path,
         stata_cmd: Sequence[str],
         subprocess_runner: Callable[..., subprocess.CompletedProcess[str]] | None = None,
+        on_progress: ProgressCallback | None = None,
+        cancellation: RunCancellation | None = None,
     ):
         self._jobs_dir = Path(jobs_dir)
         self._stata_cmd = list(stata_cmd)
         self._subprocess_runner = subprocess_runner
+        self._on_progress = on_progress
+        self._cancellation = cancellation
 
     def run(
         self,
@@ -31,6 +37,13 @@ class LocalStataRunner(StataRunner):
         timeout_seconds: int | None = None,
         inputs_dir_rel: str | None = None,
     ) -> RunResult:
+        cancellation = self._cancellation
+
+        def _should_stop() -> bool:
+            return cancellation is not None and cancellation.cancelled(
+                tenant_id=tenant_id, job_id=job_id
+            )
+
         return run_local_stata_attempt(
             jobs_dir=self._jobs_dir,
             tenant_id=tenant_id,
@@ -41,4 +54,6 @@ class LocalStataRunner(StataRunner):
             timeout_seconds=timeout_seconds,
             subprocess_runner=self._subprocess_runner,
             inputs_dir_rel=inputs_dir_rel,
+            on_progress=self._on_progress,
+            should_stop=_should_stop,
         )
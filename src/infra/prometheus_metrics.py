@@ -23,6 +23,20 @@ DEFAULT_DURATION_BUCKETS: tuple[float, ...] = (
     5.0,
     10.0,
 )
+DURABLE_COMMIT_BUCKETS: tuple[float, ...] = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.02,
+    0.05,
+    0.1,
+    0.25,
+    1.0,
+)
+DURABLE_COMMIT_BATCH_BUCKETS: tuple[float, ...] = (1, 2, 4, 8, 16, 32, 64, 128)
+
 
 class PrometheusMetrics:
     def __init__(self) -> None:
@@ -59,6 +73,56 @@ class PrometheusMetrics:
             buckets=DEFAULT_DURATION_BUCKETS,
             registry=self._registry,
         )
+        self._blocking_io_inflight = Gauge(
+            "ss_api_blocking_io_inflight",
+            "API blocking I/O calls running on the dedicated thread pool",
+            registry=self._registry,
+        )
+        self._blocking_io_wait_seconds = Histogram(
+            "ss_api_blocking_io_wait_seconds",
+            "Time API blocking I/O calls waited for a pool slot",
+            buckets=DEFAULT_DURATION_BUCKETS,
+            registry=self._registry,
+        )
+        self._blocking_io_duration_seconds = Histogram(
+            "ss_api_blocking_io_duration_seconds",
+            "API blocking I/O call duration in seconds",
+            labelnames=("operation",),
+            buckets=DEFAULT_DURATION_BUCKETS,
+            registry=self._registry,
+        )
+        self._durable_commit_seconds = Histogram(
+            "ss_durable_commit_seconds",
+            "Time a writer waits for its atomic file write to be durable, from sync to return",
+            labelnames=("policy",),
+            buckets=DURABLE_COMMIT_BUCKETS,
+            registry=self._registry,
+        )
+        self._durable_commit_batch_files = Histogram(
+            "ss_durable_commit_batch_files",
+            "Files made durable per commit",
+            labelnames=("policy",),
+            buckets=DURABLE_COMMIT_BATCH_BUCKETS,
+            registry=self._registry,
+        )
+        self._job_cache_lookups_total = Counter(
+            "ss_job_cache_lookups_total",
+            "In-process job cache lookups",
+            labelnames=("result",),
+            registry=self._registry,
+        )
+        self._dataset_preview_cache_lookups_total = Counter(
+            "ss_dataset_preview_cache_lookups_total",
+            "Dataset preview cache lookups",
+            labelnames=("result",),
+            registry=self._registry,
+        )
+        self._run_result_cache_lookups_total = Counter(
+            "ss_run_result_cache_lookups_total",
+            "Run result cache lookups",
+            labelnames=("result",),
+            registry=self._registry,
+        )
 
     @property
     def content_type_latest(self) -> str:
@@ -96,6 +160,33 @@ class PrometheusMetrics:
     def set_worker_up(self, *, worker_id: str, up: bool) -> None:
         self._worker_up.labels(worker_id=worker_id).set(1.0 if up else 0.0)
 
+    def record_job_cache_lookup(self, *, hit: bool) -> None:
+        self._job_cache_lookups_total.labels(result="hit" if hit else "miss").inc()
+
+    def record_dataset_preview_cache_lookup(self, *, hit: bool) -> None:
+        self._dataset_preview_cache_lookups_total.labels(result="hit" if hit else "miss").inc()
+
+    def record_run_result_cache_lookup(self, *, hit: bool) -> None:
+        self._run_result_cache_lookups_total.labels(result="hit" if hit else "miss").inc()
+
+    def blocking_io_inflight_inc(self) -> None:
+        self._blocking_io_inflight.inc()
+
+    def blocking_io_inflight_dec(self) -> None:
+        self._blocking_io_inflight.dec()
+
+    def observe_blocking_io(
+        self, *, operation: str, wait_seconds: float, duration_seconds: float
+    ) -> None:
+        self._blocking_io_wait_seconds.observe(wait_seconds)
+        self._blocking_io_duration_seconds.labels(operation=operation).observe(duration_seconds)
+
+    def observe_durable_commit(self, *, policy: str, seconds: float) -> None:
+        self._durable_commit_seconds.labels(policy=policy).observe(seconds)
+
+    def observe_durable_commit_batch(self, *, policy: str, files: int) -> None:
+        self._durable_commit_batch_files.labels(policy=policy).observe(files)
+
     def observe_http_request(
         self,
         *,
@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+import logging
+
+from src.config import Config
+from src.domain.queue_notifier import QueueNotifier
+from src.infra.doorbell_queue_notifier import DOORBELL_DIRNAME, DoorbellQueueNotifier
+from src.infra.exceptions import QueueNotifierUnsupportedError
+from src.infra.inotify_queue_notifier import InotifyQueueNotifier, inotify_available
+
+logger = logging.getLogger(__name__)
+
+_FILE_QUEUE_BACKENDS = frozenset({"file", "file_indexed"})
+
+
+def build_queue_notifier(*, config: Config) -> QueueNotifier | None:
+    """Notifier for idle workers, or None to keep sleep-polling (`SS_QUEUE_NOTIFIER=none`)."""
+    notifier = config.queue_notifier
+    if notifier == "none":
+        return None
+    if notifier not in {"auto", "inotify", "doorbell"}:
+        logger.warning("SS_QUEUE_NOTIFIER_UNSUPPORTED", extra={"notifier": notifier})
+        raise QueueNotifierUnsupportedError(notifier=notifier)
+    if config.queue_backend not in _FILE_QUEUE_BACKENDS:
+        logger.warning(
+            "SS_QUEUE_NOTIFIER_BACKEND_UNSUPPORTED",
+            extra={"notifier": notifier, "queue_backend": config.queue_backend},
+        )
+        return None
+    use_inotify = notifier == "inotify" or (notifier == "auto" and inotify_available())
+    if use_inotify:
+        built: QueueNotifier = InotifyQueueNotifier(queued_dir=config.queue_dir / "queued")
+        kind = "inotify"
+    else:
+        built = DoorbellQueueNotifier(doorbell_dir=config.queue_dir / DOORBELL_DIRNAME)
+        kind = "doorbell"
+    logger.info("SS_QUEUE_NOTIFIER_SELECTED", extra={"notifier": kind})
+    return built
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+import tempfile
+import zipfile
+from collections.abc import Sequence
+from pathlib import Path
+
+from src.config import Config
+from src.domain.metrics import NoopMetrics, RunResultCacheMetrics
+from src.domain.models import is_safe_job_rel_path
+from src.domain.run_result_cache import RunResultCache
+from src.infra.bounded_file_cache import BoundedFileCacheDir
+from src.utils.json_types import JsonObject
+
+logger = logging.getLogger(__name__)
+
+_ENTRY_SUFFIX = ".zip"
+_RESULT_MEMBER = "result.json"
+# Only these run-relative trees are ever packed or restored.
+_FILE_ROOTS = ("work", "artifacts")
+
+
+class FileRunResultCache(RunResultCache):
+    """Run results as one zip per key at `cache_dir/<key[:2]>/<key>.zip`, bounded by `max_bytes`.
+
+    A zip holds `result.json` plus the run's `work/` outputs and runner artifacts under their
+    run-relative paths. Storage and the size bound are shared with the preview cache through
+    `BoundedFileCacheDir`.
+    """
+
+    def __init__(
+        self,
+        *,
+        cache_dir: Path,
+        max_bytes: int,
+        stata_cmd: Sequence[str],
+        metrics: RunResultCacheMetrics | None = None,
+    ):
+        self._entries = BoundedFileCacheDir(
+            cache_dir=cache_dir,
+            max_bytes=max_bytes,
+            suffix=_ENTRY_SUFFIX,
+            evicted_event="SS_RUN_RESULT_CACHE_EVICTED",
+        )
+        self._stata_cmd = tuple(stata_cmd)
+        self._metrics: RunResultCacheMetrics = NoopMetrics() if metrics is None else metrics
+
+    @property
+    def stata_cmd(self) -> tuple[str, ...]:
+        return self._stata_cmd
+
+    def restore(self, key: str, *, run_dir: Path) -> JsonObject | None:
+        path = self._entries.entry_path(key)
+        try:
+            result = _extract(path=path, run_dir=run_dir)
+        except FileNotFoundError:
+            result = None
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile) as e:
+            logger.warning(
+                "SS_RUN_RESULT_CACHE_ENTRY_INVALID", extra={"path": str(path), "error": str(e)}
+            )
+            path.unlink(missing_ok=True)
+            result = None
+        self._metrics.record_run_result_cache_lookup(hit=result is not None)
+        if result is None:
+            return None
+        self._entries.touch(path)
+        return result
+
+    def store(self, key: str, *, run_dir: Path, files: Sequence[str], result: JsonObject) -> None:
+        path = self._entries.entry_path(key)
+        tmp: Path | None = None
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with tempfile.NamedTemporaryFile("wb", dir=str(path.parent), delete=False) as f:
+                tmp = Path(f.name)
+            with zipfile.ZipFile(tmp, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+                zf.writestr(_RESULT_MEMBER, json.dumps(result, ensure_ascii=False))
+                for rel_path in files:
+                    if _is_packable(rel_path):
+                        zf.write(run_dir / rel_path, arcname=rel_path)
+            size = tmp.stat().st_size
+            if size > self._entries.max_bytes:
+                logger.info("SS_RUN_RESULT_CACHE_ENTRY_TOO_LARGE", extra={"bytes": size})
+                return
+            os.replace(tmp, path)
+            tmp = None
+        except OSError as e:
+            logger.warning(
+                "SS_RUN_RESULT_CACHE_WRITE_FAILED", extra={"path": str(path), "error": str(e)}
+            )
+            return
+        finally:
+            if tmp is not None:
+                tmp.unlink(missing_ok=True)
+        self._entries.record_write(size)
+
+def _is_packable(rel_path: str) -> bool:
+    return is_safe_job_rel_path(rel_path) and rel_path.split("/", 1)[0] in _FILE_ROOTS
+
+
+def _extract(*, path: Path, run_dir: Path) -> JsonObject | None:
+    with zipfile.ZipFile(path) as zf:
+        result = json.loads(zf.read(_RESULT_MEMBER))
+        if not isinstance(result, dict):
+            return None
+        for name in zf.namelist():
+            if name == _RESULT_MEMBER or not _is_packable(name):
+                continue
+            dest = run_dir / name
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            with zf.open(name) as src:
+                with tempfile.NamedTemporaryFile("wb", dir=str(dest.parent), delete=False) as f:
+                    tmp = Path(f.name)
+                    try:
+                        shutil.copyfileobj(src, f)
+                    except BaseException:
+                        f.close()
+                        tmp.unlink(missing_ok=True)
+                        raise
+            os.replace(tmp, dest)
+    return result
+
+
+def build_run_result_cache(
+    *, config: Config, metrics: RunResultCacheMetrics | None = None
+) -> FileRunResultCache | None:
+    if config.run_result_cache_max_bytes <= 0:
+        return None
+    return FileRunResultCache(
+        cache_dir=config.run_result_cache_dir,
+        max_bytes=config.run_result_cache_max_bytes,
+        stata_cmd=config.stata_cmd,
+        metrics=metrics,
+    )
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Iterable, Mapping, Sequence
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from typing import Any, Protocol, cast
 
 import boto3  # type: ignore
@@ -187,12 +187,13 @@ class S3ObjectStore(ObjectStore):
         except _BOTO_ERRORS as exc:  # pragma: no cover
             raise ObjectStoreOperationFailedError(operation="read_bytes") from exc
 
-    def iter_bytes(self, *, object_key: str, chunk_size: int = 1024 * 1024) -> Iterable[bytes]:
+    def iter_bytes(self, *, object_key: str, chunk_size: int = 1024 * 1024) -> Iterator[bytes]:
+        """Stream the object body; errors raised mid-stream surface as operation failures."""
         try:
             resp = self._client.get_object(Bucket=self._bucket, Key=object_key)
             body = resp.get("Body")
             if body is None:
-                return iter(())
-            return cast(_S3Body, body).iter_chunks(chunk_size=chunk_size)
+                return
+            yield from cast(_S3Body, body).iter_chunks(chunk_size=chunk_size)
         except _BOTO_ERRORS as exc:  # pragma: no cover
             raise ObjectStoreOperationFailedError(operation="iter_bytes") from exc
@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+import os
+import select
+import threading
+import time
+
+from src.domain.queue_notifier import QueueNotifier
+
+
+class SelectQueueNotifier(QueueNotifier):
+    """Base for notifiers backed by one readable fd, plus a self-pipe for `interrupt()`.
+
+    Subclasses provide the fd through `_fileno()` and consume pending signals in `_drain()`,
+    which reports whether any of them means new work; other signals keep `wait` waiting.
+    The interrupt pipe is never drained, so once interrupted every `wait` returns at once.
+    `interrupt` may race `close` from another thread; after close it is a no-op.
+    """
+
+    def __init__(self) -> None:
+        self._interrupt_r, self._interrupt_w = os.pipe()
+        os.set_blocking(self._interrupt_r, False)
+        os.set_blocking(self._interrupt_w, False)
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def wait(self, *, timeout_seconds: float) -> bool:
+        if self._closed:
+            return False
+        fd = self._fileno()
+        deadline = time.monotonic() + max(0.0, timeout_seconds)
+        while True:
+            remaining = max(0.0, deadline - time.monotonic())
+            readable, _, _ = select.select([fd, self._interrupt_r], [], [], remaining)
+            if self._interrupt_r in readable:
+                return False
+            if fd not in readable:
+                return False
+            if self._drain():
+                return True
+
+    def interrupt(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            try:
+                os.write(self._interrupt_w, b"x")
+            except BlockingIOError:
+                pass
+
+    def close(self) -> None:
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            self._close_source()
+            os.close(self._interrupt_r)
+            os.close(self._interrupt_w)
+
+    def _fileno(self) -> int:
+        raise NotImplementedError
+
+    def _drain(self) -> bool:
+        raise NotImplementedError
+
+    def _close_source(self) -> None:
+        raise NotImplementedError
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS jobs (
+        tenant_id TEXT NOT NULL,
+        job_id TEXT NOT NULL,
+        version INTEGER NOT NULL,
+        status TEXT NOT NULL,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL,
+        payload TEXT NOT NULL,
+        PRIMARY KEY (tenant_id, job_id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS jobs_updated_at ON jobs (updated_at)",
+    "CREATE INDEX IF NOT EXISTS jobs_tenant_updated ON jobs (tenant_id, updated_at, job_id)",
+    """
+    CREATE INDEX IF NOT EXISTS jobs_status_updated ON jobs (status, updated_at, tenant_id, job_id)
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS job_index (
+        tenant_id TEXT NOT NULL,
+        job_id TEXT NOT NULL,
+        status TEXT NOT NULL,
+        created_at TEXT NOT NULL,
+        updated_at TEXT NOT NULL,
+        version INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (tenant_id, job_id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS job_index_updated ON job_index (updated_at, tenant_id, job_id)",
+    """
+    CREATE INDEX IF NOT EXISTS job_index_tenant_updated
+    ON job_index (tenant_id, updated_at, job_id)
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS job_index_status_updated
+    ON job_index (status, updated_at, tenant_id, job_id)
+    """,
+    "CREATE TABLE IF NOT EXISTS job_index_meta (key TEXT PRIMARY KEY, value TEXT NOT NULL)",
+    """
+    CREATE TABLE IF NOT EXISTS queue (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        tenant_id TEXT NOT NULL,
+        job_id TEXT NOT NULL,
+        enqueued_at TEXT NOT NULL,
+        traceparent TEXT,
+        priority INTEGER NOT NULL DEFAULT 0,
+        claim_id TEXT,
+        worker_id TEXT,
+        claimed_at TEXT,
+        lease_expires_at TEXT,
+        lease_expires_ts REAL
+    )
+    """,
+    """
+    CREATE UNIQUE INDEX IF NOT EXISTS queue_ready_job ON queue (tenant_id, job_id)
+    WHERE claim_id IS NULL
+    """,
+    "CREATE INDEX IF NOT EXISTS queue_job ON queue (tenant_id, job_id)",
+    "CREATE INDEX IF NOT EXISTS queue_ready ON queue (seq) WHERE claim_id IS NULL",
+    """
+    CREATE INDEX IF NOT EXISTS queue_tenant_ready ON queue (tenant_id, priority DESC, seq)
+    WHERE claim_id IS NULL
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS queue_leases ON queue (lease_expires_ts)
+    WHERE claim_id IS NOT NULL
+    """,
+)
+
+
+class SQLiteDatabase:
+    """Single-file SQLite database (WAL mode) shared by the SQLite job store, queue and job index.
+
+    Connections are opened lazily, one per thread, in autocommit mode; multi-statement
+    writes go through `transaction()` (BEGIN IMMEDIATE) so writers serialize on the file.
+    """
+
+    def __init__(self, *, path: Path, busy_timeout_ms: int = 10_000):
+        self._path = Path(path)
+        self._busy_timeout_ms = busy_timeout_ms
+        self._local = threading.local()
+
+    @property
+    def path(self) -> Path:
+        return self._path
+
+    def connection(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if isinstance(conn, sqlite3.Connection):
+            return conn
+        conn = self._connect()
+        self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def transaction(self) -> Iterator[sqlite3.Connection]:
+        conn = self.connection()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _connect(self) -> sqlite3.Connection:
+        self._path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(
+            str(self._path),
+            timeout=self._busy_timeout_ms / 1000.0,
+            isolation_level=None,
+        )
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA busy_timeout={int(self._busy_timeout_ms)}")
+        for statement in _SCHEMA:
+            conn.execute(statement)
+        logger.info("SS_SQLITE_CONNECTED", extra={"path": str(self._path)})
+        return conn
+
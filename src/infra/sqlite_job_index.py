@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import logging
+import sqlite3
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+from src.domain.job_indexer import JobIndexItem, JobIndexWriter
+from src.infra.file_job_indexer import FileJobIndexer
+from src.infra.sqlite_database import SQLiteDatabase
+from src.infra.sqlite_job_indexer import SQLiteJobIndexer
+from src.utils.time import utc_now
+
+logger = logging.getLogger(__name__)
+
+_BUILT_AT_KEY = "built_at"
+
+_UPSERT_SQL = """
+    INSERT INTO job_index (tenant_id, job_id, status, created_at, updated_at, version)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT (tenant_id, job_id) DO UPDATE SET
+        status = excluded.status,
+        created_at = excluded.created_at,
+        updated_at = excluded.updated_at,
+        version = excluded.version
+    WHERE excluded.version >= job_index.version
+"""
+
+
+@dataclass(frozen=True)
+class JobIndexRebuildReport:
+    indexed: int
+    removed: int
+
+
+class SQLiteJobIndex(SQLiteJobIndexer, JobIndexWriter):
+    """Persistent job summary index for the file job store, kept in the shared SQLite file.
+
+    `IndexedJobStore` upserts a row after every job write, so listings read one index range
+    instead of every `job.json`. Upserts are ordered by the job's `version`, not by the
+    wall-clock `updated_at` (which is only displayed), so when an API and a worker save the
+    same job concurrently the older status never replaces the newer one. An upsert never
+    raises; a missed update is repaired by `rebuild` (`python -m src.cli rebuild-job-index`).
+    """
+
+    def __init__(self, *, db: SQLiteDatabase):
+        super().__init__(db=db, table="job_index")
+
+    def upsert(self, item: JobIndexItem) -> None:
+        try:
+            self._db.connection().execute(_UPSERT_SQL, _row(item))
+        except sqlite3.Error as e:
+            logger.warning(
+                "SS_JOB_INDEX_UPDATE_FAILED",
+                extra={"tenant_id": item.tenant_id, "job_id": item.job_id, "error": str(e)},
+            )
+
+    def is_built(self) -> bool:
+        try:
+            row = self._db.connection().execute(
+                "SELECT value FROM job_index_meta WHERE key = ?", (_BUILT_AT_KEY,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(
+                "SS_JOB_INDEX_LIST_FAILED", extra={"root": str(self._db.path), "error": str(e)}
+            )
+            return False
+        return row is not None
+
+    def rebuild(self, items: Iterable[JobIndexItem]) -> JobIndexRebuildReport:
+        """Replace the index with `items`; rows written concurrently during the scan survive."""
+        started_at = utc_now().isoformat()
+        rows = [_row(item) for item in items]
+        with self._db.transaction() as conn:
+            conn.executemany(_UPSERT_SQL, rows)
+            conn.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS job_index_seen "
+                "(tenant_id TEXT NOT NULL, job_id TEXT NOT NULL, PRIMARY KEY (tenant_id, job_id))"
+            )
+            conn.execute("DELETE FROM job_index_seen")
+            conn.executemany(
+                "INSERT OR IGNORE INTO job_index_seen VALUES (?, ?)", [r[:2] for r in rows]
+            )
+            removed = conn.execute(
+                "DELETE FROM job_index WHERE updated_at < ? AND NOT EXISTS (SELECT 1 FROM "
+                "job_index_seen s WHERE s.tenant_id = job_index.tenant_id "
+                "AND s.job_id = job_index.job_id)",
+                (started_at,),
+            ).rowcount
+            conn.execute(
+                "INSERT INTO job_index_meta (key, value) VALUES (?, ?) "
+                "ON CONFLICT (key) DO UPDATE SET value = excluded.value",
+                (_BUILT_AT_KEY, utc_now().isoformat()),
+            )
+        logger.info(
+            "SS_JOB_INDEX_REBUILT",
+            extra={"root": str(self._db.path), "indexed": len(rows), "removed": removed},
+        )
+        return JobIndexRebuildReport(indexed=len(rows), removed=removed)
+
+
+def rebuild_file_job_index(
+    *, scanner: FileJobIndexer, index: SQLiteJobIndex
+) -> JobIndexRebuildReport:
+    """Rebuild `index` from a full walk of the file job store (the one slow path left)."""
+    return index.rebuild(scanner.list_jobs())
+
+
+def _row(item: JobIndexItem) -> tuple[str, str, str, str, str, int]:
+    updated_at = item.updated_at or item.created_at
+    return (item.tenant_id, item.job_id, item.status, item.created_at, updated_at, item.version)
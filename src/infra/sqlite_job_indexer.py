@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import logging
+import sqlite3
+from typing import Any, Literal
+
+from src.domain.job_indexer import (
+    JobIndexer,
+    JobIndexItem,
+    JobIndexPage,
+    decode_job_cursor,
+    encode_job_cursor,
+)
+from src.infra.sqlite_database import SQLiteDatabase
+from src.utils.tenancy import DEFAULT_TENANT_ID
+
+logger = logging.getLogger(__name__)
+
+_COLUMNS = "tenant_id, job_id, status, created_at, updated_at, version"
+_ORDER = " ORDER BY updated_at DESC, tenant_id DESC, job_id DESC"
+
+
+class SQLiteJobIndexer(JobIndexer):
+    """Lists jobs from an indexed SQLite table instead of walking `jobs_dir`.
+
+    `table="jobs"` reads the SQLite job store itself; `table="job_index"` reads the summary
+    table the file job store maintains (see `SQLiteJobIndex`). Pages use keyset pagination on
+    `(updated_at, tenant_id, job_id)`, so each page is one index range scan.
+    """
+
+    def __init__(self, *, db: SQLiteDatabase, table: Literal["jobs", "job_index"] = "jobs"):
+        self._db = db
+        self._table = table
+
+    def list_jobs(self, *, tenant_id: str | None = None) -> list[JobIndexItem]:
+        where, params = _filters(tenant_id=tenant_id, status=None)
+        rows = self._select(f"SELECT {_COLUMNS} FROM {self._table}{where}{_ORDER}", params)
+        return [_to_item(row) for row in rows]
+
+    def list_page(
+        self,
+        *,
+        tenant_id: str | None = None,
+        status: str | None = None,
+        limit: int,
+        cursor: str | None = None,
+    ) -> JobIndexPage:
+        where, params = _filters(tenant_id=tenant_id, status=status)
+        if cursor is not None:
+            where += " AND " if where else " WHERE "
+            where += "(updated_at, tenant_id, job_id) < (?, ?, ?)"
+            params = (*params, *decode_job_cursor(cursor))
+        sql = f"SELECT {_COLUMNS} FROM {self._table}{where}{_ORDER} LIMIT ?"
+        items = [_to_item(row) for row in self._select(sql, (*params, limit + 1))]
+        page = items[:limit]
+        next_cursor = encode_job_cursor(page[-1]) if len(items) > limit else None
+        return JobIndexPage(items=page, next_cursor=next_cursor)
+
+    def _select(self, sql: str, params: tuple[Any, ...]) -> list[tuple[Any, ...]]:
+        try:
+            return self._db.connection().execute(sql, params).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(
+                "SS_JOB_INDEX_LIST_FAILED",
+                extra={"root": str(self._db.path), "table": self._table, "error": str(e)},
+            )
+            return []
+
+
+def _filters(*, tenant_id: str | None, status: str | None) -> tuple[str, tuple[str, ...]]:
+    clauses: list[str] = []
+    params: list[str] = []
+    if tenant_id is not None:
+        resolved = tenant_id.strip()
+        clauses.append("tenant_id = ?")
+        params.append(DEFAULT_TENANT_ID if resolved == "" else resolved)
+    if status is not None:
+        clauses.append("status = ?")
+        params.append(status)
+    where = "" if not clauses else " WHERE " + " AND ".join(clauses)
+    return where, tuple(params)
+
+
+def _to_item(row: tuple[Any, ...]) -> JobIndexItem:
+    return JobIndexItem(
+        tenant_id=str(row[0]),
+        job_id=str(row[1]),
+        status=str(row[2]),
+        created_at=str(row[3]),
+        updated_at=str(row[4]),
+        version=int(row[5]),
+    )
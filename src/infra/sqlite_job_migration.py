@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import logging
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+
+from src.domain.job_indexer import JobIndexItem
+from src.infra.exceptions import SSError
+from src.infra.file_job_indexer import FileJobIndexer
+from src.infra.job_store import JobStore as FileJobStore
+from src.infra.sqlite_database import SQLiteDatabase
+from src.infra.sqlite_job_store import encode_job_payload
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class SQLiteMigrationReport:
+    migrated: int
+    skipped: int
+    failed: int
+
+
+def migrate_file_jobs_to_sqlite(*, jobs_dir: Path, db: SQLiteDatabase) -> SQLiteMigrationReport:
+    """Copy every `job.json` under `jobs_dir` (sharded, legacy and tenant layouts) into `db`.
+
+    Rows that already exist are left untouched, so the migration can be re-run after a partial
+    run. `job.json` files are kept: they are the rollback path and workspaces stay in place.
+    """
+    source = FileJobStore(jobs_dir=jobs_dir)
+    migrated = skipped = failed = 0
+    for item in FileJobIndexer(jobs_dir=jobs_dir).list_jobs():
+        outcome = _migrate_one(source=source, db=db, item=item)
+        migrated += outcome == "migrated"
+        skipped += outcome == "skipped"
+        failed += outcome == "failed"
+    logger.info(
+        "SS_SQLITE_JOB_MIGRATION_DONE",
+        extra={"migrated": migrated, "skipped": skipped, "failed": failed, "db": str(db.path)},
+    )
+    return SQLiteMigrationReport(migrated=migrated, skipped=skipped, failed=failed)
+
+
+def _migrate_one(*, source: FileJobStore, db: SQLiteDatabase, item: JobIndexItem) -> str:
+    try:
+        job = source.load(job_id=item.job_id, tenant_id=item.tenant_id)
+    except SSError as e:
+        logger.warning(
+            "SS_SQLITE_JOB_MIGRATION_LOAD_FAILED",
+            extra={"tenant_id": item.tenant_id, "job_id": item.job_id, "error_code": e.error_code},
+        )
+        return "failed"
+    try:
+        inserted = db.connection().execute(
+            "INSERT OR IGNORE INTO jobs (tenant_id, job_id, version, status, created_at, "
+            "updated_at, payload) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                item.tenant_id,
+                job.job_id,
+                job.version,
+                job.status.value,
+                job.created_at,
+                item.updated_at or job.created_at,
+                encode_job_payload(job),
+            ),
+        ).rowcount
+    except sqlite3.Error as e:
+        logger.warning(
+            "SS_SQLITE_JOB_MIGRATION_WRITE_FAILED",
+            extra={"tenant_id": item.tenant_id, "job_id": item.job_id, "error": str(e)},
+        )
+        return "failed"
+    return "migrated" if inserted == 1 else "skipped"
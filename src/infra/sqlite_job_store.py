@@ -0,0 +1,282 @@
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+from pathlib import Path
+from typing import Any
+
+from pydantic import ValidationError
+
+from src.domain.models import Draft, Job, is_safe_job_rel_path
+from src.infra.atomic_write import atomic_write_json
+from src.infra.exceptions import (
+    ArtifactPathUnsafeError,
+    JobAlreadyExistsError,
+    JobDataCorruptedError,
+    JobIdUnsafeError,
+    JobNotFoundError,
+    JobStoreIOError,
+    JobVersionConflictError,
+    TenantIdUnsafeError,
+)
+from src.infra.job_store_migrations import (
+    assert_current_schema_version,
+    assert_supported_schema_version,
+    migrate_payload_to_current,
+    validate_job_payload,
+)
+from src.infra.sqlite_database import SQLiteDatabase
+from src.utils.job_workspace import is_safe_path_segment, resolve_job_dir
+from src.utils.json_codec import default_codec
+from src.utils.json_types import JsonObject
+from src.utils.tenancy import DEFAULT_TENANT_ID, tenant_jobs_dir
+from src.utils.time import utc_now
+
+logger = logging.getLogger(__name__)
+
+
+def encode_job_payload(job: Job) -> str:
+    return job.model_dump_json()
+
+
+def _validate_current_job(raw: str) -> Job | None:
+    """Validate a stored payload straight from JSON; `None` when it needs the migration path."""
+    try:
+        job = Job.model_validate_json(raw)
+    except ValidationError:
+        return None
+    return job if job.trace_id else None
+
+
+class SQLiteJobStore:
+    """SQLite-backed job store.
+
+    Job documents live in the `jobs` table and `save` is a single UPDATE conditioned on the
+    optimistic `version`. Job workspaces (inputs, runs, artifacts) stay under `jobs_dir`.
+    With `read_only_loads`, `load` migrates old rows in memory and leaves them to the next save.
+    """
+
+    def __init__(self, *, db: SQLiteDatabase, jobs_dir: Path, read_only_loads: bool = False):
+        self._db = db
+        self._jobs_dir = Path(jobs_dir)
+        self._read_only_loads = read_only_loads
+
+    def create(self, job: Job, *, tenant_id: str = DEFAULT_TENANT_ID) -> None:
+        job_dir = self._job_dir(tenant_id=tenant_id, job_id=job.job_id)
+        assert_current_schema_version(job=job, path=self._db.path)
+        now = utc_now().isoformat()
+        try:
+            self._db.connection().execute(
+                "INSERT INTO jobs (tenant_id, job_id, version, status, created_at, updated_at, "
+                "payload) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    tenant_id,
+                    job.job_id,
+                    job.version,
+                    job.status.value,
+                    job.created_at,
+                    now,
+                    encode_job_payload(job),
+                ),
+            )
+        except sqlite3.IntegrityError as e:
+            raise JobAlreadyExistsError(job_id=job.job_id) from e
+        except sqlite3.Error as e:
+            self._log_db_error(event="SS_JOB_SQLITE_CREATE_FAILED", job_id=job.job_id, error=e)
+            raise JobStoreIOError(operation="create", job_id=job.job_id) from e
+        try:
+            job_dir.mkdir(parents=True, exist_ok=True)
+        except OSError as e:
+            logger.warning(
+                "SS_JOB_DIR_CREATE_FAILED",
+                extra={"tenant_id": tenant_id, "job_id": job.job_id, "path": str(job_dir)},
+            )
+            raise JobStoreIOError(operation="create_dir", job_id=job.job_id) from e
+
+    def load(self, job_id: str, *, tenant_id: str = DEFAULT_TENANT_ID) -> Job:
+        self._job_dir(tenant_id=tenant_id, job_id=job_id)
+        row = self._fetch_one(
+            operation="read",
+            job_id=job_id,
+            sql="SELECT version, payload FROM jobs WHERE tenant_id = ? AND job_id = ?",
+            params=(tenant_id, job_id),
+        )
+        if row is None:
+            raise JobNotFoundError(job_id=job_id)
+        current = _validate_current_job(str(row[1]))
+        if current is not None:
+            return current
+        payload = self._decode_payload(job_id=job_id, raw=str(row[1]))
+        assert_supported_schema_version(job_id=job_id, path=self._db.path, payload=payload)
+        migrated = migrate_payload_to_current(job_id=job_id, path=self._db.path, payload=payload)
+        job = validate_job_payload(job_id=job_id, path=self._db.path, payload=migrated)
+        if migrated is not payload and not self._read_only_loads:
+            self._execute(
+                operation="migrate_write",
+                job_id=job_id,
+                sql=(
+                    "UPDATE jobs SET payload = ? "
+                    "WHERE tenant_id = ? AND job_id = ? AND version = ?"
+                ),
+                params=(encode_job_payload(job), tenant_id, job_id, int(row[0])),
+            )
+        return job
+
+    def revision(
+        self, job_id: str, *, tenant_id: str = DEFAULT_TENANT_ID
+    ) -> tuple[int, ...] | None:
+        row = self._fetch_one(
+            operation="read",
+            job_id=job_id,
+            sql="SELECT version FROM jobs WHERE tenant_id = ? AND job_id = ?",
+            params=(tenant_id, job_id),
+        )
+        return None if row is None else (int(row[0]),)
+
+    def save(self, job: Job, *, tenant_id: str = DEFAULT_TENANT_ID) -> None:
+        job_id = job.job_id
+        self._job_dir(tenant_id=tenant_id, job_id=job_id)
+        assert_current_schema_version(job=job, path=self._db.path)
+        new_version = job.version + 1
+        to_write = job.model_copy(update={"version": new_version})
+        updated = self._execute(
+            operation="write",
+            job_id=job_id,
+            sql=(
+                "UPDATE jobs SET version = ?, status = ?, updated_at = ?, payload = ? "
+                "WHERE tenant_id = ? AND job_id = ? AND version = ?"
+            ),
+            params=(
+                new_version,
+                to_write.status.value,
+                utc_now().isoformat(),
+                encode_job_payload(to_write),
+                tenant_id,
+                job_id,
+                job.version,
+            ),
+        )
+        if updated == 1:
+            job.version = new_version
+            return
+        row = self._fetch_one(
+            operation="read",
+            job_id=job_id,
+            sql="SELECT version FROM jobs WHERE tenant_id = ? AND job_id = ?",
+            params=(tenant_id, job_id),
+        )
+        if row is None:
+            raise JobNotFoundError(job_id=job_id)
+        logger.warning(
+            "SS_JOB_JSON_VERSION_CONFLICT",
+            extra={
+                "job_id": job_id,
+                "path": str(self._db.path),
+                "expected_version": job.version,
+                "actual_version": int(row[0]),
+            },
+        )
+        raise JobVersionConflictError(
+            job_id=job_id,
+            expected_version=job.version,
+            actual_version=int(row[0]),
+        )
+
+    def write_draft(self, *, job_id: str, draft: Draft, tenant_id: str = DEFAULT_TENANT_ID) -> None:
+        job = self.load(job_id=job_id, tenant_id=tenant_id)
+        job.draft = draft
+        self.save(job=job, tenant_id=tenant_id)
+
+    def write_artifact_json(
+        self,
+        *,
+        job_id: str,
+        rel_path: str,
+        payload: JsonObject,
+        tenant_id: str = DEFAULT_TENANT_ID,
+    ) -> None:
+        if not is_safe_job_rel_path(rel_path):
+            logger.warning(
+                "SS_JOB_ARTIFACT_PATH_UNSAFE",
+                extra={"job_id": job_id, "rel_path": rel_path, "reason": "unsafe_rel_path"},
+            )
+            raise ArtifactPathUnsafeError(job_id=job_id, rel_path=rel_path)
+        job_dir = self._job_dir(tenant_id=tenant_id, job_id=job_id)
+        exists = self._fetch_one(
+            operation="read",
+            job_id=job_id,
+            sql="SELECT 1 FROM jobs WHERE tenant_id = ? AND job_id = ?",
+            params=(tenant_id, job_id),
+        )
+        if exists is None:
+            raise JobNotFoundError(job_id=job_id)
+        path = (job_dir / rel_path).resolve(strict=False)
+        if not path.is_relative_to(job_dir):
+            logger.warning(
+                "SS_JOB_ARTIFACT_PATH_UNSAFE",
+                extra={"job_id": job_id, "rel_path": rel_path, "reason": "symlink_escape"},
+            )
+            raise ArtifactPathUnsafeError(job_id=job_id, rel_path=rel_path)
+        try:
+            atomic_write_json(path=path, payload=payload)
+        except OSError as e:
+            logger.warning(
+                "SS_JOB_ARTIFACT_JSON_WRITE_FAILED",
+                extra={"tenant_id": tenant_id, "job_id": job_id, "path": str(path)},
+            )
+            raise JobStoreIOError(operation="artifact_write", job_id=job_id) from e
+
+    def _job_dir(self, *, tenant_id: str, job_id: str) -> Path:
+        if tenant_jobs_dir(jobs_dir=self._jobs_dir, tenant_id=tenant_id) is None:
+            logger.warning("SS_TENANT_ID_UNSAFE", extra={"tenant_id": tenant_id})
+            raise TenantIdUnsafeError(tenant_id=tenant_id)
+        job_dir = None
+        if is_safe_path_segment(job_id):
+            job_dir = resolve_job_dir(jobs_dir=self._jobs_dir, tenant_id=tenant_id, job_id=job_id)
+        if job_dir is None:
+            logger.warning("SS_JOB_ID_UNSAFE", extra={"job_id": job_id, "reason": "segment"})
+            raise JobIdUnsafeError(job_id=job_id)
+        return job_dir
+
+    def _decode_payload(self, *, job_id: str, raw: str) -> JsonObject:
+        try:
+            decoded = default_codec().loads(raw)
+        except json.JSONDecodeError as e:
+            logger.warning("SS_JOB_JSON_CORRUPTED", extra={"job_id": job_id, "backend": "sqlite"})
+            raise JobDataCorruptedError(job_id=job_id) from e
+        if not isinstance(decoded, dict):
+            logger.warning(
+                "SS_JOB_JSON_CORRUPTED",
+                extra={"job_id": job_id, "backend": "sqlite", "reason": "not_object"},
+            )
+            raise JobDataCorruptedError(job_id=job_id)
+        return decoded
+
+    def _fetch_one(
+        self,
+        *,
+        operation: str,
+        job_id: str,
+        sql: str,
+        params: tuple[object, ...],
+    ) -> tuple[Any, ...] | None:
+        try:
+            row = self._db.connection().execute(sql, params).fetchone()
+        except sqlite3.Error as e:
+            self._log_db_error(event="SS_JOB_SQLITE_READ_FAILED", job_id=job_id, error=e)
+            raise JobStoreIOError(operation=operation, job_id=job_id) from e
+        return None if row is None else tuple(row)
+
+    def _execute(self, *, operation: str, job_id: str, sql: str, params: tuple[object, ...]) -> int:
+        try:
+            return int(self._db.connection().execute(sql, params).rowcount)
+        except sqlite3.Error as e:
+            self._log_db_error(event="SS_JOB_SQLITE_WRITE_FAILED", job_id=job_id, error=e)
+            raise JobStoreIOError(operation=operation, job_id=job_id) from e
+
+    def _log_db_error(self, *, event: str, job_id: str, error: sqlite3.Error) -> None:
+        logger.warning(
+            event,
+            extra={"job_id": job_id, "path": str(self._db.path), "error": str(error)},
+        )
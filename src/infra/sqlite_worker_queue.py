@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+import logging
+import sqlite3
+import uuid
+from collections.abc import Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta
+from typing import Any, Callable
+
+from src.domain.queue_scheduling import (
+    DEFAULT_JOB_PRIORITY,
+    FairShareScheduler,
+    TenantQueueLoad,
+)
+from src.domain.worker_queue import QueueClaim, WorkerQueue
+from src.infra.exceptions import QueueIOError
+from src.infra.sqlite_database import SQLiteDatabase
+from src.utils.tenancy import DEFAULT_TENANT_ID
+from src.utils.time import utc_now
+
+logger = logging.getLogger(__name__)
+
+# Loose index scan over `queue_tenant_ready`: one seek per tenant with ready rows.
+_READY_TENANTS_SQL = """
+WITH RECURSIVE ready(tenant_id) AS (
+    SELECT MIN(tenant_id) FROM queue WHERE claim_id IS NULL
+    UNION ALL
+    SELECT (
+        SELECT MIN(tenant_id) FROM queue WHERE claim_id IS NULL AND tenant_id > ready.tenant_id
+    )
+    FROM ready WHERE ready.tenant_id IS NOT NULL
+)
+SELECT tenant_id FROM ready WHERE tenant_id IS NOT NULL
+"""
+
+# Pinned to the partial lease index so only claimed rows are read, not the whole backlog.
+_INFLIGHT_SQL = """
+SELECT tenant_id, COUNT(*) FROM queue INDEXED BY queue_leases
+WHERE claim_id IS NOT NULL GROUP BY tenant_id
+"""
+
+_CLAIM_READY_SQL = """
+UPDATE queue
+SET claim_id = ?, worker_id = ?, claimed_at = ?, lease_expires_at = ?, lease_expires_ts = ?
+WHERE seq = (
+    SELECT seq FROM queue WHERE tenant_id = ? AND claim_id IS NULL
+    ORDER BY priority DESC, seq LIMIT 1
+)
+RETURNING tenant_id, job_id, traceparent
+"""
+
+_CLAIM_EXPIRED_SQL = """
+UPDATE queue
+SET claim_id = ?, worker_id = ?, claimed_at = ?, lease_expires_at = ?, lease_expires_ts = ?
+WHERE seq = (
+    SELECT seq FROM queue
+    WHERE claim_id IS NOT NULL AND lease_expires_ts <= ?
+    ORDER BY lease_expires_ts LIMIT 1
+)
+RETURNING tenant_id, job_id, traceparent
+"""
+
+
+@dataclass(frozen=True)
+class SQLiteWorkerQueue(WorkerQueue):
+    """WorkerQueue backed by the `queue` table of a shared `SQLiteDatabase`.
+
+    Claiming runs in one transaction: the tenants with ready rows and their in-flight counts
+    feed the `FairShareScheduler`, then an `UPDATE ... RETURNING` takes the ranked tenant's
+    highest-priority, oldest ready row, or else the row with the earliest expired lease.
+    Because claims serialize on the database, tenant caps are exact. Semantics otherwise
+    match `FileWorkerQueue`: one ready row per job, and a claimed job may be enqueued again.
+    """
+
+    db: SQLiteDatabase
+    lease_ttl_seconds: int = 60
+    clock: Callable[[], datetime] = utc_now
+    scheduler: FairShareScheduler = field(default_factory=FairShareScheduler, compare=False)
+
+    def enqueue(
+        self,
+        job_id: str,
+        *,
+        tenant_id: str = DEFAULT_TENANT_ID,
+        traceparent: str | None = None,
+        priority: int = DEFAULT_JOB_PRIORITY,
+    ) -> None:
+        with self._sqlite_errors(operation="enqueue", tenant_id=tenant_id, job_id=job_id):
+            inserted = self.db.connection().execute(
+                "INSERT OR IGNORE INTO queue "
+                "(tenant_id, job_id, enqueued_at, traceparent, priority) VALUES (?, ?, ?, ?, ?)",
+                (tenant_id, job_id, self.clock().isoformat(), traceparent, priority),
+            ).rowcount
+        if inserted == 0:
+            logger.info(
+                "SS_QUEUE_ENQUEUE_IDEMPOTENT",
+                extra={"tenant_id": tenant_id, "job_id": job_id, "path": str(self.db.path)},
+            )
+
+    def claim(self, *, worker_id: str) -> QueueClaim | None:
+        now = self.clock()
+        expires_at = now + self._ttl()
+        claim_id = uuid.uuid4().hex
+        lease = (
+            claim_id,
+            worker_id,
+            now.isoformat(),
+            expires_at.isoformat(),
+            expires_at.timestamp(),
+        )
+        with self._sqlite_errors(operation="claim"):
+            with self.db.transaction() as conn:
+                row = self._claim_row(conn=conn, lease=lease, now=now)
+        if row is None:
+            return None
+        claim = QueueClaim(
+            job_id=str(row[1]),
+            claim_id=claim_id,
+            worker_id=worker_id,
+            claimed_at=now,
+            lease_expires_at=expires_at,
+            tenant_id=str(row[0]),
+            traceparent=None if row[2] is None else str(row[2]),
+        )
+        logger.info(
+            "SS_QUEUE_CLAIMED",
+            extra={
+                "tenant_id": claim.tenant_id,
+                "job_id": claim.job_id,
+                "claim_id": claim_id,
+                "worker_id": worker_id,
+            },
+        )
+        return claim
+
+    def _claim_row(
+        self,
+        *,
+        conn: sqlite3.Connection,
+        lease: tuple[str, str, str, str, float],
+        now: datetime,
+    ) -> tuple[Any, ...] | None:
+        inflight = {str(row[0]): int(row[1]) for row in conn.execute(_INFLIGHT_SQL)}
+        loads = [
+            TenantQueueLoad(tenant_id=tenant_id, ready=1, inflight=inflight.get(tenant_id, 0))
+            for (tenant_id,) in conn.execute(_READY_TENANTS_SQL)
+        ]
+        for tenant_id in self.scheduler.order(loads):
+            rows = conn.execute(_CLAIM_READY_SQL, (*lease, tenant_id)).fetchall()
+            if rows:
+                self.scheduler.record_claim(tenant_id=tenant_id)
+                return tuple(rows[0])
+        rows = conn.execute(_CLAIM_EXPIRED_SQL, (*lease, now.timestamp())).fetchall()
+        return tuple(rows[0]) if rows else None
+
+    def ack(self, *, claim: QueueClaim) -> None:
+        with self._sqlite_errors(operation="ack", tenant_id=claim.tenant_id, job_id=claim.job_id):
+            self.db.connection().execute(
+                "DELETE FROM queue WHERE tenant_id = ? AND job_id = ? AND claim_id = ?",
+                (claim.tenant_id, claim.job_id, claim.claim_id),
+            )
+
+    def release(self, *, claim: QueueClaim) -> None:
+        tenant_id, job_id = claim.tenant_id, claim.job_id
+        key = (tenant_id, job_id)
+        with self._sqlite_errors(operation="release", tenant_id=tenant_id, job_id=job_id):
+            with self.db.transaction() as conn:
+                ready = conn.execute(
+                    "SELECT 1 FROM queue WHERE tenant_id = ? AND job_id = ? AND claim_id IS NULL",
+                    key,
+                ).fetchone()
+                if ready is not None:
+                    conn.execute(
+                        "DELETE FROM queue WHERE tenant_id = ? AND job_id = ? AND claim_id = ?",
+                        (*key, claim.claim_id),
+                    )
+                    return
+                conn.execute(
+                    "UPDATE queue SET claim_id = NULL, worker_id = NULL, claimed_at = NULL, "
+                    "lease_expires_at = NULL, lease_expires_ts = NULL "
+                    "WHERE tenant_id = ? AND job_id = ? AND claim_id = ?",
+                    (*key, claim.claim_id),
+                )
+
+    def renew(self, *, claim: QueueClaim) -> QueueClaim | None:
+        expires_at = self.clock() + self._ttl()
+        with self._sqlite_errors(operation="renew", tenant_id=claim.tenant_id, job_id=claim.job_id):
+            updated = self.db.connection().execute(
+                "UPDATE queue SET lease_expires_at = ?, lease_expires_ts = ? "
+                "WHERE tenant_id = ? AND job_id = ? AND claim_id = ?",
+                (
+                    expires_at.isoformat(),
+                    expires_at.timestamp(),
+                    claim.tenant_id,
+                    claim.job_id,
+                    claim.claim_id,
+                ),
+            ).rowcount
+        if updated == 0:
+            logger.info(
+                "SS_QUEUE_RENEW_CLAIM_GONE",
+                extra={"tenant_id": claim.tenant_id, "job_id": claim.job_id},
+            )
+            return None
+        return replace(claim, lease_expires_at=expires_at)
+
+    def _ttl(self) -> timedelta:
+        try:
+            ttl = int(self.lease_ttl_seconds)
+        except (TypeError, ValueError):
+            ttl = 60
+        if ttl <= 0:
+            ttl = 60
+        return timedelta(seconds=ttl)
+
+    @contextmanager
+    def _sqlite_errors(
+        self,
+        *,
+        operation: str,
+        tenant_id: str | None = None,
+        job_id: str | None = None,
+    ) -> Iterator[None]:
+        try:
+            yield
+        except sqlite3.Error as e:
+            logger.warning(
+                "SS_QUEUE_SQLITE_FAILED",
+                extra={
+                    "operation": operation,
+                    "tenant_id": tenant_id,
+                    "job_id": job_id,
+                    "path": str(self.db.path),
+                    "error": str(e),
+                },
+            )
+            raise QueueIOError(operation=operation, path=str(self.db.path)) from e
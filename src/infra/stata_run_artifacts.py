@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import shutil
 from pathlib import Path
 from typing import Sequence
 
@@ -67,6 +68,12 @@ def meta_payload(
         "command": list(cmd),
         "cwd_rel": cwd_rel,
     }
+    if execution.streamed:
+        payload["output_bytes"] = {
+            "stdout": execution.stdout_bytes,
+            "stderr": execution.stderr_bytes,
+            "stata_log": execution.log_bytes,
+        }
     if execution.error is not None:
         error_payload: JsonObject = {
             "error_code": execution.error.error_code,
@@ -87,23 +94,21 @@ def write_run_artifacts(
     error: RunError | None,
     exit_code: int | None,
     timed_out: bool,
+    streamed: bool = False,
 ) -> tuple[Path, Path, Path, Path, Path]:
+    """Write the run artifacts; with `streamed`, stdout/stderr/log are already on disk."""
     stdout_path = artifacts_dir / STDOUT_FILENAME
     stderr_path = artifacts_dir / STDERR_FILENAME
     log_path = artifacts_dir / STATA_LOG_FILENAME
     meta_path = artifacts_dir / META_FILENAME
     error_path = artifacts_dir / ERROR_FILENAME
 
-    write_text(stdout_path, stdout_text)
-    write_text(stderr_path, stderr_text)
-    work_log_text = read_stata_log_text(cwd=artifacts_dir.parent / "work")
-    if work_log_text != "":
-        write_text(log_path, work_log_text)
+    if streamed:
+        _fill_empty_log(log_path=log_path, stdout_path=stdout_path, stderr_path=stderr_path)
     else:
-        combined = stdout_text
-        if stderr_text != "":
-            combined = combined + "\n\n[stderr]\n" + stderr_text
-        write_text(log_path, combined)
+        _write_output_texts(
+            artifacts_dir=artifacts_dir, stdout_text=stdout_text, stderr_text=stderr_text
+        )
     write_json(meta_path, meta)
     if error is not None:
         payload: JsonObject = {
@@ -118,6 +123,32 @@ def write_run_artifacts(
     return stdout_path, stderr_path, log_path, meta_path, error_path
 
 
+def _write_output_texts(*, artifacts_dir: Path, stdout_text: str, stderr_text: str) -> None:
+    write_text(artifacts_dir / STDOUT_FILENAME, stdout_text)
+    write_text(artifacts_dir / STDERR_FILENAME, stderr_text)
+    work_log_text = read_stata_log_text(cwd=artifacts_dir.parent / "work")
+    if work_log_text != "":
+        write_text(artifacts_dir / STATA_LOG_FILENAME, work_log_text)
+    else:
+        combined = stdout_text
+        if stderr_text != "":
+            combined = combined + "\n\n[stderr]\n" + stderr_text
+        write_text(artifacts_dir / STATA_LOG_FILENAME, combined)
+
+
+def _fill_empty_log(*, log_path: Path, stdout_path: Path, stderr_path: Path) -> None:
+    # Same fallback as for captured output, copied file to file to keep memory bounded.
+    if log_path.is_file() and log_path.stat().st_size > 0:
+        return
+    with log_path.open("wb") as log:
+        with stdout_path.open("rb") as stdout:
+            shutil.copyfileobj(stdout, log)
+        if stderr_path.stat().st_size > 0:
+            log.write(b"\n\n[stderr]\n")
+            with stderr_path.open("rb") as stderr:
+                shutil.copyfileobj(stderr, log)
+
+
 def artifact_refs(
     *,
     job_dir: Path,
@@ -7,9 +7,14 @@ from typing import Callable, Sequence
 
 from src.domain.models import is_safe_job_rel_path
 from src.domain.stata_runner import RunError, RunResult
+from src.infra.input_blobs import BLOB_DIRNAME
 from src.infra.stata_cmd import build_stata_batch_cmd
+from src.infra.stata_run_stream import ProgressCallback, execute_streaming
 from src.infra.stata_run_support import (
     DO_FILENAME,
+    STATA_LOG_FILENAME,
+    STDERR_FILENAME,
+    STDOUT_FILENAME,
     Execution,
     RunDirs,
     artifact_refs,
@@ -59,7 +64,11 @@ def _prepare_workspace(
                 error_code="STATA_INPUTS_UNSAFE",
                 message="inputs_dir_rel unsafe",
             )
-        copy_inputs_dir(source_dir=source_dir, work_dir=dirs.work_dir)
+        copy_inputs_dir(
+            source_dir=source_dir,
+            work_dir=dirs.work_dir,
+            blobs_dir=dirs.job_dir / BLOB_DIRNAME,
+        )
     except OSError as e:
         logger.warning(
             "SS_STATA_RUN_COPY_INPUTS_FAILED",
@@ -124,6 +133,8 @@ def _log_completion(*, job_id: str, run_id: str, execution: Execution) -> None:
             "run_id": run_id,
             "exit_code": execution.exit_code,
             "duration_ms": execution.duration_ms,
+            "stdout_bytes": execution.stdout_bytes,
+            "log_bytes": execution.log_bytes,
         },
     )
 
@@ -145,6 +156,7 @@ def _write_artifacts_or_error(
             error=execution.error,
             exit_code=execution.exit_code,
             timed_out=execution.timed_out,
+            streamed=execution.streamed,
         )
     except OSError as e:
         logger.warning(
@@ -219,6 +231,8 @@ def _run_in_workspace(
     stata_cmd: Sequence[str],
     timeout_seconds: int | None,
     subprocess_runner: Callable[..., subprocess.CompletedProcess[str]] | None,
+    on_progress: ProgressCallback | None,
+    should_stop: Callable[[], bool] | None,
 ) -> RunResult:
     cmd = build_stata_batch_cmd(stata_cmd=stata_cmd, do_filename=DO_FILENAME)
     logger.info(
@@ -226,12 +240,24 @@ def _run_in_workspace(
         extra={"job_id": job_id, "run_id": run_id, "cwd": str(dirs.work_dir), "cmd": cmd},
     )
 
-    execution = execute(
-        cmd=cmd,
-        cwd=dirs.work_dir,
-        timeout_seconds=timeout_seconds,
-        runner=subprocess_runner,
-    )
+    if subprocess_runner is None:
+        execution = execute_streaming(
+            cmd=cmd,
+            cwd=dirs.work_dir,
+            timeout_seconds=timeout_seconds,
+            stdout_path=dirs.artifacts_dir / STDOUT_FILENAME,
+            stderr_path=dirs.artifacts_dir / STDERR_FILENAME,
+            log_mirror_path=dirs.artifacts_dir / STATA_LOG_FILENAME,
+            on_progress=on_progress,
+            should_stop=should_stop,
+        )
+    else:
+        execution = execute(
+            cmd=cmd,
+            cwd=dirs.work_dir,
+            timeout_seconds=timeout_seconds,
+            runner=subprocess_runner,
+        )
     return _persist_run(
         dirs=dirs,
         job_id=job_id,
@@ -254,6 +280,8 @@ def run_local_stata_attempt(
     timeout_seconds: int | None,
     subprocess_runner: Callable[..., subprocess.CompletedProcess[str]] | None,
     inputs_dir_rel: str | None = None,
+    on_progress: ProgressCallback | None = None,
+    should_stop: Callable[[], bool] | None = None,
 ) -> RunResult:
     prepared = _prepare_workspace(
         jobs_dir=jobs_dir,
@@ -302,4 +330,6 @@ def run_local_stata_attempt(
         stata_cmd=stata_cmd,
         timeout_seconds=timeout_seconds,
         subprocess_runner=subprocess_runner,
+        on_progress=on_progress,
+        should_stop=should_stop,
     )
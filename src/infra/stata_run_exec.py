@@ -21,6 +21,11 @@ class Execution:
     timed_out: bool
     duration_ms: int
     error: RunError | None
+    # Set by the streaming executor: output went straight to the artifact files.
+    streamed: bool = False
+    stdout_bytes: int = 0
+    stderr_bytes: int = 0
+    log_bytes: int = 0
 
 
 def coerce_text(value: str | bytes | None) -> str:
@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import logging
+import os
+import re
+import subprocess
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Callable, Sequence
+
+from src.domain.stata_runner import RunError
+from src.infra.stata_run_exec import Execution
+from src.infra.stata_run_filenames import STATA_LOG_FILENAME
+
+logger = logging.getLogger(__name__)
+
+POLL_SECONDS = 0.2
+PROGRESS_INTERVAL_SECONDS = 1.0
+TERMINATE_GRACE_SECONDS = 5.0
+LOG_TAIL_CHUNK_BYTES = 1024 * 1024
+# `r(NNN);` sits at the start of a line, so only a short prefix of each line is ever kept.
+_LINE_PREFIX_BYTES = 64
+_RETURN_CODE_RE = re.compile(rb"^\s*r\((?P<code>\d+)\);")
+
+
+@dataclass(frozen=True)
+class RunProgress:
+    """Snapshot of a running Stata process, reported about once per second."""
+
+    elapsed_ms: int
+    stdout_bytes: int
+    stderr_bytes: int
+    log_bytes: int
+    return_code: int | None
+
+
+ProgressCallback = Callable[[RunProgress], None]
+
+
+class StataLogTail:
+    """Follows `stata.log` from the last read offset, mirroring new bytes to `mirror`.
+
+    Every complete line is matched against `r(NNN);`; `return_code` is the last code seen,
+    as in a scan of the whole log. Memory stays at one read chunk plus a line prefix.
+    """
+
+    def __init__(self, *, path: Path, mirror: BinaryIO | None):
+        self._path = path
+        self._mirror = mirror
+        self._line = b""
+        self.offset = 0
+        self.return_code: int | None = None
+
+    def poll(self) -> None:
+        try:
+            with self._path.open("rb") as f:
+                f.seek(self.offset)
+                for chunk in iter(lambda: f.read(LOG_TAIL_CHUNK_BYTES), b""):
+                    self.offset += len(chunk)
+                    self._feed(chunk)
+        except OSError:
+            return
+
+    def finish(self) -> None:
+        self.poll()
+        self._match(self._line)
+        self._line = b""
+
+    def _feed(self, chunk: bytes) -> None:
+        if self._mirror is not None:
+            self._mirror.write(chunk)
+        lines = chunk.split(b"\n")
+        lines[0] = self._line + lines[0]
+        self._line = lines.pop()[:_LINE_PREFIX_BYTES]
+        for line in lines:
+            self._match(line)
+
+    def _match(self, line: bytes) -> None:
+        match = _RETURN_CODE_RE.match(line)
+        if match is not None:
+            self.return_code = int(match.group("code"))
+
+
+@dataclass(frozen=True)
+class _Streams:
+    stdout: BinaryIO
+    stderr: BinaryIO
+    tail: StataLogTail
+
+
+def execute_streaming(
+    *,
+    cmd: Sequence[str],
+    cwd: Path,
+    timeout_seconds: int | None,
+    stdout_path: Path,
+    stderr_path: Path,
+    log_mirror_path: Path,
+    on_progress: ProgressCallback | None = None,
+    should_stop: Callable[[], bool] | None = None,
+) -> Execution:
+    """Run `cmd` with stdout/stderr written straight to files while tailing `stata.log`.
+
+    The process is stopped as soon as the log shows a nonzero `r(NNN);` (Stata has already
+    abandoned the do-file), the timeout passes or `should_stop()` turns true (the worker lost
+    the job's lease). Nothing is buffered in memory: the returned
+    `Execution` carries byte counters and `streamed=True` instead of the output text.
+    """
+    started = time.monotonic()
+    stdout_path.parent.mkdir(parents=True, exist_ok=True)
+    with (
+        stdout_path.open("wb") as stdout,
+        stderr_path.open("wb") as stderr,
+        log_mirror_path.open("wb") as mirror,
+    ):
+        streams = _Streams(
+            stdout=stdout,
+            stderr=stderr,
+            tail=StataLogTail(path=cwd / STATA_LOG_FILENAME, mirror=mirror),
+        )
+        try:
+            proc = subprocess.Popen(
+                list(cmd), cwd=str(cwd), stdin=subprocess.DEVNULL, stdout=stdout, stderr=stderr
+            )
+        except OSError as e:
+            stderr.write(str(e).encode("utf-8", errors="replace"))
+            stderr.flush()
+            error = RunError("STATA_SUBPROCESS_FAILED", str(e))
+            return _execution(streams, started=started, exit_code=None, error=error)
+        deadline = None if timeout_seconds is None else started + timeout_seconds
+        return _supervise(
+            proc,
+            streams=streams,
+            started=started,
+            deadline=deadline,
+            on_progress=on_progress,
+            should_stop=should_stop,
+        )
+
+
+def _supervise(
+    proc: subprocess.Popen[bytes],
+    *,
+    streams: _Streams,
+    started: float,
+    deadline: float | None,
+    on_progress: ProgressCallback | None,
+    should_stop: Callable[[], bool] | None,
+) -> Execution:
+    next_progress = started
+    while True:
+        try:
+            exit_code: int | None = proc.wait(timeout=POLL_SECONDS)
+        except subprocess.TimeoutExpired:
+            exit_code = None
+        streams.tail.poll()
+        now = time.monotonic()
+        if on_progress is not None and (exit_code is not None or now >= next_progress):
+            on_progress(_progress(streams, started=started))
+            next_progress = now + PROGRESS_INTERVAL_SECONDS
+        if exit_code is not None:
+            return _finished(streams, started=started, exit_code=exit_code)
+        code = streams.tail.return_code
+        if code is not None and code != 0:
+            _terminate(proc)
+            streams.tail.finish()
+            error = RunError(
+                "STATA_RETURN_CODE",
+                f"stata log contains r({code});",
+                details={"return_code": code, "terminated_early": True},
+            )
+            return _execution(streams, started=started, exit_code=None, error=error)
+        if should_stop is not None and should_stop():
+            _terminate(proc)
+            streams.tail.finish()
+            error = RunError("STATA_RUN_CANCELLED", "stata run stopped: job lease lost")
+            return _execution(streams, started=started, exit_code=None, error=error)
+        if deadline is not None and now >= deadline:
+            _terminate(proc)
+            error = RunError("STATA_TIMEOUT", "stata execution timed out")
+            return _execution(
+                streams, started=started, exit_code=None, error=error, timed_out=True
+            )
+
+
+def _finished(streams: _Streams, *, started: float, exit_code: int) -> Execution:
+    streams.tail.finish()
+    code = streams.tail.return_code
+    if exit_code != 0:
+        error: RunError | None = RunError(
+            "STATA_NONZERO_EXIT", f"stata exited with code {exit_code}"
+        )
+    elif code is not None and code != 0:
+        error = RunError("STATA_RETURN_CODE", f"stata log contains r({code});")
+    else:
+        error = None
+    return _execution(streams, started=started, exit_code=exit_code, error=error)
+
+
+def _terminate(proc: subprocess.Popen[bytes]) -> None:
+    proc.terminate()
+    try:
+        proc.wait(timeout=TERMINATE_GRACE_SECONDS)
+    except subprocess.TimeoutExpired:
+        logger.warning("SS_STATA_RUN_KILL", extra={"pid": proc.pid})
+        proc.kill()
+        proc.wait()
+
+
+def _progress(streams: _Streams, *, started: float) -> RunProgress:
+    return RunProgress(
+        elapsed_ms=int((time.monotonic() - started) * 1000),
+        stdout_bytes=os.fstat(streams.stdout.fileno()).st_size,
+        stderr_bytes=os.fstat(streams.stderr.fileno()).st_size,
+        log_bytes=streams.tail.offset,
+        return_code=streams.tail.return_code,
+    )
+
+
+def _execution(
+    streams: _Streams,
+    *,
+    started: float,
+    exit_code: int | None,
+    error: RunError | None,
+    timed_out: bool = False,
+) -> Execution:
+    progress = _progress(streams, started=started)
+    return Execution(
+        stdout_text="",
+        stderr_text="",
+        exit_code=exit_code,
+        timed_out=timed_out,
+        duration_ms=progress.elapsed_ms,
+        error=error,
+        streamed=True,
+        stdout_bytes=progress.stdout_bytes,
+        stderr_bytes=progress.stderr_bytes,
+        log_bytes=progress.log_bytes,
+    )
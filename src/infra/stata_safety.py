@@ -1,11 +1,20 @@
 from __future__ import annotations
 
+import json
 import logging
 import os
 import re
-import shutil
+from collections import Counter
 from pathlib import Path
 
+from src.domain.dataset_sidecar import SIDECAR_DIRNAME
+from src.infra.input_blobs import (
+    BLOB_DIRNAME,
+    InputBlobStore,
+    input_sha256_by_rel_path,
+    stage_file,
+)
+
 logger = logging.getLogger(__name__)
 
 _ABS_POSIX_QUOTED = re.compile(r"[\"']\\s*/")
@@ -37,16 +46,30 @@ def find_unsafe_dofile_reason(do_file: str) -> str | None:
 
 
 def copy_job_inputs_dir(*, job_dir: Path, work_dir: Path) -> None:
-    copy_inputs_dir(source_dir=job_dir / "inputs", work_dir=work_dir)
+    copy_inputs_dir(
+        source_dir=job_dir / "inputs", work_dir=work_dir, blobs_dir=job_dir / BLOB_DIRNAME
+    )
+
 
+def copy_inputs_dir(*, source_dir: Path, work_dir: Path, blobs_dir: Path | None = None) -> None:
+    """Stage `source_dir` into `work_dir/inputs` as read-only links (copies as a fallback).
 
-def copy_inputs_dir(*, source_dir: Path, work_dir: Path) -> None:
+    With `blobs_dir`, datasets whose sha256 is in the directory's `manifest.json` are staged
+    through the job's content-addressed blobs.
+    """
     if not source_dir.exists() or not source_dir.is_dir():
         return
     target_dir = work_dir / "inputs"
+    blobs = None if blobs_dir is None else InputBlobStore(blobs_dir=blobs_dir)
+    sha256_by_rel_path = _manifest_sha256s(source_dir) if blobs is not None else {}
+    methods: Counter[str] = Counter()
     for root, dirs, files in os.walk(source_dir, followlinks=False):
         root_path = Path(root)
-        dirs[:] = [name for name in dirs if not (root_path / name).is_symlink()]
+        dirs[:] = [
+            name
+            for name in dirs
+            if name != SIDECAR_DIRNAME and not (root_path / name).is_symlink()
+        ]
         for name in files:
             source = root_path / name
             if source.is_symlink():
@@ -57,5 +80,17 @@ def copy_inputs_dir(*, source_dir: Path, work_dir: Path) -> None:
                 continue
             rel = source.relative_to(source_dir)
             dest = target_dir / rel
-            dest.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(source, dest)
+            sha256 = sha256_by_rel_path.get(f"inputs/{rel.as_posix()}")
+            if blobs is None:
+                methods[stage_file(source=source, dest=dest)] += 1
+            else:
+                methods[blobs.stage(source=source, dest=dest, sha256=sha256)] += 1
+    logger.debug("SS_STATA_RUN_INPUTS_STAGED", extra={"methods": dict(methods)})
+
+
+def _manifest_sha256s(source_dir: Path) -> dict[str, str]:
+    try:
+        raw = json.loads((source_dir / "manifest.json").read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return input_sha256_by_rel_path(raw) if isinstance(raw, dict) else {}
@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import logging
+
+from src.config import Config
+from src.domain.queue_scheduling import FairShareScheduler, QueueSchedulingPolicy
+from src.domain.worker_queue import WorkerQueue
+from src.infra.exceptions import QueueBackendUnsupportedError
+from src.infra.file_worker_queue import FileWorkerQueue
+from src.infra.indexed_file_worker_queue import IndexedFileWorkerQueue
+from src.infra.sqlite_database import SQLiteDatabase
+from src.infra.sqlite_worker_queue import SQLiteWorkerQueue
+
+logger = logging.getLogger(__name__)
+
+
+def build_queue_scheduler(*, config: Config) -> FairShareScheduler:
+    policy = QueueSchedulingPolicy(
+        tenant_weights=dict(config.queue_tenant_weights),
+        tenant_max_inflight=dict(config.queue_tenant_max_inflight),
+    )
+    return FairShareScheduler(policy=policy)
+
+
+def build_worker_queue(*, config: Config) -> WorkerQueue:
+    backend = config.queue_backend
+    scheduler = build_queue_scheduler(config=config)
+    if backend == "file":
+        return FileWorkerQueue(
+            queue_dir=config.queue_dir,
+            lease_ttl_seconds=config.queue_lease_ttl_seconds,
+            scheduler=scheduler,
+            compact_json=config.queue_json_compact,
+        )
+    if backend == "file_indexed":
+        if not scheduler.policy.is_default():
+            logger.warning("SS_QUEUE_SCHEDULING_UNSUPPORTED", extra={"backend": backend})
+        return IndexedFileWorkerQueue(
+            queue_dir=config.queue_dir,
+            lease_ttl_seconds=config.queue_lease_ttl_seconds,
+            compact_json=config.queue_json_compact,
+        )
+    if backend == "sqlite":
+        return SQLiteWorkerQueue(
+            db=SQLiteDatabase(path=config.sqlite_path),
+            lease_ttl_seconds=config.queue_lease_ttl_seconds,
+            scheduler=scheduler,
+        )
+    logger.warning("SS_QUEUE_BACKEND_UNSUPPORTED", extra={"backend": backend})
+    raise QueueBackendUnsupportedError(backend=backend)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import logging
 import os
 import time
@@ -9,6 +10,7 @@ from contextlib import asynccontextmanager
 from pathlib import Path
 from typing import cast
 
+import anyio.to_thread
 from fastapi import FastAPI
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import FileResponse, JSONResponse
@@ -22,7 +24,9 @@ from starlette.types import Receive, Scope, Send
 from src.api.routes import admin_api_router, api_v1_router, ops_router
 from src.api.versioning import add_legacy_deprecation_headers, is_legacy_unversioned_path
 from src.config import Config, load_config
+from src.infra.durability import configure_durability, flush_durability
 from src.infra.exceptions import OutOfMemoryError, ServiceShuttingDownError, SSError
+from src.infra.job_indexer_factory import ensure_job_index
 from src.infra.logging_config import build_logging_config
 from src.infra.object_store_exceptions import ObjectStoreConfigurationError
 from src.infra.object_store_factory import build_object_store
@@ -56,9 +60,12 @@ def _validate_production_upload_object_store(*, config: Config) -> None:
 
 
 def _clear_dependency_caches() -> None:
-    from src.api import deps
+    from src.api import deps, io_deps
+    from src.api.admin import deps as admin_deps
 
     deps.clear_dependency_caches()
+    io_deps.clear_io_dependency_caches()
+    admin_deps.clear_admin_dependency_caches()
 
 
 def _frontend_dist_dir() -> Path:
@@ -85,14 +92,20 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     app.state.shutting_down = False
     config = app.state.config
     configure_tracing(config=config, component="api")
+    from src.api.deps import get_metrics_sync
+
+    configure_durability(config=config, metrics=get_metrics_sync())
     logger.info("SS_API_STARTUP", extra={"pid": os.getpid(), "log_level": config.log_level})
     _validate_production_upload_object_store(config=config)
+    # A cold job index is built before serving, in a worker thread, not on a request.
+    await anyio.to_thread.run_sync(functools.partial(ensure_job_index, config=config))
     try:
         yield
     finally:
         app.state.shutting_down = True
         logger.info("SS_API_SHUTDOWN_INITIATED", extra={"pid": os.getpid()})
         _clear_dependency_caches()
+        flush_durability()
         logger.info("SS_API_SHUTDOWN_COMPLETE", extra={"pid": os.getpid()})
 
 
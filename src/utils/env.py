@@ -108,3 +108,33 @@ def clamped_int(
     if max_value is not None and value > max_value:
         return max_value
     return value
+
+
+def float_pairs(raw: str) -> tuple[tuple[str, float], ...]:
+    """Parse `key=number,key=number`; malformed or non-positive items are dropped."""
+    pairs: list[tuple[str, float]] = []
+    for key, value in _key_value_items(raw):
+        number = float_value(value, default=0.0)
+        if number > 0:
+            pairs.append((key, number))
+    return tuple(pairs)
+
+
+def int_pairs(raw: str) -> tuple[tuple[str, int], ...]:
+    """Parse `key=int,key=int`; malformed or non-positive items are dropped."""
+    pairs: list[tuple[str, int]] = []
+    for key, value in _key_value_items(raw):
+        number = int_value(value, default=0)
+        if number > 0:
+            pairs.append((key, number))
+    return tuple(pairs)
+
+
+def _key_value_items(raw: str) -> list[tuple[str, str]]:
+    items: list[tuple[str, str]] = []
+    for item in str(raw).split(","):
+        key, sep, value = item.partition("=")
+        if sep == "" or key.strip() == "":
+            continue
+        items.append((key.strip(), value.strip()))
+    return items
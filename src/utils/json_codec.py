@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import importlib
+import json
+from dataclasses import dataclass
+from functools import lru_cache
+from types import ModuleType
+from typing import Protocol, cast
+
+from src.utils.json_types import JsonValue
+
+
+class JsonCodec(Protocol):
+    """Encodes/decodes on-disk JSON records.
+
+    `dumps` always sorts keys and never escapes non-ASCII, so both codecs produce the same
+    layout; `compact=False` keeps the historical 2-space indented one. Decode errors are
+    raised as `json.JSONDecodeError` by every implementation.
+    """
+
+    @property
+    def name(self) -> str: ...
+
+    def dumps(self, payload: object, *, compact: bool = False) -> bytes: ...
+
+    def loads(self, data: bytes | str) -> JsonValue: ...
+
+
+@dataclass(frozen=True)
+class StdlibJsonCodec:
+    name: str = "stdlib"
+
+    def dumps(self, payload: object, *, compact: bool = False) -> bytes:
+        if compact:
+            text = json.dumps(payload, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+        else:
+            text = json.dumps(payload, ensure_ascii=False, indent=2, sort_keys=True)
+        return text.encode("utf-8")
+
+    def loads(self, data: bytes | str) -> JsonValue:
+        return cast(JsonValue, json.loads(data))
+
+
+@dataclass(frozen=True)
+class OrjsonJsonCodec:
+    """`orjson`-backed codec; payloads orjson cannot encode (e.g. >64-bit ints) use stdlib."""
+
+    module: ModuleType
+    name: str = "orjson"
+
+    def dumps(self, payload: object, *, compact: bool = False) -> bytes:
+        option = self.module.OPT_SORT_KEYS
+        if not compact:
+            option |= self.module.OPT_INDENT_2
+        try:
+            return cast(bytes, self.module.dumps(payload, option=option))
+        except TypeError:
+            return StdlibJsonCodec().dumps(payload, compact=compact)
+
+    def loads(self, data: bytes | str) -> JsonValue:
+        return cast(JsonValue, self.module.loads(data))
+
+
+@lru_cache(maxsize=1)
+def default_codec() -> JsonCodec:
+    """The process codec: `orjson` when it is installed, the stdlib `json` module otherwise."""
+    try:
+        module = importlib.import_module("orjson")
+    except ImportError:
+        return StdlibJsonCodec()
+    return OrjsonJsonCodec(module=module)
@@ -1,8 +1,6 @@
 from __future__ import annotations
 
 import logging
-import os
-import shutil
 import signal
 import threading
 from dataclasses import dataclass
@@ -15,11 +13,14 @@ from opentelemetry.trace import get_tracer
 from src.config import Config, load_config
 from src.domain.do_file_generator import DoFileGenerator
 from src.domain.output_formatter_service import OutputFormatterService
+from src.domain.queue_notifier import QueueNotifier
+from src.domain.run_cancellation import RunCancellation
 from src.domain.state_machine import JobStateMachine
+from src.domain.worker_queue import WorkerQueue
 from src.domain.worker_service import WorkerRetryPolicy, WorkerService
 from src.infra.audit_logger import LoggingAuditLogger
+from src.infra.durability import configure_durability, flush_durability
 from src.infra.exceptions import SSError
-from src.infra.file_worker_queue import FileWorkerQueue
 from src.infra.fs_do_template_catalog import FileSystemDoTemplateCatalog
 from src.infra.fs_do_template_repository import FileSystemDoTemplateRepository
 from src.infra.job_store_factory import build_job_store
@@ -27,8 +28,13 @@ from src.infra.local_stata_dependency_checker import LocalStataDependencyChecker
 from src.infra.local_stata_runner import LocalStataRunner
 from src.infra.logging_config import configure_logging
 from src.infra.prometheus_metrics import PrometheusMetrics
+from src.infra.queue_notifier_factory import build_queue_notifier
+from src.infra.run_result_cache import build_run_result_cache
 from src.infra.tracing import configure_tracing, context_from_traceparent
+from src.infra.worker_queue_factory import build_worker_queue
 from src.utils.time import utc_now
+from src.worker_pool import run_worker_slots
+from src.worker_startup import require_stata_cmd
 
 logger = logging.getLogger(__name__)
 
@@ -73,84 +79,15 @@ def _install_shutdown_handlers(*, worker_id: str, grace_seconds: float) -> _Shut
     return state
 
 
-def _fail_worker_startup(
-    *,
-    worker_id: str,
-    error_code: str,
-    message: str,
-    context: dict[str, object],
-) -> None:
-    logger.error(
-        "SS_WORKER_STARTUP_FAILED",
-        extra={"worker_id": worker_id, "error_code": error_code, **context},
-    )
-    raise SSError(error_code=error_code, message=message, status_code=500)
-
-
-def _validate_stata_cmd_or_raise(*, worker_id: str, stata_cmd: tuple[str, ...]) -> None:
-    executable = str(stata_cmd[0]).strip()
-    executable_path = Path(executable)
-    looks_like_path = executable_path.is_absolute() or executable_path.parent != Path(".")
-    if looks_like_path:
-        resolved = executable_path
-        if not resolved.is_absolute():
-            resolved = (Path.cwd() / resolved).resolve()
-        if not resolved.is_file():
-            _fail_worker_startup(
-                worker_id=worker_id,
-                error_code="STATA_CMD_INVALID",
-                message=f"SS_STATA_CMD executable not found: {resolved}",
-                context={
-                    "stata_cmd": list(stata_cmd),
-                    "reason": "not_found",
-                    "resolved": str(resolved),
-                },
-            )
-        if not os.access(str(resolved), os.X_OK):
-            _fail_worker_startup(
-                worker_id=worker_id,
-                error_code="STATA_CMD_INVALID",
-                message=f"SS_STATA_CMD executable is not executable: {resolved}",
-                context={
-                    "stata_cmd": list(stata_cmd),
-                    "reason": "not_executable",
-                    "resolved": str(resolved),
-                },
-            )
-        return
-    if shutil.which(executable) is None:
-        _fail_worker_startup(
-            worker_id=worker_id,
-            error_code="STATA_CMD_INVALID",
-            message=f"SS_STATA_CMD executable not found in PATH: {executable}",
-            context={
-                "stata_cmd": list(stata_cmd),
-                "reason": "not_in_path",
-                "executable": executable,
-            },
-        )
-
-
-def _require_stata_cmd(*, worker_id: str, stata_cmd: tuple[str, ...]) -> tuple[str, ...]:
-    if not stata_cmd:
-        _fail_worker_startup(
-            worker_id=worker_id,
-            error_code="STATA_CMD_NOT_CONFIGURED",
-            message="SS_STATA_CMD is required to start worker (no runtime fake runner fallback)",
-            context={"missing": ["SS_STATA_CMD"]},
-        )
-    _validate_stata_cmd_or_raise(worker_id=worker_id, stata_cmd=stata_cmd)
-    return stata_cmd
-
-
 def _build_runner(
     *,
     worker_id: str,
     jobs_dir: Path,
     stata_cmd: tuple[str, ...],
+    cancellation: RunCancellation,
 ) -> LocalStataRunner:
-    configured = _require_stata_cmd(worker_id=worker_id, stata_cmd=stata_cmd)
-    runner = LocalStataRunner(jobs_dir=jobs_dir, stata_cmd=configured)
+    configured = require_stata_cmd(worker_id=worker_id, stata_cmd=stata_cmd)
+    runner = LocalStataRunner(jobs_dir=jobs_dir, stata_cmd=configured, cancellation=cancellation)
     logger.info(
         "SS_WORKER_RUNNER_SELECTED",
         extra={"worker_id": worker_id, "runner": "local", "stata_cmd": list(configured)},
@@ -176,20 +113,19 @@ def _build_worker_service(
     *,
     config: Config,
     metrics: PrometheusMetrics,
-) -> tuple[WorkerService, FileWorkerQueue]:
-    store = build_job_store(config=config)
-    queue = FileWorkerQueue(
-        queue_dir=config.queue_dir,
-        lease_ttl_seconds=config.queue_lease_ttl_seconds,
-    )
+) -> tuple[WorkerService, WorkerQueue]:
+    store = build_job_store(config=config, metrics=metrics)
+    queue = build_worker_queue(config=config)
+    cancellation = RunCancellation()
     runner = _build_runner(
         worker_id=config.worker_id,
         jobs_dir=config.jobs_dir,
         stata_cmd=config.stata_cmd,
+        cancellation=cancellation,
     )
     dependency_checker = LocalStataDependencyChecker(
         jobs_dir=config.jobs_dir,
-        stata_cmd=_require_stata_cmd(worker_id=config.worker_id, stata_cmd=config.stata_cmd),
+        stata_cmd=require_stata_cmd(worker_id=config.worker_id, stata_cmd=config.stata_cmd),
     )
     do_template_repo = _wire_do_template_library(library_dir=config.do_template_library_dir)
     service = WorkerService(
@@ -208,17 +144,29 @@ def _build_worker_service(
         do_file_generator=DoFileGenerator(do_template_repo=do_template_repo),
         metrics=metrics,
         audit=LoggingAuditLogger(),
+        composition_max_parallel_steps=config.composition_max_parallel_steps,
+        run_cancellation=cancellation,
+        run_result_cache=build_run_result_cache(config=config, metrics=metrics),
     )
     return service, queue
 
 
+def _interrupt_on_shutdown(*, shutdown: _ShutdownState, notifier: QueueNotifier) -> None:
+    def _watch() -> None:
+        shutdown.requested.wait()
+        notifier.interrupt()
+
+    threading.Thread(target=_watch, name="queue-notifier-shutdown", daemon=True).start()
+
+
 def _run_worker_loop(
     *,
     worker_id: str,
     config: Config,
     service: WorkerService,
-    queue: FileWorkerQueue,
+    queue: WorkerQueue,
     shutdown: _ShutdownState,
+    notifier: QueueNotifier | None = None,
 ) -> None:
     def _stop_requested() -> bool:
         return shutdown.requested.is_set()
@@ -229,7 +177,10 @@ def _run_worker_loop(
     while not shutdown.requested.is_set():
         claim = queue.claim(worker_id=worker_id)
         if claim is None:
-            shutdown.requested.wait(timeout=config.worker_idle_sleep_seconds)
+            if notifier is None:
+                shutdown.requested.wait(timeout=config.worker_idle_sleep_seconds)
+            else:
+                notifier.wait(timeout_seconds=config.worker_idle_sleep_seconds)
             continue
 
         ctx = None if claim.traceparent is None else context_from_traceparent(claim.traceparent)
@@ -245,27 +196,68 @@ def _run_worker_loop(
             )
 
 
+def _run_worker_slot(
+    *,
+    worker_id: str,
+    config: Config,
+    service: WorkerService,
+    queue: WorkerQueue,
+    shutdown: _ShutdownState,
+) -> None:
+    """Run one slot's claim loop with a notifier of its own.
+
+    A notifier's signals are consumed by whichever `wait` drains them, so slots sharing one
+    would let a burst of enqueues wake a single slot while the rest sleep out their idle
+    timeout. Per-slot notifiers each receive every signal.
+    """
+    notifier = build_queue_notifier(config=config)
+    if notifier is not None:
+        _interrupt_on_shutdown(shutdown=shutdown, notifier=notifier)
+    try:
+        _run_worker_loop(
+            worker_id=worker_id,
+            config=config,
+            service=service,
+            queue=queue,
+            shutdown=shutdown,
+            notifier=notifier,
+        )
+    finally:
+        if notifier is not None:
+            notifier.close()
+
+
 def main() -> None:
     config = load_config()
     configure_logging(log_level=config.log_level)
     configure_tracing(config=config, component="worker")
     metrics = _start_metrics(worker_id=config.worker_id, port=config.worker_metrics_port)
+    configure_durability(config=config, metrics=metrics)
     try:
         shutdown = _install_shutdown_handlers(
             worker_id=config.worker_id,
             grace_seconds=config.worker_shutdown_grace_seconds,
         )
         service, queue = _build_worker_service(config=config, metrics=metrics)
-        logger.info("SS_WORKER_STARTUP", extra={"worker_id": config.worker_id})
-        _run_worker_loop(
+        logger.info(
+            "SS_WORKER_STARTUP",
+            extra={"worker_id": config.worker_id, "concurrency": config.worker_concurrency},
+        )
+        run_worker_slots(
             worker_id=config.worker_id,
-            config=config,
-            service=service,
-            queue=queue,
-            shutdown=shutdown,
+            concurrency=config.worker_concurrency,
+            shutdown_requested=shutdown.requested,
+            run_slot=lambda slot_worker_id: _run_worker_slot(
+                worker_id=slot_worker_id,
+                config=config,
+                service=service,
+                queue=queue,
+                shutdown=shutdown,
+            ),
         )
     finally:
         metrics.set_worker_up(worker_id=config.worker_id, up=False)
+        flush_durability()
         logger.info("SS_WORKER_SHUTDOWN_COMPLETE", extra={"worker_id": config.worker_id})
 
 
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import logging
+import threading
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+
+def slot_worker_ids(*, worker_id: str, concurrency: int) -> tuple[str, ...]:
+    """Worker ids used by each slot; a single slot keeps the plain process worker id."""
+    if concurrency <= 1:
+        return (worker_id,)
+    return tuple(f"{worker_id}-slot{index}" for index in range(concurrency))
+
+
+def run_worker_slots(
+    *,
+    worker_id: str,
+    concurrency: int,
+    shutdown_requested: threading.Event,
+    run_slot: Callable[[str], None],
+) -> None:
+    """Run `run_slot(slot_worker_id)` once per slot and wait for every slot to return.
+
+    Each slot claims on its own only after finishing its previous job, so a full pool stops
+    claiming (backpressure) and the queue lease of an unclaimed job is never held idle.
+    A slot that crashes requests shutdown for the whole pool; the first error is re-raised
+    once the remaining slots have drained.
+    """
+    slot_ids = slot_worker_ids(worker_id=worker_id, concurrency=concurrency)
+    if len(slot_ids) == 1:
+        run_slot(slot_ids[0])
+        return
+
+    errors: list[BaseException] = []
+
+    def _slot_main(slot_id: str) -> None:
+        try:
+            run_slot(slot_id)
+        except BaseException as e:
+            logger.exception(
+                "SS_WORKER_SLOT_CRASHED",
+                extra={"worker_id": worker_id, "slot_worker_id": slot_id},
+            )
+            errors.append(e)
+            shutdown_requested.set()
+
+    threads = [
+        threading.Thread(target=_slot_main, args=(slot_id,), name=slot_id) for slot_id in slot_ids
+    ]
+    for thread in threads:
+        thread.start()
+    logger.info(
+        "SS_WORKER_SLOTS_STARTED",
+        extra={"worker_id": worker_id, "concurrency": len(slot_ids)},
+    )
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
+import json
 import threading
-from collections import Counter
+import time
+from collections import Counter, defaultdict
 from concurrent.futures import ThreadPoolExecutor
 
 
@@ -39,3 +41,61 @@ def test_multi_worker_claims_each_job_exactly_once(
     assert all(value == 1 for value in counts.values())
     assert list((queue_dir / "queued").glob("*.json")) == []
     assert list((queue_dir / "claimed").glob("*.json")) == []
+
+
+_BULK_TENANT = "tenant-a-bulk"
+_SMALL_TENANTS = tuple(f"tenant-small-{i}" for i in range(4))
+
+
+def _percentile(values: list[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+def test_multi_worker_fairness_benchmark_reports_per_tenant_wait_percentiles(
+    queue,
+    record_property,
+) -> None:
+    """Bulk tenant enqueued first, small tenants after; run with `-s` to see the report.
+
+    Waits are measured both in claim order (deterministic, asserted) and wall-clock ms.
+    """
+    for i in range(120):
+        queue.enqueue(job_id=f"bulk-{i:03d}", tenant_id=_BULK_TENANT)
+    for tenant_id in _SMALL_TENANTS:
+        for i in range(10):
+            queue.enqueue(job_id=f"{tenant_id}-{i:02d}", tenant_id=tenant_id)
+    started = time.monotonic()
+    claim_ranks: dict[str, list[float]] = defaultdict(list)
+    wait_ms: dict[str, list[float]] = defaultdict(list)
+    lock = threading.Lock()
+    barrier = threading.Barrier(4)
+
+    def _work(worker_id: str) -> None:
+        barrier.wait()
+        while (claim := queue.claim(worker_id=worker_id)) is not None:
+            with lock:
+                claim_ranks[claim.tenant_id].append(sum(map(len, claim_ranks.values())))
+                wait_ms[claim.tenant_id].append((time.monotonic() - started) * 1000)
+            queue.ack(claim=claim)
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        for future in [pool.submit(_work, f"worker-{i}") for i in range(4)]:
+            future.result()
+
+    report = {
+        tenant_id: {
+            "jobs": len(ranks),
+            "rank_p50": _percentile(ranks, 50),
+            "rank_p95": _percentile(ranks, 95),
+            "wait_ms_p50": round(_percentile(wait_ms[tenant_id], 50), 2),
+            "wait_ms_p95": round(_percentile(wait_ms[tenant_id], 95), 2),
+            "wait_ms_p99": round(_percentile(wait_ms[tenant_id], 99), 2),
+        }
+        for tenant_id, ranks in sorted(claim_ranks.items())
+    }
+    record_property("queue_fairness", json.dumps(report, sort_keys=True))
+    bulk_p50 = report[_BULK_TENANT]["rank_p50"]
+    assert all(report[t]["jobs"] == 10 for t in _SMALL_TENANTS)
+    assert all(report[t]["rank_p95"] < bulk_p50 for t in _SMALL_TENANTS)
@@ -28,6 +28,12 @@ def jobs_dir(tmp_path: Path) -> Path:
     return tmp_path / "jobs"
 
 
+@pytest.fixture(autouse=True)
+def _default_jobs_dir(jobs_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Apps built from the environment (startup index, preview cache) stay out of the repo.
+    monkeypatch.setenv("SS_JOBS_DIR", str(jobs_dir))
+
+
 @pytest.fixture
 def do_template_library_dir() -> Path:
     return Path(__file__).resolve().parents[1] / "assets" / "stata_do_library"
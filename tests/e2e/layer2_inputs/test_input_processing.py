@@ -189,7 +189,7 @@ async def test_upload_empty_file_returns_400(e2e_client: httpx.AsyncClient) -> N
     assert uploaded.json()["error_code"] == "INPUT_EMPTY_FILE"
 
 
-async def test_csv_gbk_encoding_preview_returns_400(e2e_client: httpx.AsyncClient) -> None:
+async def test_csv_gbk_encoding_preview_is_decoded(e2e_client: httpx.AsyncClient) -> None:
     job_id, _token = await redeem_job(
         client=e2e_client,
         task_code="tc_e2e_inputs_gbk",
@@ -206,8 +206,9 @@ async def test_csv_gbk_encoding_preview_returns_400(e2e_client: httpx.AsyncClien
     assert uploaded.status_code == 200
 
     preview = await e2e_client.get(f"/v1/jobs/{job_id}/inputs/preview")
-    assert preview.status_code == 400
-    assert preview.json()["error_code"] == "INPUT_PARSE_FAILED"
+    assert preview.status_code == 200
+    assert preview.json()["row_count"] == 1
+    assert preview.json()["sample_rows"] == [{"id": 1, "城市": "上海"}]
 
 
 async def test_excel_select_sheet_and_missing_sheet_returns_400(
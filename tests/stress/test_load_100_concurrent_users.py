@@ -5,12 +5,18 @@ import threading
 import time
 import uuid
 from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import partial
 from pathlib import Path
 
+import anyio
+import httpx
 import pytest
 from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
+from src.api import deps
+from src.utils.json_types import JsonObject
+from tests.asgi_client import asgi_client
 from tests.stress._metrics import (
     LatencyRecorder,
     env_float,
@@ -49,48 +55,50 @@ def _recorded_post(
     return response
 
 
-def _create_job(*, app: FastAPI, recorder: LatencyRecorder) -> tuple[str, str]:
-    with TestClient(app) as client:
-        requirement = f"stress-{uuid.uuid4()}"
-        response = _recorded_post(
-            client=client,
-            recorder=recorder,
-            url="/v1/task-codes/redeem",
-            json_payload={"task_code": f"tc_stress_{uuid.uuid4()}", "requirement": requirement},
-        )
-        payload = response.json()
-        return str(payload["job_id"]), str(payload["token"])
+def _create_job(*, client: TestClient, recorder: LatencyRecorder) -> tuple[str, str]:
+    requirement = f"stress-{uuid.uuid4()}"
+    response = _recorded_post(
+        client=client,
+        recorder=recorder,
+        url="/v1/task-codes/redeem",
+        json_payload={"task_code": f"tc_stress_{uuid.uuid4()}", "requirement": requirement},
+    )
+    payload = response.json()
+    return str(payload["job_id"]), str(payload["token"])
 
 
-def _preview_job(*, app: FastAPI, recorder: LatencyRecorder, job_id: str, token: str) -> None:
-    with TestClient(app) as client:
-        _recorded_get(
-            client=client,
-            recorder=recorder,
-            url=f"/v1/jobs/{job_id}/draft/preview",
-            headers={"Authorization": f"Bearer {token}"},
-        )
+def _preview_job(*, client: TestClient, recorder: LatencyRecorder, job_id: str, token: str) -> None:
+    _recorded_get(
+        client=client,
+        recorder=recorder,
+        url=f"/v1/jobs/{job_id}/draft/preview",
+        headers={"Authorization": f"Bearer {token}"},
+    )
 
 
-def _confirm_job(*, app: FastAPI, recorder: LatencyRecorder, job_id: str, token: str) -> None:
-    with TestClient(app) as client:
-        _recorded_post(
-            client=client,
-            recorder=recorder,
-            url=f"/v1/jobs/{job_id}/confirm",
-            json_payload={"confirmed": True},
-            headers={"Authorization": f"Bearer {token}"},
-        )
+def _confirm_job(*, client: TestClient, recorder: LatencyRecorder, job_id: str, token: str) -> None:
+    _recorded_post(
+        client=client,
+        recorder=recorder,
+        url=f"/v1/jobs/{job_id}/confirm",
+        json_payload={
+            "confirmed": True,
+            "variable_corrections": {},
+            "answers": {},
+            "default_overrides": {},
+            "expert_suggestions_feedback": {},
+        },
+        headers={"Authorization": f"Bearer {token}"},
+    )
 
 
-def _poll_job(*, app: FastAPI, recorder: LatencyRecorder, job_id: str, token: str) -> None:
-    with TestClient(app) as client:
-        _recorded_get(
-            client=client,
-            recorder=recorder,
-            url=f"/v1/jobs/{job_id}",
-            headers={"Authorization": f"Bearer {token}"},
-        )
+def _poll_job(*, client: TestClient, recorder: LatencyRecorder, job_id: str, token: str) -> None:
+    _recorded_get(
+        client=client,
+        recorder=recorder,
+        url=f"/v1/jobs/{job_id}",
+        headers={"Authorization": f"Bearer {token}"},
+    )
 
 
 def _worker_loop(*, worker, worker_id: str, stop: threading.Event) -> None:
@@ -114,15 +122,17 @@ def _start_workers(*, stress_worker_factory) -> tuple[threading.Event, list[thre
     return stop, threads
 
 
-def _run_users(*, app: FastAPI, recorder: LatencyRecorder, users: int) -> list[tuple[str, str]]:
+def _run_users(
+    *, client: TestClient, recorder: LatencyRecorder, users: int
+) -> list[tuple[str, str]]:
     jobs: list[tuple[str, str]] = []
     with ThreadPoolExecutor(max_workers=users) as pool:
-        futures = [pool.submit(_create_job, app=app, recorder=recorder) for _ in range(users)]
+        futures = [pool.submit(_create_job, client=client, recorder=recorder) for _ in range(users)]
         for f in as_completed(futures):
             jobs.append(f.result())
     with ThreadPoolExecutor(max_workers=min(users, 100)) as pool:
         futures = [
-            pool.submit(_preview_job, app=app, recorder=recorder, job_id=job_id, token=token)
+            pool.submit(_preview_job, client=client, recorder=recorder, job_id=job_id, token=token)
             for job_id, token in jobs
         ]
         for f in as_completed(futures):
@@ -132,13 +142,13 @@ def _run_users(*, app: FastAPI, recorder: LatencyRecorder, users: int) -> list[t
 
 def _run_confirmations(
     *,
-    app: FastAPI,
+    client: TestClient,
     recorder: LatencyRecorder,
     jobs: list[tuple[str, str]],
 ) -> None:
     with ThreadPoolExecutor(max_workers=min(len(jobs), 50)) as pool:
         futures = [
-            pool.submit(_confirm_job, app=app, recorder=recorder, job_id=job_id, token=token)
+            pool.submit(_confirm_job, client=client, recorder=recorder, job_id=job_id, token=token)
             for job_id, token in jobs
         ]
         for f in as_completed(futures):
@@ -147,7 +157,7 @@ def _run_confirmations(
 
 def _run_polls(
     *,
-    app: FastAPI,
+    client: TestClient,
     recorder: LatencyRecorder,
     jobs: list[tuple[str, str]],
     queries: int,
@@ -155,7 +165,7 @@ def _run_polls(
     targets = [random.choice(jobs) for _ in range(queries)]
     with ThreadPoolExecutor(max_workers=min(queries, 100)) as pool:
         futures = [
-            pool.submit(_poll_job, app=app, recorder=recorder, job_id=job_id, token=token)
+            pool.submit(_poll_job, client=client, recorder=recorder, job_id=job_id, token=token)
             for job_id, token in targets
         ]
         for f in as_completed(futures):
@@ -164,7 +174,7 @@ def _run_polls(
 
 def _wait_for_terminal_runs(
     *,
-    app: FastAPI,
+    client: TestClient,
     recorder: LatencyRecorder,
     run_jobs: list[tuple[str, str]],
     timeout_seconds: float,
@@ -173,27 +183,45 @@ def _wait_for_terminal_runs(
     tokens = {job_id: token for job_id, token in run_jobs}
     remaining = {job_id for job_id, _token in run_jobs}
     deadline = time.monotonic() + timeout_seconds
-    with TestClient(app) as client:
-        while remaining and time.monotonic() < deadline:
-            done: set[str] = set()
-            for job_id in remaining:
-                response = _recorded_get(
-                    client=client,
-                    recorder=recorder,
-                    url=f"/v1/jobs/{job_id}",
-                    headers={"Authorization": f"Bearer {tokens[job_id]}"},
-                )
-                if response.status_code >= 400:
-                    continue
-                status = response.json().get("status")
-                if status in terminal:
-                    done.add(job_id)
-            remaining -= done
-            if remaining:
-                time.sleep(0.05)
+    while remaining and time.monotonic() < deadline:
+        done: set[str] = set()
+        for job_id in remaining:
+            response = _recorded_get(
+                client=client,
+                recorder=recorder,
+                url=f"/v1/jobs/{job_id}",
+                headers={"Authorization": f"Bearer {tokens[job_id]}"},
+            )
+            if response.status_code >= 400:
+                continue
+            status = response.json().get("status")
+            if status in terminal:
+                done.add(job_id)
+        remaining -= done
+        if remaining:
+            time.sleep(0.05)
     assert not remaining, f"runs did not reach terminal status within timeout: {sorted(remaining)}"
 
 
+class _SlowPreviewService:
+    def __init__(self, *, seconds: float) -> None:
+        self._seconds = seconds
+
+    def preview_primary_dataset(
+        self, *, tenant_id: str, job_id: str, rows: int, columns: int
+    ) -> JsonObject:
+        time.sleep(self._seconds)
+        return {"job_id": job_id}
+
+
+async def _timed_get(
+    *, client: httpx.AsyncClient, recorder: LatencyRecorder, url: str, headers: dict[str, str]
+) -> None:
+    start = time.monotonic()
+    response = await client.get(url, headers=headers)
+    recorder.record(duration_ms=(time.monotonic() - start) * 1000.0, ok=response.status_code < 400)
+
+
 def _join_workers(*, stop: threading.Event, threads: list[threading.Thread]) -> None:
     stop.set()
     for t in threads:
@@ -218,19 +246,23 @@ def test_load_100_concurrent_users_50_runs_200_queries_meets_slo(
     recorder = LatencyRecorder()
     resources_before = take_resource_snapshot()
 
-    jobs = _run_users(app=stress_app, recorder=recorder, users=users)
-    run_jobs = jobs[:runs]
-    _run_confirmations(app=stress_app, recorder=recorder, jobs=run_jobs)
-
-    stop, threads = _start_workers(stress_worker_factory=stress_worker_factory)
-    _run_polls(app=stress_app, recorder=recorder, jobs=jobs, queries=queries)
-    _wait_for_terminal_runs(
-        app=stress_app,
-        recorder=recorder,
-        run_jobs=run_jobs,
-        timeout_seconds=run_timeout_seconds,
-    )
-    _join_workers(stop=stop, threads=threads)
+    # One client = one event loop shared by every user thread, like a single uvicorn worker.
+    with TestClient(stress_app) as client:
+        jobs = _run_users(client=client, recorder=recorder, users=users)
+        run_jobs = jobs[:runs]
+        _run_confirmations(client=client, recorder=recorder, jobs=run_jobs)
+
+        stop, threads = _start_workers(stress_worker_factory=stress_worker_factory)
+        try:
+            _run_polls(client=client, recorder=recorder, jobs=jobs, queries=queries)
+            _wait_for_terminal_runs(
+                client=client,
+                recorder=recorder,
+                run_jobs=run_jobs,
+                timeout_seconds=run_timeout_seconds,
+            )
+        finally:
+            _join_workers(stop=stop, threads=threads)
 
     summary = recorder.summary()
     resources_after = take_resource_snapshot()
@@ -270,3 +302,44 @@ def test_get_job_latency_benchmark(benchmark, stress_app: FastAPI) -> None:
             assert r.status_code == 200
 
         benchmark(_call)
+
+
+@pytest.mark.anyio
+async def test_cheap_endpoint_p99_stays_flat_while_previews_block(stress_app: FastAPI) -> None:
+    previews = env_int("SS_STRESS_SLOW_PREVIEWS", 20)
+    queries = env_int("SS_STRESS_QUERIES", 200)
+    preview_seconds = env_float("SS_STRESS_PREVIEW_SECONDS", 0.5)
+    max_p99_seconds = env_float("SS_STRESS_MAX_CHEAP_P99_SECONDS", 0.25)
+    stress_app.dependency_overrides[deps.get_job_inputs_service] = lambda: _SlowPreviewService(
+        seconds=preview_seconds
+    )
+    cheap = LatencyRecorder()
+    slow = LatencyRecorder()
+
+    async with asgi_client(app=stress_app) as client:
+        redeemed = await client.post(
+            "/v1/task-codes/redeem",
+            json={"task_code": f"tc_flat_{uuid.uuid4()}", "requirement": "flat-p99"},
+        )
+        job_id = redeemed.json()["job_id"]
+        headers = {"Authorization": f"Bearer {redeemed.json()['token']}"}
+        preview_every = max(1, queries // max(1, previews))
+        async with anyio.create_task_group() as tg:
+            for index in range(queries):
+                if index % preview_every == 0:
+                    tg.start_soon(
+                        partial(
+                            _timed_get,
+                            client=client,
+                            recorder=slow,
+                            url=f"/v1/jobs/{job_id}/inputs/preview",
+                            headers=headers,
+                        )
+                    )
+                await _timed_get(
+                    client=client, recorder=cheap, url=f"/v1/jobs/{job_id}", headers=headers
+                )
+
+    assert slow.summary().errors == 0
+    assert cheap.summary().error_rate == 0.0
+    assert (cheap.summary().p99_ms / 1000.0) < max_p99_seconds
@@ -55,9 +55,10 @@ class _FakeJobService:
     def __init__(self, *, store: JobStore) -> None:
         self._store = store
 
-    def trigger_run(self, *, tenant_id: str, job_id: str) -> Job:
+    def trigger_run(self, *, tenant_id: str, job_id: str, bypass_run_cache: bool = False) -> Job:
         job = self._store.load(job_id, tenant_id=tenant_id)
         job.status = JobStatus.QUEUED
+        job.run_cache_bypass = bypass_run_cache
         job.scheduled_at = datetime.now(timezone.utc).isoformat()
         self._store.save(job, tenant_id=tenant_id)
         return job
@@ -194,3 +195,26 @@ async def test_admin_job_retry_sets_scheduled_at(tmp_path: Path) -> None:
     assert retried.status_code == 200
     assert retried.json()["status"] == "queued"
     assert retried.json()["scheduled_at"] is not None
+
+
+async def test_admin_jobs_list_paginates_with_cursor(tmp_path: Path) -> None:
+    app = create_app()
+    config = _test_config(tmp_path=tmp_path)
+    store = JobStore(jobs_dir=config.jobs_dir)
+    app.dependency_overrides[deps.get_config] = async_override(config)
+    default_job_id, tenant_job_id = _seed_jobs(config=config, store=store)
+
+    async with asgi_client(app=app) as client:
+        auth_headers = await _admin_auth_headers(client=client)
+        first = await client.get("/api/admin/jobs?limit=1", headers=auth_headers)
+        cursor = first.json()["next_cursor"]
+        second = await client.get(f"/api/admin/jobs?limit=1&cursor={cursor}", headers=auth_headers)
+        invalid = await client.get("/api/admin/jobs?cursor=bogus", headers=auth_headers)
+
+    assert first.status_code == 200
+    assert second.status_code == 200
+    listed = [job["job_id"] for job in [*first.json()["jobs"], *second.json()["jobs"]]]
+    assert sorted(listed) == sorted([default_job_id, tenant_job_id])
+    assert second.json()["next_cursor"] is None
+    assert invalid.status_code == 400
+    assert invalid.json()["error_code"] == "ADMIN_JOB_CURSOR_INVALID"
@@ -119,6 +119,77 @@ async def test_download_job_artifact_with_symlink_escape_returns_400(job_service
     assert response.json()["error_code"] == "ARTIFACT_PATH_UNSAFE"
 
 
+def _seed_artifact(*, store, jobs_dir, job_id: str, content: bytes) -> None:
+    persisted = store.load(job_id)
+    persisted.artifacts_index = [
+        ArtifactRef(kind=ArtifactKind.RUN_STDOUT, rel_path="artifacts/result.log")
+    ]
+    store.save(persisted)
+    job_dir = resolve_job_dir(jobs_dir=jobs_dir, job_id=job_id)
+    assert job_dir is not None
+    path = job_dir / "artifacts" / "result.log"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(content)
+
+
+async def test_download_job_artifact_supports_range_and_conditional_get(
+    job_service, store, jobs_dir
+):
+    # Arrange
+    app = create_app()
+    app.dependency_overrides[deps.get_artifacts_service] = async_override(
+        ArtifactsService(store=store, jobs_dir=jobs_dir)
+    )
+    job = job_service.create_job(requirement="hello")
+    _seed_artifact(store=store, jobs_dir=jobs_dir, job_id=job.job_id, content=b"0123456789")
+    url = f"/v1/jobs/{job.job_id}/artifacts/artifacts/result.log"
+
+    # Act
+    async with asgi_client(app=app) as client:
+        full = await client.get(url)
+        ranged = await client.get(url, headers={"Range": "bytes=2-5"})
+        by_etag = await client.get(url, headers={"If-None-Match": full.headers["etag"]})
+        by_date = await client.get(
+            url, headers={"If-Modified-Since": full.headers["last-modified"]}
+        )
+        stale = await client.get(url, headers={"If-None-Match": '"other"'})
+
+    # Assert
+    assert full.status_code == 200
+    assert full.content == b"0123456789"
+    assert "attachment" in full.headers["content-disposition"]
+    assert ranged.status_code == 206
+    assert ranged.content == b"2345"
+    assert (by_etag.status_code, by_etag.content) == (304, b"")
+    assert by_date.status_code == 304
+    assert stale.status_code == 200
+
+
+async def test_download_job_artifact_when_repeated_skips_job_reload(
+    job_service, store, jobs_dir, monkeypatch
+):
+    # Arrange
+    svc = ArtifactsService(store=store, jobs_dir=jobs_dir)
+    job = job_service.create_job(requirement="hello")
+    _seed_artifact(store=store, jobs_dir=jobs_dir, job_id=job.job_id, content=b"log")
+    svc.resolve_download_path(job_id=job.job_id, rel_path="artifacts/result.log")
+    loads: list[str] = []
+    original_load = store.load
+
+    def _counting_load(job_id: str, **kwargs):
+        loads.append(job_id)
+        return original_load(job_id, **kwargs)
+
+    monkeypatch.setattr(store, "load", _counting_load)
+
+    # Act
+    path = svc.resolve_download_path(job_id=job.job_id, rel_path="artifacts/result.log")
+
+    # Assert
+    assert path.read_bytes() == b"log"
+    assert loads == []
+
+
 async def test_run_job_when_called_twice_is_idempotent(job_service, store, draft_service):
     app = create_app()
     app.dependency_overrides[deps.get_job_service] = async_override(job_service)
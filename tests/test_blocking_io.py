@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+import anyio
+import pytest
+
+from src.api import deps
+from src.api.blocking_io import BlockingIO
+from src.domain.draft_service import DraftService
+from src.domain.job_query_service import JobQueryService
+from src.domain.models import Job
+from src.infra.file_job_workspace_store import FileJobWorkspaceStore
+from src.infra.job_store import JobStore
+from src.infra.prometheus_metrics import PrometheusMetrics
+from src.main import create_app
+from src.utils.json_types import JsonObject
+from src.utils.tenancy import DEFAULT_TENANT_ID
+from tests.asgi_client import asgi_client
+from tests.async_overrides import async_override
+from tests.fakes.fake_llm_client import FakeLLMClient
+
+pytestmark = pytest.mark.anyio
+
+
+class _BlockingSaveStore(JobStore):
+    def __init__(self, *, jobs_dir: Path) -> None:
+        super().__init__(jobs_dir=jobs_dir)
+        self.entered = threading.Event()
+        self.release = threading.Event()
+        self.finished = threading.Event()
+
+    def save(self, job: Job, *, tenant_id: str = DEFAULT_TENANT_ID) -> None:
+        self.entered.set()
+        self.release.wait(timeout=5.0)
+        super().save(job, tenant_id=tenant_id)
+        self.finished.set()
+
+
+class _BlockingPreviewService:
+    def __init__(self) -> None:
+        self.entered = threading.Event()
+        self.release = threading.Event()
+        self.finished = threading.Event()
+
+    def preview_primary_dataset(
+        self, *, tenant_id: str, job_id: str, rows: int, columns: int
+    ) -> JsonObject:
+        self.entered.set()
+        self.release.wait(timeout=5.0)
+        self.finished.set()
+        return {"job_id": job_id}
+
+
+async def test_run_with_bounded_pool_limits_concurrent_calls() -> None:
+    # Arrange
+    io = BlockingIO(max_workers=2)
+    lock = threading.Lock()
+    running = 0
+    peak = 0
+
+    def _work() -> None:
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        time.sleep(0.02)
+        with lock:
+            running -= 1
+
+    # Act
+    async with anyio.create_task_group() as tg:
+        for _ in range(6):
+            tg.start_soon(io.run, _work)
+
+    # Assert
+    assert peak == 2
+
+
+async def test_run_records_wait_and_duration_by_operation() -> None:
+    # Arrange
+    metrics = PrometheusMetrics()
+    io = BlockingIO(max_workers=1, metrics=metrics)
+
+    def load_thing(*, value: int) -> int:
+        return value * 2
+
+    # Act
+    result = await io.run(load_thing, value=21)
+
+    # Assert
+    rendered = metrics.render_latest().decode("utf-8")
+    assert result == 42
+    assert 'ss_api_blocking_io_duration_seconds_count{operation="load_thing"} 1.0' in rendered
+    assert "ss_api_blocking_io_wait_seconds_count 1.0" in rendered
+    assert "ss_api_blocking_io_inflight 0.0" in rendered
+
+
+async def test_get_job_while_preview_blocks_on_disk_still_answers(job_service, store) -> None:
+    # Arrange
+    app = create_app()
+    preview_svc = _BlockingPreviewService()
+    app.dependency_overrides[deps.get_job_service] = async_override(job_service)
+    app.dependency_overrides[deps.get_job_query_service] = async_override(
+        JobQueryService(store=store)
+    )
+    app.dependency_overrides[deps.get_job_inputs_service] = async_override(preview_svc)
+    job = job_service.create_job(requirement="hello")
+
+    async with asgi_client(app=app) as client:
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(client.get, f"/v1/jobs/{job.job_id}/inputs/preview")
+            while not preview_svc.entered.is_set():
+                await anyio.sleep(0.01)
+
+            # Act
+            response = await client.get(f"/v1/jobs/{job.job_id}")
+            preview_still_blocked = not preview_svc.finished.is_set()
+            preview_svc.release.set()
+
+    # Assert
+    assert response.status_code == 200
+    assert preview_still_blocked
+
+
+async def test_get_job_while_draft_preview_blocks_on_save_still_answers(
+    job_service, store, state_machine, jobs_dir
+) -> None:
+    # Arrange
+    app = create_app()
+    blocking_store = _BlockingSaveStore(jobs_dir=jobs_dir)
+    draft_svc = DraftService(
+        store=blocking_store,
+        llm=FakeLLMClient(),
+        state_machine=state_machine,
+        workspace=FileJobWorkspaceStore(jobs_dir=jobs_dir),
+    )
+    app.dependency_overrides[deps.get_job_query_service] = async_override(
+        JobQueryService(store=store)
+    )
+    app.dependency_overrides[deps.get_draft_service] = async_override(draft_svc)
+    job = job_service.create_job(requirement="hello")
+
+    async with asgi_client(app=app) as client:
+        async with anyio.create_task_group() as tg:
+            tg.start_soon(client.get, f"/v1/jobs/{job.job_id}/draft/preview")
+            while not blocking_store.entered.is_set():
+                await anyio.sleep(0.01)
+
+            # Act
+            response = await client.get(f"/v1/jobs/{job.job_id}")
+            preview_still_blocked = not blocking_store.finished.is_set()
+            blocking_store.release.set()
+
+    # Assert
+    assert response.status_code == 200
+    assert preview_still_blocked
@@ -0,0 +1,157 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from src.domain.models import JOB_SCHEMA_VERSION_CURRENT, Draft, Job, JobStatus
+from src.infra.caching_job_store import CachingJobStore
+from src.infra.file_job_revisions import FileJobRevisions
+from src.infra.job_store import JobStore as FileJobStore
+from src.infra.prometheus_metrics import PrometheusMetrics
+from src.infra.sqlite_database import SQLiteDatabase
+from src.infra.sqlite_job_store import SQLiteJobStore
+from src.utils.job_workspace import sharded_job_dir
+from src.utils.tenancy import DEFAULT_TENANT_ID
+
+
+class _CountingFileJobStore(FileJobStore):
+    def __init__(self, *, jobs_dir: Path):
+        super().__init__(jobs_dir=jobs_dir)
+        self.loads = 0
+
+    def load(self, job_id: str, *, tenant_id: str = DEFAULT_TENANT_ID) -> Job:
+        self.loads += 1
+        return super().load(job_id, tenant_id=tenant_id)
+
+
+def _job(job_id: str = "job_cached") -> Job:
+    return Job(
+        schema_version=JOB_SCHEMA_VERSION_CURRENT,
+        job_id=job_id,
+        status=JobStatus.CREATED,
+        created_at="2026-01-01T00:00:00+00:00",
+        trace_id="0" * 32,
+    )
+
+
+def _file_cache(
+    jobs_dir: Path, *, metrics: PrometheusMetrics | None = None
+) -> tuple[CachingJobStore, _CountingFileJobStore]:
+    inner = _CountingFileJobStore(jobs_dir=jobs_dir)
+    cache = CachingJobStore(
+        inner=inner, revisions=FileJobRevisions(jobs_dir=jobs_dir), metrics=metrics
+    )
+    return cache, inner
+
+
+def test_load_when_unchanged_serves_copy_from_cache(jobs_dir: Path) -> None:
+    # Arrange
+    cache, inner = _file_cache(jobs_dir)
+    cache.create(_job())
+    first = cache.load("job_cached")
+
+    # Act
+    first.status = JobStatus.FAILED
+    second = cache.load("job_cached")
+    third = cache.load("job_cached")
+
+    # Assert
+    assert inner.loads == 1
+    assert second.status == JobStatus.CREATED
+    assert second is not third
+
+
+def test_load_after_write_by_other_process_rereads_job(jobs_dir: Path) -> None:
+    # Arrange
+    cache, inner = _file_cache(jobs_dir)
+    cache.create(_job())
+    cache.load("job_cached")
+    other = FileJobStore(jobs_dir=jobs_dir)
+    job = other.load("job_cached")
+    job.status = JobStatus.QUEUED
+    other.save(job)
+
+    # Act
+    loaded = cache.load("job_cached")
+
+    # Assert
+    assert inner.loads == 2
+    assert loaded.status == JobStatus.QUEUED
+
+
+def test_load_after_same_size_rewrite_in_place_rereads_job(jobs_dir: Path) -> None:
+    # Arrange
+    cache, inner = _file_cache(jobs_dir)
+    cache.create(_job())
+    cache.load("job_cached")
+    job_dir = sharded_job_dir(jobs_dir=jobs_dir, job_id="job_cached")
+    assert job_dir is not None
+    path = job_dir / "job.json"
+    before = path.stat()
+    original = path.read_text(encoding="utf-8")
+    rewritten = original.replace('"created"', '"running"')
+    assert len(rewritten) == len(original) and rewritten != original
+    path.write_text(rewritten, encoding="utf-8")
+    os.utime(path, ns=(before.st_atime_ns, before.st_mtime_ns))
+
+    # Act
+    loaded = cache.load("job_cached")
+
+    # Assert
+    assert path.stat().st_ino == before.st_ino
+    assert inner.loads == 2
+    assert loaded.status == JobStatus.RUNNING
+
+
+def test_save_and_write_draft_invalidate_cached_job(jobs_dir: Path) -> None:
+    # Arrange
+    cache, inner = _file_cache(jobs_dir)
+    cache.create(_job())
+    job = cache.load("job_cached")
+    job.status = JobStatus.QUEUED
+
+    # Act
+    cache.save(job)
+    after_save = cache.load("job_cached")
+    cache.write_draft(
+        job_id="job_cached", draft=Draft(text="draft", created_at="2026-01-01T00:00:00+00:00")
+    )
+    after_draft = cache.load("job_cached")
+
+    # Assert
+    assert inner.loads == 4  # the file store's write_draft loads the job itself
+    assert after_save.status == JobStatus.QUEUED
+    assert after_draft.draft is not None
+
+
+def test_load_with_sqlite_backend_revalidates_by_version(tmp_path: Path) -> None:
+    # Arrange
+    inner = SQLiteJobStore(db=SQLiteDatabase(path=tmp_path / "ss.sqlite3"), jobs_dir=tmp_path)
+    cache = CachingJobStore(inner=inner, revisions=inner)
+    cache.create(_job())
+    cache.load("job_cached")
+    job = inner.load("job_cached")
+    job.status = JobStatus.QUEUED
+    inner.save(job)
+
+    # Act
+    loaded = cache.load("job_cached")
+
+    # Assert
+    assert loaded.status == JobStatus.QUEUED
+
+
+def test_load_records_hit_and_miss_counters(jobs_dir: Path) -> None:
+    # Arrange
+    metrics = PrometheusMetrics()
+    cache, _ = _file_cache(jobs_dir, metrics=metrics)
+    cache.create(_job())
+
+    # Act
+    for _ in range(3):
+        cache.load("job_cached")
+
+    # Assert
+    rendered = metrics.render_latest().decode("utf-8")
+    assert 'ss_job_cache_lookups_total{result="miss"} 1.0' in rendered
+    assert 'ss_job_cache_lookups_total{result="hit"} 2.0' in rendered
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import json
+import threading
+import time
+import uuid
+from dataclasses import replace
+from pathlib import Path
+
+from src.domain.composition_executor import execute_composition_plan
+from src.domain.do_file_generator import DoFileGenerator
+from src.domain.models import (
+    JOB_SCHEMA_VERSION_CURRENT,
+    Job,
+    JobInputs,
+    JobStatus,
+    LLMPlan,
+    PlanStep,
+    PlanStepType,
+)
+from src.domain.stata_runner import RunError, RunResult
+from src.infra.fs_do_template_repository import FileSystemDoTemplateRepository
+from src.infra.job_store import JobStore
+from src.utils.job_workspace import resolve_job_dir
+from src.utils.time import utc_now
+from tests.fakes.fake_stata_runner import FakeStataRunner
+
+_BRANCHES = ("analyze_a", "analyze_b", "analyze_c", "analyze_d")
+
+
+class _SlowRunner:
+    """FakeStataRunner that holds each run briefly and tracks how many overlap."""
+
+    def __init__(self, *, jobs_dir: Path, fail_step: str | None = None):
+        self._inner = FakeStataRunner(jobs_dir=jobs_dir)
+        self._fail_step = fail_step
+        self._lock = threading.Lock()
+        self._running = 0
+        self.max_running = 0
+        self.run_ids: list[str] = []
+
+    def run(self, *, run_id: str, **kwargs) -> RunResult:
+        with self._lock:
+            self._running += 1
+            self.max_running = max(self.max_running, self._running)
+            self.run_ids.append(run_id)
+        try:
+            time.sleep(0.2)
+            result = self._inner.run(run_id=run_id, **kwargs)
+        finally:
+            with self._lock:
+                self._running -= 1
+        if self._fail_step is not None and run_id.endswith(f"__{self._fail_step}"):
+            return replace(result, ok=False, error=RunError("STATA_RETURN_CODE", "r(198);"))
+        return result
+
+
+def _step(step_id: str, *, bindings: dict[str, str], depends_on: list[str]) -> PlanStep:
+    products = [] if step_id == "aggregate" else [{"product_id": "summary", "kind": "table"}]
+    return PlanStep(
+        step_id=step_id,
+        type=PlanStepType.GENERATE_STATA_DO,
+        params={
+            "composition_mode": "parallel_then_aggregate",
+            "template_id": "TA14",
+            "input_bindings": bindings,
+            "products": products,
+        },
+        depends_on=depends_on,
+        produces=[],
+    )
+
+
+def _plan() -> LLMPlan:
+    branches = [
+        _step(step_id, bindings={"primary_dataset": f"input:{step_id[-1]}"}, depends_on=[])
+        for step_id in _BRANCHES
+    ]
+    aggregate = _step(
+        "aggregate",
+        bindings={
+            "primary_dataset": "prod:analyze_a:summary",
+            "secondary_dataset": "prod:analyze_b:summary",
+        },
+        depends_on=list(_BRANCHES),
+    )
+    return LLMPlan(plan_id="plan-dag", rel_path="artifacts/plan.json", steps=[*branches, aggregate])
+
+
+def _job_with_inputs(*, jobs_dir: Path) -> tuple[Job, Path]:
+    job = Job(
+        schema_version=JOB_SCHEMA_VERSION_CURRENT,
+        job_id=f"job_{uuid.uuid4().hex}",
+        status=JobStatus.RUNNING,
+        created_at=utc_now().isoformat(),
+        requirement="test",
+        inputs=JobInputs(manifest_rel_path="inputs/manifest.json", fingerprint="fp-test"),
+        llm_plan=_plan(),
+    )
+    JobStore(jobs_dir=jobs_dir).create(job)
+    job_dir = resolve_job_dir(jobs_dir=jobs_dir, job_id=job.job_id)
+    assert job_dir is not None
+    (job_dir / "inputs").mkdir(parents=True, exist_ok=True)
+    for key in "abcd":
+        (job_dir / "inputs" / f"{key}.csv").write_text(f"id,x\n1,{key}\n", encoding="utf-8")
+    return job, job_dir
+
+
+def _execute(*, jobs_dir: Path, runner: _SlowRunner, max_parallel_steps: int):
+    job, job_dir = _job_with_inputs(jobs_dir=jobs_dir)
+    return _execute_job(
+        job=job,
+        job_dir=job_dir,
+        run_id="pipeline",
+        runner=runner,
+        max_parallel_steps=max_parallel_steps,
+    )
+
+
+def _execute_job(
+    *, job: Job, job_dir: Path, run_id: str, runner: _SlowRunner, max_parallel_steps: int = 4
+):
+    manifest = {
+        "schema_version": 2,
+        "datasets": [
+            {"dataset_key": key, "role": "primary_dataset", "rel_path": f"inputs/{key}.csv"}
+            for key in "abcd"
+        ],
+    }
+    library_dir = Path(__file__).resolve().parents[1] / "assets" / "stata_do_library"
+    result = execute_composition_plan(
+        job=job,
+        run_id=run_id,
+        jobs_dir=job_dir.parent,
+        runner=runner,
+        inputs_manifest=manifest,
+        shutdown_deadline=None,
+        clock=utc_now,
+        do_file_generator=DoFileGenerator(
+            do_template_repo=FileSystemDoTemplateRepository(library_dir=library_dir)
+        ),
+        max_parallel_steps=max_parallel_steps,
+    )
+    summary_path = job_dir / "runs" / run_id / "artifacts" / "composition_summary.json"
+    return result, json.loads(summary_path.read_text(encoding="utf-8"))
+
+
+def test_independent_branches_run_concurrently_with_the_sequential_summary(
+    tmp_path: Path,
+) -> None:
+    # Arrange
+    sequential_runner = _SlowRunner(jobs_dir=tmp_path / "seq")
+    parallel_runner = _SlowRunner(jobs_dir=tmp_path / "par")
+
+    # Act
+    sequential, sequential_summary = _execute(
+        jobs_dir=tmp_path / "seq", runner=sequential_runner, max_parallel_steps=1
+    )
+    parallel, parallel_summary = _execute(
+        jobs_dir=tmp_path / "par", runner=parallel_runner, max_parallel_steps=4
+    )
+
+    # Assert
+    assert (sequential.ok, parallel.ok) == (True, True)
+    assert (sequential_runner.max_running, parallel_runner.max_running) == (1, 4)
+    assert parallel_summary["steps"] == sequential_summary["steps"]
+    assert parallel_summary["steps"][-1]["step_id"] == "aggregate"
+    assert [ref.rel_path for ref in parallel.artifacts] == [
+        ref.rel_path for ref in sequential.artifacts
+    ]
+
+
+def test_failed_branch_fails_the_pipeline_after_running_branches_finish(tmp_path: Path) -> None:
+    # Arrange
+    runner = _SlowRunner(jobs_dir=tmp_path / "jobs", fail_step="analyze_b")
+
+    # Act
+    result, summary = _execute(jobs_dir=tmp_path / "jobs", runner=runner, max_parallel_steps=4)
+
+    # Assert
+    statuses = {step["step_id"]: step["status"] for step in summary["steps"]}
+    assert result.ok is False
+    assert result.error is not None
+    assert result.error.error_code == "STATA_RETURN_CODE"
+    assert statuses == {
+        "analyze_a": "succeeded",
+        "analyze_b": "failed",
+        "analyze_c": "succeeded",
+        "analyze_d": "succeeded",
+    }
+    assert summary["error"]["error_code"] == "STATA_RETURN_CODE"
+
+
+def test_retry_reuses_products_of_steps_that_succeeded_before(tmp_path: Path) -> None:
+    # Arrange
+    jobs_dir = tmp_path / "jobs"
+    job, job_dir = _job_with_inputs(jobs_dir=jobs_dir)
+    failing = _SlowRunner(jobs_dir=jobs_dir, fail_step="aggregate")
+    _execute_job(job=job, job_dir=job_dir, run_id="attempt1", runner=failing)
+    retry_runner = _SlowRunner(jobs_dir=jobs_dir)
+
+    # Act
+    result, summary = _execute_job(job=job, job_dir=job_dir, run_id="attempt2", runner=retry_runner)
+
+    # Assert
+    steps = {step["step_id"]: step for step in summary["steps"]}
+    reused = [d for d in summary["decisions"] if d["type"] == "step_reuse"]
+    assert result.ok is True
+    assert retry_runner.run_ids == ["attempt2__aggregate"]
+    assert steps["analyze_a"]["run_id"] == "attempt1__analyze_a"
+    assert steps["aggregate"]["bindings"][0]["source_rel_path"] == (
+        "runs/attempt1__analyze_a/artifacts/products/summary.csv"
+    )
+    assert sorted(d["step_id"] for d in reused) == list(_BRANCHES)
+    assert not (job_dir / "runs" / "attempt2__analyze_a").exists()
+
+
+def test_changed_upstream_input_or_bypass_reruns_the_step(tmp_path: Path) -> None:
+    # Arrange
+    jobs_dir = tmp_path / "jobs"
+    job, job_dir = _job_with_inputs(jobs_dir=jobs_dir)
+    first_runner = _SlowRunner(jobs_dir=jobs_dir)
+    _execute_job(job=job, job_dir=job_dir, run_id="attempt1", runner=first_runner)
+    (job_dir / "inputs" / "a.csv").write_text("id,x\n1,changed\n", encoding="utf-8")
+    changed_runner = _SlowRunner(jobs_dir=jobs_dir)
+    bypass_runner = _SlowRunner(jobs_dir=jobs_dir)
+
+    # Act
+    _execute_job(job=job, job_dir=job_dir, run_id="attempt2", runner=changed_runner)
+    job.run_cache_bypass = True
+    _execute_job(job=job, job_dir=job_dir, run_id="attempt3", runner=bypass_runner)
+
+    # Assert
+    # analyze_a reruns on its new input; its product is byte-identical, so aggregate is reused.
+    assert changed_runner.run_ids == ["attempt2__analyze_a"]
+    assert len(bypass_runner.run_ids) == 5
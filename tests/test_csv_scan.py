@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from src.domain.csv_scan import CsvScanner, scan_csv
+from src.domain.dataset_preview import dataset_preview_with_options
+from src.domain.inputs_manifest import MANIFEST_REL_PATH, read_manifest_json
+from src.domain.job_inputs_service import JobInputsService
+from src.infra.file_job_workspace_store import FileJobWorkspaceStore
+from src.utils.job_workspace import resolve_job_dir
+
+
+def test_quoted_newlines_do_not_count_as_records(tmp_path: Path) -> None:
+    # Arrange
+    path = tmp_path / "data.csv"
+    path.write_bytes(b'id,note\n1,"line one\nline two"\n2,"say ""hi""\n"\n3,plain')
+
+    # Act
+    aware = scan_csv(path)
+    naive = scan_csv(path, quote_aware=False)
+
+    # Assert
+    assert (aware.records, aware.data_rows(header_row=True)) == (4, 3)
+    assert naive.records == 6
+
+
+def test_quote_state_carries_across_chunk_boundaries() -> None:
+    # Arrange
+    data = b'a,b\n1,"x\ny"\n2,z\n'
+    scanner = CsvScanner()
+
+    # Act
+    for i in range(len(data)):
+        scanner.feed(data[i : i + 1])
+
+    # Assert
+    assert scanner.result().records == 3
+
+
+def test_preview_uses_the_sniffed_delimiter_and_encoding(tmp_path: Path) -> None:
+    # Arrange
+    path = tmp_path / "data.csv"
+    path.write_bytes("城市;人口\n北京;21\n上海;24\n".encode("gb18030"))
+
+    # Act
+    preview = dataset_preview_with_options(path=path, fmt="csv", rows=5, columns=5)
+
+    # Assert
+    assert (preview["row_count"], preview["column_count"]) == (2, 2)
+    assert preview["sample_rows"] == [{"城市": "北京", "人口": 21}, {"城市": "上海", "人口": 24}]
+
+
+def test_upload_records_the_scan_in_the_manifest(
+    job_service, store, jobs_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Arrange
+    job = job_service.create_job(requirement="hello")
+    workspace = FileJobWorkspaceStore(jobs_dir=jobs_dir)
+    service = JobInputsService(store=store, workspace=workspace)
+    service.upload_primary_dataset(
+        job_id=job.job_id,
+        data=b'x;note\n1;"a\nb"\n2;c\n',
+        original_name="data.csv",
+        filename_override=None,
+        content_type="text/csv",
+    )
+
+    def _fail(*_args: object, **_kwargs: object) -> None:
+        raise AssertionError("the upload scan must be reused, not recomputed")
+
+    monkeypatch.setattr("src.domain.dataset_preview.scan_csv", _fail)
+
+    # Act
+    preview = service.preview_primary_dataset(job_id=job.job_id, rows=5, columns=5)
+
+    # Assert
+    job_dir = resolve_job_dir(jobs_dir=jobs_dir, job_id=job.job_id)
+    assert job_dir is not None
+    manifest = read_manifest_json(job_dir / MANIFEST_REL_PATH)
+    assert manifest["datasets"][0]["csv_scan"] == {
+        "version": 2,
+        "records": 3,
+        "encoding": "utf-8",
+        "delimiter": ";",
+    }
+    assert preview["row_count"] == 2
+
+
+def test_quote_inside_an_unquoted_field_is_data() -> None:
+    # Arrange
+    data = b'id,size\n1,5" tv\n2,3\n3,4\n'
+    scanner = CsvScanner()
+
+    # Act
+    for i in range(0, len(data), 3):
+        scanner.feed(data[i : i + 3])
+
+    # Assert
+    assert scanner.result().data_rows(header_row=True) == 3
+
+
+def test_lone_carriage_returns_end_records(tmp_path: Path) -> None:
+    # Arrange
+    cr_only = tmp_path / "cr.csv"
+    cr_only.write_bytes(b"a,b\r1,2\r3,4\r")
+    crlf = tmp_path / "crlf.csv"
+    crlf.write_bytes(b'a,b\r\n1,"x\r\ny"\r\n3,4')
+    scanner = CsvScanner()
+
+    # Act
+    for byte in b"a,b\r\n1,2\r\n":
+        scanner.feed(bytes([byte]))
+
+    # Assert
+    assert (scan_csv(cr_only).records, scan_csv(crlf).records) == (3, 3)
+    assert scanner.result().records == 2
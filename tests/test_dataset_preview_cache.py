@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.domain.dataset_preview import dataset_preview_with_options
+from src.domain.dataset_preview_cache import preview_cache_key
+from src.infra.dataset_preview_cache import FileDatasetPreviewCache
+
+
+class _RecordingMetrics:
+    def __init__(self) -> None:
+        self.lookups: list[bool] = []
+
+    def record_dataset_preview_cache_lookup(self, *, hit: bool) -> None:
+        self.lookups.append(hit)
+
+
+@pytest.fixture
+def metrics() -> _RecordingMetrics:
+    return _RecordingMetrics()
+
+
+@pytest.fixture
+def cache(tmp_path: Path, metrics: _RecordingMetrics) -> FileDatasetPreviewCache:
+    return FileDatasetPreviewCache(
+        cache_dir=tmp_path / "preview_cache", max_bytes=1024 * 1024, metrics=metrics
+    )
+
+
+def _csv(tmp_path: Path) -> Path:
+    path = tmp_path / "data.csv"
+    path.write_text("b,a\n1,x\n2,y\n", encoding="utf-8")
+    return path
+
+
+def test_cached_preview_is_served_without_parsing(
+    cache: FileDatasetPreviewCache,
+    metrics: _RecordingMetrics,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Arrange
+    path = _csv(tmp_path)
+    first = dataset_preview_with_options(
+        path=path, fmt="csv", rows=5, columns=5, sha256="abc", cache=cache
+    )
+
+    def _fail(*_args: object, **_kwargs: object) -> None:
+        raise AssertionError("pandas must not run on a cache hit")
+
+    monkeypatch.setattr(pd, "read_csv", _fail)
+
+    # Act
+    second = dataset_preview_with_options(
+        path=path, fmt="csv", rows=5, columns=5, sha256="abc", cache=cache
+    )
+
+    # Assert
+    assert second == first
+    assert list(second["sample_rows"][0]) == ["b", "a"]
+    assert metrics.lookups == [False, True]
+
+
+def test_preview_options_and_content_are_part_of_the_key(
+    cache: FileDatasetPreviewCache, metrics: _RecordingMetrics, tmp_path: Path
+) -> None:
+    # Arrange
+    path = _csv(tmp_path)
+    dataset_preview_with_options(path=path, fmt="csv", rows=5, columns=5, cache=cache)
+
+    # Act
+    fewer_rows = dataset_preview_with_options(path=path, fmt="csv", rows=1, columns=5, cache=cache)
+    path.write_text("b,a\n3,z\n", encoding="utf-8")
+    changed = dataset_preview_with_options(path=path, fmt="csv", rows=5, columns=5, cache=cache)
+
+    # Assert
+    assert len(fewer_rows["sample_rows"]) == 1
+    assert changed["sample_rows"] == [{"b": 3, "a": "z"}]
+    assert metrics.lookups == [False, False, False]
+
+
+def test_cache_evicts_oldest_entries_past_max_bytes(tmp_path: Path) -> None:
+    # Arrange
+    cache = FileDatasetPreviewCache(cache_dir=tmp_path / "preview_cache", max_bytes=300)
+    keys = [
+        preview_cache_key(
+            sha256=f"sha{i}", fmt="csv", sheet_name=None, header_row=None, rows=5, columns=5
+        )
+        for i in range(4)
+    ]
+
+    # Act
+    for key in keys:
+        cache.put(key, {"row_count": 1, "padding": "x" * 80})
+
+    # Assert
+    assert cache.get(keys[0]) is None
+    assert cache.get(keys[-1]) is not None
+    assert sum(p.stat().st_size for p in (tmp_path / "preview_cache").rglob("*.json")) <= 300
@@ -0,0 +1,218 @@
+from __future__ import annotations
+
+import os
+from io import BytesIO
+from pathlib import Path
+
+import openpyxl
+import pandas as pd
+import pytest
+from openpyxl import Workbook
+
+from src.domain import dataset_sidecar_ingest
+from src.domain.dataset_preview import dataset_preview_with_options
+from src.domain.dataset_sidecar import find_sidecar
+from src.domain.dataset_sidecar_ingest import build_dataset_sidecar, ingest_job_datasets
+from src.domain.excel_sheet_meta import excel_sheet_names
+from src.domain.job_inputs_service import JobInputsService
+from src.infra.dataset_preview_cache import FileDatasetPreviewCache
+from src.infra.file_job_workspace_store import FileJobWorkspaceStore
+from src.utils.job_workspace import resolve_job_dir
+
+pytest.importorskip("pyarrow")
+
+
+def _fail(*_args: object, **_kwargs: object) -> None:
+    raise AssertionError("the original file must not be parsed once a sidecar exists")
+
+
+def test_csv_sidecar_serves_previews_with_schema_and_stats(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Arrange
+    path = tmp_path / "data.csv"
+    path.write_text("age,city\n30,a\n,b\n50,c\n", encoding="utf-8")
+    sidecar = build_dataset_sidecar(path=path, fmt="csv", sheet_name=None, header_row=None)
+    monkeypatch.setattr(pd, "read_csv", _fail)
+
+    # Act
+    preview = dataset_preview_with_options(path=path, fmt="csv", rows=2, columns=1)
+
+    # Assert
+    assert sidecar is not None
+    assert sidecar.meta["columns"] == [
+        {"name": "age", "dtype": "float64", "null_count": 1, "min": 30.0, "max": 50.0},
+        {"name": "city", "dtype": "object", "null_count": 0},
+    ]
+    assert (preview["row_count"], preview["column_count"]) == (3, 2)
+    assert preview["columns"] == [{"name": "age", "inferred_type": "number"}]
+    assert preview["sample_rows"] == [{"age": 30.0}, {"age": None}]
+
+
+def test_excel_sidecar_answers_sheet_names_without_opening_the_workbook(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Arrange
+    wb = Workbook()
+    wb.active.title = "Data"
+    wb.active.append(["x", "y"])
+    wb.active.append([1, 2])
+    wb.create_sheet("Notes")
+    bio = BytesIO()
+    wb.save(bio)
+    path = tmp_path / "book.xlsx"
+    path.write_bytes(bio.getvalue())
+    build_dataset_sidecar(path=path, fmt="excel", sheet_name=None, header_row=None)
+    monkeypatch.setattr(openpyxl, "load_workbook", _fail)
+
+    # Act
+    names = excel_sheet_names(path=path)
+    preview = dataset_preview_with_options(path=path, fmt="excel", rows=5, columns=5)
+
+    # Assert
+    assert names == ["Data", "Notes"]
+    assert (preview["selected_sheet"], preview["header_row"]) == ("Data", True)
+    assert preview["sample_rows"] == [{"x": 1, "y": 2}]
+
+
+def test_excel_sidecar_stores_mixed_type_column_as_text(tmp_path: Path) -> None:
+    # Arrange
+    wb = Workbook()
+    wb.active.append(["id", "score"])
+    for row in ([1, 0.5], [2, 0.7], ["x3", None]):
+        wb.active.append(row)
+    bio = BytesIO()
+    wb.save(bio)
+    path = tmp_path / "ids.xlsx"
+    path.write_bytes(bio.getvalue())
+
+    # Act
+    sidecar = build_dataset_sidecar(path=path, fmt="excel", sheet_name=None, header_row=None)
+    preview = dataset_preview_with_options(path=path, fmt="excel", rows=5, columns=2)
+
+    # Assert
+    assert sidecar is not None
+    assert sidecar.meta["columns"][0] == {"name": "id", "dtype": "string", "null_count": 0}
+    assert [row["id"] for row in preview["sample_rows"]] == ["1", "2", "x3"]
+    assert preview["sample_rows"][2]["score"] is None
+
+
+def test_csv_sidecar_merges_row_chunks(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    # Arrange
+    monkeypatch.setattr(dataset_sidecar_ingest, "CSV_CHUNK_ROWS", 2)
+    path = tmp_path / "data.csv"
+    path.write_text("n,label\n1,a\n2,b\n,c\n7,d\n", encoding="utf-8")
+
+    # Act
+    sidecar = build_dataset_sidecar(path=path, fmt="csv", sheet_name=None, header_row=None)
+    preview = dataset_preview_with_options(path=path, fmt="csv", rows=5, columns=2)
+
+    # Assert
+    assert sidecar is not None
+    assert sidecar.meta["row_count"] == 4
+    assert sidecar.meta["columns"][0] == {
+        "name": "n",
+        "dtype": "float64",
+        "null_count": 1,
+        "min": 1.0,
+        "max": 7.0,
+    }
+    assert [row["n"] for row in preview["sample_rows"]] == [1, 2, None, 7]
+
+
+def test_csv_sidecar_rereads_whole_file_when_a_chunk_changes_column_type(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Arrange
+    monkeypatch.setattr(dataset_sidecar_ingest, "CSV_CHUNK_ROWS", 2)
+    path = tmp_path / "data.csv"
+    path.write_text("code\n1\n2\nx3\n", encoding="utf-8")
+
+    # Act
+    sidecar = build_dataset_sidecar(path=path, fmt="csv", sheet_name=None, header_row=None)
+    preview = dataset_preview_with_options(path=path, fmt="csv", rows=5, columns=1)
+
+    # Assert
+    assert sidecar is not None
+    assert sidecar.meta["row_count"] == 3
+    assert sidecar.meta["columns"] == [{"name": "code", "dtype": "object", "null_count": 0}]
+    assert [row["code"] for row in preview["sample_rows"]] == ["1", "2", "x3"]
+
+
+def test_sidecar_is_ignored_once_the_source_changes(tmp_path: Path) -> None:
+    # Arrange
+    path = tmp_path / "data.csv"
+    path.write_text("a\n1\n", encoding="utf-8")
+    build_dataset_sidecar(path=path, fmt="csv", sheet_name=None, header_row=None)
+
+    # Act
+    path.write_text("a\n1\n2\n", encoding="utf-8")
+    os.utime(path, ns=(0, 0))
+
+    # Assert
+    assert find_sidecar(path=path, fmt="csv", sheet_name=None, header_row=None) is None
+    assert dataset_preview_with_options(path=path, fmt="csv", rows=5, columns=5)["row_count"] == 2
+
+
+def test_sidecar_is_ignored_when_the_bytes_change_but_size_and_mtime_do_not(
+    tmp_path: Path,
+) -> None:
+    # Arrange
+    path = tmp_path / "data.csv"
+    path.write_text("a\n1\n", encoding="utf-8")
+    build_dataset_sidecar(path=path, fmt="csv", sheet_name=None, header_row=None)
+    stat = path.stat()
+
+    # Act
+    path.write_text("a\n2\n", encoding="utf-8")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    preview = dataset_preview_with_options(path=path, fmt="csv", rows=5, columns=5)
+
+    # Assert
+    assert find_sidecar(path=path, fmt="csv", sheet_name=None, header_row=None) is None
+    assert preview["sample_rows"] == [{"a": 2}]
+
+
+def test_sidecar_preview_does_not_reuse_a_cached_parse_of_the_first_rows(
+    tmp_path: Path,
+) -> None:
+    # Arrange
+    path = tmp_path / "data.csv"
+    path.write_text("a,b\n1,x\n,y\n", encoding="utf-8")
+    cache = FileDatasetPreviewCache(cache_dir=tmp_path / "preview_cache", max_bytes=1024 * 1024)
+    parsed = dataset_preview_with_options(path=path, fmt="csv", rows=1, columns=1, cache=cache)
+    build_dataset_sidecar(path=path, fmt="csv", sheet_name=None, header_row=None)
+
+    # Act
+    from_sidecar = dataset_preview_with_options(
+        path=path, fmt="csv", rows=1, columns=1, cache=cache
+    )
+
+    # Assert
+    assert parsed["sample_rows"] == [{"a": 1}]
+    assert from_sidecar["sample_rows"] == [{"a": 1.0}]
+    assert from_sidecar["columns"] == [{"name": "a", "inferred_type": "number"}]
+
+
+def test_ingest_builds_a_sidecar_for_each_uploaded_dataset(
+    job_service, store, jobs_dir: Path
+) -> None:
+    # Arrange
+    job = job_service.create_job(requirement="hello")
+    workspace = FileJobWorkspaceStore(jobs_dir=jobs_dir)
+    JobInputsService(store=store, workspace=workspace).upload_primary_dataset(
+        job_id=job.job_id,
+        data=b"age,income\n30,1000\n40,2000\n",
+        original_name="data.csv",
+        filename_override=None,
+        content_type="text/csv",
+    )
+
+    # Act
+    built = ingest_job_datasets(workspace=workspace, job_id=job.job_id)
+
+    # Assert
+    job_dir = resolve_job_dir(jobs_dir=jobs_dir, job_id=job.job_id)
+    assert job_dir is not None
+    assert built == 1
+    assert len(list((job_dir / "inputs" / ".columnar").glob("*.parquet"))) == 1
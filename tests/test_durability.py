@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import os
+import stat
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from src.config import load_config
+from src.infra import durability as durability_module
+from src.infra.durability import Durability, configure_durability, current_durability
+from src.infra.prometheus_metrics import PrometheusMetrics
+
+
+def _write(durability: Durability, path: Path, text: str) -> None:
+    tmp = path.with_name(f".{path.name}.tmp")
+    with tmp.open("wb") as f:
+        f.write(text.encode("utf-8"))
+        durability.sync_file(f)
+    durability.replace(tmp=tmp, path=path)
+
+
+def test_replace_with_always_policy_syncs_and_records_each_write(tmp_path: Path) -> None:
+    # Arrange
+    metrics = PrometheusMetrics()
+    durability = Durability(policy="always", metrics=metrics)
+    target = tmp_path / "job.json"
+
+    # Act
+    _write(durability, target, "{}")
+
+    # Assert
+    rendered = metrics.render_latest().decode("utf-8")
+    assert target.read_text(encoding="utf-8") == "{}"
+    assert 'ss_durable_commit_seconds_count{policy="always"} 1.0' in rendered
+
+
+def test_group_policy_commits_a_lone_writer_without_waiting_for_the_window(
+    tmp_path: Path,
+) -> None:
+    # Arrange
+    metrics = PrometheusMetrics()
+    durability = Durability(policy="group", group_commit_ms=5000, metrics=metrics)
+    started = time.perf_counter()
+
+    # Act
+    _write(durability, tmp_path / "job.json", "{}")
+
+    # Assert
+    rendered = metrics.render_latest().decode("utf-8")
+    assert time.perf_counter() - started < 2.5
+    assert 'ss_durable_commit_seconds_count{policy="group"} 1.0' in rendered
+
+
+@pytest.mark.parametrize(("syncfs_ok", "expected_fsyncs"), [(True, 1), (False, 3)])
+def test_group_policy_commits_writers_queued_behind_a_commit_as_one_batch(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, syncfs_ok: bool, expected_fsyncs: int
+) -> None:
+    # Arrange
+    metrics = PrometheusMetrics()
+    durability = Durability(policy="group", group_commit_ms=1, metrics=metrics)
+    first_fsync, release = threading.Event(), threading.Event()
+    fsyncs: list[int] = []
+    syncfs_calls: list[int] = []
+    real_fsync = durability_module.os.fsync
+
+    def _fsync(fd: int) -> None:
+        if stat.S_ISDIR(os.fstat(fd).st_mode):
+            real_fsync(fd)
+            return
+        fsyncs.append(fd)
+        if not first_fsync.is_set():
+            first_fsync.set()
+            release.wait(timeout=5)
+        real_fsync(fd)
+
+    monkeypatch.setattr(durability_module.os, "fsync", _fsync)
+    monkeypatch.setattr(
+        durability_module, "syncfs", lambda fd: (syncfs_calls.append(fd), syncfs_ok)[1]
+    )
+    writers = [
+        threading.Thread(
+            target=_write, args=(durability, tmp_path / f"record_{index}.json", str(index))
+        )
+        for index in range(3)
+    ]
+
+    # Act
+    writers[0].start()
+    assert first_fsync.wait(timeout=5)
+    for writer in writers[1:]:
+        writer.start()
+    deadline = time.monotonic() + 5
+    while len(durability._committer._tickets) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    release.set()
+    for writer in writers:
+        writer.join()
+
+    # Assert
+    rendered = metrics.render_latest().decode("utf-8")
+    assert 'ss_durable_commit_batch_files_count{policy="group"} 2.0' in rendered
+    assert 'ss_durable_commit_batch_files_sum{policy="group"} 3.0' in rendered
+    assert 'ss_durable_commit_seconds_count{policy="group"} 3.0' in rendered
+    assert len(syncfs_calls) == 1
+    assert len(fsyncs) == expected_fsyncs
+    assert [(tmp_path / f"record_{i}.json").read_text(encoding="utf-8") for i in range(3)] == [
+        "0",
+        "1",
+        "2",
+    ]
+
+
+def test_group_policy_syncs_file_contents_before_the_rename(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Arrange
+    events: list[str] = []
+    real_fsync, real_replace = durability_module.os.fsync, durability_module.os.replace
+    monkeypatch.setattr(
+        durability_module.os, "fsync", lambda fd: (events.append("fsync"), real_fsync(fd))[1]
+    )
+    monkeypatch.setattr(
+        durability_module.os,
+        "replace",
+        lambda src, dst: (events.append("replace"), real_replace(src, dst))[1],
+    )
+    durability = Durability(policy="group", group_commit_ms=1)
+    target = tmp_path / "job.json"
+
+    # Act
+    _write(durability, target, "{}")
+
+    # Assert
+    assert events[:2] == ["fsync", "replace"]
+    assert target.read_text(encoding="utf-8") == "{}"
+
+
+def test_replace_with_os_policy_never_fsyncs(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Arrange
+    def _fail(fd: int) -> None:
+        raise AssertionError("fsync must not be called")
+
+    monkeypatch.setattr(durability_module.os, "fsync", _fail)
+    durability = Durability(policy="os")
+    target = tmp_path / "job.json"
+
+    # Act
+    _write(durability, target, "{}")
+    durability.flush()
+
+    # Assert
+    assert target.read_text(encoding="utf-8") == "{}"
+
+
+def test_configure_with_unknown_policy_falls_back_to_always(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    # Arrange
+    monkeypatch.setattr(durability_module, "_durability", Durability())
+    config = load_config(
+        env={
+            "SS_LLM_PROVIDER": "yunwu",
+            "SS_LLM_API_KEY": "test-key",
+            "SS_DURABILITY_POLICY": "sometimes",
+        }
+    )
+
+    # Act
+    configure_durability(config=config)
+
+    # Assert
+    assert current_durability().policy == "always"
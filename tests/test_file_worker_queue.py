@@ -5,7 +5,13 @@ import threading
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
+from typing import Any
 
+import pytest
+
+from src.domain.queue_scheduling import FairShareScheduler, QueueSchedulingPolicy
+from src.domain.worker_queue import QueueClaim
+from src.infra import file_worker_queue
 from src.infra.file_worker_queue import FileWorkerQueue
 
 
@@ -78,3 +84,185 @@ def test_claim_with_expired_lease_reclaims_job(tmp_path: Path) -> None:
     assert list((queue_dir / "queued").glob("*.json")) == []
     record = json.loads(claimed_files[0].read_text(encoding="utf-8"))
     assert record.get("worker_id") == "worker-2"
+
+
+def test_renew_extends_lease_so_job_is_not_reclaimed(tmp_path: Path) -> None:
+    # Arrange
+    queue_dir = tmp_path / "queue"
+    now_0 = datetime(2026, 1, 6, tzinfo=timezone.utc)
+    clock = {"now": now_0}
+    queue = FileWorkerQueue(queue_dir=queue_dir, lease_ttl_seconds=10, clock=lambda: clock["now"])
+    queue.enqueue(job_id="job_test")
+    claim = queue.claim(worker_id="worker-1")
+    assert claim is not None
+
+    # Act
+    clock["now"] = now_0 + timedelta(seconds=8)
+    renewed = queue.renew(claim=claim)
+    clock["now"] = now_0 + timedelta(seconds=15)
+    stolen = queue.claim(worker_id="worker-2")
+
+    # Assert
+    assert renewed is not None
+    assert renewed.lease_expires_at == now_0 + timedelta(seconds=18)
+    assert stolen is None
+    assert [path.name for path in (queue_dir / "claimed").iterdir()] == [
+        f"job_test__{claim.claim_id}.json"
+    ]
+
+
+def test_renew_after_lease_was_reclaimed_returns_none(tmp_path: Path) -> None:
+    # Arrange
+    queue_dir = tmp_path / "queue"
+    now_0 = datetime(2026, 1, 6, tzinfo=timezone.utc)
+    queue_1 = FileWorkerQueue(queue_dir=queue_dir, lease_ttl_seconds=1, clock=lambda: now_0)
+    queue_2 = FileWorkerQueue(
+        queue_dir=queue_dir,
+        lease_ttl_seconds=1,
+        clock=lambda: now_0 + timedelta(seconds=2),
+    )
+    queue_1.enqueue(job_id="job_test")
+    claim = queue_1.claim(worker_id="worker-1")
+    assert claim is not None
+    assert queue_2.claim(worker_id="worker-2") is not None
+
+    # Act
+    renewed = queue_1.renew(claim=claim)
+
+    # Assert
+    assert renewed is None
+
+
+def test_renew_does_not_revive_an_expired_lease(tmp_path: Path) -> None:
+    # Arrange
+    queue_dir = tmp_path / "queue"
+    now_0 = datetime(2026, 1, 6, tzinfo=timezone.utc)
+    clock = {"now": now_0}
+    queue = FileWorkerQueue(queue_dir=queue_dir, lease_ttl_seconds=10, clock=lambda: clock["now"])
+    queue.enqueue(job_id="job_test")
+    claim = queue.claim(worker_id="worker-1")
+    assert claim is not None
+
+    # Act
+    clock["now"] = now_0 + timedelta(seconds=11)
+    renewed = queue.renew(claim=claim)
+    reclaimed = queue.claim(worker_id="worker-2")
+
+    # Assert
+    assert renewed is None
+    assert reclaimed is not None and reclaimed.worker_id == "worker-2"
+
+
+def test_renew_when_record_is_reclaimed_mid_renewal_reports_claim_lost(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Arrange
+    queue_dir = tmp_path / "queue"
+    now_0 = datetime(2026, 1, 6, tzinfo=timezone.utc)
+    queue_1 = FileWorkerQueue(queue_dir=queue_dir, lease_ttl_seconds=10, clock=lambda: now_0)
+    queue_2 = FileWorkerQueue(
+        queue_dir=queue_dir,
+        lease_ttl_seconds=10,
+        clock=lambda: now_0 + timedelta(seconds=25),
+    )
+    queue_1.enqueue(job_id="job_test")
+    claim = queue_1.claim(worker_id="worker-1")
+    assert claim is not None
+    stolen: list[QueueClaim | None] = []
+    write = file_worker_queue.atomic_write_json
+
+    def _reclaim_then_write(**kwargs: Any) -> None:
+        monkeypatch.setattr(file_worker_queue, "atomic_write_json", write)
+        stolen.append(queue_2.claim(worker_id="worker-2"))
+        write(**kwargs)
+
+    monkeypatch.setattr(file_worker_queue, "atomic_write_json", _reclaim_then_write)
+
+    # Act
+    renewed = queue_1.renew(claim=claim)
+
+    # Assert
+    assert renewed is None
+    assert stolen[0] is not None and stolen[0].worker_id == "worker-2"
+    assert [path.name for path in (queue_dir / "claimed").iterdir()] == [
+        f"job_test__{stolen[0].claim_id}.json"
+    ]
+
+
+def test_claim_recovers_record_left_by_crashed_renewal(tmp_path: Path) -> None:
+    # Arrange
+    queue_dir = tmp_path / "queue"
+    now_0 = datetime(2026, 1, 6, tzinfo=timezone.utc)
+    clock = {"now": now_0}
+    queue = FileWorkerQueue(queue_dir=queue_dir, lease_ttl_seconds=10, clock=lambda: clock["now"])
+    queue.enqueue(job_id="job_test")
+    claim = queue.claim(worker_id="worker-1")
+    assert claim is not None
+    claim_path = queue_dir / "claimed" / f"job_test__{claim.claim_id}.json"
+    claim_path.rename(claim_path.with_suffix(".renewing"))
+
+    # Act
+    clock["now"] = now_0 + timedelta(seconds=15)
+    within_grace = queue.claim(worker_id="worker-2")
+    clock["now"] = now_0 + timedelta(seconds=21)
+    recovered = queue.claim(worker_id="worker-2")
+
+    # Assert
+    assert within_grace is None
+    assert recovered is not None and recovered.job_id == "job_test"
+    assert [path.suffix for path in (queue_dir / "claimed").iterdir()] == [".json"]
+
+
+def test_claim_within_tenant_returns_highest_priority_then_oldest(tmp_path: Path) -> None:
+    # Arrange
+    queue_dir = tmp_path / "queue"
+    now_0 = datetime(2026, 1, 6, tzinfo=timezone.utc)
+    clock = {"now": now_0}
+    queue = FileWorkerQueue(queue_dir=queue_dir, lease_ttl_seconds=60, clock=lambda: clock["now"])
+    for offset, (job_id, priority) in enumerate([("job_c", 0), ("job_b", 0), ("job_a", 5)]):
+        clock["now"] = now_0 + timedelta(seconds=offset)
+        queue.enqueue(job_id=job_id, tenant_id="tenant-a", priority=priority)
+
+    # Act
+    claims = [queue.claim(worker_id="worker-1") for _ in range(3)]
+
+    # Assert
+    assert [c.job_id for c in claims if c is not None] == ["job_a", "job_c", "job_b"]
+
+
+def test_claim_with_backlogged_tenant_interleaves_other_tenants(tmp_path: Path) -> None:
+    # Arrange
+    queue = FileWorkerQueue(queue_dir=tmp_path / "queue", lease_ttl_seconds=60)
+    for index in range(6):
+        queue.enqueue(job_id=f"job_bulk_{index}", tenant_id="tenant-a")
+    queue.enqueue(job_id="job_small", tenant_id="tenant-b")
+
+    # Act
+    first_two = [queue.claim(worker_id="worker-1") for _ in range(2)]
+
+    # Assert
+    assert {c.tenant_id for c in first_two if c is not None} == {"tenant-a", "tenant-b"}
+
+
+def test_claim_when_tenant_at_cap_skips_its_jobs(tmp_path: Path) -> None:
+    # Arrange
+    queue = FileWorkerQueue(
+        queue_dir=tmp_path / "queue",
+        lease_ttl_seconds=60,
+        scheduler=FairShareScheduler(
+            policy=QueueSchedulingPolicy(tenant_max_inflight={"tenant-a": 1})
+        ),
+    )
+    queue.enqueue(job_id="job_1", tenant_id="tenant-a")
+    queue.enqueue(job_id="job_2", tenant_id="tenant-a")
+    first = queue.claim(worker_id="worker-1")
+    assert first is not None
+
+    # Act
+    blocked = queue.claim(worker_id="worker-2")
+    queue.ack(claim=first)
+    unblocked = queue.claim(worker_id="worker-2")
+
+    # Assert
+    assert blocked is None
+    assert unblocked is not None and unblocked.job_id == "job_2"
@@ -0,0 +1,204 @@
+from __future__ import annotations
+
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from src.config import load_config
+from src.infra.exceptions import QueueBackendUnsupportedError
+from src.infra.file_lease_heap import FileLeaseHeap, LeaseEntry
+from src.infra.file_worker_queue import FileWorkerQueue
+from src.infra.indexed_file_worker_queue import IndexedFileWorkerQueue
+from src.infra.worker_queue_factory import build_worker_queue
+
+
+def test_claim_returns_jobs_in_enqueue_order_across_tenants(tmp_path: Path) -> None:
+    # Arrange
+    queue = IndexedFileWorkerQueue(queue_dir=tmp_path / "queue", lease_ttl_seconds=60)
+    queue.enqueue(job_id="job_b", tenant_id="tenant-z")
+    queue.enqueue(job_id="job_a")
+    queue.enqueue(job_id="job_c", tenant_id="tenant-a")
+
+    # Act
+    claims = [queue.claim(worker_id="worker-1") for _ in range(4)]
+
+    # Assert
+    assert [(c.tenant_id, c.job_id) for c in claims if c is not None] == [
+        ("tenant-z", "job_b"),
+        ("default", "job_a"),
+        ("tenant-a", "job_c"),
+    ]
+    assert claims[3] is None
+
+
+def test_claim_with_two_workers_competing_returns_single_claim(tmp_path: Path) -> None:
+    # Arrange
+    queue_dir = tmp_path / "queue"
+    queue_a = IndexedFileWorkerQueue(queue_dir=queue_dir, lease_ttl_seconds=60)
+    queue_b = IndexedFileWorkerQueue(queue_dir=queue_dir, lease_ttl_seconds=60)
+    queue_a.enqueue(job_id="job_test")
+    barrier = threading.Barrier(2)
+
+    def _claim(queue: IndexedFileWorkerQueue, worker_id: str):
+        barrier.wait()
+        return queue.claim(worker_id=worker_id)
+
+    # Act
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        future_a = pool.submit(_claim, queue_a, "worker-a")
+        future_b = pool.submit(_claim, queue_b, "worker-b")
+        claims = [c for c in (future_a.result(), future_b.result()) if c is not None]
+
+    # Assert
+    assert len(claims) == 1
+    assert len(list((queue_dir / "claimed").glob("*.json"))) == 1
+    assert list((queue_dir / "queued").glob("*.json")) == []
+
+
+def test_claim_with_expired_lease_reclaims_job(tmp_path: Path) -> None:
+    # Arrange
+    queue_dir = tmp_path / "queue"
+    now_0 = datetime(2026, 1, 6, tzinfo=timezone.utc)
+    now_1 = now_0 + timedelta(seconds=2)
+    queue_1 = IndexedFileWorkerQueue(queue_dir=queue_dir, lease_ttl_seconds=1, clock=lambda: now_0)
+    queue_2 = IndexedFileWorkerQueue(queue_dir=queue_dir, lease_ttl_seconds=1, clock=lambda: now_1)
+    queue_1.enqueue(job_id="job_test")
+
+    # Act
+    claim_1 = queue_1.claim(worker_id="worker-1")
+    not_yet = queue_1.claim(worker_id="worker-1")
+    claim_2 = queue_2.claim(worker_id="worker-2")
+
+    # Assert
+    assert claim_1 is not None
+    assert not_yet is None
+    assert claim_2 is not None
+    assert claim_2.worker_id == "worker-2"
+    claimed_files = list((queue_dir / "claimed").glob("*.json"))
+    assert len(claimed_files) == 1
+    record = json.loads(claimed_files[0].read_text(encoding="utf-8"))
+    assert record["claim_id"] == claim_2.claim_id
+
+
+def test_claim_after_ack_does_not_reclaim_expired_lease(tmp_path: Path) -> None:
+    # Arrange
+    queue_dir = tmp_path / "queue"
+    now_0 = datetime(2026, 1, 6, tzinfo=timezone.utc)
+    queue_1 = IndexedFileWorkerQueue(queue_dir=queue_dir, lease_ttl_seconds=1, clock=lambda: now_0)
+    queue_2 = IndexedFileWorkerQueue(
+        queue_dir=queue_dir,
+        lease_ttl_seconds=1,
+        clock=lambda: now_0 + timedelta(seconds=5),
+    )
+    queue_1.enqueue(job_id="job_test")
+    claim = queue_1.claim(worker_id="worker-1")
+    assert claim is not None
+
+    # Act
+    queue_1.ack(claim=claim)
+    reclaimed = queue_2.claim(worker_id="worker-2")
+
+    # Assert
+    assert reclaimed is None
+
+
+def test_release_makes_job_claimable_again(tmp_path: Path) -> None:
+    # Arrange
+    queue = IndexedFileWorkerQueue(queue_dir=tmp_path / "queue", lease_ttl_seconds=60)
+    queue.enqueue(job_id="job_test")
+    claim = queue.claim(worker_id="worker-1")
+    assert claim is not None
+
+    # Act
+    queue.release(claim=claim)
+    again = queue.claim(worker_id="worker-2")
+
+    # Assert
+    assert again is not None
+    assert again.job_id == "job_test"
+    assert again.claim_id != claim.claim_id
+
+
+def test_claim_on_existing_scan_mode_queue_rebuilds_index(tmp_path: Path) -> None:
+    # Arrange
+    queue_dir = tmp_path / "queue"
+    now_0 = datetime(2026, 1, 6, tzinfo=timezone.utc)
+    legacy = FileWorkerQueue(queue_dir=queue_dir, lease_ttl_seconds=1, clock=lambda: now_0)
+    legacy.enqueue(job_id="job_claimed")
+    assert legacy.claim(worker_id="worker-legacy") is not None
+    legacy.enqueue(job_id="job_queued")
+    indexed = IndexedFileWorkerQueue(
+        queue_dir=queue_dir,
+        lease_ttl_seconds=1,
+        clock=lambda: now_0 + timedelta(seconds=5),
+    )
+
+    # Act
+    first = indexed.claim(worker_id="worker-new")
+    second = indexed.claim(worker_id="worker-new")
+
+    # Assert
+    assert first is not None and first.job_id == "job_queued"
+    assert second is not None and second.job_id == "job_claimed"
+    assert (queue_dir / "index" / "ready.cursor").exists()
+
+
+def test_build_worker_queue_selects_backend_from_config(tmp_path: Path) -> None:
+    base_env = {
+        "SS_LLM_PROVIDER": "yunwu",
+        "SS_LLM_API_KEY": "test-key",
+        "SS_QUEUE_DIR": str(tmp_path / "queue"),
+    }
+
+    default_queue = build_worker_queue(config=load_config(env=base_env))
+    indexed_queue = build_worker_queue(
+        config=load_config(env={**base_env, "SS_QUEUE_BACKEND": "file_indexed"})
+    )
+
+    assert type(default_queue) is FileWorkerQueue
+    assert isinstance(indexed_queue, IndexedFileWorkerQueue)
+    with pytest.raises(QueueBackendUnsupportedError) as exc:
+        build_worker_queue(config=load_config(env={**base_env, "SS_QUEUE_BACKEND": "redis"}))
+    assert exc.value.error_code == "QUEUE_BACKEND_UNSUPPORTED"
+
+
+def test_lease_heap_pops_entries_in_expiry_order(tmp_path: Path) -> None:
+    heap = FileLeaseHeap(path=tmp_path / "leases.heap")
+    expiries = [7.0, 3.0, 9.0, 1.0, 5.0, 3.5, 8.0, 2.0]
+    for i, expires_at in enumerate(expiries):
+        heap.push(
+            LeaseEntry(expires_at=expires_at, tenant_id="default", job_id=f"job_{i}", claim_id="c")
+        )
+
+    popped = []
+    while (entry := heap.pop()) is not None:
+        popped.append(entry.expires_at)
+
+    assert popped == sorted(expiries)
+    assert heap.peek() is None
+
+
+def test_renew_pushes_new_lease_so_original_expiry_does_not_reclaim(tmp_path: Path) -> None:
+    queue_dir = tmp_path / "queue"
+    now_0 = datetime(2026, 1, 6, tzinfo=timezone.utc)
+    clock = {"now": now_0}
+    queue = IndexedFileWorkerQueue(
+        queue_dir=queue_dir, lease_ttl_seconds=10, clock=lambda: clock["now"]
+    )
+    queue.enqueue(job_id="job_test")
+    claim = queue.claim(worker_id="worker-1")
+    assert claim is not None
+
+    clock["now"] = now_0 + timedelta(seconds=8)
+    assert queue.renew(claim=claim) is not None
+    clock["now"] = now_0 + timedelta(seconds=15)
+    not_yet = queue.claim(worker_id="worker-2")
+    clock["now"] = now_0 + timedelta(seconds=20)
+    reclaimed = queue.claim(worker_id="worker-2")
+
+    assert not_yet is None
+    assert reclaimed is not None and reclaimed.worker_id == "worker-2"
@@ -0,0 +1,125 @@
+from __future__ import annotations
+
+import errno
+import hashlib
+import json
+import os
+import stat
+from pathlib import Path
+
+import pytest
+
+from src.infra import input_blobs
+from src.infra.input_blobs import (
+    BLOB_DIRNAME,
+    STAGE_COPY,
+    STAGE_HARDLINK,
+    InputBlobStore,
+    stage_file,
+)
+from src.infra.stata_safety import copy_job_inputs_dir
+
+_DATA = b"a,b\n1,2\n"
+_SHA = hashlib.sha256(_DATA).hexdigest()
+
+
+def _no_reflink(*, source: Path, tmp: Path) -> bool:
+    return False
+
+
+def _job_with_input(tmp_path: Path) -> Path:
+    job_dir = tmp_path / "job"
+    inputs = job_dir / "inputs"
+    inputs.mkdir(parents=True)
+    (inputs / "data.csv").write_bytes(_DATA)
+    manifest = {"datasets": [{"rel_path": "inputs/data.csv", "sha256": _SHA}]}
+    (inputs / "manifest.json").write_text(json.dumps(manifest), encoding="utf-8")
+    return job_dir
+
+
+def test_runs_share_one_read_only_blob_per_input(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Arrange
+    monkeypatch.setattr(input_blobs, "_try_reflink", _no_reflink)
+    job_dir = _job_with_input(tmp_path)
+
+    # Act
+    for attempt in ("run1", "run2"):
+        copy_job_inputs_dir(job_dir=job_dir, work_dir=job_dir / "runs" / attempt / "work")
+
+    # Assert
+    blob = job_dir / BLOB_DIRNAME / _SHA
+    staged = [job_dir / "runs" / run / "work" / "inputs" / "data.csv" for run in ("run1", "run2")]
+    assert {path.stat().st_ino for path in staged} == {blob.stat().st_ino}
+    assert all(path.read_bytes() == _DATA for path in staged)
+    assert not stat.S_IMODE(staged[0].stat().st_mode) & stat.S_IWUSR
+    assert stat.S_IMODE((job_dir / "inputs" / "data.csv").stat().st_mode) & stat.S_IWUSR
+    assert (job_dir / "runs" / "run1" / "work" / "inputs" / "manifest.json").is_file()
+
+
+def test_stage_file_falls_back_to_copy_across_devices(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Arrange
+    monkeypatch.setattr(input_blobs, "_try_reflink", _no_reflink)
+
+    def _cross_device(*_args: object, **_kwargs: object) -> None:
+        raise OSError(errno.EXDEV, "cross-device link")
+
+    monkeypatch.setattr(os, "link", _cross_device)
+    source = tmp_path / "source.dta"
+    source.write_bytes(b"payload")
+
+    # Act
+    method = stage_file(source=source, dest=tmp_path / "out" / "source.dta")
+
+    # Assert
+    dest = tmp_path / "out" / "source.dta"
+    assert method == STAGE_COPY
+    assert dest.read_bytes() == b"payload"
+    assert dest.stat().st_ino != source.stat().st_ino
+    assert not stat.S_IMODE(dest.stat().st_mode) & stat.S_IWUSR
+    assert sorted(p.name for p in dest.parent.iterdir()) == ["source.dta"]
+
+
+def test_blob_is_ingested_once_and_restaged_over_existing_dest(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Arrange
+    monkeypatch.setattr(input_blobs, "_try_reflink", _no_reflink)
+    store = InputBlobStore(blobs_dir=tmp_path / BLOB_DIRNAME)
+    source = tmp_path / "data.csv"
+    source.write_bytes(_DATA)
+    dest = tmp_path / "run" / "inputs" / "data.csv"
+    store.stage(source=source, dest=dest, sha256=_SHA)
+    blob_ino = (tmp_path / BLOB_DIRNAME / _SHA).stat().st_ino
+
+    # Act
+    method = store.stage(source=source, dest=dest, sha256=_SHA)
+
+    # Assert
+    assert method == STAGE_HARDLINK
+    assert (tmp_path / BLOB_DIRNAME / _SHA).stat().st_ino == blob_ino
+    assert dest.read_bytes() == _DATA
+
+
+def test_blob_not_matching_its_sha256_is_replaced_from_the_upload(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Arrange
+    monkeypatch.setattr(input_blobs, "_try_reflink", _no_reflink)
+    store = InputBlobStore(blobs_dir=tmp_path / BLOB_DIRNAME)
+    (tmp_path / BLOB_DIRNAME).mkdir()
+    (tmp_path / BLOB_DIRNAME / _SHA).write_bytes(b"a,b\n9,9\n")
+    source = tmp_path / "data.csv"
+    source.write_bytes(_DATA)
+    dest = tmp_path / "run" / "inputs" / "data.csv"
+
+    # Act
+    store.stage(source=source, dest=dest, sha256=_SHA)
+
+    # Assert
+    assert dest.read_bytes() == _DATA
+    assert (tmp_path / BLOB_DIRNAME / _SHA).read_bytes() == _DATA
+    assert dest.stat().st_ino != source.stat().st_ino
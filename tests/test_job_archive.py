@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from src.domain.artifacts_service import ArtifactsService
+from src.domain.models import (
+    JOB_SCHEMA_VERSION_CURRENT,
+    ArtifactKind,
+    ArtifactRef,
+    Job,
+    JobStatus,
+)
+from src.infra import durability as durability_module
+from src.infra.archive_restoring_job_store import ArchiveRestoringJobStore
+from src.infra.durability import Durability
+from src.infra.file_job_indexer import FileJobIndexer
+from src.infra.job_archive import ARCHIVE_INDEX_FILENAME, ARCHIVE_LOCKS_DIRNAME
+from src.infra.job_archive_cache import ArchiveExtractionCache
+from src.infra.job_archiver import JobArchiveReport, archive_terminal_jobs
+from src.infra.job_store import JobStore
+from src.utils.job_workspace import resolve_job_dir
+from src.utils.time import utc_now
+
+LOG_REL_PATH = "runs/run_0001/artifacts/stata.log"
+
+
+def _finished_job(store: JobStore, jobs_dir: Path, job_id: str, *, status: JobStatus) -> Path:
+    store.create(
+        Job(
+            schema_version=JOB_SCHEMA_VERSION_CURRENT,
+            job_id=job_id,
+            created_at="2026-01-01T00:00:00+00:00",
+            trace_id="0" * 32,
+            status=status,
+            artifacts_index=[ArtifactRef(kind=ArtifactKind.STATA_LOG, rel_path=LOG_REL_PATH)],
+        )
+    )
+    job_dir = resolve_job_dir(jobs_dir=jobs_dir, job_id=job_id)
+    assert job_dir is not None
+    (job_dir / "runs/run_0001/artifacts").mkdir(parents=True)
+    (job_dir / LOG_REL_PATH).write_text(f"log of {job_id}\n", encoding="utf-8")
+    (job_dir / "inputs").mkdir()
+    (job_dir / "inputs/primary.csv").write_text("a,b\n1,2\n", encoding="utf-8")
+    return job_dir
+
+
+def _archive(
+    store: JobStore, jobs_dir: Path, *, archive_format: str, now: datetime | None = None
+) -> JobArchiveReport:
+    return archive_terminal_jobs(
+        jobs_dir=jobs_dir,
+        lock_dir=jobs_dir / "_archive_cache" / ARCHIVE_LOCKS_DIRNAME,
+        store=store,
+        indexer=FileJobIndexer(jobs_dir=jobs_dir),
+        archive_format=archive_format,
+        min_age=timedelta(days=30),
+        now=utc_now() + timedelta(days=31) if now is None else now,
+    )
+
+
+@pytest.mark.parametrize("archive_format", ["zip", "tar.gz"])
+def test_archived_job_still_loads_and_serves_downloads(
+    store: JobStore, jobs_dir: Path, tmp_path: Path, archive_format: str
+) -> None:
+    # Arrange
+    job_dir = _finished_job(store, jobs_dir, "job_archive_ok", status=JobStatus.SUCCEEDED)
+    service = ArtifactsService(
+        store=store,
+        jobs_dir=jobs_dir,
+        archive=ArchiveExtractionCache(cache_dir=tmp_path / "cache"),
+    )
+
+    # Act
+    report = _archive(store, jobs_dir, archive_format=archive_format)
+    path = service.resolve_download_path(job_id="job_archive_ok", rel_path=LOG_REL_PATH)
+
+    # Assert
+    assert (report.archived, report.files) == (1, 2)
+    assert not (job_dir / "runs").exists() and not (job_dir / "inputs").exists()
+    assert (job_dir / ARCHIVE_INDEX_FILENAME).is_file()
+    assert store.load("job_archive_ok").status == JobStatus.SUCCEEDED
+    assert path.read_text(encoding="utf-8") == "log of job_archive_ok\n"
+
+
+def test_archive_skips_unfinished_and_recent_jobs(store: JobStore, jobs_dir: Path) -> None:
+    # Arrange
+    running_dir = _finished_job(store, jobs_dir, "job_archive_busy", status=JobStatus.RUNNING)
+    recent_dir = _finished_job(store, jobs_dir, "job_archive_new", status=JobStatus.SUCCEEDED)
+
+    # Act
+    report = _archive(store, jobs_dir, archive_format="zip", now=utc_now() + timedelta(days=1))
+
+    # Assert
+    assert (report.archived, report.skipped) == (0, 2)
+    assert (running_dir / LOG_REL_PATH).is_file()
+    assert (recent_dir / LOG_REL_PATH).is_file()
+
+
+def test_extraction_cache_evicts_least_recently_read_job(
+    store: JobStore, jobs_dir: Path, tmp_path: Path
+) -> None:
+    # Arrange
+    first_dir = _finished_job(store, jobs_dir, "job_archive_a", status=JobStatus.SUCCEEDED)
+    second_dir = _finished_job(store, jobs_dir, "job_archive_b", status=JobStatus.FAILED)
+    _archive(store, jobs_dir, archive_format="zip")
+    cache = ArchiveExtractionCache(cache_dir=tmp_path / "cache", max_jobs=1)
+
+    # Act
+    first = cache.resolve_archived(job_id="job_archive_a", job_dir=first_dir, rel_path=LOG_REL_PATH)
+    second = cache.resolve_archived(
+        job_id="job_archive_b", job_dir=second_dir, rel_path=LOG_REL_PATH
+    )
+
+    # Assert
+    assert first is not None and second is not None
+    assert not first.exists()
+    assert second.read_text(encoding="utf-8") == "log of job_archive_b\n"
+    assert cache.resolve_archived(job_id="job_archive_b", job_dir=second_dir, rel_path="x") is None
+
+
+def test_requeueing_archived_job_restores_its_workspace(store: JobStore, jobs_dir: Path) -> None:
+    # Arrange
+    job_dir = _finished_job(store, jobs_dir, "job_archive_retry", status=JobStatus.FAILED)
+    _archive(store, jobs_dir, archive_format="tar.gz")
+    restoring = ArchiveRestoringJobStore(
+        inner=store,
+        jobs_dir=jobs_dir,
+        lock_dir=jobs_dir / "_archive_cache" / ARCHIVE_LOCKS_DIRNAME,
+    )
+    job = restoring.load("job_archive_retry")
+    job.status = JobStatus.QUEUED
+
+    # Act
+    restoring.save(job)
+
+    # Assert
+    assert (job_dir / "inputs/primary.csv").read_text(encoding="utf-8") == "a,b\n1,2\n"
+    assert (job_dir / LOG_REL_PATH).is_file()
+    assert not (job_dir / ARCHIVE_INDEX_FILENAME).exists()
+    assert not (job_dir / "workspace.tar.gz").exists()
+
+
+def test_archive_fsyncs_before_unlinking_even_under_os_durability(
+    store: JobStore, jobs_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    # Arrange
+    job_dir = _finished_job(store, jobs_dir, "job_archive_sync", status=JobStatus.SUCCEEDED)
+    monkeypatch.setattr(durability_module, "_durability", Durability(policy="os"))
+    events: list[str] = []
+    real_fsync, real_unlink = durability_module.os.fsync, Path.unlink
+    monkeypatch.setattr(
+        durability_module.os, "fsync", lambda fd: (events.append("fsync"), real_fsync(fd))[1]
+    )
+
+    def _unlink(self: Path, missing_ok: bool = False) -> None:
+        if self.is_relative_to(job_dir) and self.name in {"stata.log", "primary.csv"}:
+            events.append("unlink")
+        real_unlink(self, missing_ok=missing_ok)
+
+    monkeypatch.setattr(Path, "unlink", _unlink)
+
+    # Act
+    _archive(store, jobs_dir, archive_format="zip")
+
+    # Assert
+    first_unlink = events.index("unlink")
+    assert events[:first_unlink].count("fsync") >= 4
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
 import hashlib
+import io
 import json
 
 import pytest
 
 from src.api import deps
+from src.domain.job_inputs_models import DatasetUpload
 from src.domain.job_inputs_service import JobInputsService
+from src.domain.job_inputs_staging import UPLOAD_CHUNK_SIZE
 from src.domain.models import ArtifactKind
 from src.infra.file_job_workspace_store import FileJobWorkspaceStore
 from src.main import create_app
@@ -253,3 +256,66 @@ async def test_upload_when_cross_tenant_access_returns_404(job_service, store, j
 
     assert response.status_code == 404
     assert response.json()["error_code"] == "JOB_NOT_FOUND"
+
+
+async def test_upload_when_dataset_set_invalid_leaves_no_staged_files(
+    job_service, store, jobs_dir
+) -> None:
+    app = _app(svc=_svc(store=store, jobs_dir=jobs_dir))
+    job = job_service.create_job(requirement="hello")
+
+    async with asgi_client(app=app) as client:
+        response = await client.post(
+            f"/v1/jobs/{job.job_id}/inputs/upload",
+            files=[
+                ("file", ("a.csv", b"a\n1\n", "text/csv")),
+                ("file", ("b.csv", b"b\n2\n", "text/csv")),
+            ],
+            data={"role": ["primary_dataset", "primary_dataset"]},
+        )
+
+    assert response.status_code == 400
+    assert response.json()["error_code"] == "INPUT_PRIMARY_DATASET_MULTIPLE"
+    job_dir = resolve_job_dir(jobs_dir=jobs_dir, job_id=job.job_id)
+    assert job_dir is not None
+    inputs_dir = job_dir / "inputs"
+    assert not inputs_dir.exists() or list(inputs_dir.iterdir()) == []
+
+
+class _ReadSizeRecorder(io.BytesIO):
+    def __init__(self, data: bytes) -> None:
+        super().__init__(data)
+        self.max_read = 0
+
+    def read(self, size: int | None = -1, /) -> bytes:
+        chunk = super().read(size)
+        self.max_read = max(self.max_read, len(chunk))
+        return chunk
+
+
+def test_upload_datasets_streams_in_bounded_chunks(job_service, store, jobs_dir) -> None:
+    # Arrange
+    svc = _svc(store=store, jobs_dir=jobs_dir)
+    job = job_service.create_job(requirement="hello")
+    data = b"x,y\n" + b"1,2\n" * (1024 * 1024)
+    stream = _ReadSizeRecorder(data)
+
+    # Act
+    svc.upload_datasets(
+        job_id=job.job_id,
+        uploads=[
+            DatasetUpload(
+                role="primary_dataset",
+                stream=stream,
+                original_name="big.csv",
+                filename_override=None,
+                content_type="text/csv",
+            )
+        ],
+    )
+
+    # Assert
+    assert stream.max_read <= UPLOAD_CHUNK_SIZE
+    job_dir = resolve_job_dir(jobs_dir=jobs_dir, job_id=job.job_id)
+    assert job_dir is not None
+    assert (job_dir / "inputs" / f"{_dataset_key(data)}.csv").read_bytes() == data
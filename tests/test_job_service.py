@@ -143,3 +143,17 @@ def test_trigger_run_with_output_formats_persists_output_formats(job_service, dr
     # Assert
     loaded = store.load(job.job_id)
     assert loaded.output_formats == ["docx", "pdf", "xlsx", "csv"]
+
+
+def test_trigger_run_first_run_persists_run_cache_bypass(job_service, draft_service, store):
+    # Arrange
+    job = job_service.create_job(requirement=None)
+    asyncio.run(draft_service.preview(job_id=job.job_id))
+
+    # Act
+    job_service.trigger_run(job_id=job.job_id, bypass_run_cache=True)
+
+    # Assert
+    loaded = store.load(job.job_id)
+    assert loaded.status == JobStatus.QUEUED
+    assert loaded.run_cache_bypass is True
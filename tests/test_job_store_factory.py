@@ -3,7 +3,10 @@ from __future__ import annotations
 import pytest
 
 from src.config import load_config
+from src.infra.archive_restoring_job_store import ArchiveRestoringJobStore
+from src.infra.caching_job_store import CachingJobStore
 from src.infra.exceptions import JobStoreBackendUnsupportedError
+from src.infra.indexed_job_store import IndexedJobStore
 from src.infra.job_store import JobStore as FileJobStore
 from src.infra.job_store_factory import build_job_store
 
@@ -13,7 +16,10 @@ def test_build_job_store_with_default_config_returns_file_job_store() -> None:
 
     store = build_job_store(config=config)
 
-    assert isinstance(store, FileJobStore)
+    assert isinstance(store, ArchiveRestoringJobStore)
+    assert isinstance(store.inner, IndexedJobStore)
+    assert isinstance(store.inner.inner, CachingJobStore)
+    assert isinstance(store.inner.inner.inner, FileJobStore)
 
 
 def test_build_job_store_with_unsupported_backend_raises_unsupported_error() -> None:
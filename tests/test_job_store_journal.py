@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from src.domain.models import (
+    JOB_SCHEMA_VERSION_CURRENT,
+    ArtifactKind,
+    ArtifactRef,
+    Job,
+    JobStatus,
+    RunAttempt,
+)
+from src.infra.job_store import JobStore
+from src.utils.job_workspace import resolve_job_dir, shard_for_job_id
+
+JOB_ID = "job_journal"
+
+
+def _create(store: JobStore, jobs_dir: Path) -> Path:
+    store.create(
+        Job(
+            schema_version=JOB_SCHEMA_VERSION_CURRENT,
+            job_id=JOB_ID,
+            created_at="2026-01-01T00:00:00+00:00",
+            trace_id="0" * 32,
+        )
+    )
+    job_dir = resolve_job_dir(jobs_dir=jobs_dir, job_id=JOB_ID)
+    assert job_dir is not None
+    return job_dir
+
+
+def _add_artifact(store: JobStore, index: int) -> None:
+    job = store.load(JOB_ID)
+    job.artifacts_index.append(ArtifactRef(kind=ArtifactKind.LLM_PROMPT, rel_path=f"p{index}.txt"))
+    store.save(job)
+
+
+def test_save_with_new_artifacts_appends_journal_and_keeps_core_compact(jobs_dir: Path) -> None:
+    # Arrange
+    store = JobStore(jobs_dir=jobs_dir)
+    job_dir = _create(store, jobs_dir)
+
+    # Act
+    for index in range(3):
+        _add_artifact(store, index)
+    loaded = store.load(JOB_ID)
+
+    # Assert
+    core = json.loads((job_dir / "job.json").read_text(encoding="utf-8"))
+    journal = (job_dir / core["journal"]["file"]).read_bytes().splitlines()
+    assert "artifacts_index" not in core and "runs" not in core
+    assert core["journal"]["entries"] == 3
+    assert json.loads(journal[-1])["artifacts_index"] == {
+        "at": 2,
+        "items": [{"kind": "llm.prompt", "rel_path": "p2.txt"}],
+    }
+    assert [ref.rel_path for ref in loaded.artifacts_index] == ["p0.txt", "p1.txt", "p2.txt"]
+    assert loaded.version == 4
+
+
+def test_save_with_run_updated_in_place_splices_from_changed_run(jobs_dir: Path) -> None:
+    # Arrange
+    store = JobStore(jobs_dir=jobs_dir)
+    _create(store, jobs_dir)
+    job = store.load(JOB_ID)
+    job.runs.extend(
+        [RunAttempt(run_id="r1", status="failed"), RunAttempt(run_id="r2", status="running")]
+    )
+    store.save(job)
+
+    # Act
+    job.runs[1].status = "succeeded"
+    job.status = JobStatus.QUEUED
+    store.save(job)
+    loaded = store.load(JOB_ID)
+
+    # Assert
+    assert [(run.run_id, run.status) for run in loaded.runs] == [
+        ("r1", "failed"),
+        ("r2", "succeeded"),
+    ]
+    assert loaded.status == JobStatus.QUEUED
+
+
+def test_save_past_compaction_threshold_snapshots_into_new_generation(jobs_dir: Path) -> None:
+    # Arrange
+    store = JobStore(jobs_dir=jobs_dir, journal_compact_entries=2)
+    job_dir = _create(store, jobs_dir)
+
+    # Act
+    for index in range(3):
+        _add_artifact(store, index)
+
+    # Assert
+    core = json.loads((job_dir / "job.json").read_text(encoding="utf-8"))
+    journals = sorted(p.name for p in job_dir.glob("job.journal.*.jsonl"))
+    assert journals == [core["journal"]["file"]] == ["job.journal.4.jsonl"]
+    assert core["journal"]["entries"] == 1
+    assert len(store.load(JOB_ID).artifacts_index) == 3
+
+
+def test_load_ignores_journal_bytes_past_committed_length(jobs_dir: Path) -> None:
+    # Arrange
+    store = JobStore(jobs_dir=jobs_dir)
+    job_dir = _create(store, jobs_dir)
+    _add_artifact(store, 0)
+    core = json.loads((job_dir / "job.json").read_text(encoding="utf-8"))
+    with (job_dir / core["journal"]["file"]).open("ab") as f:
+        f.write(b'{"artifacts_index": {"at": 0, "items": []}, "version": 9}\n{"torn')
+
+    # Act
+    loaded = store.load(JOB_ID)
+    _add_artifact(store, 1)
+    reloaded = store.load(JOB_ID)
+
+    # Assert
+    assert [ref.rel_path for ref in loaded.artifacts_index] == ["p0.txt"]
+    assert [ref.rel_path for ref in reloaded.artifacts_index] == ["p0.txt", "p1.txt"]
+
+
+def test_save_of_legacy_inline_job_moves_collections_into_journal(jobs_dir: Path) -> None:
+    # Arrange
+    job_dir = jobs_dir / shard_for_job_id(JOB_ID) / JOB_ID
+    job_dir.mkdir(parents=True)
+    inline = Job(
+        schema_version=JOB_SCHEMA_VERSION_CURRENT,
+        job_id=JOB_ID,
+        created_at="2026-01-01T00:00:00+00:00",
+        trace_id="0" * 32,
+        runs=[RunAttempt(run_id="r1", status="succeeded")],
+    )
+    (job_dir / "job.json").write_text(inline.model_dump_json(), encoding="utf-8")
+    store = JobStore(jobs_dir=jobs_dir)
+
+    # Act
+    _add_artifact(store, 0)
+
+    # Assert
+    core = json.loads((job_dir / "job.json").read_text(encoding="utf-8"))
+    loaded = store.load(JOB_ID)
+    assert "runs" not in core
+    assert [run.run_id for run in loaded.runs] == ["r1"]
+    assert [ref.rel_path for ref in loaded.artifacts_index] == ["p0.txt"]
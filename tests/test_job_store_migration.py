@@ -2,6 +2,15 @@ from __future__ import annotations
 
 import json
 import logging
+from pathlib import Path
+
+from src.infra.job_schema_migration import (
+    DEFAULT_STATE_FILENAME,
+    JobSchemaMigrationProgress,
+    migrate_job_schemas,
+)
+from src.infra.job_store import JobStore
+from src.utils.tenancy import TENANTS_DIRNAME
 
 
 def test_load_with_v1_job_json_migrates_to_v3_and_persists(store, jobs_dir, caplog) -> None:
@@ -42,3 +51,72 @@ def test_load_with_v1_job_json_migrates_to_v3_and_persists(store, jobs_dir, capl
     steps = [(getattr(r, "from_version"), getattr(r, "to_version")) for r in records]
     assert steps == [(1, 2), (2, 3)]
     assert all(getattr(r, "job_id") == job_id for r in records)
+
+
+def _write_v1_job(jobs_dir: Path, job_id: str, *, tenant_id: str | None = None) -> Path:
+    root = jobs_dir if tenant_id is None else jobs_dir / TENANTS_DIRNAME / tenant_id
+    job_dir = root / job_id
+    job_dir.mkdir(parents=True, exist_ok=True)
+    path = job_dir / "job.json"
+    payload = {
+        "schema_version": 1,
+        "job_id": job_id,
+        "status": "created",
+        "created_at": "2026-01-06T17:50:00+00:00",
+    }
+    path.write_text(json.dumps(payload), encoding="utf-8")
+    return path
+
+
+def test_load_with_read_only_loads_migrates_in_memory_without_writing(jobs_dir: Path) -> None:
+    # Arrange
+    path = _write_v1_job(jobs_dir, "job_read_only")
+    before = path.read_bytes()
+    store = JobStore(jobs_dir=jobs_dir, read_only_loads=True)
+
+    # Act
+    first = store.load("job_read_only")
+    second = store.load("job_read_only")
+
+    # Assert
+    assert first.schema_version == 3
+    assert first.trace_id == second.trace_id
+    assert path.read_bytes() == before
+
+
+def test_migrate_job_schemas_migrates_all_tenants_and_resumes(jobs_dir: Path) -> None:
+    # Arrange
+    default_path = _write_v1_job(jobs_dir, "job_bulk_a")
+    tenant_path = _write_v1_job(jobs_dir, "job_bulk_b", tenant_id="acme")
+    state_path = jobs_dir / DEFAULT_STATE_FILENAME
+    progress: list[JobSchemaMigrationProgress] = []
+
+    # Act
+    first = migrate_job_schemas(
+        jobs_dir=jobs_dir, state_path=state_path, chunk_size=1, on_progress=progress.append
+    )
+    second = migrate_job_schemas(jobs_dir=jobs_dir, state_path=state_path)
+    restarted = migrate_job_schemas(jobs_dir=jobs_dir, state_path=state_path, restart=True)
+
+    # Assert
+    assert (first.total, first.migrated, first.failed) == (2, 2, 0)
+    assert [p.done for p in progress] == [1, 2]
+    assert (second.resumed, second.migrated) == (2, 0)
+    assert (restarted.resumed, restarted.unchanged) == (0, 2)
+    for path in (default_path, tenant_path):
+        assert json.loads(path.read_text(encoding="utf-8"))["schema_version"] == 3
+
+
+def test_migrate_job_schemas_with_process_pool_migrates_every_job(jobs_dir: Path) -> None:
+    # Arrange
+    paths = [_write_v1_job(jobs_dir, f"job_pool_{i}") for i in range(6)]
+
+    # Act
+    report = migrate_job_schemas(
+        jobs_dir=jobs_dir, state_path=jobs_dir / DEFAULT_STATE_FILENAME, workers=2, chunk_size=2
+    )
+
+    # Assert
+    assert (report.total, report.migrated, report.failed) == (6, 6, 0)
+    for path in paths:
+        assert json.loads(path.read_text(encoding="utf-8"))["schema_version"] == 3
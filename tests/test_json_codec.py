@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.domain.models import JOB_SCHEMA_VERSION_CURRENT, Job
+from src.infra.job_store import JobStore
+from src.infra.sqlite_database import SQLiteDatabase
+from src.infra.sqlite_job_store import SQLiteJobStore
+from src.utils.job_workspace import resolve_job_dir
+from src.utils.json_codec import OrjsonJsonCodec, StdlibJsonCodec
+
+PAYLOAD = {"b": [1, 2.5, None], "a": "中文", "c": {"z": True, "y": "x"}}
+
+
+def _job() -> Job:
+    return Job(
+        schema_version=JOB_SCHEMA_VERSION_CURRENT,
+        job_id="job_codec",
+        created_at="2026-01-01T00:00:00+00:00",
+        trace_id="0" * 32,
+    )
+
+
+def test_stdlib_codec_pretty_matches_historical_layout() -> None:
+    # Arrange
+    codec = StdlibJsonCodec()
+
+    # Act
+    pretty = codec.dumps(PAYLOAD)
+    compact = codec.dumps(PAYLOAD, compact=True)
+
+    # Assert
+    assert pretty == json.dumps(PAYLOAD, ensure_ascii=False, indent=2, sort_keys=True).encode()
+    assert compact == '{"a":"中文","b":[1,2.5,null],"c":{"y":"x","z":true}}'.encode()
+    assert codec.loads(compact) == PAYLOAD
+
+
+def test_orjson_codec_matches_stdlib_layout() -> None:
+    # Arrange
+    orjson = pytest.importorskip("orjson")
+    codec = OrjsonJsonCodec(module=orjson)
+
+    # Act
+    pretty = codec.dumps(PAYLOAD)
+    compact = codec.dumps(PAYLOAD, compact=True)
+
+    # Assert
+    assert pretty == StdlibJsonCodec().dumps(PAYLOAD)
+    assert compact == StdlibJsonCodec().dumps(PAYLOAD, compact=True)
+    with pytest.raises(json.JSONDecodeError):
+        codec.loads(b"{")
+
+
+def test_file_store_with_compact_json_writes_single_line_job(jobs_dir: Path) -> None:
+    # Arrange
+    store = JobStore(jobs_dir=jobs_dir, compact_json=True)
+    store.create(_job())
+    job = store.load("job_codec")
+    job.requirement = "compact"
+
+    # Act
+    store.save(job)
+
+    # Assert
+    job_dir = resolve_job_dir(jobs_dir=jobs_dir, job_id="job_codec")
+    assert job_dir is not None
+    raw = (job_dir / "job.json").read_text(encoding="utf-8")
+    assert "\n" not in raw
+    assert store.load("job_codec").requirement == "compact"
+
+
+def test_sqlite_store_round_trips_job_through_model_dump_json(tmp_path: Path) -> None:
+    # Arrange
+    store = SQLiteJobStore(db=SQLiteDatabase(path=tmp_path / "ss.sqlite3"), jobs_dir=tmp_path)
+    store.create(_job())
+    job = store.load("job_codec")
+    job.requirement = "direct"
+
+    # Act
+    store.save(job)
+    loaded = store.load("job_codec")
+
+    # Assert
+    assert loaded.requirement == "direct"
+    assert loaded.version == 2
@@ -0,0 +1,161 @@
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from src.config import load_config
+from src.infra.doorbell_queue_notifier import DOORBELL_DIRNAME, DoorbellQueueNotifier
+from src.infra.exceptions import QueueNotifierUnsupportedError
+from src.infra.file_worker_queue import FileWorkerQueue
+from src.infra.inotify_queue_notifier import InotifyQueueNotifier, inotify_available
+from src.infra.queue_notifier_factory import build_queue_notifier
+
+_WAKE_BUDGET_SECONDS = 0.5
+
+
+def _config(tmp_path: Path, **env: str):
+    return load_config(
+        env={
+            "SS_LLM_PROVIDER": "yunwu",
+            "SS_LLM_API_KEY": "test-key",
+            "SS_JOBS_DIR": str(tmp_path / "jobs"),
+            "SS_QUEUE_DIR": str(tmp_path / "queue"),
+            **env,
+        }
+    )
+
+
+def test_doorbell_notifier_when_job_enqueued_wakes_before_timeout(tmp_path: Path) -> None:
+    # Arrange
+    queue_dir = tmp_path / "queue"
+    notifier = DoorbellQueueNotifier(doorbell_dir=queue_dir / DOORBELL_DIRNAME)
+    queue = FileWorkerQueue(queue_dir=queue_dir, lease_ttl_seconds=60)
+
+    # Act
+    queue.enqueue(job_id="job_test")
+    started = time.monotonic()
+    woke = notifier.wait(timeout_seconds=5.0)
+    elapsed = time.monotonic() - started
+    notifier.close()
+
+    # Assert
+    assert woke is True
+    assert elapsed < _WAKE_BUDGET_SECONDS
+
+
+def test_doorbell_notifier_when_closed_removes_socket_and_ring_is_noop(tmp_path: Path) -> None:
+    # Arrange
+    queue_dir = tmp_path / "queue"
+    notifier = DoorbellQueueNotifier(doorbell_dir=queue_dir / DOORBELL_DIRNAME)
+    queue = FileWorkerQueue(queue_dir=queue_dir, lease_ttl_seconds=60)
+
+    # Act
+    notifier.close()
+    queue.enqueue(job_id="job_test")
+
+    # Assert
+    assert list((queue_dir / DOORBELL_DIRNAME).iterdir()) == []
+
+
+def test_notifier_when_interrupted_returns_false_without_waiting(tmp_path: Path) -> None:
+    # Arrange
+    notifier = DoorbellQueueNotifier(doorbell_dir=tmp_path / DOORBELL_DIRNAME)
+    threading.Timer(0.05, notifier.interrupt).start()
+
+    # Act
+    started = time.monotonic()
+    woke = notifier.wait(timeout_seconds=5.0)
+    elapsed = time.monotonic() - started
+    notifier.close()
+
+    # Assert
+    assert woke is False
+    assert elapsed < _WAKE_BUDGET_SECONDS
+
+
+@pytest.mark.skipif(not inotify_available(), reason="inotify not available")
+def test_inotify_notifier_when_tenant_job_enqueued_wakes_before_timeout(tmp_path: Path) -> None:
+    # Arrange
+    queue_dir = tmp_path / "queue"
+    notifier = InotifyQueueNotifier(queued_dir=queue_dir / "queued")
+    queue = FileWorkerQueue(queue_dir=queue_dir, lease_ttl_seconds=60)
+    queue.enqueue(job_id="job_first", tenant_id="tenant-a")
+    notifier.wait(timeout_seconds=1.0)
+
+    # Act
+    queue.enqueue(job_id="job_second", tenant_id="tenant-a")
+    started = time.monotonic()
+    woke = notifier.wait(timeout_seconds=5.0)
+    elapsed = time.monotonic() - started
+    notifier.close()
+
+    # Assert
+    assert woke is True
+    assert elapsed < _WAKE_BUDGET_SECONDS
+
+
+@pytest.mark.skipif(not inotify_available(), reason="inotify not available")
+def test_inotify_notifier_wakes_only_once_a_record_is_closed(tmp_path: Path) -> None:
+    # Arrange
+    queued_dir = tmp_path / "queue" / "queued"
+    notifier = InotifyQueueNotifier(queued_dir=queued_dir)
+    record = (queued_dir / "job_partial.json").open("xb")
+
+    # Act
+    woke_while_open = notifier.wait(timeout_seconds=0.05)
+    record.write(b"{}")
+    record.close()
+    woke_after_close = notifier.wait(timeout_seconds=5.0)
+    notifier.close()
+
+    # Assert
+    assert woke_while_open is False
+    assert woke_after_close is True
+
+
+@pytest.mark.skipif(not inotify_available(), reason="inotify not available")
+def test_inotify_notifier_when_nothing_enqueued_times_out(tmp_path: Path) -> None:
+    # Arrange
+    notifier = InotifyQueueNotifier(queued_dir=tmp_path / "queue" / "queued")
+
+    # Act
+    woke = notifier.wait(timeout_seconds=0.05)
+    notifier.close()
+
+    # Assert
+    assert woke is False
+
+
+def test_build_queue_notifier_when_none_returns_none(tmp_path: Path) -> None:
+    # Arrange
+    config = _config(tmp_path)
+
+    # Act
+    notifier = build_queue_notifier(config=config)
+
+    # Assert
+    assert notifier is None
+
+
+def test_build_queue_notifier_when_doorbell_returns_doorbell_notifier(tmp_path: Path) -> None:
+    # Arrange
+    config = _config(tmp_path, SS_QUEUE_NOTIFIER="doorbell")
+
+    # Act
+    notifier = build_queue_notifier(config=config)
+
+    # Assert
+    assert isinstance(notifier, DoorbellQueueNotifier)
+    notifier.close()
+
+
+def test_build_queue_notifier_when_value_unknown_raises(tmp_path: Path) -> None:
+    # Arrange
+    config = _config(tmp_path, SS_QUEUE_NOTIFIER="kqueue")
+
+    # Act / Assert
+    with pytest.raises(QueueNotifierUnsupportedError):
+        build_queue_notifier(config=config)
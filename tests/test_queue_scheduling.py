@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from collections import Counter
+from pathlib import Path
+
+from src.config import load_config
+from src.domain.queue_scheduling import FairShareScheduler, QueueSchedulingPolicy, TenantQueueLoad
+from src.infra.worker_queue_factory import build_queue_scheduler
+
+
+def _next_tenant(scheduler: FairShareScheduler, loads: list[TenantQueueLoad]) -> str:
+    tenant_id = scheduler.order(loads)[0]
+    scheduler.record_claim(tenant_id=tenant_id)
+    return tenant_id
+
+
+def test_order_with_weights_alternates_tenants_in_weight_proportion() -> None:
+    # Arrange
+    scheduler = FairShareScheduler(
+        policy=QueueSchedulingPolicy(tenant_weights={"tenant-a": 3.0, "tenant-b": 1.0})
+    )
+    loads = [
+        TenantQueueLoad(tenant_id="tenant-a", ready=100, inflight=0),
+        TenantQueueLoad(tenant_id="tenant-b", ready=100, inflight=0),
+    ]
+
+    # Act
+    picks = Counter(_next_tenant(scheduler, loads) for _ in range(40))
+
+    # Assert
+    assert picks == {"tenant-a": 30, "tenant-b": 10}
+
+
+def test_order_prefers_tenant_with_fewer_inflight_jobs_per_weight() -> None:
+    # Arrange
+    scheduler = FairShareScheduler()
+    loads = [
+        TenantQueueLoad(tenant_id="tenant-a", ready=5, inflight=3),
+        TenantQueueLoad(tenant_id="tenant-b", ready=5, inflight=1),
+    ]
+
+    # Act
+    order = scheduler.order(loads)
+
+    # Assert
+    assert order == ["tenant-b", "tenant-a"]
+
+
+def test_order_skips_tenants_at_cap_and_without_ready_jobs() -> None:
+    # Arrange
+    scheduler = FairShareScheduler(
+        policy=QueueSchedulingPolicy(tenant_max_inflight={"tenant-a": 2, "*": 5})
+    )
+    loads = [
+        TenantQueueLoad(tenant_id="tenant-a", ready=3, inflight=2),
+        TenantQueueLoad(tenant_id="tenant-b", ready=0, inflight=0),
+        TenantQueueLoad(tenant_id="tenant-c", ready=1, inflight=4),
+    ]
+
+    # Act
+    order = scheduler.order(loads)
+
+    # Assert
+    assert order == ["tenant-c"]
+
+
+def test_order_when_idle_tenant_returns_does_not_replay_unused_share() -> None:
+    # Arrange
+    scheduler = FairShareScheduler()
+    busy_only = [TenantQueueLoad(tenant_id="tenant-a", ready=100, inflight=0)]
+    both = [*busy_only, TenantQueueLoad(tenant_id="tenant-b", ready=100, inflight=0)]
+    for _ in range(20):
+        _next_tenant(scheduler, busy_only)
+
+    # Act
+    picks = [_next_tenant(scheduler, both) for _ in range(6)]
+
+    # Assert
+    assert Counter(picks) == {"tenant-a": 3, "tenant-b": 3}
+
+
+def test_build_queue_scheduler_parses_tenant_weights_and_caps(tmp_path: Path) -> None:
+    # Arrange
+    config = load_config(
+        env={
+            "SS_LLM_PROVIDER": "yunwu",
+            "SS_LLM_API_KEY": "test-key",
+            "SS_JOBS_DIR": str(tmp_path / "jobs"),
+            "SS_QUEUE_TENANT_WEIGHTS": "tenant-a=3, tenant-b=0.5, broken, tenant-c=-1",
+            "SS_QUEUE_TENANT_MAX_INFLIGHT": "tenant-a=2,*=4",
+        }
+    )
+
+    # Act
+    policy = build_queue_scheduler(config=config).policy
+
+    # Assert
+    assert dict(policy.tenant_weights) == {"tenant-a": 3.0, "tenant-b": 0.5}
+    assert policy.weight("tenant-c") == 1.0
+    assert policy.max_inflight("tenant-a") == 2
+    assert policy.max_inflight("tenant-z") == 4
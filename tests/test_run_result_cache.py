@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from src.domain.do_template_run_service import DoTemplateRunService
+from src.domain.models import ArtifactKind, ArtifactRef
+from src.domain.stata_runner import RunResult
+from src.infra.fs_do_template_repository import FileSystemDoTemplateRepository
+from src.infra.run_result_cache import FileRunResultCache
+from src.infra.stata_run_support import job_rel_path, resolve_run_dirs, write_json, write_text
+
+
+class CountingRunner:
+    def __init__(self, *, jobs_dir: Path):
+        self._jobs_dir = jobs_dir
+        self.calls = 0
+
+    def run(
+        self,
+        *,
+        tenant_id: str = "default",
+        job_id: str,
+        run_id: str,
+        do_file: str,
+        timeout_seconds: int | None = None,
+    ) -> RunResult:
+        self.calls += 1
+        dirs = resolve_run_dirs(jobs_dir=self._jobs_dir, job_id=job_id, run_id=run_id)
+        assert dirs is not None
+        write_text(dirs.work_dir / "result.log", f"call {self.calls}\n")
+        meta_path = dirs.artifacts_dir / "run.meta.json"
+        write_json(meta_path, {"job_id": job_id, "run_id": run_id, "ok": True})
+        return RunResult(
+            job_id=job_id,
+            run_id=run_id,
+            ok=True,
+            exit_code=0,
+            timed_out=False,
+            artifacts=(
+                ArtifactRef(
+                    kind=ArtifactKind.RUN_META_JSON,
+                    rel_path=job_rel_path(job_dir=dirs.job_dir, path=meta_path),
+                ),
+            ),
+        )
+
+
+@pytest.fixture
+def run_cache(tmp_path: Path) -> FileRunResultCache:
+    return FileRunResultCache(
+        cache_dir=tmp_path / "run_cache", max_bytes=1024 * 1024, stata_cmd=("stata-mp",)
+    )
+
+
+def _service(
+    *,
+    store,
+    state_machine,
+    jobs_dir: Path,
+    library: Path,
+    runner: CountingRunner,
+    run_cache: FileRunResultCache,
+):
+    return DoTemplateRunService(
+        store=store,
+        runner=runner,
+        repo=FileSystemDoTemplateRepository(library_dir=library),
+        state_machine=state_machine,
+        jobs_dir=jobs_dir,
+        run_result_cache=run_cache,
+    )
+
+
+def _library(tmp_path: Path, *, meta_extra: dict[str, object]) -> Path:
+    library = tmp_path / "library"
+    (library / "do" / "meta").mkdir(parents=True)
+    (library / "DO_LIBRARY_INDEX.json").write_text(
+        json.dumps({"tasks": {"T01": {"do_file": "T01_demo.do"}}}), encoding="utf-8"
+    )
+    (library / "do" / "T01_demo.do").write_text('display "__X__"\n', encoding="utf-8")
+    meta = {
+        "id": "T01",
+        "version": "1.0.0",
+        "parameters": [{"name": "__X__", "required": True}],
+        "outputs": [{"file": "result.log", "type": "log"}],
+        **meta_extra,
+    }
+    (library / "do" / "meta" / "T01_demo.meta.json").write_text(
+        json.dumps(meta), encoding="utf-8"
+    )
+    return library
+
+
+def test_identical_run_restores_cached_outputs_without_running_stata(
+    job_service, store, state_machine, jobs_dir: Path, tmp_path: Path, run_cache
+) -> None:
+    # Arrange
+    runner = CountingRunner(jobs_dir=jobs_dir)
+    svc = _service(
+        store=store,
+        state_machine=state_machine,
+        jobs_dir=jobs_dir,
+        library=_library(tmp_path, meta_extra={}),
+        runner=runner,
+        run_cache=run_cache,
+    )
+    first = job_service.create_job(requirement="first")
+    second = job_service.create_job(requirement="second")
+    svc.run(job_id=first.job_id, template_id="T01", params={"__X__": "1"}, run_id="run-a")
+
+    # Act
+    result = svc.run(job_id=second.job_id, template_id="T01", params={"__X__": "1"}, run_id="run-b")
+
+    # Assert
+    dirs = resolve_run_dirs(jobs_dir=jobs_dir, job_id=second.job_id, run_id="run-b")
+    assert dirs is not None
+    meta = json.loads((dirs.artifacts_dir / "run.meta.json").read_text(encoding="utf-8"))
+    assert runner.calls == 1
+    assert result.ok is True
+    assert (dirs.work_dir / "result.log").read_text(encoding="utf-8") == "call 1\n"
+    assert (meta["job_id"], meta["run_id"]) == (second.job_id, "run-b")
+    assert meta["run_cache"]["source_job_id"] == first.job_id
+
+
+def test_non_deterministic_template_runs_stata_every_time(
+    job_service, store, state_machine, jobs_dir: Path, tmp_path: Path, run_cache
+) -> None:
+    # Arrange
+    runner = CountingRunner(jobs_dir=jobs_dir)
+    svc = _service(
+        store=store,
+        state_machine=state_machine,
+        jobs_dir=jobs_dir,
+        library=_library(tmp_path, meta_extra={"deterministic": False}),
+        runner=runner,
+        run_cache=run_cache,
+    )
+    first = job_service.create_job(requirement="first")
+    second = job_service.create_job(requirement="second")
+
+    # Act
+    svc.run(job_id=first.job_id, template_id="T01", params={"__X__": "1"}, run_id="run-a")
+    svc.run(job_id=second.job_id, template_id="T01", params={"__X__": "1"}, run_id="run-b")
+
+    # Assert
+    assert runner.calls == 2
+    assert list((tmp_path / "run_cache").rglob("*.zip")) == []
+
+
+def test_store_evicts_oldest_entries_past_max_bytes(tmp_path: Path) -> None:
+    # Arrange
+    run_dir = tmp_path / "run"
+    (run_dir / "work").mkdir(parents=True)
+    (run_dir / "work" / "out.bin").write_bytes(os.urandom(600))
+    cache = FileRunResultCache(cache_dir=tmp_path / "cache", max_bytes=2000, stata_cmd=())
+    result = {"exit_code": 0, "artifacts": []}
+
+    # Act
+    for index, key in enumerate(("aa" + "0" * 62, "bb" + "0" * 62, "cc" + "0" * 62)):
+        cache.store(key, run_dir=run_dir, files=["work/out.bin"], result=result)
+        entry = tmp_path / "cache" / key[:2] / f"{key}.zip"
+        os.utime(entry, (1_000_000 + index, 1_000_000 + index))
+
+    # Assert
+    assert sorted(path.stem[:2] for path in (tmp_path / "cache").rglob("*.zip")) == ["bb", "cc"]
+    assert cache.restore("aa" + "0" * 62, run_dir=tmp_path / "restored") is None
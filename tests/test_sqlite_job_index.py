@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+
+from src.config import load_config
+from src.domain.job_indexer import JobIndexItem
+from src.domain.models import JOB_SCHEMA_VERSION_CURRENT, Job, JobStatus
+from src.infra.admin_exceptions import AdminJobCursorInvalidError
+from src.infra.file_job_indexer import FileJobIndexer
+from src.infra.indexed_job_store import IndexedJobStore
+from src.infra.job_indexer_factory import build_job_indexer, ensure_job_index
+from src.infra.job_store import JobStore as FileJobStore
+from src.infra.sqlite_database import SQLiteDatabase
+from src.infra.sqlite_job_index import SQLiteJobIndex, rebuild_file_job_index
+
+
+def _index(tmp_path: Path) -> SQLiteJobIndex:
+    return SQLiteJobIndex(db=SQLiteDatabase(path=tmp_path / "ss.sqlite3"))
+
+
+def _item(
+    job_id: str,
+    *,
+    status: str = "created",
+    updated_at: str,
+    tenant_id: str = "default",
+    version: int = 1,
+) -> JobIndexItem:
+    return JobIndexItem(
+        tenant_id=tenant_id,
+        job_id=job_id,
+        status=status,
+        created_at="2026-01-01T00:00:00+00:00",
+        updated_at=updated_at,
+        version=version,
+    )
+
+
+def test_list_page_walks_newest_first_with_cursor(tmp_path: Path) -> None:
+    # Arrange
+    index = _index(tmp_path)
+    for n in range(5):
+        index.upsert(_item(f"job_{n}", updated_at=f"2026-01-01T00:00:0{n}+00:00"))
+
+    # Act
+    first = index.list_page(limit=2)
+    second = index.list_page(limit=2, cursor=first.next_cursor)
+    last = index.list_page(limit=2, cursor=second.next_cursor)
+
+    # Assert
+    assert [item.job_id for item in first.items] == ["job_4", "job_3"]
+    assert [item.job_id for item in second.items] == ["job_2", "job_1"]
+    assert [item.job_id for item in last.items] == ["job_0"]
+    assert last.next_cursor is None
+
+
+def test_list_page_filters_by_tenant_and_status(tmp_path: Path) -> None:
+    # Arrange
+    index = _index(tmp_path)
+    index.upsert(_item("job_a", status="failed", updated_at="2026-01-01T00:00:01+00:00"))
+    index.upsert(
+        _item("job_b", status="failed", updated_at="2026-01-01T00:00:02+00:00", tenant_id="t-a")
+    )
+    index.upsert(
+        _item("job_c", status="queued", updated_at="2026-01-01T00:00:03+00:00", tenant_id="t-a")
+    )
+
+    # Act
+    failed = index.list_page(status="failed", limit=10)
+    tenant_failed = index.list_page(tenant_id="t-a", status="failed", limit=10)
+
+    # Assert
+    assert [item.job_id for item in failed.items] == ["job_b", "job_a"]
+    assert [item.job_id for item in tenant_failed.items] == ["job_b"]
+
+
+def test_upsert_when_older_version_arrives_later_keeps_newer_row(tmp_path: Path) -> None:
+    # Arrange
+    index = _index(tmp_path)
+    index.upsert(
+        _item("job_a", status="succeeded", updated_at="2026-01-01T00:00:01+00:00", version=4)
+    )
+
+    # Act
+    index.upsert(
+        _item("job_a", status="running", updated_at="2026-01-01T00:00:02+00:00", version=3)
+    )
+
+    # Assert
+    assert [(item.status, item.version) for item in index.list_jobs()] == [("succeeded", 4)]
+
+
+def test_list_page_with_malformed_cursor_raises(tmp_path: Path) -> None:
+    # Arrange
+    index = _index(tmp_path)
+
+    # Act / Assert
+    with pytest.raises(AdminJobCursorInvalidError):
+        index.list_page(limit=10, cursor="not-a-cursor")
+
+
+def test_indexed_job_store_updates_index_on_create_and_save(tmp_path: Path) -> None:
+    # Arrange
+    index = _index(tmp_path)
+    store = IndexedJobStore(inner=FileJobStore(jobs_dir=tmp_path / "jobs"), index=index)
+    job = Job(
+        schema_version=JOB_SCHEMA_VERSION_CURRENT,
+        job_id="job_indexed",
+        status=JobStatus.CREATED,
+        created_at="2026-01-01T00:00:00+00:00",
+    )
+    store.create(job, tenant_id="tenant-a")
+
+    # Act
+    job.status = JobStatus.QUEUED
+    store.save(job, tenant_id="tenant-a")
+
+    # Assert
+    items = index.list_page(tenant_id="tenant-a", limit=10).items
+    assert [(item.job_id, item.status, item.version) for item in items] == [
+        ("job_indexed", "queued", job.version)
+    ]
+
+
+def test_rebuild_indexes_file_jobs_and_drops_stale_rows(tmp_path: Path) -> None:
+    # Arrange
+    jobs_dir = tmp_path / "jobs"
+    job_dir = jobs_dir / "job_on_disk"
+    job_dir.mkdir(parents=True)
+    (job_dir / "job.json").write_text(
+        json.dumps({"job_id": "job_on_disk", "status": "failed", "created_at": "2026-01-01"}),
+        encoding="utf-8",
+    )
+    index = _index(tmp_path)
+    index.upsert(_item("job_deleted", updated_at="2026-01-01T00:00:00+00:00"))
+
+    # Act
+    report = rebuild_file_job_index(scanner=FileJobIndexer(jobs_dir=jobs_dir), index=index)
+
+    # Assert
+    assert (report.indexed, report.removed) == (1, 1)
+    assert [item.job_id for item in index.list_jobs()] == ["job_on_disk"]
+    assert index.is_built() is True
+
+
+def test_cold_index_is_scanned_per_request_and_built_only_by_ensure(tmp_path: Path) -> None:
+    # Arrange
+    jobs_dir = tmp_path / "jobs"
+    (jobs_dir / "job_on_disk").mkdir(parents=True)
+    (jobs_dir / "job_on_disk" / "job.json").write_text(
+        json.dumps({"job_id": "job_on_disk", "status": "failed", "created_at": "2026-01-01"}),
+        encoding="utf-8",
+    )
+    config = load_config(
+        env={
+            "SS_LLM_PROVIDER": "yunwu",
+            "SS_LLM_API_KEY": "test-key",
+            "SS_JOBS_DIR": str(jobs_dir),
+            "SS_SQLITE_PATH": str(tmp_path / "ss.sqlite3"),
+        }
+    )
+
+    # Act
+    cold = build_job_indexer(config=config)
+    built_before = _index(tmp_path).is_built()
+    ensure_job_index(config=config)
+    warm = build_job_indexer(config=config)
+
+    # Assert
+    assert isinstance(cold, FileJobIndexer)
+    assert built_before is False
+    assert isinstance(warm, SQLiteJobIndex)
+    assert [item.job_id for item in warm.list_jobs()] == ["job_on_disk"]
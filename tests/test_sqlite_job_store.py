@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from src.domain.models import JOB_SCHEMA_VERSION_CURRENT, Job, JobStatus
+from src.infra.exceptions import (
+    JobAlreadyExistsError,
+    JobNotFoundError,
+    JobVersionConflictError,
+)
+from src.infra.job_store import JobStore as FileJobStore
+from src.infra.sqlite_database import SQLiteDatabase
+from src.infra.sqlite_job_indexer import SQLiteJobIndexer
+from src.infra.sqlite_job_migration import migrate_file_jobs_to_sqlite
+from src.infra.sqlite_job_store import SQLiteJobStore
+from src.utils.job_workspace import resolve_job_dir
+
+
+def _job(job_id: str) -> Job:
+    return Job(
+        schema_version=JOB_SCHEMA_VERSION_CURRENT,
+        job_id=job_id,
+        created_at="2026-01-06T17:50:00+00:00",
+    )
+
+
+def _store(tmp_path: Path) -> SQLiteJobStore:
+    db = SQLiteDatabase(path=tmp_path / "jobs" / "_ss.sqlite3")
+    return SQLiteJobStore(db=db, jobs_dir=tmp_path / "jobs")
+
+
+def test_create_then_load_round_trips_and_creates_workspace_dir(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+
+    store.create(_job("job_sqlite_1"), tenant_id="tenant-a")
+    loaded = store.load("job_sqlite_1", tenant_id="tenant-a")
+
+    assert loaded.job_id == "job_sqlite_1"
+    assert loaded.version == 1
+    job_dir = resolve_job_dir(
+        jobs_dir=tmp_path / "jobs", tenant_id="tenant-a", job_id="job_sqlite_1"
+    )
+    assert job_dir is not None and job_dir.is_dir()
+    with pytest.raises(JobNotFoundError):
+        store.load("job_sqlite_1")
+
+
+def test_create_twice_raises_job_already_exists_error(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    store.create(_job("job_dup"))
+
+    with pytest.raises(JobAlreadyExistsError):
+        store.create(_job("job_dup"))
+
+
+def test_save_with_stale_version_raises_version_conflict(tmp_path: Path) -> None:
+    store = _store(tmp_path)
+    store.create(_job("job_cas"))
+    first = store.load("job_cas")
+    second = store.load("job_cas")
+
+    first.status = JobStatus.QUEUED
+    store.save(first)
+    second.requirement = "stale"
+
+    assert first.version == 2
+    with pytest.raises(JobVersionConflictError):
+        store.save(second)
+    assert store.load("job_cas").status == JobStatus.QUEUED
+
+
+def test_migrate_file_jobs_to_sqlite_copies_jobs_and_is_rerunnable(tmp_path: Path) -> None:
+    jobs_dir = tmp_path / "jobs"
+    file_store = FileJobStore(jobs_dir=jobs_dir)
+    file_store.create(_job("job_default"))
+    file_store.create(_job("job_tenant"), tenant_id="tenant-b")
+    db = SQLiteDatabase(path=jobs_dir / "_ss.sqlite3")
+
+    first = migrate_file_jobs_to_sqlite(jobs_dir=jobs_dir, db=db)
+    second = migrate_file_jobs_to_sqlite(jobs_dir=jobs_dir, db=db)
+
+    assert (first.migrated, first.skipped, first.failed) == (2, 0, 0)
+    assert (second.migrated, second.skipped, second.failed) == (0, 2, 0)
+    store = SQLiteJobStore(db=db, jobs_dir=jobs_dir)
+    assert store.load("job_tenant", tenant_id="tenant-b").job_id == "job_tenant"
+    listed = {(item.tenant_id, item.job_id) for item in SQLiteJobIndexer(db=db).list_jobs()}
+    assert listed == {("default", "job_default"), ("tenant-b", "job_tenant")}
@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from src.config import load_config
+from src.domain.queue_scheduling import FairShareScheduler, QueueSchedulingPolicy
+from src.infra.sqlite_database import SQLiteDatabase
+from src.infra.sqlite_worker_queue import SQLiteWorkerQueue
+from src.infra.worker_queue_factory import build_worker_queue
+
+
+def test_claim_returns_jobs_in_enqueue_order_and_enqueue_is_idempotent(tmp_path: Path) -> None:
+    queue = SQLiteWorkerQueue(db=SQLiteDatabase(path=tmp_path / "q.sqlite3"))
+    queue.enqueue(job_id="job_b", tenant_id="tenant-z", traceparent="tp-1")
+    queue.enqueue(job_id="job_a", tenant_id="tenant-z")
+    queue.enqueue(job_id="job_b", tenant_id="tenant-z")
+
+    claims = [queue.claim(worker_id="worker-1") for _ in range(3)]
+
+    assert [(c.tenant_id, c.job_id) for c in claims if c is not None] == [
+        ("tenant-z", "job_b"),
+        ("tenant-z", "job_a"),
+    ]
+    assert claims[0] is not None and claims[0].traceparent == "tp-1"
+    assert claims[2] is None
+
+
+def test_claim_with_competing_workers_returns_single_claim(tmp_path: Path) -> None:
+    path = tmp_path / "q.sqlite3"
+    queue_a = SQLiteWorkerQueue(db=SQLiteDatabase(path=path))
+    queue_b = SQLiteWorkerQueue(db=SQLiteDatabase(path=path))
+    queue_a.enqueue(job_id="job_test")
+    barrier = threading.Barrier(2)
+
+    def _claim(queue: SQLiteWorkerQueue, worker_id: str):
+        barrier.wait()
+        return queue.claim(worker_id=worker_id)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        futures = [pool.submit(_claim, queue_a, "w-a"), pool.submit(_claim, queue_b, "w-b")]
+        claims = [c for c in (f.result() for f in futures) if c is not None]
+
+    assert len(claims) == 1
+
+
+def test_claim_with_expired_lease_reclaims_and_stale_ack_is_ignored(tmp_path: Path) -> None:
+    db = SQLiteDatabase(path=tmp_path / "q.sqlite3")
+    now_0 = datetime(2026, 1, 6, tzinfo=timezone.utc)
+    queue_1 = SQLiteWorkerQueue(db=db, lease_ttl_seconds=1, clock=lambda: now_0)
+    queue_2 = SQLiteWorkerQueue(
+        db=db, lease_ttl_seconds=1, clock=lambda: now_0 + timedelta(seconds=2)
+    )
+    queue_1.enqueue(job_id="job_test")
+    claim_1 = queue_1.claim(worker_id="worker-1")
+    not_yet = queue_1.claim(worker_id="worker-1")
+    claim_2 = queue_2.claim(worker_id="worker-2")
+    assert claim_1 is not None and not_yet is None
+    assert claim_2 is not None and claim_2.claim_id != claim_1.claim_id
+
+    queue_1.ack(claim=claim_1)
+    after_stale_ack = db.connection().execute("SELECT COUNT(*) FROM queue").fetchone()[0]
+    queue_2.ack(claim=claim_2)
+
+    assert after_stale_ack == 1
+    assert db.connection().execute("SELECT COUNT(*) FROM queue").fetchone()[0] == 0
+
+
+def test_release_makes_job_claimable_again(tmp_path: Path) -> None:
+    queue = SQLiteWorkerQueue(db=SQLiteDatabase(path=tmp_path / "q.sqlite3"))
+    queue.enqueue(job_id="job_test")
+    claim = queue.claim(worker_id="worker-1")
+    assert claim is not None
+
+    queue.release(claim=claim)
+    again = queue.claim(worker_id="worker-2")
+
+    assert again is not None and again.job_id == "job_test"
+    assert again.claim_id != claim.claim_id
+
+
+def test_build_worker_queue_with_sqlite_backend_uses_sqlite_path(tmp_path: Path) -> None:
+    config = load_config(
+        env={
+            "SS_LLM_PROVIDER": "yunwu",
+            "SS_LLM_API_KEY": "test-key",
+            "SS_QUEUE_BACKEND": "sqlite",
+            "SS_SQLITE_PATH": str(tmp_path / "ss.sqlite3"),
+        }
+    )
+
+    queue = build_worker_queue(config=config)
+    queue.enqueue(job_id="job_test")
+
+    assert isinstance(queue, SQLiteWorkerQueue)
+    assert (tmp_path / "ss.sqlite3").exists()
+
+
+def test_renew_extends_lease_and_returns_none_once_reclaimed(tmp_path: Path) -> None:
+    db = SQLiteDatabase(path=tmp_path / "q.sqlite3")
+    now_0 = datetime(2026, 1, 6, tzinfo=timezone.utc)
+    clock = {"now": now_0}
+    queue = SQLiteWorkerQueue(db=db, lease_ttl_seconds=10, clock=lambda: clock["now"])
+    queue.enqueue(job_id="job_test")
+    claim = queue.claim(worker_id="worker-1")
+    assert claim is not None
+
+    clock["now"] = now_0 + timedelta(seconds=8)
+    renewed = queue.renew(claim=claim)
+    clock["now"] = now_0 + timedelta(seconds=15)
+    not_yet = queue.claim(worker_id="worker-2")
+    clock["now"] = now_0 + timedelta(seconds=30)
+    stolen = queue.claim(worker_id="worker-2")
+
+    assert renewed is not None
+    assert not_yet is None
+    assert stolen is not None
+    assert queue.renew(claim=claim) is None
+
+
+def test_claim_orders_by_priority_and_respects_tenant_cap(tmp_path: Path) -> None:
+    queue = SQLiteWorkerQueue(
+        db=SQLiteDatabase(path=tmp_path / "q.sqlite3"),
+        scheduler=FairShareScheduler(
+            policy=QueueSchedulingPolicy(tenant_max_inflight={"tenant-a": 2})
+        ),
+    )
+    queue.enqueue(job_id="job_low", tenant_id="tenant-a")
+    queue.enqueue(job_id="job_high", tenant_id="tenant-a", priority=9)
+    queue.enqueue(job_id="job_last", tenant_id="tenant-a")
+
+    claims = [queue.claim(worker_id="worker-1") for _ in range(3)]
+
+    assert [c.job_id for c in claims if c is not None] == ["job_high", "job_low"]
+    assert claims[2] is None
+
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import json
+import sys
+import time
+from io import BytesIO
+from pathlib import Path
+
+from src.infra.local_stata_runner import LocalStataRunner
+from src.infra.stata_run_stream import RunProgress, StataLogTail, execute_streaming
+from src.utils.job_workspace import resolve_job_dir
+
+
+def _script(tmp_path: Path, body: str) -> list[str]:
+    path = tmp_path / "fake_stata.py"
+    path.write_text(f"import sys, time\n{body}\n", encoding="utf-8")
+    return [sys.executable, str(path)]
+
+
+def _execute(tmp_path: Path, cmd: list[str], *, timeout_seconds: int | None = 30, **kwargs):
+    work = tmp_path / "work"
+    work.mkdir(exist_ok=True)
+    artifacts = tmp_path / "artifacts"
+    return execute_streaming(
+        cmd=cmd,
+        cwd=work,
+        timeout_seconds=timeout_seconds,
+        stdout_path=artifacts / "run.stdout",
+        stderr_path=artifacts / "run.stderr",
+        log_mirror_path=artifacts / "stata.log",
+        **kwargs,
+    )
+
+
+def test_output_streams_to_files_with_byte_counters_and_progress(tmp_path: Path) -> None:
+    # Arrange
+    cmd = _script(
+        tmp_path,
+        "sys.stdout.write('x' * 5000)\n"
+        "sys.stderr.write('warn')\n"
+        "open('stata.log', 'w').write('. display 1\\n1\\n')",
+    )
+    progress: list[RunProgress] = []
+
+    # Act
+    execution = _execute(tmp_path, cmd, on_progress=progress.append)
+
+    # Assert
+    assert (execution.error, execution.exit_code, execution.streamed) == (None, 0, True)
+    assert (execution.stdout_bytes, execution.stderr_bytes, execution.log_bytes) == (5000, 4, 14)
+    assert (tmp_path / "artifacts" / "run.stdout").read_bytes() == b"x" * 5000
+    assert (tmp_path / "artifacts" / "stata.log").read_bytes() == b". display 1\n1\n"
+    assert progress[-1].stdout_bytes == 5000
+
+
+def test_fatal_return_code_in_the_log_stops_the_run_early(tmp_path: Path) -> None:
+    # Arrange
+    cmd = _script(
+        tmp_path,
+        "log = open('stata.log', 'w')\n"
+        "log.write('. use missing\\nfile missing.dta not found\\nr(601);\\n')\n"
+        "log.flush()\n"
+        "time.sleep(60)",
+    )
+    started = time.monotonic()
+
+    # Act
+    execution = _execute(tmp_path, cmd)
+
+    # Assert
+    assert time.monotonic() - started < 30
+    assert execution.error is not None
+    assert execution.error.error_code == "STATA_RETURN_CODE"
+    assert execution.error.details == {"return_code": 601, "terminated_early": True}
+    assert execution.timed_out is False
+
+
+def test_timeout_terminates_the_process(tmp_path: Path) -> None:
+    # Arrange
+    cmd = _script(tmp_path, "time.sleep(60)")
+
+    # Act
+    execution = _execute(tmp_path, cmd, timeout_seconds=1)
+
+    # Assert
+    assert execution.timed_out is True
+    assert execution.exit_code is None
+    assert execution.error is not None
+    assert execution.error.error_code == "STATA_TIMEOUT"
+
+
+def test_stop_request_terminates_the_process(tmp_path: Path) -> None:
+    # Arrange
+    cmd = _script(tmp_path, "time.sleep(60)")
+    stop_at = time.monotonic() + 0.5
+
+    # Act
+    execution = _execute(tmp_path, cmd, should_stop=lambda: time.monotonic() >= stop_at)
+
+    # Assert
+    assert execution.exit_code is None
+    assert execution.error is not None
+    assert execution.error.error_code == "STATA_RUN_CANCELLED"
+    assert execution.timed_out is False
+
+
+def test_log_tail_matches_return_codes_split_across_reads(tmp_path: Path) -> None:
+    # Arrange
+    path = tmp_path / "stata.log"
+    mirror = BytesIO()
+    tail = StataLogTail(path=path, mirror=mirror)
+
+    # Act
+    path.write_bytes(b"ok\n  r(1")
+    tail.poll()
+    before = tail.return_code
+    with path.open("ab") as f:
+        f.write(b"98);\nend")
+    tail.finish()
+
+    # Assert
+    assert before is None
+    assert tail.return_code == 198
+    assert mirror.getvalue() == b"ok\n  r(198);\nend"
+
+
+def test_local_runner_records_output_bytes_in_meta(
+    job_service, jobs_dir: Path, tmp_path: Path
+) -> None:
+    # Arrange
+    job = job_service.create_job(requirement="stream")
+    cmd = _script(tmp_path, "print('hello')")
+    runner = LocalStataRunner(jobs_dir=jobs_dir, stata_cmd=cmd)
+
+    # Act
+    result = runner.run(job_id=job.job_id, run_id="run_stream", do_file="display 1\n")
+
+    # Assert
+    job_dir = resolve_job_dir(jobs_dir=jobs_dir, job_id=job.job_id)
+    assert job_dir is not None
+    artifacts_dir = job_dir / "runs" / "run_stream" / "artifacts"
+    meta = json.loads((artifacts_dir / "run.meta.json").read_text(encoding="utf-8"))
+    assert result.ok is True
+    assert meta["output_bytes"] == {"stdout": 6, "stderr": 0, "stata_log": 0}
+    assert (artifacts_dir / "stata.log").read_text(encoding="utf-8") == "hello\n"
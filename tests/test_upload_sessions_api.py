@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import hashlib
 import json
+from collections.abc import Iterator
 from dataclasses import replace
 from pathlib import Path
 
@@ -53,6 +54,16 @@ def _test_config(*, jobs_dir: Path) -> Config:
     )
 
 
+class _StreamOnlyObjectStore(FakeObjectStore):
+    def read_bytes(self, *, object_key: str) -> bytes:
+        raise AssertionError("finalize must stream objects, not read them whole")
+
+    def iter_bytes(self, *, object_key: str, chunk_size: int = 1024 * 1024) -> Iterator[bytes]:
+        data = super().read_bytes(object_key=object_key)
+        for offset in range(0, len(data), 3):
+            yield data[offset : offset + 3]
+
+
 def _app(
     *,
     store,
@@ -156,6 +167,57 @@ async def test_upload_sessions_direct_finalize_updates_manifest_and_preview_work
     assert len(manifest["datasets"]) == 1
 
 
+async def test_upload_sessions_direct_finalize_streams_object_and_rejects_bad_checksum(
+    job_service,
+    store,
+    jobs_dir: Path,
+) -> None:
+    fake = _StreamOnlyObjectStore()
+    app = _app(
+        store=store,
+        jobs_dir=jobs_dir,
+        object_store=fake,
+        config=_test_config(jobs_dir=jobs_dir),
+    )
+    job = job_service.create_job(requirement="hello")
+    data = b"a,b\n1,2\n"
+
+    async with asgi_client(app=app) as client:
+        bundle = await client.post(
+            f"/v1/jobs/{job.job_id}/inputs/bundle",
+            json={
+                "files": [
+                    {"filename": "data.csv", "size_bytes": len(data), "role": "primary_dataset"}
+                ]
+            },
+        )
+        file_id = bundle.json()["files"][0]["file_id"]
+        session = await client.post(
+            f"/v1/jobs/{job.job_id}/inputs/upload-sessions",
+            json={"bundle_id": bundle.json()["bundle_id"], "file_id": file_id},
+        )
+        session_payload = session.json()
+        etag = fake.put_via_presigned_url(url=session_payload["presigned_url"], data=data)
+        finalize_url = f"/v1/upload-sessions/{session_payload['upload_session_id']}/finalize"
+        mismatch = await client.post(
+            finalize_url,
+            json={"parts": [{"part_number": 1, "etag": etag, "sha256": "0" * 64}]},
+        )
+        finalized = await client.post(
+            finalize_url,
+            json={"parts": [{"part_number": 1, "etag": etag, "sha256": _sha256_hex(data)}]},
+        )
+
+    assert mismatch.json()["error_code"] == "CHECKSUM_MISMATCH"
+    assert finalized.json()["success"] is True
+    assert finalized.json()["size_bytes"] == len(data)
+    job_dir = resolve_job_dir(jobs_dir=jobs_dir, job_id=job.job_id)
+    assert job_dir is not None
+    inputs = {p.name for p in (job_dir / "inputs").iterdir()}
+    assert f"ds_{_sha256_hex(data)[:16]}.csv" in inputs
+    assert not any(name.startswith(".staged-") for name in inputs)
+
+
 async def test_upload_sessions_multipart_refresh_subset_and_finalize_is_supported(
     job_service,
     store,
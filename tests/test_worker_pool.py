@@ -0,0 +1,170 @@
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from src.config import load_config
+from src.domain.worker_queue import QueueClaim
+from src.infra.file_worker_queue import FileWorkerQueue
+from src.infra.inotify_queue_notifier import inotify_available
+from src.worker import _run_worker_loop, _run_worker_slot, _ShutdownState
+from src.worker_pool import run_worker_slots, slot_worker_ids
+
+
+class _SlowAckService:
+    def __init__(self, *, queue: FileWorkerQueue, total: int, shutdown: threading.Event):
+        self._queue = queue
+        self._total = total
+        self._shutdown = shutdown
+        self._lock = threading.Lock()
+        self._inflight = 0
+        self.max_inflight = 0
+        self.done: list[QueueClaim] = []
+
+    def process_claim(self, *, claim: QueueClaim, stop_requested, shutdown_deadline) -> None:
+        with self._lock:
+            self._inflight += 1
+            self.max_inflight = max(self.max_inflight, self._inflight)
+        time.sleep(0.05)
+        self._queue.ack(claim=claim)
+        with self._lock:
+            self._inflight -= 1
+            self.done.append(claim)
+            if len(self.done) == self._total:
+                self._shutdown.set()
+
+
+class _GatedService:
+    """Holds every claim until `expected` claims are in flight at once."""
+
+    def __init__(self, *, queue: FileWorkerQueue, expected: int, shutdown: threading.Event):
+        self._queue = queue
+        self._expected = expected
+        self._shutdown = shutdown
+        self._lock = threading.Lock()
+        self.claimed_at: list[float] = []
+        self.all_claimed = threading.Event()
+
+    def process_claim(self, *, claim: QueueClaim, stop_requested, shutdown_deadline) -> None:
+        with self._lock:
+            self.claimed_at.append(time.monotonic())
+            if len(self.claimed_at) == self._expected:
+                self.all_claimed.set()
+        self.all_claimed.wait(timeout=5.0)
+        self._queue.ack(claim=claim)
+        with self._lock:
+            self._expected -= 1
+            if self._expected == 0:
+                self._shutdown.set()
+
+
+def test_slot_worker_ids_keeps_plain_id_for_single_slot() -> None:
+    assert slot_worker_ids(worker_id="w", concurrency=1) == ("w",)
+    assert slot_worker_ids(worker_id="w", concurrency=3) == ("w-slot0", "w-slot1", "w-slot2")
+
+
+def test_run_worker_slots_processes_jobs_concurrently_up_to_concurrency(tmp_path: Path) -> None:
+    # Arrange
+    queue = FileWorkerQueue(queue_dir=tmp_path / "queue")
+    for i in range(8):
+        queue.enqueue(job_id=f"job_{i}")
+    shutdown = _ShutdownState(requested=threading.Event(), deadline=None)
+    service = _SlowAckService(queue=queue, total=8, shutdown=shutdown.requested)
+    config = load_config(
+        env={
+            "SS_LLM_PROVIDER": "yunwu",
+            "SS_LLM_API_KEY": "test-key",
+            "SS_WORKER_IDLE_SLEEP_SECONDS": "0.01",
+        }
+    )
+
+    # Act
+    run_worker_slots(
+        worker_id="worker-1",
+        concurrency=4,
+        shutdown_requested=shutdown.requested,
+        run_slot=lambda slot_id: _run_worker_loop(
+            worker_id=slot_id,
+            config=config,
+            service=service,
+            queue=queue,
+            shutdown=shutdown,
+        ),
+    )
+
+    # Assert
+    assert sorted(c.job_id for c in service.done) == [f"job_{i}" for i in range(8)]
+    assert service.max_inflight == 4
+    assert {c.worker_id for c in service.done} <= set(
+        slot_worker_ids(worker_id="worker-1", concurrency=4)
+    )
+
+
+def test_run_worker_slots_when_slot_crashes_stops_pool_and_reraises() -> None:
+    shutdown = threading.Event()
+    stopped: list[str] = []
+
+    def _run_slot(slot_id: str) -> None:
+        if slot_id.endswith("slot0"):
+            raise RuntimeError("boom")
+        shutdown.wait(timeout=5)
+        stopped.append(slot_id)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        run_worker_slots(
+            worker_id="w", concurrency=3, shutdown_requested=shutdown, run_slot=_run_slot
+        )
+
+    assert shutdown.is_set()
+    assert sorted(stopped) == ["w-slot1", "w-slot2"]
+
+
+@pytest.mark.skipif(not inotify_available(), reason="inotify not available")
+def test_run_worker_slots_with_notifier_wakes_every_idle_slot(tmp_path: Path) -> None:
+    # Arrange
+    queue_dir = tmp_path / "queue"
+    queue = FileWorkerQueue(queue_dir=queue_dir)
+    shutdown = _ShutdownState(requested=threading.Event(), deadline=None)
+    service = _GatedService(queue=queue, expected=2, shutdown=shutdown.requested)
+    config = load_config(
+        env={
+            "SS_LLM_PROVIDER": "yunwu",
+            "SS_LLM_API_KEY": "test-key",
+            "SS_QUEUE_DIR": str(queue_dir),
+            "SS_QUEUE_NOTIFIER": "inotify",
+            "SS_WORKER_IDLE_SLEEP_SECONDS": "30",
+        }
+    )
+    pool = threading.Thread(
+        target=run_worker_slots,
+        kwargs={
+            "worker_id": "worker-1",
+            "concurrency": 2,
+            "shutdown_requested": shutdown.requested,
+            "run_slot": lambda slot_id: _run_worker_slot(
+                worker_id=slot_id,
+                config=config,
+                service=service,
+                queue=queue,
+                shutdown=shutdown,
+            ),
+        },
+    )
+    pool.start()
+    time.sleep(0.2)
+
+    # Act
+    enqueued_at = time.monotonic()
+    queue.enqueue(job_id="job_a")
+    queue.enqueue(job_id="job_b")
+    both_claimed = service.all_claimed.wait(timeout=5.0)
+    shutdown.requested.set()
+    pool.join(timeout=5.0)
+
+    # Assert
+    assert both_claimed
+    assert max(service.claimed_at) - enqueued_at < 1.0
+    assert not pool.is_alive()
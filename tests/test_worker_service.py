@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import time
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
@@ -9,6 +10,7 @@ import pytest
 
 from src.domain.models import JOB_SCHEMA_VERSION_CURRENT, Job, JobStatus, RunAttempt
 from src.domain.output_formatter_service import OutputFormatterOutcome
+from src.domain.run_cancellation import RunCancellation
 from src.domain.stata_runner import RunError, RunResult
 from src.domain.state_machine import JobStateMachine
 from src.domain.worker_queue import QueueClaim
@@ -23,6 +25,8 @@ class _FakeQueue:
     released: list[QueueClaim] | None = None
     ack_error: Exception | None = None
     release_error: Exception | None = None
+    lease_lost: bool = False
+    renewed: int = 0
 
     def claim(self, *, worker_id: str) -> QueueClaim | None:
         return self.claim_result
@@ -41,6 +45,12 @@ class _FakeQueue:
             self.released = []
         self.released.append(claim)
 
+    def renew(self, *, claim: QueueClaim) -> QueueClaim | None:
+        if self.lease_lost:
+            return None
+        self.renewed += 1
+        return claim
+
     def enqueue(
         self,
         job_id: str,
@@ -126,7 +136,7 @@ def _job(*, status: JobStatus, runs: int = 0) -> Job:
     return job
 
 
-def _claim(*, job_id: str = "job_123") -> QueueClaim:
+def _claim(*, job_id: str = "job_123", ttl_seconds: float = 30) -> QueueClaim:
     now = datetime.now(tz=timezone.utc)
     return QueueClaim(
         tenant_id="default",
@@ -134,7 +144,7 @@ def _claim(*, job_id: str = "job_123") -> QueueClaim:
         claim_id="claim_1",
         worker_id="worker_1",
         claimed_at=now,
-        lease_expires_at=now + timedelta(seconds=30),
+        lease_expires_at=now + timedelta(seconds=ttl_seconds),
     )
 
 
@@ -146,6 +156,7 @@ def _service(
     output_formatter: _FakeOutputFormatter,
     retry: WorkerRetryPolicy,
     sleep: Callable[[float], None] | None = None,
+    run_cancellation: RunCancellation | None = None,
 ) -> WorkerService:
     return WorkerService(
         store=store,
@@ -161,6 +172,7 @@ def _service(
         audit=None,
         clock=lambda: datetime(2026, 1, 1),
         sleep=(lambda _seconds: None) if sleep is None else sleep,
+        run_cancellation=run_cancellation,
     )
 
 
@@ -408,3 +420,97 @@ def test_worker_ack_when_queue_fails_raises_queue_io_error(tmp_path: Path) -> No
 
     with pytest.raises(QueueIOError):
         svc._ack(claim)
+
+
+def _slow_ok_execute_plan(*, job: Job, run_id: str, **_kwargs: object) -> RunResult:
+    time.sleep(0.35)
+    return RunResult(
+        job_id=job.job_id,
+        run_id=run_id,
+        ok=True,
+        exit_code=0,
+        timed_out=False,
+        artifacts=tuple(),
+        error=None,
+    )
+
+
+def test_process_claim_with_long_run_renews_lease_and_acks(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = _FakeStore(job=_job(status=JobStatus.QUEUED))
+    queue = _FakeQueue()
+    svc = _service(
+        store=store,
+        queue=queue,
+        jobs_dir=tmp_path,
+        output_formatter=_FakeOutputFormatter(outcome=OutputFormatterOutcome(artifacts=tuple())),
+        retry=WorkerRetryPolicy(max_attempts=1, backoff_base_seconds=1.0, backoff_max_seconds=30.0),
+    )
+    monkeypatch.setattr("src.domain.worker_service.execute_plan", _slow_ok_execute_plan)
+    claim = _claim(ttl_seconds=0.3)
+
+    svc.process_claim(claim=claim)
+
+    assert queue.renewed >= 2
+    assert queue.acked == [claim]
+    assert store.job is not None and store.job.status == JobStatus.SUCCEEDED
+
+
+def test_process_claim_when_lease_lost_during_run_abandons_job(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = _FakeStore(job=_job(status=JobStatus.QUEUED))
+    queue = _FakeQueue(lease_lost=True)
+    svc = _service(
+        store=store,
+        queue=queue,
+        jobs_dir=tmp_path,
+        output_formatter=_FakeOutputFormatter(outcome=OutputFormatterOutcome(artifacts=tuple())),
+        retry=WorkerRetryPolicy(max_attempts=1, backoff_base_seconds=1.0, backoff_max_seconds=30.0),
+    )
+    monkeypatch.setattr("src.domain.worker_service.execute_plan", _slow_ok_execute_plan)
+
+    svc.process_claim(claim=_claim(ttl_seconds=0.3))
+
+    assert queue.acked is None and queue.released is None
+    assert store.job is not None and store.job.status != JobStatus.SUCCEEDED
+    assert store.job.runs[-1].status == "running"
+
+
+def test_process_claim_when_lease_lost_cancels_the_running_stata_run(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    cancellation = RunCancellation()
+    claim = _claim(ttl_seconds=0.3)
+    seen: list[bool] = []
+
+    def _execute_until_cancelled(*, job: Job, run_id: str, **_kwargs: object) -> RunResult:
+        deadline = time.monotonic() + 5.0
+        while time.monotonic() < deadline and not cancellation.cancelled(job_id=job.job_id):
+            time.sleep(0.01)
+        seen.append(cancellation.cancelled(job_id=job.job_id))
+        return RunResult(
+            job_id=job.job_id,
+            run_id=run_id,
+            ok=False,
+            exit_code=None,
+            timed_out=False,
+            artifacts=tuple(),
+            error=RunError(error_code="STATA_RUN_CANCELLED", message="lease lost"),
+        )
+
+    svc = _service(
+        store=_FakeStore(job=_job(status=JobStatus.QUEUED)),
+        queue=_FakeQueue(lease_lost=True),
+        jobs_dir=tmp_path,
+        output_formatter=_FakeOutputFormatter(outcome=OutputFormatterOutcome(artifacts=tuple())),
+        retry=WorkerRetryPolicy(max_attempts=1, backoff_base_seconds=1.0, backoff_max_seconds=30.0),
+        run_cancellation=cancellation,
+    )
+    monkeypatch.setattr("src.domain.worker_service.execute_plan", _execute_until_cancelled)
+
+    svc.process_claim(claim=claim)
+
+    assert seen == [True]
+    assert cancellation.cancelled(job_id=claim.job_id) is False